@@ -18,8 +18,9 @@ import numpy
 from numpy.polynomial import polynomial
 
 from sarpy.io.general.base import SarpyIOError
-from sarpy.io.general.tiff import TiffDetails, NativeTiffDataSegment
+from sarpy.io.general.tiff import TiffDetails, get_tiff_data_segment
 from sarpy.io.general.utils import parse_timestring, get_seconds, is_file_like
+from sarpy.io.general.opener_signature import OpenerSignature
 from sarpy.io.complex.base import SICDTypeReader
 from sarpy.io.complex.utils import fit_position_xvalidation
 from sarpy.io.complex.sicd_elements.blocks import XYZPolyType, Poly2DType
@@ -91,11 +92,6 @@ class CapellaDetails(object):
             logger.info(msg)
             raise SarpyIOError(msg)
 
-        # verify the file is not compressed
-        self._tiff_details.check_compression()
-        # verify the file is not tiled
-        self._tiff_details.check_tiled()
-
     @property
     def file_name(self) -> str:
         """
@@ -452,12 +448,15 @@ class CapellaReader(SICDTypeReader):
 
     __slots__ = ('_capella_details', )
 
-    def __init__(self, capella_details):
+    def __init__(self, capella_details, max_workers: int = 1):
         """
 
         Parameters
         ----------
         capella_details : str|CapellaDetails
+        max_workers : int
+            The maximum number of threads used to decode tiles or strips
+            concurrently, for a tiled or compressed tiff file.
         """
 
         if isinstance(capella_details, str):
@@ -469,8 +468,9 @@ class CapellaReader(SICDTypeReader):
         self._capella_details = capella_details
         sicd = self.capella_details.get_sicd()
         reverse_axes, transpose_axes = self.capella_details.get_symmetry()
-        data_segment = NativeTiffDataSegment(
-            self.capella_details.tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes)
+        data_segment = get_tiff_data_segment(
+            self.capella_details.tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+            max_workers=max_workers)
 
         SICDTypeReader.__init__(self, data_segment, sicd, close_segments=True)
         self._check_sizes()
@@ -491,6 +491,9 @@ class CapellaReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(magic=(b'II*\x00', b'MM\x00*', b'II+\x00', b'MM\x00+'))
+
+
 def is_a(file_name: str) -> Optional[CapellaReader]:
     """
     Tests whether a given file_name corresponds to a Capella SAR file.
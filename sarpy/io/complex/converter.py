@@ -7,20 +7,29 @@ __classification__ = "UNCLASSIFIED"
 __author__ = ("Wade Schwartzkopf", "Thomas McCullough", "Valkyrie Systems Corporation")
 
 import os
+import json
+import hashlib
 import logging
-from typing import Union, List, Tuple, Callable, BinaryIO
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Union, List, Tuple, Callable, BinaryIO, Optional
 
 import numpy
 
+from sarpy.__about__ import __title__, __version__
 from sarpy.geometry.geocoords import ecf_to_geodetic
 from sarpy.geometry.point_projection import image_to_ground_dem
 from sarpy.io.complex.base import SICDTypeReader
 from sarpy.io.complex.sicd import SICDWriter
+from sarpy.io.complex.sicd_elements.ImageCreation import ImageCreationType
 from sarpy.io.complex.sio import SIOWriter
 from sarpy.io.DEM.geotiff1deg import GeoTIFF1DegInterpolator
 from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.base import check_for_openers
 from sarpy.io.general.nitf import NITFReader
+from sarpy.io.general.opener_signature import OpenerSignature, OpenerProbe
 from sarpy.io.general.utils import is_file_like
 
 logger = logging.getLogger(__name__)
@@ -29,10 +38,13 @@ logger = logging.getLogger(__name__)
 # Module variables
 _writer_types = {'SICD': SICDWriter, 'SIO': SIOWriter}
 _openers = []
+_opener_signatures = {}
 _parsed_openers = False
+_checkpoint_suffix = '.checkpoint'
+_pipeline_stages = ('read', 'convert', 'write')
 
 
-def register_opener(open_func: Callable) -> None:
+def register_opener(open_func: Callable, signature: Optional[OpenerSignature] = None) -> None:
     """
     Provide a new opener.
 
@@ -42,6 +54,9 @@ def register_opener(open_func: Callable) -> None:
         This is required to be a function which takes a single argument (file name).
         This function should return a sarpy.io.complex.base.SICDTypeReader instance
         if the referenced file is viable for the underlying type, and None otherwise.
+    signature : None|OpenerSignature
+        The inexpensive necessary conditions for a file to be opened by `open_func`,
+        used to avoid calling `open_func` for files which are clearly not viable.
 
     Returns
     -------
@@ -50,8 +65,12 @@ def register_opener(open_func: Callable) -> None:
 
     if not callable(open_func):
         raise TypeError('open_func must be a callable')
+    if signature is not None and not isinstance(signature, OpenerSignature):
+        raise TypeError('signature must be an OpenerSignature instance')
     if open_func not in _openers:
         _openers.append(open_func)
+    if signature is not None:
+        _opener_signatures[open_func] = signature
 
 
 def parse_openers() -> None:
@@ -101,8 +120,13 @@ def open_complex(file_name: Union[str, BinaryIO]) -> SICDTypeReader:
         raise SarpyIOError('File {} does not exist.'.format(file_name))
     # parse openers, if not already done
     parse_openers()
-    # see if we can find a reader though trial and error
+    # see if we can find a reader though trial and error, skipping the openers
+    #   whose signature rules out the file
+    probe = OpenerProbe(file_name)
     for opener in _openers:
+        signature = _opener_signatures.get(opener, None)
+        if signature is not None and not signature.matches(probe):
+            continue
         reader = opener(file_name)
         if reader is not None:
             return reader
@@ -121,12 +145,22 @@ class Converter(object):
     This is a class for conversion (of a single frame) of one complex format to
     SICD or SIO format. Another use case is to create a (contiguous) subset of a
     given complex dataset. **This class is intended to be used as a context manager.**
+
+    If `checkpoint` is `True`, then the completed row blocks are recorded in a
+    sidecar file alongside the output file, which is removed once the conversion
+    is complete. If the conversion is interrupted, then a subsequent conversion
+    with `checkpoint=True` to the same output file, with the same frame, limits,
+    and metadata, will resume writing into the partially written output file,
+    writing only the rows which were not completed.
     """
 
-    __slots__ = ('_reader', '_file_name', '_writer', '_frame', '_row_limits', '_col_limits')
+    __slots__ = (
+        '_reader', '_file_name', '_writer', '_frame', '_row_limits', '_col_limits',
+        '_checkpoint', '_checkpoint_identity', '_completed_rows', '_creation_time',
+        '_statistics', '_statistics_lock', '_output_file_object')
 
     def __init__(self, reader, output_directory, output_file=None, frame=None, row_limits=None, col_limits=None,
-                 output_format='SICD', check_older_version=False, check_existence=True):
+                 output_format='SICD', check_older_version=False, check_existence=True, checkpoint=False):
         """
 
         Parameters
@@ -151,8 +185,20 @@ class Converter(object):
             Try to use a less recent version of SICD (1.1), for possible application compliance issues?
         check_existence : bool
             Should we check if the given file already exists, and raises an exception if so?
+            An existing file with a matching checkpoint file is resumed, rather than
+            raising an exception, if `checkpoint` is `True`.
+        checkpoint : bool
+            Record the completed row blocks in a checkpoint file, and resume from
+            any existing matching checkpoint?
         """
 
+        self._output_file_object = None
+        self._checkpoint = bool(checkpoint)
+        self._checkpoint_identity = None
+        self._completed_rows = []  # type: List[List[int]]
+        self._creation_time = None
+        self._statistics = None
+        self._statistics_lock = threading.Lock()
         if isinstance(reader, SICDTypeReader):
             self._reader = reader
         else:
@@ -164,8 +210,6 @@ class Converter(object):
         if output_file is None:
             output_file = self._reader.get_sicds_as_tuple()[frame].get_suggested_name(frame+1)+'_SICD'
         output_path = os.path.join(output_directory, output_file)
-        if check_existence and os.path.exists(output_path):
-            raise SarpyIOError('The file {} already exists.'.format(output_path))
 
         # validate the output format and fetch the writer type
         if output_format is None:
@@ -191,8 +235,60 @@ class Converter(object):
 
         # set up our writer
         self._file_name = output_path
-        self._writer = writer_type(
-            output_path, this_sicd, check_older_version=check_older_version, check_existence=check_existence)
+        resume = False
+        if self._checkpoint:
+            self._checkpoint_identity = {
+                'output_format': output_format,
+                'frame': self._frame,
+                'row_limits': [int(entry) for entry in self._row_limits],
+                'col_limits': [int(entry) for entry in self._col_limits],
+                'check_older_version': bool(check_older_version),
+                'sicd_digest': hashlib.sha256(this_sicd.to_xml_bytes()).hexdigest()}
+            resume = self._load_checkpoint()
+            if this_sicd.ImageCreation is None or this_sicd.ImageCreation.DateTime is None:
+                # NB: the creation time populated by the writer must be consistent
+                #   on resuming, so that the metadata is rewritten identically
+                if not resume or self._creation_time is None:
+                    self._creation_time = str(numpy.datetime64(datetime.now()))
+                this_sicd = this_sicd.copy()
+                if this_sicd.ImageCreation is None:
+                    profile = '{} {}'.format(__title__, __version__)
+                    this_sicd.ImageCreation = ImageCreationType(Application=profile, Profile=profile)
+                this_sicd.ImageCreation.DateTime = numpy.datetime64(self._creation_time)
+        if resume:
+            logger.info(
+                'Resuming the conversion to file {},\n\t'
+                'with completed rows {}'.format(output_path, self._completed_rows))
+            # NB: the header and metadata are rewritten identically, and the
+            #   image data is written in place
+            self._output_file_object = open(output_path, 'r+b')
+            try:
+                self._writer = writer_type(
+                    self._output_file_object, this_sicd, check_older_version=check_older_version)
+            except Exception:
+                self._close_writer()
+                raise
+        else:
+            if check_existence and os.path.exists(output_path):
+                raise SarpyIOError('The file {} already exists.'.format(output_path))
+            self._writer = writer_type(
+                output_path, this_sicd, check_older_version=check_older_version, check_existence=check_existence)
+            if self._checkpoint:
+                self._save_checkpoint()
+
+    def _close_writer(self):
+        """
+        Close the writer, and then any output file object opened for resuming.
+        """
+
+        try:
+            if getattr(self, '_writer', None) is not None:
+                self._writer.close()
+        finally:
+            file_object = getattr(self, '_output_file_object', None)
+            if file_object is not None:
+                self._output_file_object = None
+                file_object.close()
 
     def _get_rows_per_block(self, max_block_size):
         pixel_type = self._writer.sicd_meta.ImageData.PixelType
@@ -211,16 +307,280 @@ class Converter(object):
         """SICDWriter|SIOWriter: The writer instance."""
         return self._writer
 
-    def write_data(self, max_block_size=None):
+    @property
+    def checkpoint_file(self):  # type: () -> Optional[str]
+        """None|str: The checkpoint file, if checkpointing."""
+        return self._file_name + _checkpoint_suffix if self._checkpoint else None
+
+    @property
+    def completed_rows(self):  # type: () -> List[Tuple[int, int]]
+        """
+        List[Tuple[int, int]]: The completed (start, stop) row intervals,
+        relative to the output.
+        """
+
+        return [(start, stop) for start, stop in self._completed_rows]
+
+    def _load_checkpoint(self):
+        """
+        Loads the completed rows from the checkpoint file, provided that it and
+        the output file exist and it matches the present conversion.
+
+        Returns
+        -------
+        bool
+            Is there a valid checkpoint from which to resume?
+        """
+
+        if not (os.path.isfile(self.checkpoint_file) and os.path.isfile(self._file_name)):
+            return False
+        try:
+            with open(self.checkpoint_file, 'r') as fi:
+                contents = json.load(fi)
+        except (OSError, ValueError):
+            logger.warning('Failed parsing checkpoint file {}, ignoring it'.format(self.checkpoint_file))
+            return False
+        if contents.get('identity', None) != self._checkpoint_identity:
+            logger.warning(
+                'The checkpoint file {} does not match the present conversion,\n\t'
+                'ignoring it'.format(self.checkpoint_file))
+            return False
+        self._completed_rows = [[int(start), int(stop)] for start, stop in contents.get('completed_rows', [])]
+        self._creation_time = contents.get('creation_time', None)
+        return True
+
+    def _save_checkpoint(self):
+        """
+        Atomically replaces the checkpoint file with the present state.
+        """
+
+        temp_file = self.checkpoint_file + '.partial'
+        with open(temp_file, 'w') as fi:
+            json.dump(
+                {'identity': self._checkpoint_identity, 'creation_time': self._creation_time,
+                 'completed_rows': self._completed_rows}, fi)
+            fi.flush()
+            os.fsync(fi.fileno())
+        os.replace(temp_file, self.checkpoint_file)
+
+    def _mark_completed(self, start, stop):
+        """
+        Records the given output rows as completed, merging intervals.
+        """
+
+        intervals = sorted(self._completed_rows + [[start, stop]])
+        merged = []
+        for entry in intervals:
+            if len(merged) > 0 and entry[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], entry[1])
+            else:
+                merged.append(list(entry))
+        self._completed_rows = merged
+
+    def _get_remaining_rows(self):
+        """
+        Gets the (start, stop) output row intervals which are not completed.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+        """
+
+        out = []
+        position = 0
+        for start, stop in self._completed_rows + [[self._row_limits[1] - self._row_limits[0], None]]:
+            if start > position:
+                out.append((position, start))
+            if stop is not None:
+                position = max(position, stop)
+        return out
+
+    def get_statistics(self):
+        # type: () -> Optional[dict]
+        """
+        Gets the statistics of the stages of the most recent :meth:`write_data`.
+
+        Returns
+        -------
+        None|dict
+            Keyed by stage name, from `('read', 'convert', 'write')`, each entry
+            is a dictionary with keys `blocks`, `bytes` (produced by the stage),
+            `seconds` (spent in the stage), and `throughput` (bytes per second
+            spent in the stage). Additionally, `elapsed` gives the total seconds.
+        """
+
+        with self._statistics_lock:
+            if self._statistics is None:
+                return None
+            out = {}
+            for stage in _pipeline_stages:
+                entry = dict(self._statistics[stage])
+                entry['throughput'] = entry['bytes']/entry['seconds'] if entry['seconds'] > 0 else 0.0
+                out[stage] = entry
+            out['elapsed'] = self._statistics['elapsed']
+            return out
+
+    def _record_stage(self, stage, start_time, data_bytes):
+        with self._statistics_lock:
+            entry = self._statistics[stage]
+            entry['blocks'] += 1
+            entry['bytes'] += data_bytes
+            entry['seconds'] += time.perf_counter() - start_time
+
+    def _get_blocks(self, rows_per_block):
+        """
+        Gets the (start, end) row blocks to be written, relative to the input.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+        """
+
+        out = []
+        for range_start, range_end in self._get_remaining_rows():
+            block_start = self._row_limits[0] + range_start
+            while block_start < self._row_limits[0] + range_end:
+                block_end = min(block_start + rows_per_block, self._row_limits[0] + range_end)
+                out.append((block_start, block_end))
+                block_start = block_end
+        return out
+
+    def _read_block(self, block):
+        """
+        The read stage, which reads (and formats) the given block from the reader.
+        """
+
+        start_time = time.perf_counter()
+        block_start, block_end = block
+        data = self._reader[
+            block_start:block_end, self._col_limits[0]:self._col_limits[1], self._frame, 'nosqueeze']
+        self._record_stage('read', start_time, data.nbytes)
+        return data
+
+    def _convert_block(self, block, data):
+        """
+        The convert stage, which applies the inverse of the format function of
+        the (first) writer data segment to the given block.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, Tuple[slice, ...]]
+            The raw data and raw subscript.
+        """
+
+        start_time = time.perf_counter()
+        subscript = (
+            slice(block[0] - self._row_limits[0], block[1] - self._row_limits[0], 1),
+            slice(0, self._col_limits[1] - self._col_limits[0], 1))
+        raw_data, raw_subscript = self._writer.data_segment[0].format_for_write(data, subscript=subscript)
+        self._record_stage('convert', start_time, raw_data.nbytes)
+        return raw_data, raw_subscript
+
+    def _write_block(self, block, raw_data, raw_subscript):
+        """
+        The write stage, which writes the given raw block to the (first) writer
+        data segment, and records it in any checkpoint.
+        """
+
+        start_time = time.perf_counter()
+        self._writer.write_raw(raw_data, subscript=raw_subscript, index=0)
+        if self._checkpoint:
+            # NB: the data must be on disk before being recorded as complete
+            self._writer.flush()
+            self._mark_completed(block[0] - self._row_limits[0], block[1] - self._row_limits[0])
+            self._save_checkpoint()
+        self._record_stage('write', start_time, raw_data.nbytes)
+        logger.info('Done writing block {}-{} to file {}'.format(block[0], block[1], self._file_name))
+
+    def _write_pipelined(self, blocks, queue_depth):
+        """
+        Performs the read and convert stages in background threads, connected
+        by queues holding at most `queue_depth` blocks, and the write stage in
+        the calling thread.
+        """
+
+        stop = threading.Event()
+        read_queue = queue.Queue(maxsize=queue_depth)
+        convert_queue = queue.Queue(maxsize=queue_depth)
+        finished = object()
+
+        def put(the_queue, item):
+            # NB: give up if the downstream stage has failed
+            while not stop.is_set():
+                try:
+                    the_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read_stage():
+            try:
+                for block in blocks:
+                    if not put(read_queue, (block, self._read_block(block))):
+                        return
+                put(read_queue, finished)
+            except BaseException as exception:
+                put(read_queue, exception)
+
+        def convert_stage():
+            try:
+                while not stop.is_set():
+                    item = read_queue.get()
+                    if item is finished or isinstance(item, BaseException):
+                        put(convert_queue, item)
+                        return
+                    block, data = item
+                    if not put(convert_queue, (block, ) + self._convert_block(block, data)):
+                        return
+            except BaseException as exception:
+                put(convert_queue, exception)
+
+        threads = [
+            threading.Thread(target=read_stage, name='sarpy-convert-read', daemon=True),
+            threading.Thread(target=convert_stage, name='sarpy-convert-format', daemon=True)]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = convert_queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                self._write_block(*item)
+        finally:
+            stop.set()
+            # NB: unblock any stage waiting on an empty queue
+            for the_queue in [read_queue, convert_queue]:
+                try:
+                    the_queue.put_nowait(finished)
+                except queue.Full:
+                    pass
+            for thread in threads:
+                thread.join()
+
+    def write_data(self, max_block_size=None, queue_depth=2):
         r"""
         Assuming that the desired changes have been made to the writer instance
         nitf header tags, write the data.
 
+        This is performed in three stages for each block of rows - read (including
+        any decoding and formatting by the reader), convert (to the raw form for
+        the writer), and write. If `queue_depth > 0`, then these stages are
+        pipelined, with the read and convert stages performed in background
+        threads, so that reading overlaps with writing. The statistics for each
+        stage are available from :meth:`get_statistics`.
+
         Parameters
         ----------
         max_block_size : None|int
             (nominal) maximum block size in bytes. Minimum value is :math:`2^{20} = 1~\text{MB}`.
             Default value is :math:`2^{26} = 64~\text{MB}`.
+        queue_depth : int
+            The maximum number of blocks held between stages, so at most
+            `2*queue_depth + 3` blocks are in memory. If `0`, then the stages are
+            performed sequentially.
 
         Returns
         -------
@@ -234,33 +594,60 @@ class Converter(object):
             max_block_size = int(max_block_size)
             if max_block_size < 2**20:
                 max_block_size = 2**20
+        queue_depth = int(queue_depth)
+        if queue_depth < 0:
+            raise ValueError('queue_depth must be non-negative')
+
+        with self._statistics_lock:
+            self._statistics = {
+                stage: {'blocks': 0, 'bytes': 0, 'seconds': 0.0} for stage in _pipeline_stages}
+            self._statistics['elapsed'] = 0.0
+        start_time = time.perf_counter()
 
         # now, write the data
-        rows_per_block = self._get_rows_per_block(max_block_size)
-        block_start = self._row_limits[0]
-        while block_start < self._row_limits[1]:
-            block_end = min(block_start + rows_per_block, self._row_limits[1])
-            data = self._reader[block_start:block_end, self._col_limits[0]:self._col_limits[1], self._frame, 'nosqueeze']
-            self._writer.write_chip(data, start_indices=(block_start - self._row_limits[0], 0))
-            logger.info('Done writing block {}-{} to file {}'.format(block_start, block_end, self._file_name))
-            block_start = block_end
-        self._writer.close()
+        blocks = self._get_blocks(self._get_rows_per_block(max_block_size))
+        if queue_depth == 0 or len(blocks) < 2:
+            for block in blocks:
+                self._write_block(block, *self._convert_block(block, self._read_block(block)))
+        else:
+            self._write_pipelined(blocks, queue_depth)
+        self._close_writer()
+        if self._checkpoint and os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+        with self._statistics_lock:
+            self._statistics['elapsed'] = time.perf_counter() - start_time
+        statistics = self.get_statistics()
+        logger.info(
+            'Wrote file {} in {:0.2f} seconds, with stage throughput (MB/s) {}'.format(
+                self._file_name, statistics['elapsed'],
+                ', '.join('{} {:0.1f}'.format(stage, statistics[stage]['throughput']/1048576.)
+                          for stage in _pipeline_stages)))
 
     def __del__(self):
-        if hasattr(self, '_writer'):
-            self._writer.close()
+        self._close_writer()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
         if exception_type is None:
-            self._writer.close()
+            self._close_writer()
         else:
             logger.error(
                 'The {} file converter generated an exception during processing.\n\t'
                 'The file {} may be only partially generated and corrupt.'.format(
                     self.__class__.__name__, self._file_name))
+            if self._checkpoint:
+                logger.error(
+                    'The completed rows are recorded in checkpoint file {}, and the\n\t'
+                    'conversion may be resumed using checkpoint=True'.format(self.checkpoint_file))
+            # NB: release the file handles now, without masking the original exception
+            try:
+                self._close_writer()
+            except Exception as e:
+                logger.error(
+                    'Closing the {} file converter failed with error\n\t{}'.format(self.__class__.__name__, e))
             # The exception will be reraised.
             # It's unclear how any exception could be caught.
 
@@ -269,7 +656,7 @@ def conversion_utility(
         input_file, output_directory, output_files=None, frames=None, output_format='SICD',
         row_limits=None, column_limits=None, max_block_size=None, check_older_version=False,
         preserve_nitf_information=False, check_existence=True,
-        dem_filename_pattern=None, dem_type=None, geoid_file=None):
+        dem_filename_pattern=None, dem_type=None, geoid_file=None, checkpoint=False, queue_depth=2):
     """
     Copy SAR complex data to a file of the specified format.
 
@@ -312,6 +699,14 @@ def conversion_utility(
         reference surface is not specified, then EGM2008 is assumed.
     geoid_file : str | None
         Optional Geoid file which might be needed when dem_filename_pattern is specified.
+    checkpoint : bool
+        Record the completed row blocks of each output file in a checkpoint file,
+        and resume any interrupted conversion with a matching checkpoint file?
+        Passed through to the Converter class.
+    queue_depth : int
+        The maximum number of blocks held between the pipelined read, convert,
+        and write stages, or `0` for sequential processing. Passed through to
+        :meth:`Converter.write_data`.
 
     Returns
     -------
@@ -481,5 +876,5 @@ def conversion_utility(
                 reader, output_directory, output_file=o_file, frame=frame,
                 row_limits=row_lims, col_limits=col_lims, output_format=output_format,
                 check_older_version=check_older_version,
-                check_existence=check_existence) as converter:
-            converter.write_data(max_block_size=max_block_size)
+                check_existence=check_existence, checkpoint=checkpoint) as converter:
+            converter.write_data(max_block_size=max_block_size, queue_depth=queue_depth)
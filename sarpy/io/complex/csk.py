@@ -38,6 +38,7 @@ from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.data_segment import HDF5DatasetSegment
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like, is_hdf5, h5py
+from sarpy.io.general.opener_signature import OpenerSignature
 from sarpy.io.complex.utils import fit_time_coa_polynomial, fit_position_xvalidation
 
 try:
@@ -678,13 +679,15 @@ class CSKReader(SICDTypeReader):
 
     __slots__ = ('_csk_details', )
 
-    def __init__(self, csk_details):
+    def __init__(self, csk_details, chunk_cache_bytes: Optional[int] = 32*1048576):
         """
 
         Parameters
         ----------
         csk_details : str|CSKDetails
             file name or CSKDetails object
+        chunk_cache_bytes : None|int
+            The size in bytes of the raw chunk cache for each dataset, if chunked.
         """
 
         if isinstance(csk_details, str):
@@ -696,23 +699,30 @@ class CSKReader(SICDTypeReader):
         sicd_data, shape_dict, dtype_dict, reverse_axes, transpose_axes = csk_details.get_sicd_collection()
         data_segments = []
         sicds = []
-        for band_name in sicd_data:
-            if self._csk_details.mission_id in ['CSK', 'KMPS']:
-                the_band = '{}/SBI'.format(band_name)
-            elif self._csk_details.mission_id == 'CSG':
-                the_band = '{}/IMG'.format(band_name)
-            else:
-                raise ValueError(_unhandled_id_text.format(self._csk_details.mission_id))
-
-            sicds.append(sicd_data[band_name])
-            basic_shape = shape_dict[band_name]
-            data_segments.append(
-                HDF5DatasetSegment(
-                    csk_details.file_name, the_band,
-                    formatted_dtype='complex64', formatted_shape=(basic_shape[1], basic_shape[0]),
-                    reverse_axes=reverse_axes, transpose_axes=transpose_axes,
-                    format_function=ComplexFormatFunction(raw_dtype=dtype_dict[band_name], order='IQ', band_dimension=2),
-                    close_file=True))
+        # NB: the segments share a single file object, closed by the final segment,
+        #   so it must be closed here if constructing any segment fails
+        file_object = h5py.File(csk_details.file_name, 'r')
+        try:
+            for i, band_name in enumerate(sicd_data):
+                if self._csk_details.mission_id in ['CSK', 'KMPS']:
+                    the_band = '{}/SBI'.format(band_name)
+                elif self._csk_details.mission_id == 'CSG':
+                    the_band = '{}/IMG'.format(band_name)
+                else:
+                    raise ValueError(_unhandled_id_text.format(self._csk_details.mission_id))
+
+                sicds.append(sicd_data[band_name])
+                basic_shape = shape_dict[band_name]
+                data_segments.append(
+                    HDF5DatasetSegment(
+                        file_object, the_band,
+                        formatted_dtype='complex64', formatted_shape=(basic_shape[1], basic_shape[0]),
+                        reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+                        format_function=ComplexFormatFunction(raw_dtype=dtype_dict[band_name], order='IQ', band_dimension=2),
+                        close_file=(i == len(sicd_data) - 1), chunk_cache_bytes=chunk_cache_bytes))
+        except Exception:
+            file_object.close()
+            raise
 
         SICDTypeReader.__init__(self, data_segments, sicds, close_segments=True)
         self._check_sizes()
@@ -733,6 +743,8 @@ class CSKReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(hdf5_keys=('Mission ID', 'Product Type'))
+
 
 def is_a(file_name: Union[str, BinaryIO]) -> Union[None, CSKReader]:
     """
@@ -22,6 +22,7 @@ from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.data_segment import DataSegment, NumpyMemmapSegment
 from sarpy.io.general.utils import is_file_like, MemMap
+from sarpy.io.general.opener_signature import OpenerSignature
 from sarpy.geometry.geocoords import geodetic_to_ecf, wgs_84_norm, ned_to_ecf
 
 from sarpy.io.complex.base import SICDTypeReader
@@ -1983,6 +1984,9 @@ class GFFReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(magic=(b'GSATIMG', ))
+
+
 def is_a(file_name: str) -> Optional[GFFReader]:
     """
     Tests whether a given file_name corresponds to a Cosmo Skymed file. Returns a reader instance, if so.
@@ -38,6 +38,7 @@ from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.data_segment import HDF5DatasetSegment, BandAggregateSegment
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like, is_hdf5, h5py
+from sarpy.io.general.opener_signature import OpenerSignature
 
 logger = logging.getLogger(__name__)
 
@@ -446,15 +447,44 @@ def get_iceye_data_segment(
         reverse_axes: Union[None, int, Sequence[int]],
         transpose_axes: Union[None, Tuple[int, ...]],
         real_group: str = 's_i',
-        imaginary_grop: str = 's_q') -> BandAggregateSegment:
-    real_dataset = HDF5DatasetSegment(
-        file_name, real_group, reverse_axes=reverse_axes, transpose_axes=transpose_axes, close_file=True)
-    imag_dataset = HDF5DatasetSegment(
-        file_name, imaginary_grop, reverse_axes=reverse_axes, transpose_axes=transpose_axes, close_file=True)
-    return BandAggregateSegment(
-        (real_dataset, imag_dataset), band_dimension=2,
-        formatted_dtype='complex64', formatted_shape=real_dataset.formatted_shape,
-        format_function=ComplexFormatFunction(real_dataset.formatted_dtype, order='IQ', band_dimension=-1))
+        imaginary_grop: str = 's_q',
+        chunk_cache_bytes: Optional[int] = 32*1048576) -> BandAggregateSegment:
+    """
+    Gets the data segment combining the real and imaginary datasets, which are
+    read through a single shared file object.
+
+    Parameters
+    ----------
+    file_name : str
+    reverse_axes : None|int|Sequence[int]
+    transpose_axes : None|Tuple[int, ...]
+    real_group : str
+    imaginary_grop : str
+    chunk_cache_bytes : None|int
+        The size in bytes of the raw chunk cache for each dataset, if chunked.
+
+    Returns
+    -------
+    BandAggregateSegment
+    """
+
+    file_object = h5py.File(file_name, 'r')
+    # NB: the children are closed in order, so the final child closes the shared file,
+    #   and it must be closed here if constructing any segment fails
+    try:
+        real_dataset = HDF5DatasetSegment(
+            file_object, real_group, reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+            close_file=False, chunk_cache_bytes=chunk_cache_bytes)
+        imag_dataset = HDF5DatasetSegment(
+            file_object, imaginary_grop, reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+            close_file=True, chunk_cache_bytes=chunk_cache_bytes)
+        return BandAggregateSegment(
+            (real_dataset, imag_dataset), band_dimension=2,
+            formatted_dtype='complex64', formatted_shape=real_dataset.formatted_shape,
+            format_function=ComplexFormatFunction(real_dataset.formatted_dtype, order='IQ', band_dimension=-1))
+    except Exception:
+        file_object.close()
+        raise
 
 
 class ICEYEReader(SICDTypeReader):
@@ -466,13 +496,15 @@ class ICEYEReader(SICDTypeReader):
 
     __slots__ = ('_iceye_details', )
 
-    def __init__(self, iceye_details):
+    def __init__(self, iceye_details, chunk_cache_bytes: Optional[int] = 32*1048576):
         """
 
         Parameters
         ----------
         iceye_details : str|ICEYEDetails
             file name or ICEYEDetails object
+        chunk_cache_bytes : None|int
+            The size in bytes of the raw chunk cache for each dataset, if chunked.
         """
 
         if isinstance(iceye_details, str):
@@ -482,7 +514,8 @@ class ICEYEReader(SICDTypeReader):
                             'filename or ICEYEDetails object')
         self._iceye_details = iceye_details
         sicd, reverse_axes, transpose_axes = iceye_details.get_sicd()
-        data_segment = get_iceye_data_segment(iceye_details.file_name, reverse_axes, transpose_axes)
+        data_segment = get_iceye_data_segment(
+            iceye_details.file_name, reverse_axes, transpose_axes, chunk_cache_bytes=chunk_cache_bytes)
 
         SICDTypeReader.__init__(self, data_segment, sicd, close_segments=True)
         self._check_sizes()
@@ -503,6 +536,9 @@ class ICEYEReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(hdf5_keys=('s_i', 's_q', 'satellite_name', 'product_name'))
+
+
 def is_a(file_name: str) -> Union[None, ICEYEReader]:
     """
     Tests whether a given file_name corresponds to a ICEYE file. Returns a reader instance, if so.
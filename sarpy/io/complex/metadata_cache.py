@@ -0,0 +1,307 @@
+"""
+A persistent on-disk cache of the sicd structure collection derived from the
+metadata of a vendor product, shared across reader instances, processes, and runs.
+
+This module introduced in version 1.3.83.
+"""
+
+__classification__ = "UNCLASSIFIED"
+__author__ = "Thomas McCullough"
+
+import hashlib
+import json
+import logging
+import os
+from tempfile import mkstemp
+from typing import Union, Optional, Sequence, Callable, List, Any
+
+from sarpy.__about__ import __version__
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value: Any) -> Any:
+    """
+    Encode a (possibly nested) collection of sicd structures, strings and
+    numbers as json compatible values.
+    """
+
+    if isinstance(value, SICDType):
+        return {'SICD': value.to_xml_string(check_validity=False)}
+    elif isinstance(value, tuple):
+        return {'tuple': [_encode(entry) for entry in value]}
+    elif isinstance(value, list):
+        return [_encode(entry) for entry in value]
+    elif value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    else:
+        raise TypeError('Cannot encode value of type {} in the sicd metadata cache'.format(type(value)))
+
+
+def _decode(value: Any) -> Any:
+    """
+    The inverse of :func:`_encode`.
+    """
+
+    if isinstance(value, dict):
+        if 'SICD' in value:
+            return SICDType.from_xml_string(value['SICD'])
+        elif 'tuple' in value:
+            return tuple(_decode(entry) for entry in value['tuple'])
+        else:
+            raise ValueError('Got unexpected sicd metadata cache entry with keys {}'.format(list(value.keys())))
+    elif isinstance(value, list):
+        return [_decode(entry) for entry in value]
+    else:
+        return value
+
+
+class SICDMetadataCache(object):
+    """
+    A cache of the sicd structure collection derived from the metadata files of
+    a vendor product, keyed by the reader type and the identity (path, size, and
+    modification time) of each metadata file, and the sarpy version. An entry
+    is only used if all of these match, so modifying any metadata file or
+    upgrading sarpy simply causes the collection to be derived again.
+
+    Each entry is a json file, either stored in the cache directory or, if no
+    directory is provided, as a sidecar file next to the first metadata file.
+    Entries are written to a temporary file which is atomically renamed into
+    place, and failure to read or write an entry is logged, rather than raised.
+
+    The sicd structures are stored as xml, and the xml round trip is not
+    numerically exact (unit vectors, for example, are renormalized). So that a
+    reader gets identical metadata whether or not the entry already existed,
+    :meth:`get_collection` always returns the collection decoded from the
+    stored form, even when it has just been derived.
+
+    Introduced in version 1.3.83.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from sarpy.io.complex.sentinel import SentinelReader
+        reader = SentinelReader('S1A_IW_SLC.SAFE', metadata_cache='/scratch/sarpy_metadata_cache')
+    """
+
+    suffix = '.sarpy_sicd.json'
+    __slots__ = ('_directory', )
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+
+        Parameters
+        ----------
+        directory : None|str
+            The cache directory, which will be created if it does not exist. If
+            `None`, entries are stored as sidecar files in the product directory.
+        """
+
+        self._directory = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._directory = os.path.abspath(directory)
+
+    @property
+    def directory(self) -> Optional[str]:
+        """
+        None|str: The cache directory, `None` for sidecar files.
+        """
+
+        return self._directory
+
+    @staticmethod
+    def get_fingerprint(source_files: Sequence[str]) -> List[list]:
+        """
+        Gets the identity of each source file, as `[path, size, modification time]`.
+
+        Parameters
+        ----------
+        source_files : Sequence[str]
+
+        Returns
+        -------
+        List[list]
+        """
+
+        out = []
+        for file_name in source_files:
+            stat = os.stat(file_name)
+            out.append([os.path.realpath(file_name), stat.st_size, stat.st_mtime_ns])
+        return out
+
+    def get_path(self, reader_type: str, source_files: Sequence[str]) -> str:
+        """
+        Gets the path of the cache entry for the given reader type and source files.
+
+        Parameters
+        ----------
+        reader_type : str
+        source_files : Sequence[str]
+
+        Returns
+        -------
+        str
+        """
+
+        if len(source_files) < 1:
+            raise ValueError('At least one source file is required')
+        if self.directory is None:
+            return os.path.realpath(source_files[0]) + '.' + reader_type + self.suffix
+        identity = '|'.join([reader_type, ] + [os.path.realpath(entry) for entry in source_files])
+        return os.path.join(self.directory, hashlib.sha256(identity.encode('utf-8')).hexdigest() + self.suffix)
+
+    def fetch(self, reader_type: str, source_files: Sequence[str]) -> Optional[Any]:
+        """
+        Fetch the cached collection for the given reader type and source files.
+
+        Parameters
+        ----------
+        reader_type : str
+        source_files : Sequence[str]
+
+        Returns
+        -------
+        None|Any
+            `None` if there is no valid entry.
+        """
+
+        path = self.get_path(reader_type, source_files)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'r') as fi:
+                entry = json.load(fi)
+            if entry.get('version') != __version__ or entry.get('reader') != reader_type or \
+                    entry.get('sources') != self.get_fingerprint(source_files):
+                logger.info('Sicd metadata cache entry {} is stale'.format(path))
+                return None
+            collection = _decode(entry['collection'])
+        except Exception as e:
+            logger.warning('Failed reading sicd metadata cache entry {} with error\n\t{}'.format(path, e))
+            return None
+        logger.debug('Using sicd metadata cache entry {}'.format(path))
+        return collection
+
+    def store(self, reader_type: str, source_files: Sequence[str], collection: Any) -> Optional[str]:
+        """
+        Store the collection for the given reader type and source files.
+
+        Parameters
+        ----------
+        reader_type : str
+        source_files : Sequence[str]
+        collection : Any
+            A (possibly nested) list or tuple of sicd structures, strings, and numbers.
+
+        Returns
+        -------
+        None|str
+            The path of the entry, or `None` if it could not be written.
+        """
+
+        try:
+            encoded = _encode(collection)
+        except Exception as e:
+            logger.warning('Failed encoding sicd metadata cache entry with error\n\t{}'.format(e))
+            return None
+        return self._store_encoded(reader_type, source_files, encoded)
+
+    def _store_encoded(self, reader_type: str, source_files: Sequence[str], encoded: Any) -> Optional[str]:
+        """
+        Store the already encoded collection for the given reader type and source files.
+
+        Parameters
+        ----------
+        reader_type : str
+        source_files : Sequence[str]
+        encoded : Any
+
+        Returns
+        -------
+        None|str
+        """
+
+        path = self.get_path(reader_type, source_files)
+        temp_path = None
+        try:
+            entry = {
+                'version': __version__,
+                'reader': reader_type,
+                'sources': self.get_fingerprint(source_files),
+                'collection': encoded}
+            fi, temp_path = mkstemp(suffix='.partial', dir=os.path.dirname(path))
+            with os.fdopen(fi, 'w') as fo:
+                json.dump(entry, fo)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning('Failed writing sicd metadata cache entry {} with error\n\t{}'.format(path, e))
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+        logger.info('Created sicd metadata cache entry {}'.format(path))
+        return path
+
+    def get_collection(
+            self,
+            reader_type: str,
+            source_files: Sequence[str],
+            derive: Callable[[], Any]) -> Any:
+        """
+        Gets the cached collection for the given reader type and source files,
+        deriving and storing it if there is no valid entry.
+
+        A newly derived collection is returned in its decoded stored form, so
+        the result is the same as a subsequent cache hit.
+
+        Parameters
+        ----------
+        reader_type : str
+        source_files : Sequence[str]
+        derive : Callable[[], Any]
+            Derives the collection from the source files.
+
+        Returns
+        -------
+        Any
+        """
+
+        collection = self.fetch(reader_type, source_files)
+        if collection is not None:
+            return collection
+
+        collection = derive()
+        try:
+            encoded = _encode(collection)
+        except Exception as e:
+            logger.warning('Failed encoding sicd metadata cache entry with error\n\t{}'.format(e))
+            return collection
+        self._store_encoded(reader_type, source_files, encoded)
+        return _decode(encoded)
+
+
+def get_metadata_cache(
+        metadata_cache: Union[None, str, SICDMetadataCache]) -> Optional[SICDMetadataCache]:
+    """
+    Validates the metadata cache argument of a reader.
+
+    Parameters
+    ----------
+    metadata_cache : None|str|SICDMetadataCache
+        The cache, or cache directory.
+
+    Returns
+    -------
+    None|SICDMetadataCache
+    """
+
+    if metadata_cache is None or isinstance(metadata_cache, SICDMetadataCache):
+        return metadata_cache
+    elif isinstance(metadata_cache, str):
+        return SICDMetadataCache(metadata_cache)
+    else:
+        raise TypeError(
+            'metadata_cache must be None, a directory name, or SICDMetadataCache instance. '
+            'Got type {}'.format(type(metadata_cache)))
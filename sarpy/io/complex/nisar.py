@@ -40,6 +40,7 @@ from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.data_segment import HDF5DatasetSegment
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like, is_hdf5, h5py
+from sarpy.io.general.opener_signature import OpenerSignature
 
 if h5py is None:
     h5pyFile = None
@@ -699,13 +700,18 @@ class NISARReader(SICDTypeReader):
 
     __slots__ = ('_nisar_details', )
 
-    def __init__(self, nisar_details: Union[str, NISARDetails]):
+    def __init__(
+            self,
+            nisar_details: Union[str, NISARDetails],
+            chunk_cache_bytes: Optional[int] = 32*1048576):
         """
 
         Parameters
         ----------
         nisar_details : str|NISARDetails
             file name or NISARDetails object
+        chunk_cache_bytes : None|int
+            The size in bytes of the raw chunk cache for each dataset, if chunked.
         """
 
         if isinstance(nisar_details, str):
@@ -717,24 +723,32 @@ class NISARReader(SICDTypeReader):
         sicd_data, shape_dict, reverse_axes, transpose_axes = nisar_details.get_sicd_collection()
         data_segments = []
         sicds = []
-        for band_name in sicd_data:
-            sicds.append(sicd_data[band_name])
-            raw_shape, raw_dtype = shape_dict[band_name]
-            formatted_shape = (raw_shape[1], raw_shape[0]) if transpose_axes is not None \
-                else raw_shape[:2]
-            if raw_dtype.name == 'complex64':
-                formatted_dtype = raw_dtype
-                format_function = None
-            else:
-                formatted_dtype = 'complex64'
-                format_function = ComplexFormatFunction(raw_dtype=raw_dtype, order='IQ', band_dimension=-1)
-
-            data_segments.append(
-                HDF5DatasetSegment(
-                    nisar_details.file_name, band_name,
-                    formatted_dtype=formatted_dtype, formatted_shape=formatted_shape,
-                    reverse_axes=reverse_axes, transpose_axes=transpose_axes,
-                    format_function=format_function, close_file=True))
+        # NB: the segments share a single file object, closed by the final segment,
+        #   so it must be closed here if constructing any segment fails
+        file_object = h5py.File(nisar_details.file_name, 'r')
+        try:
+            for i, band_name in enumerate(sicd_data):
+                sicds.append(sicd_data[band_name])
+                raw_shape, raw_dtype = shape_dict[band_name]
+                formatted_shape = (raw_shape[1], raw_shape[0]) if transpose_axes is not None \
+                    else raw_shape[:2]
+                if raw_dtype.name == 'complex64':
+                    formatted_dtype = raw_dtype
+                    format_function = None
+                else:
+                    formatted_dtype = 'complex64'
+                    format_function = ComplexFormatFunction(raw_dtype=raw_dtype, order='IQ', band_dimension=-1)
+
+                data_segments.append(
+                    HDF5DatasetSegment(
+                        file_object, band_name,
+                        formatted_dtype=formatted_dtype, formatted_shape=formatted_shape,
+                        reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+                        format_function=format_function, close_file=(i == len(sicd_data) - 1),
+                        chunk_cache_bytes=chunk_cache_bytes))
+        except Exception:
+            file_object.close()
+            raise
 
         SICDTypeReader.__init__(self, data_segments, sicds, close_segments=True)
         self._check_sizes()
@@ -755,6 +769,8 @@ class NISARReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(hdf5_keys=('science', ))
+
 
 def is_a(file_name: str) -> Optional[NISARReader]:
     """
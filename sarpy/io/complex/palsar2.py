@@ -20,6 +20,7 @@ from sarpy.io.general.data_segment import DataSegment, NumpyMemmapSegment, \
     SubsetSegment, BandAggregateSegment
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like
+from sarpy.io.general.opener_signature import OpenerSignature
 
 from sarpy.io.complex.base import SICDTypeReader
 from sarpy.io.complex.sicd_elements.blocks import Poly1DType, Poly2DType
@@ -40,6 +41,7 @@ from sarpy.io.complex.sicd_elements.Radiometric import RadiometricType
 from sarpy.io.complex.sicd_elements.ErrorStatistics import ErrorStatisticsType, \
     ErrorComponentsType, RadarSensorErrorType, PosVelErrType
 from sarpy.io.complex.utils import two_dim_poly_fit, fit_position_xvalidation
+from sarpy.io.complex.metadata_cache import SICDMetadataCache, get_metadata_cache
 
 logger = logging.getLogger(__name__)
 
@@ -1589,26 +1591,55 @@ class PALSARDetails(object):
         sicd.derive()
         return sicd
 
-    def get_sicd_collection(self) -> List[SICDType]:
+    def get_metadata_files(self) -> List[str]:
+        """
+        Gets the files from which the sicd collection is derived, i.e. the IMG
+        files (in the order of the img elements), and the LED, TRL and VOL files.
+
+        Returns
+        -------
+        List[str]
+        """
+
+        out = [entry.file_name for entry in self._img_elements]
+        out.extend(
+            entry.file_name for entry in [self._led_element, self._trl_element, self._vol_element]
+            if entry is not None)
+        return out
+
+    def get_sicd_collection(
+            self,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None) -> List[SICDType]:
         """
         Gets the sicd structure collection.
 
+        Parameters
+        ----------
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
+
         Returns
         -------
         List[SICDType]
         """
 
-        # get the polarizations
-        tx_pols = []
-        tx_rcv_pols = []
-        for entry in self._img_elements:
-            txp, rcvp = entry.get_polarizations()
-            if txp is None:
-                raise ValueError('Got no polarization from IMG file {}'.format(entry.file_name))
-            tx_pols.append(txp)
-            tx_rcv_pols.append('{}:{}'.format(txp, rcvp))
+        def derive():
+            # get the polarizations
+            tx_pols = []
+            tx_rcv_pols = []
+            for entry in self._img_elements:
+                txp, rcvp = entry.get_polarizations()
+                if txp is None:
+                    raise ValueError('Got no polarization from IMG file {}'.format(entry.file_name))
+                tx_pols.append(txp)
+                tx_rcv_pols.append('{}:{}'.format(txp, rcvp))
+
+            return [self._get_sicd(index, tx_pols, tx_rcv_pols) for index, _ in enumerate(self._img_elements)]
 
-        return [self._get_sicd(index, tx_pols, tx_rcv_pols) for index, _ in enumerate(self._img_elements)]
+        metadata_cache = get_metadata_cache(metadata_cache)
+        if metadata_cache is None:
+            return derive()
+        return metadata_cache.get_collection('PALSARReader', self.get_metadata_files(), derive)
 
 
 class PALSARReader(SICDTypeReader):
@@ -1621,13 +1652,18 @@ class PALSARReader(SICDTypeReader):
     __slots__ = (
         '_palsar_details', )
 
-    def __init__(self, palsar_details):
+    def __init__(
+            self,
+            palsar_details,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None):
         """
 
         Parameters
         ----------
         palsar_details : str|PALSARDetails
             Path name to file package or palsar details object.
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
         """
 
         if isinstance(palsar_details, str):
@@ -1638,7 +1674,7 @@ class PALSARReader(SICDTypeReader):
                 'filename or PALSARDetails object')
         self._palsar_details = palsar_details  # type: PALSARDetails
 
-        sicds = self._palsar_details.get_sicd_collection()
+        sicds = self._palsar_details.get_sicd_collection(metadata_cache=metadata_cache)
         data_segments = []
         data_sizes = []
         for sicd, img_details in zip(sicds, self._palsar_details.img_elements):
@@ -1655,6 +1691,8 @@ class PALSARReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(manifest_names=('IMG-*', ))
+
 
 def is_a(file_name: str) -> Optional[PALSARReader]:
     """
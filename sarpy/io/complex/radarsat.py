@@ -39,11 +39,13 @@ from sarpy.io.complex.sicd_elements.RMA import RMAType, INCAType
 from sarpy.io.complex.sicd_elements.SCPCOA import SCPCOAType
 from sarpy.io.complex.sicd_elements.Radiometric import RadiometricType, NoiseLevelType_
 from sarpy.io.complex.utils import fit_time_coa_polynomial, fit_position_xvalidation
+from sarpy.io.complex.metadata_cache import SICDMetadataCache, get_metadata_cache
 
 from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.data_segment import DataSegment
-from sarpy.io.general.tiff import NativeTiffDataSegment
+from sarpy.io.general.tiff import get_tiff_data_segment
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like
+from sarpy.io.general.opener_signature import OpenerSignature
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +105,8 @@ def _construct_tiff_segment(
         the_sicd: SICDType,
         the_file: str,
         reverse_axes: Union[None, int, Sequence[int]] = None,
-        transpose_axes: Union[None, Tuple[int, ...]] = None):
+        transpose_axes: Union[None, Tuple[int, ...]] = None,
+        max_workers: int = 1):
     """
 
     Parameters
@@ -112,13 +115,16 @@ def _construct_tiff_segment(
     the_file : str
     reverse_axes : None|Tuple[int, ...]
     transpose_axes : None|Tuple[int, ...]
+    max_workers : int
+        The maximum number of threads used to decode tiles or strips concurrently.
 
     Returns
     -------
-    NativeTiffDataSegment
+    NativeTiffDataSegment|TiledTiffDataSegment
     """
 
-    segment = NativeTiffDataSegment(the_file, reverse_axes=reverse_axes, transpose_axes=transpose_axes)
+    segment = get_tiff_data_segment(
+        the_file, reverse_axes=reverse_axes, transpose_axes=transpose_axes, max_workers=max_workers)
     _validate_segment_and_sicd(the_sicd, segment, 'tiff', the_file)
     return segment
 
@@ -1534,28 +1540,64 @@ class RadarSatDetails(object):
             the_sicds.append(this_sicd)
         return the_sicds, the_files
 
-    def get_sicd_collection(self) -> Tuple[List[List[SICDType]], List[List[str]]]:
+    def get_metadata_files(self) -> List[str]:
+        """
+        Gets the metadata files from which the sicd collection is derived, i.e.
+        the product.xml, and the xml files (lookup tables and noise levels) in
+        its directory and calibration subdirectory.
+
+        Returns
+        -------
+        List[str]
+        """
+
+        out = [self.file_name, ]
+        base_path = os.path.dirname(self.file_name)
+        for the_dir in [base_path, os.path.join(base_path, 'calibration')]:
+            if not os.path.isdir(the_dir):
+                continue
+            for fil in sorted(os.listdir(the_dir)):
+                full_file = os.path.join(the_dir, fil)
+                if fil != 'product.xml' and os.path.splitext(fil)[1] == '.xml' and os.path.isfile(full_file):
+                    out.append(full_file)
+        return out
+
+    def get_sicd_collection(
+            self,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None) -> Tuple[
+                List[List[SICDType]], List[List[str]]]:
         """
         Gets the collection of sicd objects.
 
+        Parameters
+        ----------
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
+
         Returns
         -------
         sicds: List[List[SICDType]]
         files: List[List[str]]
         """
 
-        sicds = []
-        data_files = []
-        if self._bursts is None:
-            t_sicds, t_files = self._get_regular_sicd()
-            sicds.append(t_sicds)
-            data_files.append(t_files)
-        else:
-            for (beam, burst) in self._bursts:
-                t_sicds, t_files = self._get_scansar_sicd(beam, burst)
+        def derive():
+            sicds = []
+            data_files = []
+            if self._bursts is None:
+                t_sicds, t_files = self._get_regular_sicd()
                 sicds.append(t_sicds)
                 data_files.append(t_files)
-        return sicds, data_files
+            else:
+                for (beam, burst) in self._bursts:
+                    t_sicds, t_files = self._get_scansar_sicd(beam, burst)
+                    sicds.append(t_sicds)
+                    data_files.append(t_files)
+            return sicds, data_files
+
+        metadata_cache = get_metadata_cache(metadata_cache)
+        if metadata_cache is None:
+            return derive()
+        return metadata_cache.get_collection('RadarSatReader', self.get_metadata_files(), derive)
 
 
 ##############
@@ -1571,13 +1613,22 @@ class RadarSatReader(SICDTypeReader):
 
     __slots__ = ('_radar_sat_details', '_other_reader')
 
-    def __init__(self, radar_sat_details):
+    def __init__(
+            self,
+            radar_sat_details,
+            max_workers: int = 1,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None):
         """
 
         Parameters
         ----------
         radar_sat_details : str|RadarSatDetails
             file name or RadarSatDetails object
+        max_workers : int
+            The maximum number of threads used to decode tiles or strips
+            concurrently, for a tiled or compressed tiff file.
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
         """
 
         self._other_reader = None
@@ -1590,11 +1641,12 @@ class RadarSatReader(SICDTypeReader):
         # determine symmetry
         reverse_axes, transpose_axes = self._radar_sat_details.get_symmetry()
         # get the sicd collection and data file names
-        the_sicds, the_files = self.radarsat_details.get_sicd_collection()
+        the_sicds, the_files = self.radarsat_details.get_sicd_collection(metadata_cache=metadata_cache)
         use_sicds = []
         the_segments = []
         for sicd_entry, file_entry in zip(the_sicds, the_files):
-            the_segments.extend(self._construct_segments(sicd_entry, file_entry, reverse_axes, transpose_axes))
+            the_segments.extend(
+                self._construct_segments(sicd_entry, file_entry, reverse_axes, transpose_axes, max_workers))
             use_sicds.extend(sicd_entry)
 
         SICDTypeReader.__init__(self, the_segments, use_sicds, close_segments=True)
@@ -1605,7 +1657,8 @@ class RadarSatReader(SICDTypeReader):
             sicds: List[SICDType],
             data_files: List[str],
             reverse_axes: Optional[Tuple[int, ...]],
-            transpose_axes: Optional[Tuple[int, ...]]) -> List[DataSegment]:
+            transpose_axes: Optional[Tuple[int, ...]],
+            max_workers: int = 1) -> List[DataSegment]:
         """
         Construct the data segments.
 
@@ -1615,6 +1668,7 @@ class RadarSatReader(SICDTypeReader):
         data_files : List[str]
         reverse_axes : None|Tuple[int, ...]
         transpose_axes : None|Tuple[int, ...]
+        max_workers : int
 
         Returns
         -------
@@ -1626,7 +1680,8 @@ class RadarSatReader(SICDTypeReader):
             for sicd, data_file in zip(sicds, data_files):
                 fext = os.path.splitext(data_file)[1]
                 if fext in ['.tiff', '.tif']:
-                    data_segments.append(_construct_tiff_segment(sicd, data_file, reverse_axes, transpose_axes))
+                    data_segments.append(
+                        _construct_tiff_segment(sicd, data_file, reverse_axes, transpose_axes, max_workers))
                 elif fext in ['.nitf', '.ntf']:
                     reader, segment = _construct_single_nitf_segment(sicd, data_file, reverse_axes, transpose_axes)
                     self._other_reader = reader  # NB: maintain reference, to keep segment open
@@ -1672,6 +1727,9 @@ class RadarSatReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(file_names=('product.xml', ), manifest_names=('product.xml', 'metadata'))
+
+
 def is_a(file_name: str) -> Optional[RadarSatReader]:
     """
     Tests whether a given file_name corresponds to a RadarSat file. Returns a reader instance, if so.
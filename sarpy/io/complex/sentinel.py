@@ -8,6 +8,7 @@ __author__ = ("Thomas McCullough", "Daniel Haverporth")
 
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from xml.etree import ElementTree
 from typing import List, Tuple, Union, Optional
@@ -35,11 +36,13 @@ from sarpy.io.complex.sicd_elements.ImageFormation import ImageFormationType, Rc
 from sarpy.io.complex.sicd_elements.RMA import RMAType, INCAType
 from sarpy.io.complex.sicd_elements.Radiometric import RadiometricType, NoiseLevelType_
 from sarpy.io.complex.utils import two_dim_poly_fit, get_im_physical_coords
+from sarpy.io.complex.metadata_cache import SICDMetadataCache, get_metadata_cache
 
 from sarpy.io.general.base import BaseReader, SarpyIOError
 from sarpy.io.general.data_segment import SubsetSegment
-from sarpy.io.general.tiff import TiffDetails, NativeTiffDataSegment
+from sarpy.io.general.tiff import NativeTiffDataSegment, TiledTiffDataSegment, get_tiff_data_segment
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like
+from sarpy.io.general.opener_signature import OpenerSignature
 
 logger = logging.getLogger(__name__)
 
@@ -989,10 +992,62 @@ class SentinelDetails(object):
                 sicd.derive()
                 sicd.populate_rniirs(override=False)
 
-    def get_sicd_collection(self) -> List[Tuple[str, Union[SICDType, List[SICDType]]]]:
+    def _get_file_set_sicds(self, file_set: dict) -> Tuple[str, Union[SICDType, List[SICDType]]]:
+        """
+        Get the data file location and corresponding sicd collection for the given
+        measurement data unit file set.
+
+        Parameters
+        ----------
+        file_set : dict
+
+        Returns
+        -------
+        Tuple[str, SICDType|List[SICDType]]
+        """
+
+        # get the sicd collection for each product
+        sicds = self._parse_product_sicd(file_set['product'])
+        # refine our sicds(s) using the calibration data (if sensible)
+        self._refine_using_calibration(file_set['calibration'], sicds)
+        # refine our sicd(s) using the noise data (if sensible)
+        self._refine_using_noise(file_set['noise'], sicds)
+        # populate our derived fields for the sicds
+        self._derive(sicds)
+        return file_set['data'], sicds
+
+    def get_metadata_files(self) -> List[str]:
+        """
+        Gets the metadata files from which the sicd collection is derived, i.e.
+        the manifest.safe, and the product, calibration, and noise files of each
+        measurement data unit.
+
+        Returns
+        -------
+        List[str]
+        """
+
+        out = [self._file_name, ]
+        for file_set in self._get_file_sets():
+            out.extend(file_set[key] for key in ['product', 'calibration', 'noise'] if file_set[key] is not None)
+        return out
+
+    def get_sicd_collection(
+            self,
+            max_workers: int = 1,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None) -> List[
+                Tuple[str, Union[SICDType, List[SICDType]]]]:
         """
         Get the data file location(s) and corresponding sicd collection for each file.
 
+        Parameters
+        ----------
+        max_workers : int
+            The maximum number of processes used to derive the sicd collections
+            of the files (i.e. swaths and polarizations) concurrently.
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
+
         Returns
         -------
         List[Tuple[str, SICDType|List[SICDType]]]
@@ -1001,18 +1056,70 @@ class SentinelDetails(object):
             or a list of `SICDType` (TOPSAR with multiple bursts).
         """
 
-        out = []
-        for entry in self._get_file_sets():
-            # get the sicd collection for each product
-            sicds = self._parse_product_sicd(entry['product'])
-            # refine our sicds(s) using the calibration data (if sensible)
-            self._refine_using_calibration(entry['calibration'], sicds)
-            # refine our sicd(s) using the noise data (if sensible)
-            self._refine_using_noise(entry['noise'], sicds)
-            # populate our derived fields for the sicds
-            self._derive(sicds)
-            out.append((entry['data'], sicds))
-        return out
+        max_workers = int(max_workers)
+        if max_workers < 1:
+            raise ValueError('max_workers must be a positive integer')
+
+        def derive():
+            if max_workers == 1 or len(file_sets) < 2:
+                return [self._get_file_set_sicds(entry) for entry in file_sets]
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(file_sets))) as executor:
+                return list(executor.map(
+                    _get_file_set_sicds, [self.file_name, ]*len(file_sets), file_sets))
+
+        file_sets = self._get_file_sets()
+        metadata_cache = get_metadata_cache(metadata_cache)
+        if metadata_cache is None:
+            return derive()
+        return metadata_cache.get_collection('SentinelReader', self.get_metadata_files(), derive)
+
+
+def _get_file_set_sicds(file_name: str, file_set: dict) -> Tuple[str, Union[SICDType, List[SICDType]]]:
+    """
+    Process pool helper for :meth:`SentinelDetails.get_sicd_collection`.
+    """
+
+    return SentinelDetails(file_name)._get_file_set_sicds(file_set)
+
+
+def _get_burst_definitions(
+        sicd_collection: List[Tuple[str, Union[SICDType, List[SICDType]]]]) -> List[
+            Tuple[str, SICDType, Optional[Tuple[int, int]]]]:
+    """
+    Flattens the sicd collection into the data file, sicd, and (formatted) column
+    limits within the data file for each image. The column limits are `None` when
+    the image is the entire data file.
+
+    Parameters
+    ----------
+    sicd_collection : List[Tuple[str, SICDType|List[SICDType]]]
+
+    Returns
+    -------
+    List[Tuple[str, SICDType, None|Tuple[int, int]]]
+    """
+
+    out = []
+    for data_file, sicds in sicd_collection:
+        if isinstance(sicds, SICDType):
+            out.append((data_file, sicds, None))
+        elif len(sicds) == 1:
+            out.append((data_file, sicds[0], None))
+        else:
+            begin_col = 0
+            for sicd in sicds:
+                end_col = begin_col + sicd.ImageData.NumCols
+                out.append((data_file, sicd, (begin_col, end_col)))
+                begin_col = end_col
+    return out
+
+
+def _get_data_segment(
+        data_file: str,
+        max_decode_workers: int = 1) -> Union[NativeTiffDataSegment, TiledTiffDataSegment]:
+    # NB: the transpose is true for all Sentinel-1 data
+    return get_tiff_data_segment(
+        data_file, reverse_axes=None, transpose_axes=(1, 0, 2), max_workers=max_decode_workers)
 
 
 class SentinelReader(SICDTypeReader):
@@ -1024,12 +1131,24 @@ class SentinelReader(SICDTypeReader):
 
     __slots__ = ('_sentinel_details', '_parent_segments')
 
-    def __init__(self, sentinel_details: Union[str, SentinelDetails]):
+    def __init__(
+            self,
+            sentinel_details: Union[str, SentinelDetails],
+            max_workers: int = 1,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None,
+            max_decode_workers: int = 1):
         """
 
         Parameters
         ----------
         sentinel_details : str|SentinelDetails
+        max_workers : int
+            The maximum number of processes used to derive the sicd collection.
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
+        max_decode_workers : int
+            The maximum number of threads used to decode tiles or strips
+            concurrently, for a tiled or compressed tiff file.
         """
 
         if isinstance(sentinel_details, str):
@@ -1039,38 +1158,25 @@ class SentinelReader(SICDTypeReader):
 
         self._sentinel_details = sentinel_details  # type: SentinelDetails
 
-        reverse_axes = None
-        transpose_axes = (1, 0, 2)  # True for all Sentinel-1 data
-
-        parent_segments = []
+        parent_segments = {}
         segments = []
-        sicd_collection = self._sentinel_details.get_sicd_collection()
+        sicd_collection = self._sentinel_details.get_sicd_collection(
+            max_workers=max_workers, metadata_cache=metadata_cache)
         sicd_collection_out = []
-        for data_file, sicds in sicd_collection:
-            tiff_details = TiffDetails(data_file)
-            if isinstance(sicds, SICDType):
-                segments.append(
-                    NativeTiffDataSegment(
-                        tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes))
-                sicd_collection_out.append(sicds)
-            elif len(sicds) == 1:
-                segments.append(
-                    NativeTiffDataSegment(
-                        tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes))
-                sicd_collection_out.append(sicds[0])
+        for data_file, sicd, column_limits in _get_burst_definitions(sicd_collection):
+            if column_limits is None:
+                segments.append(_get_data_segment(data_file, max_decode_workers=max_decode_workers))
             else:
-                p_segment = NativeTiffDataSegment(
-                    tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes)
-                parent_segments.append(p_segment)
-                begin_col = 0
-                for sicd in sicds:
-                    end_col = begin_col + sicd.ImageData.NumCols
-                    subet_def = (slice(0, tiff_details.tags['ImageWidth'], 1), slice(begin_col, end_col, 1))
-                    segments.append(SubsetSegment(p_segment, subet_def, 'formatted', close_parent=False))
-                    begin_col = end_col
-                    sicd_collection_out.append(sicd)
-
-        self._parent_segments = parent_segments  # type: List[NativeTiffDataSegment]
+                p_segment = parent_segments.get(data_file, None)
+                if p_segment is None:
+                    p_segment = _get_data_segment(data_file, max_decode_workers=max_decode_workers)
+                    parent_segments[data_file] = p_segment
+                subset_def = (slice(0, p_segment.formatted_shape[0], 1), slice(column_limits[0], column_limits[1], 1))
+                segments.append(SubsetSegment(p_segment, subset_def, 'formatted', close_parent=False))
+            sicd_collection_out.append(sicd)
+        parent_segments = list(parent_segments.values())
+
+        self._parent_segments = parent_segments  # type: List[Union[NativeTiffDataSegment, TiledTiffDataSegment]]
         SICDTypeReader.__init__(self, segments, sicd_collection_out, close_segments=True)
         self._check_sizes()
 
@@ -1099,9 +1205,101 @@ class SentinelReader(SICDTypeReader):
             self._parent_segments = None
 
 
+def _convert_burst(
+        data_file: str,
+        sicd: SICDType,
+        column_limits: Optional[Tuple[int, int]],
+        output_directory: str,
+        output_file: str,
+        check_existence: bool,
+        max_block_size: Optional[int]) -> str:
+    """
+    Process pool helper for :func:`convert_bursts_to_sicd`, which converts the
+    single image without deriving the sicd collection for the entire product.
+    """
+
+    from sarpy.io.complex.converter import conversion_utility
+
+    segment = _get_data_segment(data_file)
+    if column_limits is not None:
+        subset_def = (slice(0, segment.formatted_shape[0], 1), slice(column_limits[0], column_limits[1], 1))
+        segment = SubsetSegment(segment, subset_def, 'formatted', close_parent=True)
+    reader = SICDTypeReader(segment, sicd, close_segments=True)
+    try:
+        conversion_utility(
+            reader, output_directory, output_files=output_file, frames=0,
+            max_block_size=max_block_size, check_existence=check_existence)
+    finally:
+        reader.close()
+    return os.path.join(output_directory, output_file)
+
+
+def convert_bursts_to_sicd(
+        file_name: Union[str, SentinelDetails],
+        output_directory: str,
+        max_workers: Optional[int] = None,
+        check_existence: bool = True,
+        max_block_size: Optional[int] = None,
+        metadata_cache: Union[None, str, SICDMetadataCache] = None) -> List[str]:
+    """
+    Converts every image (i.e. each burst of each swath and polarization, for a
+    TOPSAR collect) of the Sentinel-1 SLC product to a SICD file, using a process
+    pool both to derive the sicd collection and to convert the images concurrently.
+
+    The output files are named as they would be by
+    :func:`sarpy.io.complex.converter.conversion_utility` for the
+    :class:`SentinelReader`.
+
+    Parameters
+    ----------
+    file_name : str|SentinelDetails
+    output_directory : str
+        The output directory. **This must exist.**
+    max_workers : None|int
+        The maximum number of processes, defaulting to the number of processors.
+    check_existence : bool
+        Check for the existence of any possibly overwritten file?
+    max_block_size : None|int
+        (nominal) maximum block size in bytes for each conversion.
+    metadata_cache : None|str|SICDMetadataCache
+        The cache (or cache directory) of previously derived sicd collections.
+
+    Returns
+    -------
+    List[str]
+        The output file paths, in the order of the images of the :class:`SentinelReader`.
+    """
+
+    if isinstance(file_name, str):
+        file_name = SentinelDetails(file_name)
+    if not isinstance(file_name, SentinelDetails):
+        raise TypeError('file_name must be a file name or SentinelDetails object.')
+    if not os.path.isdir(output_directory):
+        raise SarpyIOError('output directory {} must exist.'.format(output_directory))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = int(max_workers)
+    if max_workers < 1:
+        raise ValueError('max_workers must be a positive integer')
+
+    definitions = _get_burst_definitions(
+        file_name.get_sicd_collection(max_workers=max_workers, metadata_cache=metadata_cache))
+    arguments = [
+        (data_file, sicd, column_limits, output_directory,
+         sicd.get_suggested_name(index+1)+'_SICD', check_existence, max_block_size)
+        for index, (data_file, sicd, column_limits) in enumerate(definitions)]
+    if max_workers == 1 or len(arguments) < 2:
+        return [_convert_burst(*entry) for entry in arguments]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(arguments))) as executor:
+        return list(executor.map(_convert_burst, *zip(*arguments)))
+
+
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(file_names=('manifest.safe', ), manifest_names=('manifest.safe', ))
+
+
 def is_a(file_name: str) -> Optional[SentinelReader]:
     """
     Tests whether a given file_name corresponds to a Sentinel file. Returns a reader instance, if so.
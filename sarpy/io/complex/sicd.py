@@ -30,6 +30,7 @@ from sarpy.io.general.nitf_elements.security import NITFSecurityTags
 from sarpy.io.general.nitf_elements.image import ImageSegmentHeader, \
     ImageSegmentHeader0, ImageBands, ImageBand
 from sarpy.io.general.utils import is_file_like
+from sarpy.io.general.opener_signature import OpenerSignature
 
 from sarpy.io.xml.base import parse_xml_from_string
 
@@ -41,7 +42,16 @@ logger = logging.getLogger(__name__)
 
 
 class AmpLookupFunction(ComplexFormatFunction):
-    __slots__ = ('_magnitude_lookup_table', )
+    """
+    Format function for SICD `AMP8I_PHS8I` pixel type data, consisting of
+    amplitude lookup table index and phase pairs.
+
+    Decoding is a single gather from a fused 256x256 complex lookup table of
+    amplitude index and phase. Encoding finds the nearest amplitude table entry
+    by a vectorized binary search.
+    """
+
+    __slots__ = ('_magnitude_lookup_table', '_complex_lookup_table', '_sorted_magnitudes', '_sort_order')
     _allowed_ordering = ('MP', )
 
     def __init__(
@@ -72,6 +82,9 @@ class AmpLookupFunction(ComplexFormatFunction):
             self, raw_dtype, 'MP', raw_shape=raw_shape, formatted_shape=formatted_shape,
             reverse_axes=reverse_axes, transpose_axes=transpose_axes, band_dimension=band_dimension)
         self._magnitude_lookup_table = None
+        self._complex_lookup_table = None
+        self._sorted_magnitudes = None
+        self._sort_order = None
         self.set_magnitude_lookup(magnitude_lookup_table)
 
     @property
@@ -86,6 +99,19 @@ class AmpLookupFunction(ComplexFormatFunction):
 
         return self._magnitude_lookup_table
 
+    @property
+    def complex_lookup_table(self) -> numpy.ndarray:
+        """
+        The fused complex64 lookup table of shape `(256, 256)`, indexed as
+        `[phase, amplitude index]`.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        return self._complex_lookup_table
+
     def set_magnitude_lookup(self, lookup_table: numpy.ndarray) -> None:
         if not isinstance(lookup_table, numpy.ndarray):
             raise ValueError('requires a numpy.ndarray, got {}'.format(type(lookup_table)))
@@ -103,16 +129,63 @@ class AmpLookupFunction(ComplexFormatFunction):
                 'but the raw datatype is not `uint8`.')
         self._magnitude_lookup_table = lookup_table
 
-    def _forward_magnitude_theta(
+        # NB: the flat index (phase << 8) | amplitude index is exactly the
+        #   little-endian uint16 interpretation of an (amplitude, phase) byte pair
+        theta = numpy.arange(256, dtype='float64')*(2*numpy.pi/256)
+        self._complex_lookup_table = numpy.cast['complex64'](
+            numpy.exp(1j*theta)[:, numpy.newaxis]*lookup_table[numpy.newaxis, :].astype('float64'))
+        self._sort_order = numpy.argsort(lookup_table, kind='stable')
+        self._sorted_magnitudes = lookup_table[self._sort_order]
+
+    def _forward_functional_step_into(
             self,
             data: numpy.ndarray,
-            out: numpy.ndarray,
-            magnitude: numpy.ndarray,
-            theta: numpy.ndarray,
-            subscript: Tuple[slice, ...]) -> None:
-        magnitude = self.magnitude_lookup_table[magnitude]
-        ComplexFormatFunction._forward_magnitude_theta(
-            self, data, out, magnitude, theta, subscript)
+            subscript: Tuple[slice, ...],
+            out: numpy.ndarray) -> None:
+        out = self._get_output_view(data, out)
+        flat_table = numpy.reshape(self._complex_lookup_table, (-1, ))
+
+        if self.band_dimension == data.ndim - 1:
+            try:
+                indices = data.view('<u2')
+            except ValueError:
+                # the final dimension is not contiguous
+                indices = None
+            if indices is not None:
+                if self.formatted_ndim < self.raw_ndim:
+                    indices = indices[..., 0]
+                numpy.take(flat_table, indices, out=out, mode='clip')
+                return
+
+        for data_slice, out_slice in self._get_chunks(data):
+            amplitude, phase = self._get_pair_views(data[data_slice])
+            indices = numpy.left_shift(phase, 8, dtype='uint16')
+            indices |= amplitude
+            numpy.take(flat_table, indices, out=out[out_slice], mode='clip')
+
+    def _get_amplitude_indices(self, magnitude: numpy.ndarray) -> numpy.ndarray:
+        """
+        Finds the index of the nearest magnitude lookup table entry for each
+        given magnitude.
+
+        Parameters
+        ----------
+        magnitude : numpy.ndarray
+
+        Returns
+        -------
+        numpy.ndarray
+            Of dtype `uint8`.
+        """
+
+        sorted_magnitudes = self._sorted_magnitudes
+        upper = numpy.searchsorted(sorted_magnitudes, magnitude, side='left')
+        numpy.clip(upper, 1, sorted_magnitudes.size - 1, out=upper)
+        lower = upper - 1
+        # choose the lower neighbor where it is at least as close
+        use_lower = (magnitude - sorted_magnitudes[lower]) <= (sorted_magnitudes[upper] - magnitude)
+        nearest = numpy.where(use_lower, lower, upper)
+        return self._sort_order[nearest].astype('uint8')
 
     def _reverse_magnitude_theta(
             self,
@@ -122,10 +195,9 @@ class AmpLookupFunction(ComplexFormatFunction):
             theta: numpy.ndarray,
             slice0: Tuple[slice, ...],
             slice1: Tuple[slice, ...]) -> None:
-        magnitude = numpy.digitize(
-            numpy.round(magnitude.ravel()), self.magnitude_lookup_table, right=False).reshape(data.shape)
-
-        ComplexFormatFunction._reverse_magnitude_theta(self, data, out, magnitude, theta, slice0, slice1)
+        out[slice0] = self._get_amplitude_indices(magnitude)
+        theta *= 256/(2*numpy.pi)
+        out[slice1] = numpy.round(theta).astype('int64') % 256
 
 
 class SICDDetails(NITFDetails):
@@ -415,6 +487,9 @@ class SICDReader(NITFReader, SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(magic=(b'NITF', ))
+
+
 def is_a(file_name: Union[str, BinaryIO]) -> Optional[SICDReader]:
     """
     Tests whether a given file_name corresponds to a SICD file, and returns
@@ -863,7 +938,10 @@ class SICDWriter(NITFWriter):
             sicd_meta: Optional[SICDType] = None,
             sicd_writing_details: Optional[SICDWritingDetails] = None,
             check_older_version: bool = False,
-            check_existence: bool = True):
+            check_existence: bool = True,
+            max_workers: int = 1,
+            streaming: bool = False,
+            max_buffer_bytes: int = 268435456):
         """
 
         Parameters
@@ -876,6 +954,15 @@ class SICDWriter(NITFWriter):
             NGA applications like SOCET or RemoteView
         check_existence : bool
             Should we check if the given file already exists?
+        max_workers : int
+            The number of threads used to write image data.
+        streaming : bool
+            Write the file strictly sequentially, permitting a non-seekable
+            output like a pipe or upload stream. The image data must be written
+            in full width row stripes, which are output in row order.
+        max_buffer_bytes : int
+            For streaming, the maximum size of the image data held in memory
+            while awaiting the preceding image data.
         """
 
         if sicd_meta is None and sicd_writing_details is None:
@@ -883,7 +970,8 @@ class SICDWriter(NITFWriter):
         if sicd_writing_details is None:
             sicd_writing_details = SICDWritingDetails(sicd_meta, check_older_version=check_older_version)
         NITFWriter.__init__(
-            self, file_object, sicd_writing_details, check_existence=check_existence)
+            self, file_object, sicd_writing_details, check_existence=check_existence,
+            max_workers=max_workers, streaming=streaming, max_buffer_bytes=max_buffer_bytes)
 
     @property
     def nitf_writing_details(self) -> SICDWritingDetails:
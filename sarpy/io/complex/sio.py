@@ -25,6 +25,7 @@ from sarpy.io.general.base import BaseWriter, SarpyIOError
 from sarpy.io.general.data_segment import NumpyArraySegment, NumpyMemmapSegment
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.utils import is_file_like, is_real_file
+from sarpy.io.general.opener_signature import OpenerSignature
 from sarpy.io.xml.base import parse_xml_from_string
 
 logger = logging.getLogger(__name__)
@@ -337,6 +338,10 @@ class SIOReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(
+    magic=(b'\xff\x01\x7f\xfe', b'\xfe\x7f\x01\xff', b'\xff\x02\x7f\xfd', b'\xfd\x7f\x02\xff'))
+
+
 def is_a(file_name: str) -> Optional[SIOReader]:
     """
     Tests whether a given file_name corresponds to a SIO file. Returns a reader instance, if so.
@@ -35,11 +35,13 @@ from sarpy.io.complex.sicd_elements.ImageFormation import ImageFormationType, \
 from sarpy.io.complex.sicd_elements.RMA import RMAType, INCAType
 from sarpy.io.complex.sicd_elements.Radiometric import RadiometricType, NoiseLevelType_
 from sarpy.io.complex.utils import two_dim_poly_fit, fit_position_xvalidation
+from sarpy.io.complex.metadata_cache import SICDMetadataCache, get_metadata_cache
 
 from sarpy.io.general.base import SarpyIOError
 from sarpy.io.general.data_segment import DataSegment, NumpyMemmapSegment, SubsetSegment
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.utils import get_seconds, parse_timestring, is_file_like
+from sarpy.io.general.opener_signature import OpenerSignature
 
 
 logger = logging.getLogger(__name__)
@@ -894,10 +896,47 @@ class TSXDetails(object):
         out_sicd.populate_rniirs(override=False)
         return out_sicd
 
-    def get_sicd_collection(self) -> Tuple[List[str], List[SICDType]]:
+    def get_metadata_files(self) -> List[str]:
+        """
+        Gets the metadata files from which the sicd collection is derived, i.e.
+        the main level1Product xml file, and the GEOREF.xml file (if present).
+
+        Returns
+        -------
+        List[str]
+        """
+
+        out = [self._main_file, ]
+        if self._georef_file is not None:
+            out.append(self._georef_file)
+        return out
+
+    def get_sicd_collection(
+            self,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None) -> Tuple[List[str], List[SICDType]]:
         """
         Gets the sicd metadata collection.
 
+        Parameters
+        ----------
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
+
+        Returns
+        -------
+        files: List[str]
+        sicds: List[SICDType]
+        """
+
+        metadata_cache = get_metadata_cache(metadata_cache)
+        if metadata_cache is None:
+            return self._derive_sicd_collection()
+        return metadata_cache.get_collection('TSXReader', self.get_metadata_files(), self._derive_sicd_collection)
+
+    def _derive_sicd_collection(self) -> Tuple[List[str], List[SICDType]]:
+        """
+        Derives the sicd metadata collection.
+
         Returns
         -------
         files: List[str]
@@ -1157,12 +1196,17 @@ class TSXReader(SICDTypeReader):
 
     __slots__ = ('_tsx_details', )
 
-    def __init__(self, tsx_details):
+    def __init__(
+            self,
+            tsx_details,
+            metadata_cache: Union[None, str, SICDMetadataCache] = None):
         """
 
         Parameters
         ----------
         tsx_details : str|TSXDetails
+        metadata_cache : None|str|SICDMetadataCache
+            The cache (or cache directory) of previously derived sicd collections.
         """
 
         if isinstance(tsx_details, str):
@@ -1175,7 +1219,7 @@ class TSXReader(SICDTypeReader):
 
         data_segments = []
         image_format = tsx_details.image_format
-        the_files, the_sicds = tsx_details.get_sicd_collection()
+        the_files, the_sicds = tsx_details.get_sicd_collection(metadata_cache=metadata_cache)
         for the_file, the_sicd in zip(the_files, the_sicds):
             rows = the_sicd.ImageData.NumRows
             cols = the_sicd.ImageData.NumCols
@@ -1204,6 +1248,9 @@ class TSXReader(SICDTypeReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(file_names=('*.xml', ), manifest_names=('*.xml', ))
+
+
 def is_a(file_name: str) -> Optional[TSXReader]:
     """
     Tests whether a given file_name corresponds to a TerraSAR-X file SSC package.
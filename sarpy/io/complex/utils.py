@@ -429,15 +429,14 @@ def get_data_mean_magnitude(bounds, reader, index, block_size_in_bytes):
     logger.info(
         'Calculating mean over the block ({}:{}, {}:{}), this may be time consuming'.format(*bounds))
     mean_block_size = get_fetch_block_size(bounds[0], bounds[1], block_size_in_bytes)
-    mean_column_blocks, _ = extract_blocks((bounds[2], bounds[3], 1), mean_block_size)
+    if mean_block_size is None:
+        mean_block_size = bounds[3] - bounds[2]
     mean_total = 0.0
     mean_count = 0
-    # noinspection PyTypeChecker
-    for this_column_range in mean_column_blocks:
-        data = numpy.abs(reader[
-                         bounds[0]:bounds[1],
-                         this_column_range[0]:this_column_range[1],
-                         index])
+    for _, data in reader.iterate_blocks(
+            index=index, block_shape=(bounds[1] - bounds[0], mean_block_size),
+            bounds=tuple(bounds[:4]), prefetch=1):
+        data = numpy.abs(data)
         mask = (data > 0) & numpy.isfinite(data)
         mean_total += numpy.sum(data[mask])
         mean_count += numpy.sum(mask)
@@ -506,13 +505,12 @@ def get_data_extrema(bounds, reader, index, block_size_in_bytes, percentile=None
     logger.info(
         'Calculating extrema over the block ({}:{}, {}:{}), this may be time consuming'.format(*bounds))
     mean_block_size = get_fetch_block_size(bounds[0], bounds[1], block_size_in_bytes)
-    mean_column_blocks, _ = extract_blocks((bounds[2], bounds[3], 1), mean_block_size)
-    # noinspection PyTypeChecker
-    for this_column_range in mean_column_blocks:
-        data = numpy.abs(reader[
-                         bounds[0]:bounds[1],
-                         this_column_range[0]:this_column_range[1],
-                         index])
+    if mean_block_size is None:
+        mean_block_size = bounds[3] - bounds[2]
+    for _, data in reader.iterate_blocks(
+            index=index, block_shape=(bounds[1] - bounds[0], mean_block_size),
+            bounds=tuple(bounds[:4]), prefetch=1):
+        data = numpy.abs(data)
         mask = numpy.isfinite(data)
         if numpy.any(mask):
             temp_values = stats_calculation(data[mask], percentile=percentile)
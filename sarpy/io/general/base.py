@@ -10,7 +10,7 @@ __author__ = "Thomas McCullough"
 
 import os
 import logging
-from typing import Union, List, Tuple, Sequence, Optional, Callable
+from typing import Union, List, Tuple, Sequence, Optional, Callable, Iterator
 from importlib import import_module
 import pkgutil
 
@@ -19,7 +19,7 @@ import numpy
 from sarpy.compliance import SarpyError
 from sarpy.io.general.format_function import FormatFunction
 from sarpy.io.general.data_segment import DataSegment, extract_string_from_subscript, \
-    NumpyArraySegment
+    NumpyArraySegment, CachedDataSegment
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,9 @@ class SarpyIOError(SarpyError):
 def check_for_openers(start_package: str, register_method: Callable) -> None:
     """
     Walks the package, and registers the discovered openers. That is, the modules
-    with an :meth:`is_a` method.
+    with an :meth:`is_a` method. If the module also defines an `is_a_signature`
+    (an :class:`sarpy.io.general.opener_signature.OpenerSignature` instance),
+    then this is provided as the `signature` keyword argument.
 
     Parameters
     ----------
@@ -55,7 +57,11 @@ def check_for_openers(start_package: str, register_method: Callable) -> None:
             continue
         sub_module = import_module(module_name)
         if hasattr(sub_module, 'is_a'):
-            register_method(sub_module.is_a)
+            signature = getattr(sub_module, 'is_a_signature', None)
+            if signature is None:
+                register_method(sub_module.is_a)
+            else:
+                register_method(sub_module.is_a, signature=signature)
 
 
 #############
@@ -225,6 +231,63 @@ class BaseReader(object):
 
         return (self.data_segment, ) if self.image_count == 1 else self._data_segment
 
+    def enable_cache(
+            self,
+            tile_shape: Optional[Tuple[int, ...]] = None,
+            max_bytes: int = 256*1048576,
+            coordinate_basis: str = 'formatted',
+            index: Union[None, int, Sequence[int]] = None) -> None:
+        """
+        Attach a least recently used tile cache to the given data segment(s),
+        which is beneficial for interactive or overlapping access patterns.
+        Data segments which are already cached are left unchanged.
+
+        Parameters
+        ----------
+        tile_shape : None|Tuple[int, ...]
+            The tile shape, see :class:`CachedDataSegment`.
+        max_bytes : int
+            The byte budget for the cache of **each** data segment.
+        coordinate_basis : str
+            One of `('raw', 'formatted')`.
+        index : None|int|Sequence[int]
+            The data segment index or indices to cache. All, if not provided.
+
+        Returns
+        -------
+        None
+        """
+
+        self._validate_closed()
+        segments = list(self.get_data_segment_as_tuple())
+        if index is None:
+            index = list(range(len(segments)))
+        elif isinstance(index, int):
+            index = [index, ]
+
+        for the_index in index:
+            entry = segments[the_index]
+            if isinstance(entry, CachedDataSegment):
+                continue
+            segments[the_index] = CachedDataSegment(
+                entry, tile_shape=tile_shape, max_bytes=max_bytes,
+                coordinate_basis=coordinate_basis, close_parent=self._close_segments)
+        self._data_segment = segments[0] if len(segments) == 1 else tuple(segments)
+
+    def get_cache_statistics(self) -> Tuple[Optional[dict], ...]:
+        """
+        Gets the tile cache statistics for each data segment.
+
+        Returns
+        -------
+        Tuple[None|dict, ...]
+            The entry will be `None` for any data segment with no cache attached.
+        """
+
+        return tuple(
+            entry.get_cache_statistics() if isinstance(entry, CachedDataSegment) else None
+            for entry in self.get_data_segment_as_tuple())
+
     @property
     def data_size(self) -> Union[Tuple[int, ...], Tuple[Tuple[int, ...]]]:
         """
@@ -426,6 +489,181 @@ class BaseReader(object):
                 return self.__call__(*subscript[:-1], index=subscript[-1], raw=raw, squeeze=squeeze)
         return self.__call__(*subscript, index=0, raw=raw, squeeze=squeeze)
 
+    def get_block_bounds(
+            self,
+            index: int = 0,
+            block_shape: Union[None, int, Tuple[int, ...]] = None,
+            memory_budget: Optional[int] = None,
+            overlap: Union[int, Tuple[int, ...]] = 0,
+            order: str = 'row',
+            bounds: Optional[Tuple[int, ...]] = None,
+            raw: bool = False) -> List[Tuple[int, ...]]:
+        """
+        Partition the image (or the given region) into a collection of blocks.
+        Blocking is performed along the first two dimensions (or only the first,
+        for one dimensional data), and any further dimensions are read in full.
+
+        Parameters
+        ----------
+        index : int
+            The data segment index.
+        block_shape : None|int|Tuple[int, ...]
+            The (nominal) block shape, not including the overlap. A single
+            integer will be used as the size along both blocked dimensions.
+            This is mutually exclusive with `memory_budget`.
+        memory_budget : None|int
+            The maximum (nominal, not including overlap) size of a block in bytes,
+            used to determine a block shape spanning the full extent of the
+            second dimension, if possible. If neither this nor `block_shape` is
+            provided, a budget of 64 MB will be used.
+        overlap : int|Tuple[int, ...]
+            The number of elements by which each block will be extended on each
+            side along the blocked dimensions, limited by the image (or region)
+            extent.
+        order : str
+            One of `('row', 'column')`. For `'row'`, blocks are visited in row
+            major order, and otherwise in column major order.
+        bounds : None|Tuple[int, ...]
+            The region to partition, of the form `(row_start, row_end, col_start, col_end)`,
+            or `(start, end)` for one dimensional data. The full image, if not provided.
+        raw : bool
+            Should blocking be performed relative to the raw shape and dtype,
+            rather than the formatted shape and dtype?
+
+        Returns
+        -------
+        List[Tuple[int, ...]]
+            The sequence of block bounds, each of the same form as `bounds`.
+        """
+
+        data_segment = self.get_data_segment_as_tuple()[index]
+        full_shape = data_segment.raw_shape if raw else data_segment.formatted_shape
+        dtype = data_segment.raw_dtype if raw else data_segment.formatted_dtype
+        block_dims = min(2, len(full_shape))
+
+        if bounds is None:
+            bounds = []
+            for size in full_shape[:block_dims]:
+                bounds.extend([0, size])
+        if len(bounds) != 2*block_dims:
+            raise ValueError('bounds must have length {}, got `{}`'.format(2*block_dims, bounds))
+        bounds = tuple(int(entry) for entry in bounds)
+        for dim in range(block_dims):
+            if not (0 <= bounds[2*dim] < bounds[2*dim+1] <= full_shape[dim]):
+                raise ValueError('Got invalid bounds `{}` for shape `{}`'.format(bounds, full_shape))
+        extent = tuple(bounds[2*dim+1] - bounds[2*dim] for dim in range(block_dims))
+
+        if isinstance(overlap, int):
+            overlap = (overlap, )*block_dims
+        if len(overlap) != block_dims or any(entry < 0 for entry in overlap):
+            raise ValueError('Got invalid overlap `{}`'.format(overlap))
+
+        if block_shape is not None and memory_budget is not None:
+            raise ValueError('At most one of block_shape and memory_budget may be provided')
+        if block_shape is None:
+            memory_budget = 64*1048576 if memory_budget is None else int(memory_budget)
+            element_bytes = dtype.itemsize*int(numpy.prod(full_shape[block_dims:]))
+            if block_dims == 1:
+                block_shape = (max(1, int(memory_budget/element_bytes)), )
+            else:
+                row_bytes = element_bytes*extent[1]
+                if row_bytes <= memory_budget:
+                    block_shape = (int(memory_budget/row_bytes), extent[1])
+                else:
+                    block_shape = (1, max(1, int(memory_budget/element_bytes)))
+        elif isinstance(block_shape, int):
+            block_shape = (block_shape, )*block_dims
+        if len(block_shape) != block_dims or any(entry < 1 for entry in block_shape):
+            raise ValueError('Got invalid block_shape `{}`'.format(block_shape))
+
+        order = order.strip().lower()
+        if order not in ['row', 'column']:
+            raise ValueError('order must be one of `row` or `column`, got `{}`'.format(order))
+
+        axis_ranges = []
+        for dim in range(block_dims):
+            start, stop = bounds[2*dim], bounds[2*dim+1]
+            axis_ranges.append([
+                (max(start, entry - overlap[dim]), min(stop, entry + block_shape[dim] + overlap[dim]))
+                for entry in range(start, stop, block_shape[dim])])
+
+        if block_dims == 1:
+            return axis_ranges[0]
+        if order == 'row':
+            return [row + col for row in axis_ranges[0] for col in axis_ranges[1]]
+        else:
+            return [row + col for col in axis_ranges[1] for row in axis_ranges[0]]
+
+    def iterate_blocks(
+            self,
+            index: int = 0,
+            block_shape: Union[None, int, Tuple[int, ...]] = None,
+            memory_budget: Optional[int] = None,
+            overlap: Union[int, Tuple[int, ...]] = 0,
+            order: str = 'row',
+            bounds: Optional[Tuple[int, ...]] = None,
+            raw: bool = False,
+            prefetch: int = 0) -> Iterator[Tuple[Tuple[int, ...], numpy.ndarray]]:
+        """
+        Iterate over the image (or given region) block by block. Any squeezing
+        of the block data is left to the caller.
+
+        Parameters
+        ----------
+        index : int
+            The data segment index.
+        block_shape : None|int|Tuple[int, ...]
+        memory_budget : None|int
+        overlap : int|Tuple[int, ...]
+        order : str
+        bounds : None|Tuple[int, ...]
+        raw : bool
+            Read raw data, rather than formatted data?
+        prefetch : int
+            The number of blocks to read ahead on a background thread, which
+            permits overlapping reading with processing of the current block.
+            Reading is performed in the calling thread, if this is `0`.
+
+        Yields
+        ------
+        block_bounds : Tuple[int, ...]
+            The bounds of the form `(row_start, row_end, col_start, col_end)`,
+            or `(start, end)` for one dimensional data.
+        data : numpy.ndarray
+
+        See Also
+        --------
+        :meth:`get_block_bounds`.
+        """
+
+        # NB: imported here to avoid a circular import
+        from sarpy.io.general.prefetch import ReadPrefetcher
+
+        self._validate_closed()
+        data_segment = self.get_data_segment_as_tuple()[index]
+        all_bounds = self.get_block_bounds(
+            index=index, block_shape=block_shape, memory_budget=memory_budget,
+            overlap=overlap, order=order, bounds=bounds, raw=raw)
+        subscripts = [
+            tuple(slice(block_bounds[i], block_bounds[i+1], 1) for i in range(0, len(block_bounds), 2))
+            for block_bounds in all_bounds]
+
+        prefetch = int(prefetch)
+        if prefetch < 0:
+            raise ValueError('prefetch must be non-negative')
+        if prefetch == 0:
+            for block_bounds, subscript in zip(all_bounds, subscripts):
+                if raw:
+                    yield block_bounds, data_segment.read_raw(subscript, squeeze=False)
+                else:
+                    yield block_bounds, data_segment.read(subscript, squeeze=False)
+            return
+
+        with ReadPrefetcher(
+                data_segment, subscripts, raw=raw, squeeze=False, queue_depth=prefetch) as prefetcher:
+            for block_bounds, subscript in zip(all_bounds, subscripts):
+                yield block_bounds, prefetcher.read(subscript)
+
     def close(self) -> None:
         """
         This should perform any necessary clean-up operations, like closing
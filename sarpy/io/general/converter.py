@@ -4,8 +4,9 @@ opened by the sicd, sidd, cphd, or crsd reader collections.
 """
 
 import os
-from typing import Callable
+from typing import Callable, Optional
 from sarpy.io.general.base import SarpyIOError, BaseReader, check_for_openers
+from sarpy.io.general.opener_signature import OpenerSignature, OpenerProbe
 
 __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
@@ -14,10 +15,11 @@ __author__ = "Thomas McCullough"
 ###########
 # Module variables
 _openers = []
+_opener_signatures = {}
 _parsed_openers = False
 
 
-def register_opener(open_func: Callable) -> None:
+def register_opener(open_func: Callable, signature: Optional[OpenerSignature] = None) -> None:
     """
     Provide a new opener.
 
@@ -27,6 +29,9 @@ def register_opener(open_func: Callable) -> None:
         This is required to be a function which takes a single argument (file name).
         This function should return a sarpy.io.general.base.BaseReader instance
         if the referenced file is viable for the underlying type, and None otherwise.
+    signature : None|OpenerSignature
+        The inexpensive necessary conditions for a file to be opened by `open_func`,
+        used to avoid calling `open_func` for files which are clearly not viable.
 
     Returns
     -------
@@ -35,8 +40,12 @@ def register_opener(open_func: Callable) -> None:
 
     if not callable(open_func):
         raise TypeError('open_func must be a callable')
+    if signature is not None and not isinstance(signature, OpenerSignature):
+        raise TypeError('signature must be an OpenerSignature instance')
     if open_func not in _openers:
         _openers.append(open_func)
+    if signature is not None:
+        _opener_signatures[open_func] = signature
 
 
 def parse_openers() -> None:
@@ -77,8 +86,13 @@ def open_general(file_name: str) -> BaseReader:
         raise SarpyIOError('File {} does not exist.'.format(file_name))
     # parse openers, if not already done
     parse_openers()
-    # see if we can find a reader though trial and error
+    # see if we can find a reader though trial and error, skipping the openers
+    #   whose signature rules out the file
+    probe = OpenerProbe(file_name)
     for opener in _openers:
+        signature = _opener_signatures.get(opener, None)
+        if signature is not None and not signature.matches(probe):
+            continue
         reader = opener(file_name)
         if reader is not None:
             return reader
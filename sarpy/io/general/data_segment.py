@@ -11,14 +11,19 @@ __author__ = "Thomas McCullough"
 
 import logging
 import os
-from typing import Union, Tuple, Sequence, BinaryIO, Optional
+import threading
+import itertools
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Tuple, Sequence, BinaryIO, Optional, Callable, List
 
 import numpy
 
 from sarpy.io.general.format_function import FormatFunction, IdentityFunction
 from sarpy.io.general.slice_parsing import verify_subscript, get_slice_result_size, \
     get_subscript_result_size
-from sarpy.io.general.utils import h5py, is_file_like
+from sarpy.io.general.utils import h5py, is_file_like, is_real_file
 
 if h5py is not None:
     from h5py import File as h5pyFile, Dataset as h5pyDataset
@@ -26,6 +31,11 @@ else:
     h5pyFile = None
     h5pyDataset = None
 
+try:
+    from PIL import Image as PIL_Image
+except ImportError:
+    PIL_Image = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,12 +82,12 @@ def _find_slice_overlap(
 
     Returns
     -------
-    child_slice : None|slice
-        The overlap expressed as a slice relative to the sliced coordinates.
-        None if there is no overlap.
-    parent_slice : None|slice
-        The overlap expressed as a slice relative to the overall indices.
-        None if there is no overlap.
+    block_slice : None|slice
+        The overlap expressed as a slice relative to the interval defined by
+        `ref_slice`. None if there is no overlap.
+    result_slice : None|slice
+        The overlap expressed as a (step 1) slice relative to the result of
+        applying `slice_in`. None if there is no overlap.
     """
 
     if ref_slice.step not in [1, -1]:
@@ -90,51 +100,39 @@ def _find_slice_overlap(
         start_ind = 0 if ref_slice.stop is None else ref_slice.stop + 1
         stop_ind = ref_slice.start + 1
 
+    # the elements of slice_in are slice_in.start + i*slice_in.step, for 0 <= i < count,
+    # determine the range of i for which the element lies in [start_ind, stop_ind)
+    count = get_slice_result_size(slice_in)
     if slice_in.step > 0:
-        if slice_in.stop <= start_ind or slice_in.start >= stop_ind:
-            # there is no overlap
-
-            return None, None
-        # find minimum multiplier so that slice_in.start + mult*slice_in.step >= start_ind
-        #    mult >= (start_ind - slice_in.start)/slice_in.step
-        child_start = 0 if start_ind <= slice_in.start else \
-            int(numpy.ceil((start_ind - slice_in.start)/slice_in.step))
-        parent_start = slice_in.start - start_ind + child_start*slice_in.step
-        # find end - maximum multiplier so that slice_in.start + mult*slice_in.step <= stop_ind
-        #    mult <= (stop_ind - slice_in.start)/slice_in.step
-        max_ind = min(slice_in.stop, stop_ind)
-        child_stop = int(numpy.floor((max_ind - slice_in.start)/slice_in.step))
-        parent_stop = slice_in.start - start_ind + child_stop*slice_in.step
+        child_start = max(0, int(numpy.ceil((start_ind - slice_in.start)/slice_in.step)))
+        child_stop = min(count, int(numpy.ceil((stop_ind - slice_in.start)/slice_in.step)))
     else:
-        if slice_in.start < start_ind or (slice_in.stop is not None and slice_in.stop >= stop_ind):
-            # there is no overlap
-
-            # noinspection PyTypeChecker
-            return None, None
-
-        # find minimum multiplier so that slice_in.start + mult*slice_in.step <= stop_ind-1
-        #    mult >= (stop_ind - 1 - slice_in.start)/slice_in.step
-        child_start = 0 if slice_in.start < stop_ind else int(numpy.ceil((stop_ind - 1 - slice_in.start)/slice_in.step))
-        parent_start = slice_in.start - start_ind + child_start*slice_in.step
-        # find end - first multiplier so that slice_in.start + mult*slice_in.step < start_ind - 1
-        #    mult > (start_ind - slice_in.start)/slice_in.step
-        if slice_in.stop is None:
-            min_ind = max(start_ind-1, -1)
-        else:
-            min_ind = max(start_ind-1, slice_in.stop)
-        child_stop = int(numpy.ceil((min_ind - slice_in.start)/slice_in.step))
-        parent_stop = slice_in.start - start_ind + child_stop*slice_in.step
-        if parent_stop < 0:
-            parent_stop = None
+        abs_step = -slice_in.step
+        child_start = max(0, int(numpy.ceil((slice_in.start - stop_ind + 1)/abs_step)))
+        child_stop = min(count, int(numpy.floor((slice_in.start - start_ind)/abs_step)) + 1)
 
-    if ref_slice.step < 0:
+    if child_start >= child_stop:
+        # there is no overlap
         # noinspection PyTypeChecker
-        return _reverse_slice(slice(parent_start, parent_stop, slice_in.step)), \
-               _reverse_slice(slice(child_start, child_stop, 1))
+        return None, None
+
+    first = slice_in.start + child_start*slice_in.step
+    last = slice_in.start + (child_stop - 1)*slice_in.step
+    # NB: the stop is placed immediately beyond the final element, so that it
+    #   is within the bounds of the block
+    if ref_slice.step > 0:
+        parent_start = first - start_ind
+        parent_step = slice_in.step
+        parent_stop = last - start_ind + (1 if parent_step > 0 else -1)
     else:
-        # noinspection PyTypeChecker
-        return slice(parent_start, parent_stop, slice_in.step), \
-               slice(child_start, child_stop, 1)
+        # indices relative to the reversed block
+        parent_start = stop_ind - 1 - first
+        parent_step = -slice_in.step
+        parent_stop = stop_ind - 1 - last + (1 if parent_step > 0 else -1)
+    if parent_stop < 0:
+        parent_stop = None
+    # noinspection PyTypeChecker
+    return slice(parent_start, parent_stop, parent_step), slice(child_start, child_stop, 1)
 
 
 def _infer_subscript_for_write(
@@ -212,6 +210,454 @@ def extract_string_from_subscript(
     return subscript, tuple(string_entries)
 
 
+def _get_out_view(
+        out: Optional[numpy.ndarray],
+        result_shape: Tuple[int, ...],
+        dtype: numpy.dtype,
+        squeeze: bool) -> Optional[numpy.ndarray]:
+    """
+    Helper function for read operations, which validates a caller supplied output
+    array and returns a view of it with the full (unsqueezed) result shape.
+
+    Parameters
+    ----------
+    out : None|numpy.ndarray
+        The caller supplied output array, which must have the expected data type
+        and the expected shape, after squeezing if `squeeze=True`.
+    result_shape : Tuple[int, ...]
+        The full result shape, prior to any squeeze operation.
+    dtype : numpy.dtype
+    squeeze : bool
+
+    Returns
+    -------
+    None|numpy.ndarray
+        `None` if `out` is `None`, otherwise a view of `out`.
+    """
+
+    if out is None:
+        return None
+
+    if not isinstance(out, numpy.ndarray):
+        raise TypeError('out must be a numpy.ndarray, got type `{}`'.format(type(out)))
+    if out.dtype != dtype:
+        raise ValueError('out is required to have dtype `{}`, got `{}`'.format(dtype, out.dtype))
+    expected_shape = tuple(entry for entry in result_shape if entry != 1) if squeeze else result_shape
+    if out.shape != expected_shape:
+        raise ValueError(
+            'out is required to have shape `{}`, got `{}`'.format(expected_shape, out.shape))
+    # NB: inserting or removing dimensions of size 1 never requires a copy
+    return numpy.reshape(out, result_shape)
+
+
+def _finalize_read(
+        data: numpy.ndarray,
+        out: Optional[numpy.ndarray],
+        squeeze: bool) -> numpy.ndarray:
+    """
+    Helper function for read operations, which returns `out` if it was provided
+    (assumed already populated), and otherwise the data with optional squeeze.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+    out : None|numpy.ndarray
+    squeeze : bool
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    if out is not None:
+        return out
+    return numpy.squeeze(data) if squeeze else data
+
+
+def _read_into_buffer(file_object: BinaryIO, buffer: memoryview) -> int:
+    """
+    Helper function which populates the given writable byte buffer from the
+    current position of the file-like object, using `readinto` if available.
+
+    Parameters
+    ----------
+    file_object : BinaryIO
+    buffer : memoryview
+
+    Returns
+    -------
+    int
+        The number of bytes read, which will be less than the buffer size only
+        if the end of the file was encountered.
+    """
+
+    size = buffer.nbytes
+    count = 0
+    if hasattr(file_object, 'readinto'):
+        while count < size:
+            part = file_object.readinto(buffer[count:])
+            if not part:
+                break
+            count += part
+    else:
+        while count < size:
+            the_bytes = file_object.read(size - count)
+            if not the_bytes:
+                break
+            buffer[count:count+len(the_bytes)] = the_bytes
+            count += len(the_bytes)
+    return count
+
+
+def _get_byte_view(array: numpy.ndarray) -> memoryview:
+    """
+    Gets a writable flat byte view of the given C-contiguous array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+
+    Returns
+    -------
+    memoryview
+    """
+
+    if not array.flags.c_contiguous:
+        raise ValueError('Requires a C-contiguous array')
+    return memoryview(numpy.reshape(array, (-1, )).view('uint8'))
+
+
+#####
+# written pixel coverage
+
+def _subscript_to_intervals(subscript: Tuple[slice, ...], shape: Tuple[int, ...]) -> List[List[Tuple[int, int]]]:
+    """
+    Converts a normalized subscript into the sorted disjoint (start, stop)
+    intervals of the indices along each axis.
+    """
+
+    out = []
+    for the_slice, size in zip(subscript, shape):
+        indices = range(*the_slice.indices(size))
+        if len(indices) == 0:
+            out.append([])
+        elif abs(indices.step) == 1:
+            out.append([(min(indices[0], indices[-1]), max(indices[0], indices[-1]) + 1)])
+        else:
+            out.append([(entry, entry + 1) for entry in sorted(indices)])
+    return out
+
+
+class PixelCoverage(object):
+    """
+    Tracks which elements of an array of given shape have been written.
+
+    The covered region is stored as sorted disjoint intervals along the first
+    axis, each of which refers to the (identical) covered region for the
+    remaining axes, stored recursively in the same fashion, or is marked as
+    fully covered. Adjacent intervals with identical coverage are merged, so
+    the usual row stripe or block writing patterns are represented by a
+    handful of intervals regardless of the array size. This permits exact
+    detection of overlapping writes, and reporting of the portions which
+    have not been written.
+
+    Introduced in version 1.3.76.
+    """
+
+    __slots__ = ('_shape', '_root', '_covered_count', '_overlap_count', '_lock')
+
+    def __init__(self, shape: Tuple[int, ...]):
+        """
+
+        Parameters
+        ----------
+        shape : Tuple[int, ...]
+        """
+
+        self._shape = tuple(int(entry) for entry in shape)
+        self._root = []
+        self._covered_count = 0
+        self._overlap_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Tuple[int, ...]: The shape of the array.
+        """
+
+        return self._shape
+
+    @property
+    def expected_count(self) -> int:
+        """
+        int: The total number of elements.
+        """
+
+        return int(numpy.prod(self._shape))
+
+    @property
+    def covered_count(self) -> int:
+        """
+        int: The number of distinct elements which have been written.
+        """
+
+        return self._covered_count
+
+    @property
+    def overlap_count(self) -> int:
+        """
+        int: The number of element writes which repeated previously written elements.
+        """
+
+        return self._overlap_count
+
+    def is_complete(self) -> bool:
+        """
+        Have all elements been written?
+
+        Returns
+        -------
+        bool
+        """
+
+        return self._covered_count == self.expected_count
+
+    def _is_full(self, intervals: List[List[Tuple[int, int]]], axis: int) -> bool:
+        return all(entry == [(0, size)] for entry, size in zip(intervals[axis:], self._shape[axis:]))
+
+    def _build(self, intervals: List[List[Tuple[int, int]]], axis: int) -> Optional[list]:
+        """
+        Builds the node for the given region, for the given axis onwards.
+        `None` indicates full coverage.
+        """
+
+        if self._is_full(intervals, axis):
+            return None
+        child = self._build(intervals, axis + 1) if axis + 1 < len(self._shape) else None
+        return [[start, stop, child] for start, stop in intervals[axis]]
+
+    @staticmethod
+    def _copy(node: Optional[list]) -> Optional[list]:
+        if node is None:
+            return None
+        return [[start, stop, PixelCoverage._copy(child)] for start, stop, child in node]
+
+    def _insert(self, node: list, intervals: List[List[Tuple[int, int]]], axis: int) -> int:
+        """
+        Inserts the given region into the given node, for the given axis
+        onwards, in place. The intervals of the axis and the node entries are
+        merged in a single sorted pass.
+
+        Returns
+        -------
+        int
+            The number of newly covered elements.
+        """
+
+        rest_count = 1
+        for entry in intervals[axis + 1:]:
+            rest_count *= sum(stop - start for start, stop in entry)
+
+        # NB: nodes are copied before modification, so the newly built node, and
+        #   the result of inserting into a given child node, may be shared between
+        #   entries. Strided writes produce many entries with the same child node.
+        built = []
+        inserted = {}
+
+        def get_built() -> Optional[list]:
+            if len(built) == 0:
+                built.append(self._build(intervals, axis + 1))
+            return built[0]
+
+        entries = []
+        new_count = 0
+        index = 0
+        current = node[0] if len(node) > 0 else None
+        for a, b in intervals[axis]:
+            # retain the existing entries preceding this interval
+            while current is not None and current[1] <= a:
+                entries.append(current)
+                index += 1
+                current = node[index] if index < len(node) else None
+            position = a
+            while position < b:
+                if current is None or current[0] >= b:
+                    entries.append([position, b, get_built()])
+                    new_count += (b - position)*rest_count
+                    position = b
+                    break
+                start, stop, child = current
+                if start < position:
+                    entries.append([start, position, child])
+                    start = position
+                elif start > position:
+                    entries.append([position, start, get_built()])
+                    new_count += (start - position)*rest_count
+                    position = start
+                end = min(stop, b)
+                new_child = None
+                if child is not None:
+                    result = inserted.get(id(child), None)
+                    if result is None:
+                        new_child = self._copy(child)
+                        child_count = self._insert(new_child, intervals, axis + 1)
+                        if new_child == [[0, self._shape[axis + 1], None]]:
+                            new_child = None
+                        # NB: retain the child, so that its id is not reused
+                        result = (child, new_child, child_count)
+                        inserted[id(child)] = result
+                    _, new_child, child_count = result
+                    new_count += (end - start)*child_count
+                entries.append([start, end, new_child])
+                position = end
+                if stop > b:
+                    current = [b, stop, child]
+                else:
+                    index += 1
+                    current = node[index] if index < len(node) else None
+        while current is not None:
+            entries.append(current)
+            index += 1
+            current = node[index] if index < len(node) else None
+
+        # merge adjacent intervals with identical coverage
+        node.clear()
+        for entry in entries:
+            if len(node) > 0 and node[-1][1] == entry[0] and \
+                    (node[-1][2] is entry[2] or node[-1][2] == entry[2]):
+                node[-1][1] = entry[1]
+            else:
+                node.append(list(entry))
+        return new_count
+
+    def add(self, subscript: Tuple[slice, ...]) -> int:
+        """
+        Record the elements of the given normalized subscript as written. This
+        is thread-safe.
+
+        Parameters
+        ----------
+        subscript : Tuple[slice, ...]
+            As from :func:`verify_subscript`, with one entry per axis.
+
+        Returns
+        -------
+        int
+            The number of elements of `subscript` which were previously written.
+        """
+
+        intervals = _subscript_to_intervals(subscript, self._shape)
+        total = 1
+        for entry in intervals:
+            total *= sum(stop - start for start, stop in entry)
+        if total == 0:
+            return 0
+
+        with self._lock:
+            new_count = self._insert(self._root, intervals, 0)
+            self._covered_count += new_count
+            self._overlap_count += total - new_count
+        return total - new_count
+
+    def get_missing_ranges(self, max_count: Optional[int] = None) -> List[Tuple[Tuple[int, int], ...]]:
+        """
+        Gets the disjoint regions which have not been written.
+
+        Parameters
+        ----------
+        max_count : None|int
+            The maximum number of regions to return.
+
+        Returns
+        -------
+        List[Tuple[Tuple[int, int], ...]]
+            Each entry is the `(start, stop)` range along each axis.
+        """
+
+        out = []
+
+        def full_rest(axis: int) -> Tuple[Tuple[int, int], ...]:
+            return tuple((0, size) for size in self._shape[axis:])
+
+        def visit(node: list, axis: int, prefix: Tuple[Tuple[int, int], ...]) -> None:
+            position = 0
+            for start, stop, child in node + [[self._shape[axis], self._shape[axis], None]]:
+                if max_count is not None and len(out) >= max_count:
+                    return
+                if start > position:
+                    out.append(prefix + ((position, start), ) + full_rest(axis + 1))
+                if child is not None:
+                    visit(child, axis + 1, prefix + ((start, stop), ))
+                position = stop
+
+        with self._lock:
+            if self.expected_count > 0:
+                visit(self._root, 0, ())
+        return out if max_count is None else out[:max_count]
+
+    def describe_missing(self, max_count: int = 5) -> str:
+        """
+        Gets a brief description of the regions which have not been written,
+        suitable for logging.
+
+        Parameters
+        ----------
+        max_count : int
+            The maximum number of regions described.
+
+        Returns
+        -------
+        str
+        """
+
+        missing = self.get_missing_ranges(max_count=max_count + 1)
+        description = ', '.join(
+            '[{}]'.format(', '.join('{}:{}'.format(start, stop) for start, stop in entry))
+            for entry in missing[:max_count])
+        if len(missing) > max_count:
+            description += ', ...'
+        return description
+
+    def reset(self) -> None:
+        """
+        Discard all coverage.
+        """
+
+        with self._lock:
+            self._root = []
+            self._covered_count = 0
+            self._overlap_count = 0
+
+
+def _check_coverage(coverage: PixelCoverage, warn: bool) -> bool:
+    """
+    Checks whether all pixels of the coverage have been written, logging the
+    missing regions if not and `warn` is `True`.
+    """
+
+    if coverage.is_complete():
+        return True
+    if warn:
+        logger.error(
+            'Segment expected {} pixels written, but only {} pixels were written.\n\t'
+            'The unwritten raw ranges include {}'.format(
+                coverage.expected_count, coverage.covered_count, coverage.describe_missing()))
+    return False
+
+
+def _update_coverage(coverage: PixelCoverage, subscript: Tuple[slice, ...]) -> None:
+    """
+    Records the given subscript as written. Rewriting previously written pixels
+    is permitted, and only logged at debug level.
+    """
+
+    overlap = coverage.add(subscript)
+    if overlap > 0:
+        logger.debug(
+            'Writing raw subscript {} repeats {} previously written pixels'.format(subscript, overlap))
+
+
 #####
 # Abstract data segment definition and derived element implementations
 
@@ -598,7 +1044,8 @@ class DataSegment(object):
     def read(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         """
         In keeping with data segment mode, read the data slice specified relative
         to the formatted data coordinates. This requires that `mode` is `'r'`.
@@ -608,10 +1055,15 @@ class DataSegment(object):
         subscript : None|int|slice|Sequence[int|slice|Tuple[int, ...]]
         squeeze : bool
             Apply the numpy.squeeze operation, which eliminates dimension of size 1?
+        out : None|numpy.ndarray
+            Optional array into which the result will be written. This must have
+            data type given by `formatted_dtype`, and the shape of the result
+            (accounting for `squeeze`).
 
         Returns
         -------
         numpy.ndarray
+            This will be `out`, if provided.
         """
 
         self._validate_closed()
@@ -621,13 +1073,20 @@ class DataSegment(object):
         norm_subscript = self.verify_formatted_subscript(subscript)
         raw_subscript = self.format_function.transform_formatted_slice(norm_subscript)
         raw_data = self.read_raw(raw_subscript, squeeze=False)
-        return self.format_function(raw_data, raw_subscript, squeeze=squeeze)
+        if out is None:
+            return self.format_function(raw_data, raw_subscript, squeeze=squeeze)
+
+        _, result_shape = get_subscript_result_size(norm_subscript, self.formatted_shape)
+        out_view = _get_out_view(out, result_shape, self.formatted_dtype, squeeze)
+        self.format_function(raw_data, raw_subscript, squeeze=False, out=out_view)
+        return out
 
     # noinspection PyTypeChecker
     def read_raw(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         """
         In keeping with data segment mode, read raw data from the source, without
         reformatting and or applying symmetry operations. This requires that `mode`
@@ -640,11 +1099,16 @@ class DataSegment(object):
             operations have been applied.
         squeeze : bool
             Apply numpy.squeeze, which eliminates any dimensions of size 1?
+        out : None|numpy.ndarray
+            Optional array into which the result will be written. This must have
+            data type given by `raw_dtype`, and the shape of the result
+            (accounting for `squeeze`).
 
         Returns
         -------
         numpy.ndarray
-            This will be of data type given by `raw_dtype`.
+            This will be of data type given by `raw_dtype`, and will be `out`,
+            if provided.
         """
 
         if self.mode != 'r':
@@ -662,36 +1126,40 @@ class DataSegment(object):
         if data.dtype != self.raw_dtype:
             logger.warning('Expected data dtype `{}`, got `{}`.'.format(self.raw_dtype, data.dtype))
 
-    def write(
+    def format_for_write(
             self,
             data: numpy.ndarray,
             start_indices: Union[None, int, Tuple[int, ...]] = None,
-            subscript: Union[None, Sequence[slice]] = None,
-            **kwargs) -> None:
+            subscript: Union[None, Sequence[slice]] = None) -> Tuple[numpy.ndarray, Tuple[slice, ...]]:
         """
-        In keeping with data segment mode, write the data provided in formatted
-        form, assuming the slice specified relative to the formatted data coordinates.
+        Converts the data provided in formatted form, assuming the slice
+        specified relative to the formatted data coordinates, into the raw data
+        and raw subscript to be written using :meth:`write_raw`. That is, this
+        is the first half of :meth:`write`, permitting the conversion and the
+        writing to be performed separately (e.g. in different threads).
 
         This requires that `mode` is `'w'`, and `format_function.has_inverse == True`,
         because we have to apply the format function inverse to the provided data.
 
         **Only one of `start_indices` and `subscript` should be specified.**
 
+        Introduced in version 1.3.78.
+
         Parameters
         ----------
         data : numpy.ndarray
-            The data in formatted form, to be transferred to raw form and written.
+            The data in formatted form, to be transferred to raw form.
         start_indices : None|int|Tuple[int, ...]
             Assuming a contiguous chunk of data, this provides the starting
             indices of the chunk. Any missing (tail) coordinates will be filled
             in with 0's.
         subscript : None|Sequence[slice]
             The subscript definition in formatted coordinates.
-        kwargs
 
         Returns
         -------
-        None
+        raw_data : numpy.ndarray
+        raw_subscript : Tuple[slice, ...]
         """
 
         self._validate_closed()
@@ -714,6 +1182,41 @@ class DataSegment(object):
 
         raw_data = self.format_function.inverse(data, subscript)
         raw_subscript = self.format_function.transform_formatted_slice(subscript)
+        return raw_data, raw_subscript
+
+    def write(
+            self,
+            data: numpy.ndarray,
+            start_indices: Union[None, int, Tuple[int, ...]] = None,
+            subscript: Union[None, Sequence[slice]] = None,
+            **kwargs) -> None:
+        """
+        In keeping with data segment mode, write the data provided in formatted
+        form, assuming the slice specified relative to the formatted data coordinates.
+
+        This requires that `mode` is `'w'`, and `format_function.has_inverse == True`,
+        because we have to apply the format function inverse to the provided data.
+
+        **Only one of `start_indices` and `subscript` should be specified.**
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The data in formatted form, to be transferred to raw form and written.
+        start_indices : None|int|Tuple[int, ...]
+            Assuming a contiguous chunk of data, this provides the starting
+            indices of the chunk. Any missing (tail) coordinates will be filled
+            in with 0's.
+        subscript : None|Sequence[slice]
+            The subscript definition in formatted coordinates.
+        kwargs
+
+        Returns
+        -------
+        None
+        """
+
+        raw_data, raw_subscript = self.format_for_write(data, start_indices=start_indices, subscript=subscript)
         self.write_raw(raw_data, subscript=raw_subscript, **kwargs)
 
     def write_raw(
@@ -907,13 +1410,14 @@ class ReorientationSegment(DataSegment):
     def read_raw(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
 
         self._validate_closed()
         if self.mode != 'r':
             raise ValueError('Requires mode == "r"')
 
-        return self.parent.read(subscript, squeeze=squeeze)
+        return self.parent.read(subscript, squeeze=squeeze, out=out)
 
     def check_fully_written(self, warn: bool = False) -> bool:
         return self.parent.check_fully_written(warn=warn)
@@ -997,7 +1501,7 @@ class SubsetSegment(DataSegment):
     __slots__ = (
         '_parent', '_formatted_subset_definition', '_raw_subset_definition',
         '_original_formatted_indices', '_original_raw_indices', '_squeeze',
-        '_close_parent', '_pixels_written', '_expected_pixels_written')
+        '_close_parent', '_coverage')
 
     def __init__(
             self,
@@ -1034,11 +1538,7 @@ class SubsetSegment(DataSegment):
         DataSegment.__init__(
             self, parent.raw_dtype, raw_shape, parent.formatted_dtype, formatted_shape,
             mode=parent.mode)
-        self._pixels_written = 0
-        if self.mode == 'w':
-            self._expected_pixels_written = int(numpy.prod(raw_shape))
-        else:
-            self._expected_pixels_written = 0
+        self._coverage = PixelCoverage(self.raw_shape) if self.mode == 'w' else None
 
     def _validate_shapes(self) -> None:
         # handled else where
@@ -1225,12 +1725,20 @@ class SubsetSegment(DataSegment):
     def read_raw(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         self._validate_closed()
         if self.mode != 'r':
             raise ValueError('Requires mode == "r"')
 
         norm_subscript = self.get_parent_raw_subscript(subscript)
+        if out is not None:
+            _, result_shape = get_subscript_result_size(subscript, self.raw_shape)
+            _get_out_view(out, result_shape, self.raw_dtype, squeeze)
+            # NB: the parent shape differs only by dimensions of size 1, so this is a view
+            _, parent_shape = get_subscript_result_size(norm_subscript, self.parent.raw_shape)
+            self.parent.read_raw(norm_subscript, squeeze=False, out=numpy.reshape(out, parent_shape))
+            return out
         if squeeze:
             return self.parent.read_raw(norm_subscript, squeeze=True)
         else:
@@ -1247,12 +1755,20 @@ class SubsetSegment(DataSegment):
     def read(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         self._validate_closed()
         if self.mode != 'r':
             raise ValueError('Requires mode == "r"')
 
         norm_subscript = self.get_parent_formatted_subscript(subscript)
+        if out is not None:
+            _, result_shape = get_subscript_result_size(subscript, self.formatted_shape)
+            _get_out_view(out, result_shape, self.formatted_dtype, squeeze)
+            # NB: the parent shape differs only by dimensions of size 1, so this is a view
+            _, parent_shape = get_subscript_result_size(norm_subscript, self.parent.formatted_shape)
+            self.parent.read(norm_subscript, squeeze=False, out=numpy.reshape(out, parent_shape))
+            return out
         if squeeze:
             return self.parent.read(norm_subscript, squeeze=True)
         else:
@@ -1269,33 +1785,26 @@ class SubsetSegment(DataSegment):
     def check_fully_written(self, warn: bool = False) -> bool:
         if self.mode == 'r':
             return True
+        return _check_coverage(self._coverage, warn)
 
-        if self._pixels_written < self._expected_pixels_written:
-            if warn:
-                logger.error(
-                    'Segment expected {} pixels written, but only {} pixels were written'.format(
-                        self._expected_pixels_written, self._pixels_written))
-            return False
-        elif self._pixels_written == self._expected_pixels_written:
-            return True
-        else:
-            if warn:
-                logger.error(
-                    'Segment expected {} pixels written,\n\t'
-                    'but {} pixels were written.\n\t'
-                    'This redundancy may be an error'.format(
-                        self._expected_pixels_written, self._pixels_written))
-            return False
+    def get_unwritten_ranges(self, max_count: Optional[int] = None) -> List[Tuple[Tuple[int, int], ...]]:
+        """
+        Gets the regions, in raw coordinates, which have not been written.
 
-    def _update_pixels_written(self, written: int) -> None:
-        new_pixels_written = self._pixels_written + written
-        if self._pixels_written <= self._expected_pixels_written < new_pixels_written:
-            logger.error(
-                'Segment expected {} pixels written,\n\t'
-                'but now has {} pixels written.\n\t'
-                'This redundancy may be an error'.format(
-                    self._expected_pixels_written, new_pixels_written))
-        self._pixels_written = new_pixels_written
+        Parameters
+        ----------
+        max_count : None|int
+            The maximum number of regions to return.
+
+        Returns
+        -------
+        List[Tuple[Tuple[int, int], ...]]
+            Each entry is the `(start, stop)` range along each raw axis.
+        """
+
+        if self.mode == 'r':
+            return []
+        return self._coverage.get_missing_ranges(max_count=max_count)
 
     def write_raw(
             self,
@@ -1308,7 +1817,7 @@ class SubsetSegment(DataSegment):
         subscript = _infer_subscript_for_write(data, start_indices, subscript, self.raw_shape)
         parent_subscript = self.get_parent_raw_subscript(subscript)
         self.parent.write_raw(data, subscript=parent_subscript, **kwargs)
-        self._update_pixels_written(data.size)
+        _update_coverage(self._coverage, subscript)
 
     def get_raw_bytes(self, warn: bool = True) -> Union[bytes, Tuple]:
         """
@@ -1528,13 +2037,16 @@ class BandAggregateSegment(DataSegment):
     def read_raw(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         self._validate_closed()
         if self.mode != 'r':
             raise ValueError('Requires mode == "r"')
 
         norm_subscript, the_shape = get_subscript_result_size(subscript, self.raw_shape)
-        out = numpy.empty(the_shape, dtype=self.raw_dtype)
+        data = _get_out_view(out, the_shape, self.raw_dtype, squeeze)
+        if data is None:
+            data = numpy.empty(the_shape, dtype=self.raw_dtype)
         full_band_subscript = tuple(slice(0, entry, 1) for entry in the_shape)
 
         for out_index, index in enumerate(numpy.arange(self.bands)[norm_subscript[self.band_dimension]]):
@@ -1542,12 +2054,10 @@ class BandAggregateSegment(DataSegment):
             band_subscript = full_band_subscript[:self.band_dimension] + \
                 (out_index, ) + \
                 full_band_subscript[self.band_dimension+1:]
-            out[band_subscript] = self.children[index].read(child_subscript, squeeze=False)
+            # NB: the band slice of data is a view, so the child populates it directly
+            self.children[index].read(child_subscript, squeeze=False, out=data[band_subscript])
 
-        if squeeze:
-            return numpy.squeeze(out)
-        else:
-            return out
+        return _finalize_read(data, out, squeeze)
 
     def check_fully_written(self, warn: bool = False) -> bool:
         if self.mode == 'r':
@@ -1654,12 +2164,25 @@ class BlockAggregateSegment(DataSegment):
     hole will be populated with `missing_data_value`. Data attempted to write
     across any hole will simply be ignored.
 
+    Children are read directly into the corresponding view of the output array.
+    If the blocks do not overlap, then the children may be read concurrently
+    using `max_workers` threads, and each child request may be split so that no
+    single child read exceeds `max_read_bytes`, bounding the size of any
+    intermediate array allocated by the child.
+
+    Likewise, if the blocks do not overlap, then writes may be performed
+    concurrently using `max_workers` threads. Each child write may be split into
+    row stripes of at most `max_write_bytes`, so that a large write to a single
+    child is also performed concurrently.
+
     Introduced in version 1.3.0.
     """
 
     __slots__ = (
         '_children', '_formatted_child_arrangement', '_raw_child_arrangement',
-        '_missing_data_value', '_close_children')
+        '_missing_data_value', '_close_children', '_disjoint_children',
+        '_max_workers', '_max_read_bytes', '_max_write_bytes', '_executor',
+        '_children_written', '_children_coverage')
 
     def __init__(
             self,
@@ -1673,7 +2196,10 @@ class BlockAggregateSegment(DataSegment):
             reverse_axes: Optional[Union[int, Sequence[int]]] = None,
             transpose_axes: Optional[Tuple[int, ...]] = None,
             format_function: Optional[FormatFunction] = None,
-            close_children: bool = True):
+            close_children: bool = True,
+            max_workers: int = 1,
+            max_read_bytes: Optional[int] = None,
+            max_write_bytes: Optional[int] = None):
         """
 
         Parameters
@@ -1687,15 +2213,33 @@ class BlockAggregateSegment(DataSegment):
             Missing data value, which must be compatible with
             raw_dtype=child.formatted_dtype.
         close_children : bool
+        max_workers : int
+            The maximum number of threads used to read or write children concurrently.
+        max_read_bytes : None|int
+            The maximum size of any single child read request, in bytes.
+            Unbounded, if not provided.
+        max_write_bytes : None|int
+            The maximum size of any single child write request, in bytes.
+            Unbounded, if not provided.
         """
 
-        self.close_children = close_children
         self._close_children = None
+        self.close_children = close_children
 
         self._children = None
         self._formatted_child_arrangement = None
         self._raw_child_arrangement = None
+        self._disjoint_children = False
         self._missing_data_value = missing_data_value
+        self._executor = None
+        self._max_workers = 1
+        self.max_workers = max_workers
+        self._max_read_bytes = None
+        self.max_read_bytes = max_read_bytes
+        self._max_write_bytes = None
+        self.max_write_bytes = max_write_bytes
+        self._children_written = None
+        self._children_coverage = None
         raw_dtype = children[0].formatted_dtype
         the_mode = children[0].mode
         DataSegment.__init__(
@@ -1717,25 +2261,81 @@ class BlockAggregateSegment(DataSegment):
         self._close_children = bool(value)
 
     @property
-    def children(self) -> Tuple[DataSegment, ...]:
+    def max_workers(self) -> int:
         """
-        The collection of children that we are stacking together.
-
-        Returns
-        -------
-        Tuple[DataSegment, ...]
+        int: The maximum number of threads used to read or write children
+        concurrently. Children are only accessed concurrently when the blocks
+        do not overlap.
         """
 
-        return self._children
+        return self._max_workers
 
-    def _set_children(
-            self,
-            children: Sequence[DataSegment],
-            child_arrangement: Sequence[Tuple[slice, ...]],
-            coordinate_basis: str) -> None:
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        value = int(value)
+        if value < 1:
+            raise ValueError('max_workers must be a positive integer')
+        if value != self._max_workers and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._max_workers = value
 
-        if len(children) != len(child_arrangement):
-            raise ValueError('We must have the same number of children as child_arrangement entries')
+    @property
+    def max_read_bytes(self) -> Optional[int]:
+        """
+        None|int: The maximum size of any single child read request, in bytes.
+        """
+
+        return self._max_read_bytes
+
+    @max_read_bytes.setter
+    def max_read_bytes(self, value: Optional[int]) -> None:
+        if value is None:
+            self._max_read_bytes = None
+            return
+        value = int(value)
+        if value < 1:
+            raise ValueError('max_read_bytes must be a positive integer')
+        self._max_read_bytes = value
+
+    @property
+    def max_write_bytes(self) -> Optional[int]:
+        """
+        None|int: The maximum size of any single child write request, in bytes.
+        """
+
+        return self._max_write_bytes
+
+    @max_write_bytes.setter
+    def max_write_bytes(self, value: Optional[int]) -> None:
+        if value is None:
+            self._max_write_bytes = None
+            return
+        value = int(value)
+        if value < 1:
+            raise ValueError('max_write_bytes must be a positive integer')
+        self._max_write_bytes = value
+
+    @property
+    def children(self) -> Tuple[DataSegment, ...]:
+        """
+        The collection of children that we are stacking together.
+
+        Returns
+        -------
+        Tuple[DataSegment, ...]
+        """
+
+        return self._children
+
+    def _set_children(
+            self,
+            children: Sequence[DataSegment],
+            child_arrangement: Sequence[Tuple[slice, ...]],
+            coordinate_basis: str) -> None:
+
+        if len(children) != len(child_arrangement):
+            raise ValueError('We must have the same number of children as child_arrangement entries')
 
         coordinate_basis = coordinate_basis.strip().lower()
         if coordinate_basis == 'raw':
@@ -1770,18 +2370,109 @@ class BlockAggregateSegment(DataSegment):
         self._children = tuple(children)
         self._raw_child_arrangement = tuple(raw_arrangement)
         self._formatted_child_arrangement = tuple(formatted_arrangement)
+        self._disjoint_children = self._check_disjoint(self._raw_child_arrangement)
+        # NB: tracks those children which have been confirmed as fully written
+        self._children_written = numpy.zeros((len(self._children), ), dtype='bool')
+        if self.mode == 'w':
+            # NB: tracks the written portion of each block, relative to the block
+            self._children_coverage = tuple(
+                PixelCoverage(tuple(stop - start for start, stop in self._get_block_bounds(entry)))
+                for entry in self._raw_child_arrangement)
+
+    def _get_block_bounds(self, block: Tuple[slice, ...]) -> Tuple[Tuple[int, int], ...]:
+        """
+        Gets the (start, stop) raw index range along each axis for the given block.
+        """
+
+        return tuple(
+            (min(indices[0], indices[-1]), max(indices[0], indices[-1]) + 1) if len(indices) > 0 else (0, 0)
+            for indices in (range(*entry.indices(size)) for entry, size in zip(block, self.raw_shape)))
+
+    @staticmethod
+    def _check_disjoint(arrangement: Sequence[Tuple[slice, ...]]) -> bool:
+        """
+        Determines whether the blocks of the given arrangement are pairwise disjoint.
+
+        Parameters
+        ----------
+        arrangement : Sequence[Tuple[slice, ...]]
+
+        Returns
+        -------
+        bool
+        """
+
+        def bounds(entry: slice) -> Tuple[int, int]:
+            if entry.step > 0:
+                return entry.start, entry.stop
+            return (0 if entry.stop is None else entry.stop + 1), entry.start + 1
+
+        boxes = [[bounds(entry) for entry in block] for block in arrangement]
+        for i, box0 in enumerate(boxes):
+            for box1 in boxes[i+1:]:
+                if all(lim0[0] < lim1[1] and lim1[0] < lim0[1] for lim0, lim1 in zip(box0, box1)):
+                    return False
+        return True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def _split_request(
+            self,
+            child_subscript: Tuple[slice, ...],
+            parent_subscript: Tuple[slice, ...],
+            max_bytes: Optional[int]) -> List[Tuple[Tuple[slice, ...], Tuple[slice, ...]]]:
+        """
+        Splits the child request along the first dimension, so that no piece
+        exceeds `max_bytes`.
+
+        Parameters
+        ----------
+        child_subscript : Tuple[slice, ...]
+        parent_subscript : Tuple[slice, ...]
+            The (step 1) subscript relative to the output or input array.
+        max_bytes : None|int
+
+        Returns
+        -------
+        List[Tuple[Tuple[slice, ...], Tuple[slice, ...]]]
+        """
+
+        rows = parent_subscript[0].stop - parent_subscript[0].start
+        row_bytes = self.raw_dtype.itemsize*int(numpy.prod(
+            [entry.stop - entry.start for entry in parent_subscript[1:]]))
+        if max_bytes is None or rows*row_bytes <= max_bytes:
+            return [(child_subscript, parent_subscript), ]
+
+        step = max(1, int(max_bytes/max(1, row_bytes)))
+        child_slice = child_subscript[0]
+        out = []
+        for start in range(0, rows, step):
+            stop = min(rows, start + step)
+            # NB: placed immediately beyond the final element, to remain in bounds
+            child_stop = child_slice.start + (stop - 1)*child_slice.step + (1 if child_slice.step > 0 else -1)
+            out.append((
+                (slice(child_slice.start + start*child_slice.step, None if child_stop < 0 else child_stop, child_slice.step), ) +
+                child_subscript[1:],
+                (slice(parent_subscript[0].start + start, parent_subscript[0].start + stop, 1), ) +
+                parent_subscript[1:]))
+        return out
 
     def read_raw(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         self._validate_closed()
         if self.mode != 'r':
             raise ValueError('Requires mode == "r"')
 
         subscript, formatted_shape = get_subscript_result_size(subscript, self.raw_shape)
-        out = numpy.full(formatted_shape, fill_value=self._missing_data_value, dtype=self.raw_dtype)
 
+        tasks = []
+        covered = 0
         for entry, child in zip(self._raw_child_arrangement, self._children):
             use_block = True
             parent_subscript = []
@@ -1796,12 +2487,33 @@ class BlockAggregateSegment(DataSegment):
                     parent_subscript.append(par_entry)
                     child_subscript.append(child_entry)
             if use_block:
-                out[tuple(parent_subscript)] = child.read_raw(tuple(child_subscript), squeeze=False)
-
-        if squeeze:
-            return numpy.squeeze(out)
+                covered += int(numpy.prod([entry.stop - entry.start for entry in parent_subscript]))
+                for the_child_subscript, the_parent_subscript in self._split_request(
+                        tuple(child_subscript), tuple(parent_subscript), self.max_read_bytes):
+                    tasks.append((child, the_child_subscript, the_parent_subscript))
+
+        # NB: for disjoint blocks, the output is fully populated by the children
+        #   exactly when the overlap sizes sum to the output size
+        fully_covered = self._disjoint_children and covered == int(numpy.prod(formatted_shape))
+        data = _get_out_view(out, formatted_shape, self.raw_dtype, squeeze)
+        if data is None:
+            data = numpy.empty(formatted_shape, dtype=self.raw_dtype) if fully_covered else \
+                numpy.full(formatted_shape, fill_value=self._missing_data_value, dtype=self.raw_dtype)
+        elif not fully_covered:
+            data[...] = self._missing_data_value
+
+        def read_child(child_segment: DataSegment, the_subscript: Tuple[slice, ...], target: Tuple[slice, ...]) -> None:
+            child_segment.read_raw(the_subscript, squeeze=False, out=data[target])
+
+        if self._max_workers > 1 and self._disjoint_children and len(tasks) > 1:
+            # NB: the children populate disjoint views of the output
+            futures = [self._get_executor().submit(read_child, *task) for task in tasks]
+            for future in futures:
+                future.result()
         else:
-            return out
+            for task in tasks:
+                read_child(*task)
+        return _finalize_read(data, out, squeeze)
 
     def check_fully_written(self, warn: bool = False) -> bool:
         if self.mode == 'r':
@@ -1809,12 +2521,52 @@ class BlockAggregateSegment(DataSegment):
 
         out = True
         for i, child in enumerate(self.children):
+            if self._children_written[i]:
+                continue
             done = child.check_fully_written(warn=warn)
             if warn and not done:
-                logger.error('Block {} of BlockAggregateSegment indicates incomplete writing'.format(i))
+                coverage = self._children_coverage[i]
+                logger.error(
+                    'Block {} of BlockAggregateSegment indicates incomplete writing.\n\t'
+                    'The unwritten raw ranges (relative to the block) include {}'.format(
+                        i, coverage.describe_missing()))
+            self._children_written[i] = done
             out &= done
         return out
 
+    def get_unwritten_ranges(self, max_count: Optional[int] = None) -> List[Tuple[Tuple[int, int], ...]]:
+        """
+        Gets the regions, in raw coordinates, of the blocks which have not been
+        written via this data segment. Any holes in the block definition are
+        not included.
+
+        Parameters
+        ----------
+        max_count : None|int
+            The maximum number of regions to return.
+
+        Returns
+        -------
+        List[Tuple[Tuple[int, int], ...]]
+            Each entry is the `(start, stop)` range along each raw axis.
+        """
+
+        if self.mode == 'r':
+            return []
+
+        out = []
+        for block, coverage in zip(self._raw_child_arrangement, self._children_coverage):
+            bounds = self._get_block_bounds(block)
+            remaining = None if max_count is None else max_count - len(out)
+            for entry in coverage.get_missing_ranges(max_count=remaining):
+                # NB: the coverage is relative to the block, in its orientation
+                out.append(tuple(
+                    (bound[0] + start, bound[0] + stop) if the_slice.step > 0 else (bound[1] - stop, bound[1] - start)
+                    for (start, stop), bound, the_slice in zip(entry, bounds, block)))
+            if max_count is not None and len(out) >= max_count:
+                break
+        return out
+
     def write_raw(
             self,
             data: numpy.ndarray,
@@ -1833,6 +2585,10 @@ class BlockAggregateSegment(DataSegment):
 
         **Only one of `start_indices` and `subscript` should be specified.**
 
+        If the blocks do not overlap and `max_workers > 1`, then the child writes
+        (split into row stripes according to `max_write_bytes`) are performed
+        concurrently.
+
         Parameters
         ----------
         data : numpy.ndarray
@@ -1854,12 +2610,15 @@ class BlockAggregateSegment(DataSegment):
         self._verify_write_raw_details(data)
 
         norm_subscript = _infer_subscript_for_write(data, start_indices, subscript, self.raw_shape)
-        for entry, child in zip(self._raw_child_arrangement, self._children):
+        tasks = []
+        block_coverage = []
+        for block_index, (entry, child) in enumerate(zip(self._raw_child_arrangement, self._children)):
             # determine if there is overlap of norm_subscript with this block,
             # and write the appropriate data, if so.
             use_block = True
             data_subscript = []
             child_subscript = []
+            block_subscript = []
             for lim, data_slice, block_slice in zip(self.raw_shape, norm_subscript, entry):
                 child_entry, par_entry = _find_slice_overlap(data_slice, block_slice)
                 # this expresses the overlap between our data slice in overall coordinates
@@ -1875,9 +2634,29 @@ class BlockAggregateSegment(DataSegment):
                 _, data_entry = _find_slice_overlap(slice(0, lim, 1), par_entry)
                 data_subscript.append(data_entry)
                 child_subscript.append(child_entry)
+                block_subscript.append(child_entry)
 
             if use_block:
-                child.write(data[tuple(data_subscript)], subscript=tuple(child_subscript), **kwargs)
+                block_coverage.append((block_index, tuple(block_subscript)))
+                for the_child_subscript, the_data_subscript in self._split_request(
+                        tuple(child_subscript), tuple(data_subscript), self.max_write_bytes):
+                    tasks.append((child, the_child_subscript, the_data_subscript))
+
+        def write_child(child_segment: DataSegment, the_subscript: Tuple[slice, ...], source: Tuple[slice, ...]) -> None:
+            child_segment.write(data[source], subscript=the_subscript, **kwargs)
+
+        if self._max_workers > 1 and self._disjoint_children and len(tasks) > 1:
+            # NB: the children populate disjoint portions of the output
+            futures = [self._get_executor().submit(write_child, *task) for task in tasks]
+            for future in futures:
+                future.result()
+        else:
+            for task in tasks:
+                write_child(*task)
+
+        for block_index, block_subscript in block_coverage:
+            # NB: any redundancy is reported by the child
+            self._children_coverage[block_index].add(block_subscript)
 
     def get_raw_bytes(self, warn: bool = True) -> Union[bytes, Tuple]:
         self._validate_closed()
@@ -1898,7 +2677,10 @@ class BlockAggregateSegment(DataSegment):
                 return
 
             self.flush()
-            if self._children is not None:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._children is not None and self.close_children:
                 for entry in self._children:
                     entry.close()
             DataSegment.close(self)
@@ -1907,176 +2689,540 @@ class BlockAggregateSegment(DataSegment):
             return
 
 
-####
-# Concrete implementations
-
-class NumpyArraySegment(DataSegment):
+class CachedDataSegment(DataSegment):
     """
-    DataSegment based on reading from a numpy.ndarray.
+    Wraps a given read mode DataSegment, and caches fixed size tiles of its
+    formatted (or raw) data in a least recently used cache bounded by a total
+    byte budget. Reads are assembled from the cached tiles, and only tiles not
+    present in the cache are fetched from the parent.
 
-    Introduced in version 1.3.0.
+    Introduced in version 1.3.62.
     """
 
-    __slots__ = ('_underlying_array', '_pixels_written', '_expected_pixels_written')
+    _allowed_modes = ('r', )
+
+    __slots__ = (
+        '_parent', '_close_parent', '_coordinate_basis', '_tile_shape',
+        '_max_bytes', '_cache', '_cached_bytes', '_hits', '_misses', '_cache_lock')
 
     def __init__(
             self,
-            underlying_array: numpy.ndarray,
-            formatted_dtype: Optional[Union[str, numpy.dtype]] = None,
-            formatted_shape: Optional[Tuple[int, ...]] = None,
-            reverse_axes: Optional[Union[int, Sequence[int]]] = None,
-            transpose_axes: Optional[Tuple[int, ...]] = None,
-            format_function: Optional[FormatFunction] = None,
-            mode: str = 'r'):
+            parent: DataSegment,
+            tile_shape: Optional[Tuple[int, ...]] = None,
+            max_bytes: int = 256*1048576,
+            coordinate_basis: str = 'formatted',
+            close_parent: bool = True):
         """
 
         Parameters
         ----------
-        underlying_array : numpy.ndarray
-        formatted_dtype : str|numpy.dtype
-        formatted_shape : Tuple[int, ...]
-        reverse_axes : None|int|Sequence[int]
-            The collection of axes (in raw order) to reverse, prior to applying
-            transpose operation
-        transpose_axes : None|Tuple[int, ...]
-            The transpose operation to perform to the raw data, after applying
-            any axis reversal, and before applying any format function
-        format_function : None|FormatFunction
-        mode : str
+        parent : DataSegment
+        tile_shape : None|Tuple[int, ...]
+            The tile shape in the cached coordinate basis. If not provided, tiles
+            will be at most 512 elements along each of the first two dimensions,
+            and span the full extent of any further dimensions.
+        max_bytes : int
+            The maximum total size of cached tiles, in bytes.
+        coordinate_basis : str
+            The coordinate basis in which to tile and cache, it should be one of
+            `('raw', 'formatted')`.
+        close_parent : bool
+            Call parent.close() when close is called?
         """
 
-        if not isinstance(underlying_array, numpy.ndarray):
-            raise TypeError(
-                'underlying array must be a numpy.ndarray, got type `{}`'.format(
-                    type(underlying_array)))
-        self._underlying_array = underlying_array
-        self._pixels_written = 0
-        if formatted_dtype is None:
-            if format_function is None:
-                formatted_dtype = underlying_array.dtype
-            else:
-                raise ValueError(
-                    'Format function is provided, so formatted_dtype must be provided.')
-        if formatted_shape is None:
-            if format_function is None:
-                if transpose_axes is None:
-                    formatted_shape = underlying_array.shape
-                else:
-                    formatted_shape = [underlying_array.shape[index] for index in transpose_axes]
-            else:
-                raise ValueError(
-                    'Format function is provided, so formatted_shape must be provided.')
+        self._close_parent = None
+        self.close_parent = close_parent
+        self._parent = parent
+        if parent.mode != 'r':
+            raise ValueError('Requires a parent with mode "r"')
+
+        coordinate_basis = coordinate_basis.strip().lower()
+        if coordinate_basis not in ['raw', 'formatted']:
+            raise ValueError('Got unexpected coordinate basis `{}`'.format(coordinate_basis))
+        self._coordinate_basis = coordinate_basis
+
+        self._max_bytes = None
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._cache_lock = threading.Lock()
 
         DataSegment.__init__(
-            self, underlying_array.dtype, underlying_array.shape, formatted_dtype, formatted_shape,
-            reverse_axes=reverse_axes, transpose_axes=transpose_axes, format_function=format_function,
-            mode=mode)
-        if self.mode == 'w':
-            self._expected_pixels_written = self._underlying_array.size
-        else:
-            self._expected_pixels_written = 0
+            self, parent.raw_dtype, parent.raw_shape, parent.formatted_dtype, parent.formatted_shape,
+            mode='r')
+
+        self._tile_shape = None
+        self._set_tile_shape(tile_shape)
+
+    def _validate_shapes(self) -> None:
+        # handled by the parent
+        pass
 
     @property
-    def underlying_array(self) -> numpy.ndarray:
-        """
-        The underlying data array.
+    def parent(self) -> DataSegment:
+        return self._parent
 
-        Returns
-        -------
-        numpy.ndarray
+    @property
+    def close_parent(self) -> bool:
+        """
+        bool: Call parent.close() when close is called?
         """
 
-        return self._underlying_array
+        return self._close_parent
 
-    def read_raw(
-            self,
-            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
-        self._validate_closed()
-        if self.mode != 'r':
-            raise ValueError('Requires mode == "r"')
+    @close_parent.setter
+    def close_parent(self, value):
+        self._close_parent = bool(value)
 
-        subscript, out_shape = get_subscript_result_size(subscript, self.raw_shape)
-        out = self._underlying_array[subscript]  # squeezed by default
+    @property
+    def coordinate_basis(self) -> str:
+        """
+        str: The coordinate basis in which tiles are defined and cached, one of
+        `('raw', 'formatted')`.
+        """
 
-        if squeeze:
-            return numpy.squeeze(out)
-        else:
-            return numpy.reshape(out, out_shape)
+        return self._coordinate_basis
 
-    def check_fully_written(self, warn: bool = False) -> bool:
-        if self.mode == 'r':
-            return True
+    @property
+    def _basis_shape(self) -> Tuple[int, ...]:
+        return self.raw_shape if self.coordinate_basis == 'raw' else self.formatted_shape
 
-        if self._pixels_written < self._expected_pixels_written:
-            if warn:
-                logger.error(
-                    'Segment expected {} pixels written, but only {} pixels were written'.format(
-                        self._expected_pixels_written, self._pixels_written))
-            return False
-        elif self._pixels_written == self._expected_pixels_written:
-            return True
-        else:
-            if warn:
-                logger.error(
-                    'Segment expected {} pixels written,\n\t'
-                    'but {} pixels were written.\n\t'
-                    'This redundancy may be an error'.format(
-                        self._expected_pixels_written, self._pixels_written))
-            return False
+    @property
+    def _basis_dtype(self) -> numpy.dtype:
+        return self.raw_dtype if self.coordinate_basis == 'raw' else self.formatted_dtype
 
-    def _update_pixels_written(self, written: int) -> None:
-        new_pixels_written = self._pixels_written + written
-        if self._pixels_written <= self._expected_pixels_written < new_pixels_written:
-            logger.error(
-                'Segment expected {} pixels written,\n\t'
-                'but now has {} pixels written.\n\t'
-                'This redundancy may be an error'.format(
-                    self._expected_pixels_written, new_pixels_written))
-        self._pixels_written = new_pixels_written
+    @property
+    def tile_shape(self) -> Tuple[int, ...]:
+        """
+        Tuple[int, ...]: The tile shape, in the cached coordinate basis.
+        """
 
-    def write_raw(
-            self,
-            data: numpy.ndarray,
-            start_indices: Optional[Union[int, Tuple[int, ...]]] = None,
-            subscript: Optional[Sequence[slice]] = None,
-            **kwargs):
-        self._validate_closed()
-        self._verify_write_raw_details(data)
-        subscript = _infer_subscript_for_write(data, start_indices, subscript, self.raw_shape)
-        self._underlying_array[subscript] = data
-        self._update_pixels_written(data.size)
+        return self._tile_shape
 
-    def get_raw_bytes(self, warn: bool = False) -> Union[bytes, Tuple]:
-        self._validate_closed()
-        if warn and not self.check_fully_written(warn=True):
-            logger.error(
-                'There has been a call to `get_raw_bytes` from {},\n\t'
-                'but all pixels are not fully written'.format(self.__class__))
-        return self.underlying_array.tobytes()
+    def _set_tile_shape(self, value: Optional[Tuple[int, ...]]) -> None:
+        basis_shape = self._basis_shape
+        if value is None:
+            value = tuple(
+                min(entry, 512) if index < 2 else entry for index, entry in enumerate(basis_shape))
+        if not isinstance(value, tuple) or len(value) != len(basis_shape):
+            raise ValueError(
+                'tile_shape must be a tuple of length {}, got `{}`'.format(len(basis_shape), value))
+        for entry in value:
+            if not isinstance(entry, int) or entry <= 0:
+                raise ValueError('tile_shape must be specified by a tuple of positive ints, got `{}`'.format(value))
+        self._tile_shape = value
 
-    def flush(self) -> None:
-        self._validate_closed()
-        try:
-            if self.mode == 'w' and hasattr(self._underlying_array, 'flush'):
-                # noinspection PyUnresolvedReferences
-                self._underlying_array.flush()
-        except AttributeError:
-            return
+    @property
+    def max_bytes(self) -> int:
+        """
+        int: The maximum total size of cached tiles, in bytes.
+        """
 
-    def close(self) -> None:
-        try:
-            if self._closed:
-                return
+        return self._max_bytes
 
-            self.flush()
-            self._underlying_array = None
-            DataSegment.close(self)
-        except AttributeError:
-            return
+    @max_bytes.setter
+    def max_bytes(self, value):
+        value = int(value)
+        if value < 0:
+            raise ValueError('max_bytes must be non-negative')
+        self._max_bytes = value
+        if hasattr(self, '_cache_lock'):
+            with self._cache_lock:
+                self._evict()
 
+    @property
+    def hits(self) -> int:
+        """
+        int: The number of tile requests satisfied from the cache.
+        """
 
-class NumpyMemmapSegment(NumpyArraySegment):
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        int: The number of tile requests which required fetching from the parent.
+        """
+
+        return self._misses
+
+    @property
+    def cached_bytes(self) -> int:
+        """
+        int: The current total size of the cached tiles, in bytes.
+        """
+
+        return self._cached_bytes
+
+    def get_cache_statistics(self) -> dict:
+        """
+        Gets the cache statistics.
+
+        Returns
+        -------
+        dict
+            With keys `hits`, `misses`, `tiles`, `cached_bytes`, and `max_bytes`.
+        """
+
+        with self._cache_lock:
+            return {
+                'hits': self._hits, 'misses': self._misses, 'tiles': len(self._cache),
+                'cached_bytes': self._cached_bytes, 'max_bytes': self._max_bytes}
+
+    def clear_cache(self) -> None:
+        """
+        Empty the cache. This does not reset the hit and miss counts.
+        """
+
+        with self._cache_lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+
+    def _evict(self) -> None:
+        # NB: this is assumed to be called with the cache lock held
+        while self._cached_bytes > self._max_bytes and len(self._cache) > 0:
+            _, tile = self._cache.popitem(last=False)
+            self._cached_bytes -= tile.nbytes
+
+    def _get_tile_subscript(self, tile_index: Tuple[int, ...]) -> Tuple[slice, ...]:
+        return tuple(
+            slice(index*size, min((index+1)*size, limit), 1)
+            for index, size, limit in zip(tile_index, self.tile_shape, self._basis_shape))
+
+    def _get_tile(self, tile_index: Tuple[int, ...]) -> numpy.ndarray:
+        """
+        Gets the given tile, from the cache if present, and otherwise from the
+        parent.
+
+        Parameters
+        ----------
+        tile_index : Tuple[int, ...]
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        with self._cache_lock:
+            tile = self._cache.get(tile_index, None)
+            if tile is not None:
+                self._cache.move_to_end(tile_index)
+                self._hits += 1
+                return tile
+            self._misses += 1
+
+        tile_subscript = self._get_tile_subscript(tile_index)
+        if self.coordinate_basis == 'raw':
+            tile = self.parent.read_raw(tile_subscript, squeeze=False)
+        else:
+            tile = self.parent.read(tile_subscript, squeeze=False)
+        tile.flags.writeable = False
+
+        with self._cache_lock:
+            if tile.nbytes <= self._max_bytes and tile_index not in self._cache:
+                self._cache[tile_index] = tile
+                self._cached_bytes += tile.nbytes
+                self._evict()
+        return tile
+
+    @staticmethod
+    def _get_axis_overlaps(
+            data_slice: slice,
+            size: int) -> List[Tuple[int, slice, slice]]:
+        """
+        Determine the tiles along a given axis which intersect the given slice.
+
+        Parameters
+        ----------
+        data_slice : slice
+            The normalized slice along this axis.
+        size : int
+            The tile size along this axis.
+
+        Returns
+        -------
+        List[Tuple[int, slice, slice]]
+            Entries of the form `(tile index, tile relative slice, output slice)`.
+        """
+
+        stop = -1 if data_slice.stop is None else data_slice.stop
+        indices = numpy.arange(data_slice.start, stop, data_slice.step)
+        tiles = indices // size
+        # the locations where the tile index changes
+        breaks = numpy.concatenate(([0, ], numpy.nonzero(numpy.diff(tiles))[0] + 1, [indices.size, ]))
+        overlaps = []
+        for out_start, out_stop in zip(breaks[:-1], breaks[1:]):
+            tile = int(tiles[out_start])
+            tile_start = int(indices[out_start]) - tile*size
+            tile_stop = int(indices[out_stop - 1]) - tile*size + data_slice.step
+            if tile_stop < 0:
+                tile_stop = None
+            overlaps.append(
+                (tile, slice(tile_start, tile_stop, data_slice.step),
+                 slice(int(out_start), int(out_stop), 1)))
+        return overlaps
+
+    def _read_from_tiles(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze: bool,
+            out: Optional[numpy.ndarray]) -> numpy.ndarray:
+        """
+        Assembles the data for the subscript in the cached coordinate basis from
+        the intersecting tiles.
+
+        Parameters
+        ----------
+        subscript : None|int|slice|Sequence[int|slice|Tuple[int, ...]]
+        squeeze : bool
+        out : None|numpy.ndarray
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        subscript, result_shape = get_subscript_result_size(subscript, self._basis_shape)
+        data = _get_out_view(out, result_shape, self._basis_dtype, squeeze)
+        if data is None:
+            data = numpy.empty(result_shape, dtype=self._basis_dtype)
+
+        # determine the intersecting tiles along each axis
+        axis_overlaps = [
+            self._get_axis_overlaps(data_slice, size)
+            for data_slice, size in zip(subscript, self.tile_shape)]
+
+        for combination in itertools.product(*axis_overlaps):
+            tile = self._get_tile(tuple(entry[0] for entry in combination))
+            data[tuple(entry[2] for entry in combination)] = tile[tuple(entry[1] for entry in combination)]
+        return _finalize_read(data, out, squeeze)
+
+    def read_raw(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        self._validate_closed()
+        if self.coordinate_basis == 'raw':
+            return self._read_from_tiles(subscript, squeeze, out)
+        return self.parent.read_raw(subscript, squeeze=squeeze, out=out)
+
+    def read(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        self._validate_closed()
+        if self.coordinate_basis == 'formatted':
+            return self._read_from_tiles(subscript, squeeze, out)
+
+        # read the raw data through the cache, and apply the parent format function
+        norm_subscript = self.verify_formatted_subscript(subscript)
+        raw_subscript = self.parent.format_function.transform_formatted_slice(norm_subscript)
+        raw_data = self.read_raw(raw_subscript, squeeze=False)
+        if out is None:
+            return self.parent.format_function(raw_data, raw_subscript, squeeze=squeeze)
+        _, result_shape = get_subscript_result_size(norm_subscript, self.formatted_shape)
+        out_view = _get_out_view(out, result_shape, self.formatted_dtype, squeeze)
+        self.parent.format_function(raw_data, raw_subscript, squeeze=False, out=out_view)
+        return out
+
+    def check_fully_written(self, warn: bool = False) -> bool:
+        return True
+
+    def write_raw(
+            self,
+            data: numpy.ndarray,
+            start_indices: Union[None, int, Tuple[int, ...]] = None,
+            subscript: Union[None, Sequence[slice]] = None,
+            **kwargs):
+        raise ValueError('I/O Error, functionality requires mode == "w"')
+
+    def get_raw_bytes(self, warn: bool = True) -> Union[bytes, Tuple]:
+        self._validate_closed()
+        return self.parent.get_raw_bytes(warn=warn)
+
+    def close(self):
+        try:
+            if self._closed:
+                return
+
+            self.clear_cache()
+            if self.close_parent:
+                self.parent.close()
+            DataSegment.close(self)
+            self._parent = None
+        except AttributeError:
+            return
+
+
+####
+# Concrete implementations
+
+class NumpyArraySegment(DataSegment):
+    """
+    DataSegment based on reading from a numpy.ndarray.
+
+    Introduced in version 1.3.0.
+    """
+
+    __slots__ = ('_underlying_array', '_coverage')
+
+    def __init__(
+            self,
+            underlying_array: numpy.ndarray,
+            formatted_dtype: Optional[Union[str, numpy.dtype]] = None,
+            formatted_shape: Optional[Tuple[int, ...]] = None,
+            reverse_axes: Optional[Union[int, Sequence[int]]] = None,
+            transpose_axes: Optional[Tuple[int, ...]] = None,
+            format_function: Optional[FormatFunction] = None,
+            mode: str = 'r'):
+        """
+
+        Parameters
+        ----------
+        underlying_array : numpy.ndarray
+        formatted_dtype : str|numpy.dtype
+        formatted_shape : Tuple[int, ...]
+        reverse_axes : None|int|Sequence[int]
+            The collection of axes (in raw order) to reverse, prior to applying
+            transpose operation
+        transpose_axes : None|Tuple[int, ...]
+            The transpose operation to perform to the raw data, after applying
+            any axis reversal, and before applying any format function
+        format_function : None|FormatFunction
+        mode : str
+        """
+
+        if not isinstance(underlying_array, numpy.ndarray):
+            raise TypeError(
+                'underlying array must be a numpy.ndarray, got type `{}`'.format(
+                    type(underlying_array)))
+        self._underlying_array = underlying_array
+        self._coverage = None
+        if formatted_dtype is None:
+            if format_function is None:
+                formatted_dtype = underlying_array.dtype
+            else:
+                raise ValueError(
+                    'Format function is provided, so formatted_dtype must be provided.')
+        if formatted_shape is None:
+            if format_function is None:
+                if transpose_axes is None:
+                    formatted_shape = underlying_array.shape
+                else:
+                    formatted_shape = [underlying_array.shape[index] for index in transpose_axes]
+            else:
+                raise ValueError(
+                    'Format function is provided, so formatted_shape must be provided.')
+
+        DataSegment.__init__(
+            self, underlying_array.dtype, underlying_array.shape, formatted_dtype, formatted_shape,
+            reverse_axes=reverse_axes, transpose_axes=transpose_axes, format_function=format_function,
+            mode=mode)
+        if self.mode == 'w':
+            self._coverage = PixelCoverage(self.raw_shape)
+
+    @property
+    def underlying_array(self) -> numpy.ndarray:
+        """
+        The underlying data array.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        return self._underlying_array
+
+    def read_raw(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        self._validate_closed()
+        if self.mode != 'r':
+            raise ValueError('Requires mode == "r"')
+
+        subscript, out_shape = get_subscript_result_size(subscript, self.raw_shape)
+        data = self._underlying_array[subscript]  # squeezed by default
+
+        if out is not None:
+            _get_out_view(out, out_shape, self.raw_dtype, squeeze)[...] = numpy.reshape(data, out_shape)
+            return out
+        elif squeeze:
+            return numpy.squeeze(data)
+        else:
+            return numpy.reshape(data, out_shape)
+
+    def check_fully_written(self, warn: bool = False) -> bool:
+        if self.mode == 'r':
+            return True
+        return _check_coverage(self._coverage, warn)
+
+    def get_unwritten_ranges(self, max_count: Optional[int] = None) -> List[Tuple[Tuple[int, int], ...]]:
+        """
+        Gets the regions, in raw coordinates, which have not been written.
+
+        Parameters
+        ----------
+        max_count : None|int
+            The maximum number of regions to return.
+
+        Returns
+        -------
+        List[Tuple[Tuple[int, int], ...]]
+            Each entry is the `(start, stop)` range along each raw axis.
+        """
+
+        if self.mode == 'r':
+            return []
+        return self._coverage.get_missing_ranges(max_count=max_count)
+
+    def write_raw(
+            self,
+            data: numpy.ndarray,
+            start_indices: Optional[Union[int, Tuple[int, ...]]] = None,
+            subscript: Optional[Sequence[slice]] = None,
+            **kwargs):
+        self._validate_closed()
+        self._verify_write_raw_details(data)
+        subscript = _infer_subscript_for_write(data, start_indices, subscript, self.raw_shape)
+        self._underlying_array[subscript] = data
+        _update_coverage(self._coverage, subscript)
+
+    def get_raw_bytes(self, warn: bool = False) -> Union[bytes, Tuple]:
+        self._validate_closed()
+        if warn and not self.check_fully_written(warn=True):
+            logger.error(
+                'There has been a call to `get_raw_bytes` from {},\n\t'
+                'but all pixels are not fully written'.format(self.__class__))
+        return self.underlying_array.tobytes()
+
+    def flush(self) -> None:
+        self._validate_closed()
+        try:
+            if self.mode == 'w' and hasattr(self._underlying_array, 'flush'):
+                # noinspection PyUnresolvedReferences
+                self._underlying_array.flush()
+        except AttributeError:
+            return
+
+    def close(self) -> None:
+        try:
+            if self._closed:
+                return
+
+            self.flush()
+            self._underlying_array = None
+            DataSegment.close(self)
+        except AttributeError:
+            return
+
+
+class NumpyMemmapSegment(NumpyArraySegment):
     """
     DataSegment based on establishing a numpy memmap, and using that as the
     underlying array.
@@ -2127,9 +3273,6 @@ class NumpyMemmapSegment(NumpyArraySegment):
         self.close_file = close_file
         self._file_object = file_object
 
-        self._pixels_written = 0
-        self._expected_pixels_written = 0
-
         mmap_mode = 'r' if mode == 'r' else 'r+'
         self._memory_map = numpy.memmap(
             file_object,
@@ -2176,16 +3319,39 @@ class NumpyMemmapSegment(NumpyArraySegment):
             return
 
 
+def _get_chunk_cache_slots(chunk_count: int) -> int:
+    """
+    Gets the number of hash table slots for a hdf5 raw chunk cache holding the
+    given number of chunks. Following the hdf5 guidance, this is a prime number
+    roughly 100 times the number of chunks.
+    """
+
+    value = max(101, 100*int(chunk_count)) | 1
+    while any(value % entry == 0 for entry in range(3, int(value**0.5) + 1, 2)):
+        value += 2
+    return value
+
+
 class HDF5DatasetSegment(DataSegment):
     """
     DataSegment based on reading from an hdf5 file, using the h5py library.
 
+    For a chunked (possibly compressed) dataset, the h5py raw chunk cache for
+    the dataset may be sized using `chunk_cache_bytes`, so that chunks shared
+    by successive reads are only decompressed once. Reads with a step no larger
+    than the chunk size along some axis fetch the chunk aligned span containing
+    the requested elements, in batches of at most `max_batch_bytes`, and then
+    extract the requested elements, rather than using a strided hdf5 selection.
+
+    Several segments may share a single `h5py.File` object, with only the final
+    one to be closed using `close_file=True`.
+
     Introduced in version 1.3.0.
     """
     _allowed_modes = ('r', )
 
     __slots__ = (
-        '_file_object', '_data_set', '_close_file')
+        '_file_object', '_data_set', '_close_file', '_chunk_cache_bytes', '_max_batch_bytes')
 
     def __init__(
             self,
@@ -2196,7 +3362,9 @@ class HDF5DatasetSegment(DataSegment):
             reverse_axes: Optional[Union[int, Sequence[int]]] = None,
             transpose_axes: Optional[Tuple[int, ...]] = None,
             format_function: Optional[FormatFunction] = None,
-            close_file: bool = False):
+            close_file: bool = False,
+            chunk_cache_bytes: Optional[int] = None,
+            max_batch_bytes: int = 64*1048576):
         """
 
         Parameters
@@ -2213,11 +3381,20 @@ class HDF5DatasetSegment(DataSegment):
             any axis reversal, and before applying any format function
         format_function : None|FormatFunction
         close_file : bool
+        chunk_cache_bytes : None|int
+            The size in bytes of the raw chunk cache for a chunked dataset. If
+            `None`, the chunk cache of the file (1 MiB, by default) is used.
+            This is only applicable for a dataset given by path.
+        max_batch_bytes : int
+            The maximum size in bytes of each chunk aligned span fetched for a
+            strided read.
         """
 
         self._close_file = None
         self._file_object = None
         self._data_set = None
+        self._chunk_cache_bytes = None
+        self._max_batch_bytes = int(max_batch_bytes)
 
         if h5py is None:
             raise ValueError(
@@ -2226,6 +3403,16 @@ class HDF5DatasetSegment(DataSegment):
         if isinstance(file_object, str):
             close_file = True
 
+        if chunk_cache_bytes is not None:
+            chunk_cache_bytes = int(chunk_cache_bytes)
+            if chunk_cache_bytes < 0:
+                raise ValueError('chunk_cache_bytes must be a non-negative integer')
+            if not isinstance(data_set, str):
+                raise ValueError('chunk_cache_bytes requires that data_set is given by path')
+        self._chunk_cache_bytes = chunk_cache_bytes
+        if self._max_batch_bytes < 1:
+            raise ValueError('max_batch_bytes must be a positive integer')
+
         self._set_file_object(file_object)
         self._set_data_set(data_set)
 
@@ -2279,14 +3466,98 @@ class HDF5DatasetSegment(DataSegment):
             value = self.file_object[value]
         if not isinstance(value, h5py.Dataset):
             raise ValueError('Requires a dataset path or h5py.Dataset object')
+        if self._chunk_cache_bytes is not None and value.chunks is not None:
+            # open the dataset again, with its own appropriately sized chunk cache
+            nbytes = self._chunk_cache_bytes
+            chunk_bytes = int(numpy.prod(value.chunks))*value.dtype.itemsize
+            access_list = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+            access_list.set_chunk_cache(_get_chunk_cache_slots(max(1, nbytes//chunk_bytes)), nbytes, 1.0)
+            value = h5py.Dataset(h5py.h5d.open(self.file_object.id, value.name.encode('utf-8'), dapl=access_list))
         self._data_set = value
 
+    @property
+    def chunks(self) -> Optional[Tuple[int, ...]]:
+        """
+        None|Tuple[int, ...]: The chunk shape of the dataset, which is `None`
+        for a contiguous dataset.
+        """
+
+        return self.data_set.chunks
+
+    @property
+    def chunk_cache_bytes(self) -> Optional[int]:
+        """
+        None|int: The size in bytes of the raw chunk cache for the dataset, if
+        specifically configured.
+        """
+
+        return self._chunk_cache_bytes
+
+    def _use_chunk_aligned(self, subscript: Tuple[slice, ...]) -> bool:
+        chunks = self.chunks
+        if chunks is None:
+            return False
+        return any(1 < entry.step <= chunk for entry, chunk in zip(subscript, chunks))
+
+    def _read_chunk_aligned(self, subscript: Tuple[slice, ...], out_shape: Tuple[int, ...]) -> numpy.ndarray:
+        """
+        Reads the positive step subscript by fetching the spans containing the
+        requested elements, in batches of chunk rows, and extracting the
+        requested elements.
+        """
+
+        chunks = self.chunks
+        data = numpy.empty(out_shape, dtype=self.raw_dtype)
+        if data.size == 0:
+            return data
+
+        # the span along each axis (other than the first)
+        read_subscript = []
+        extract_subscript = []
+        span_size = 1
+        for entry, chunk, count in zip(subscript[1:], chunks[1:], out_shape[1:]):
+            last = entry.start + (count - 1)*entry.step
+            if entry.step <= chunk:
+                read_subscript.append(slice(entry.start, last + 1, 1))
+                extract_subscript.append(slice(None, None, entry.step))
+                span_size *= last + 1 - entry.start
+            else:
+                read_subscript.append(entry)
+                extract_subscript.append(slice(None, None, 1))
+                span_size *= count
+
+        # batches along the first axis, aligned to chunk boundaries
+        row_slice, row_chunk, row_count = subscript[0], chunks[0], out_shape[0]
+        row_bytes = max(1, span_size*self.raw_dtype.itemsize)
+        batch_rows = max(1, self._max_batch_bytes//(row_bytes*row_chunk))*row_chunk
+        first_row = row_slice.start
+        last_row = first_row + (row_count - 1)*row_slice.step
+        batch_start = (first_row//row_chunk)*row_chunk
+        while batch_start <= last_row:
+            batch_end = min(batch_start + batch_rows, last_row + 1)
+            # the output indices within this batch
+            out_start = max(0, -((first_row - batch_start)//row_slice.step))
+            out_end = min(row_count, -((first_row - batch_end)//row_slice.step))
+            if out_end > out_start:
+                start = first_row + out_start*row_slice.step
+                stop = first_row + (out_end - 1)*row_slice.step + 1
+                if row_slice.step <= row_chunk:
+                    batch = self.data_set[(slice(start, stop, 1), ) + tuple(read_subscript)]
+                    data[out_start:out_end] = batch[(slice(None, None, row_slice.step), ) + tuple(extract_subscript)]
+                else:
+                    batch = self.data_set[(slice(start, stop, row_slice.step), ) + tuple(read_subscript)]
+                    data[out_start:out_end] = batch[(slice(None, None, 1), ) + tuple(extract_subscript)]
+            batch_start = batch_end
+        return data
+
     def read_raw(
             self,
             subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         self._validate_closed()
         subscript, out_shape = get_subscript_result_size(subscript, self.raw_shape)
+        out_view = _get_out_view(out, out_shape, self.raw_dtype, squeeze)
 
         # NB: h5py does not support slicing with a negative step (right now)
         #   we need to read the identical elements in positive order,
@@ -2303,14 +3574,24 @@ class HDF5DatasetSegment(DataSegment):
                 use_subscript.append(entry)
         use_subscript = tuple(use_subscript)
 
-        out = numpy.reshape(self.data_set[use_subscript], out_shape)
+        if self._use_chunk_aligned(use_subscript):
+            data = self._read_chunk_aligned(use_subscript, out_shape)
+        elif out_view is not None and len(reverse) == 0 and out_view.flags.c_contiguous:
+            # read directly into the provided array
+            self.data_set.read_direct(out_view, source_sel=use_subscript)
+            return out
+        else:
+            data = numpy.reshape(self.data_set[use_subscript], out_shape)
         for index in reverse:
-            out = numpy.flip(out, axis=index)
+            data = numpy.flip(data, axis=index)
 
-        if squeeze:
-            return numpy.squeeze(out)
-        else:
+        if out_view is not None:
+            out_view[...] = data
             return out
+        elif squeeze:
+            return numpy.squeeze(data)
+        else:
+            return data
 
     def write_raw(
             self,
@@ -2345,12 +3626,30 @@ class FileReadDataSegment(DataSegment):
     Read a data array manually from a file - this is primarily intended for cloud
     usage.
 
+    For high latency storage, a read may be split into row stripes which are
+    fetched concurrently by a pool of worker threads, and assembled into a single
+    output array. This is enabled by setting `max_workers` greater than 1.
+
+    Data is read using `readinto`, directly into the output array when the
+    subscript defines a contiguous span of full rows. Otherwise, only the byte
+    range containing the requested columns of each requested row is read, with
+    ranges separated by no more than `coalesce_gap` bytes combined into a single
+    read, into a reusable buffer from which the requested elements are extracted.
+
     Introduced in version 1.3.0.
     """
     _allowed_modes = ('r', )
 
+    pooled_buffer_limit = 64*1048576
+    """
+    The maximum size, in bytes, of the read buffer retained for reuse by each
+    reading thread. Larger buffers are allocated for the given read only.
+    """
+
     __slots__ = (
-        '_file_object', '_data_offset', '_close_file')
+        '_file_object', '_data_offset', '_close_file',
+        '_max_workers', '_stripe_size', '_coalesce_gap', '_file_opener', '_executor',
+        '_file_lock', '_thread_data', '_opened_files')
 
     def __init__(
             self,
@@ -2363,7 +3662,11 @@ class FileReadDataSegment(DataSegment):
             reverse_axes: Optional[Union[int, Sequence[int]]] = None,
             transpose_axes: Optional[Tuple[int, ...]] = None,
             format_function: Optional[FormatFunction] = None,
-            close_file: bool = False):
+            close_file: bool = False,
+            max_workers: int = 1,
+            stripe_size: int = 16*1048576,
+            file_opener: Optional[Callable[[], BinaryIO]] = None,
+            coalesce_gap: int = 1048576):
         """
 
         Parameters
@@ -2382,12 +3685,38 @@ class FileReadDataSegment(DataSegment):
             any axis reversal, and before applying any format function
         format_function : None|FormatFunction
         close_file : bool
+        max_workers : int
+            The maximum number of worker threads used to fetch row stripes
+            concurrently. The value 1 reads serially on the calling thread.
+        stripe_size : int
+            The target size, in bytes, of a single row stripe for concurrent
+            reading. A stripe always consists of at least one row.
+        file_opener : None|Callable[[], BinaryIO]
+            Optional callable which returns a new, independent file-like object
+            for the same resource. If provided, each worker thread uses its own
+            file object. Otherwise, positional reads are used for real files
+            and access to any other file-like object is serialized.
+        coalesce_gap : int
+            The maximum number of unneeded bytes between the byte ranges of
+            consecutive requested rows for which the ranges will be combined
+            into a single read.
         """
 
         self._file_object = None
         self._data_offset = None
         self._close_file = None
+        self._max_workers = None
+        self._stripe_size = None
+        self._coalesce_gap = None
+        self._file_opener = file_opener
+        self._executor = None
+        self._file_lock = threading.Lock()
+        self._thread_data = threading.local()
+        self._opened_files = []
         self.close_file = close_file
+        self.max_workers = max_workers
+        self.stripe_size = stripe_size
+        self.coalesce_gap = coalesce_gap
         self._set_data_offset(data_offset)
         self._set_file_object(file_object)
         DataSegment.__init__(
@@ -2407,6 +3736,55 @@ class FileReadDataSegment(DataSegment):
     def close_file(self, value):
         self._close_file = bool(value)
 
+    @property
+    def max_workers(self) -> int:
+        """
+        int: The maximum number of worker threads used for reading row stripes.
+        """
+
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        value = int(value)
+        if value < 1:
+            raise ValueError('max_workers must be a positive integer')
+        if self._executor is not None and value != self._max_workers:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._max_workers = value
+
+    @property
+    def stripe_size(self) -> int:
+        """
+        int: The target size in bytes of a single row stripe for concurrent reading.
+        """
+
+        return self._stripe_size
+
+    @stripe_size.setter
+    def stripe_size(self, value):
+        value = int(value)
+        if value < 1:
+            raise ValueError('stripe_size must be a positive integer')
+        self._stripe_size = value
+
+    @property
+    def coalesce_gap(self) -> int:
+        """
+        int: The maximum gap in bytes between the byte ranges of consecutive
+        requested rows for which the ranges are combined into a single read.
+        """
+
+        return self._coalesce_gap
+
+    @coalesce_gap.setter
+    def coalesce_gap(self, value):
+        value = int(value)
+        if value < 0:
+            raise ValueError('coalesce_gap must be a non-negative integer')
+        self._coalesce_gap = value
+
     @property
     def file_object(self) -> BinaryIO:
         return self._file_object
@@ -2431,51 +3809,266 @@ class FileReadDataSegment(DataSegment):
             raise ValueError('data_offset must be non-negative.')
         self._data_offset = value
 
-    def read_raw(
-            self,
-            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
-            squeeze=True) -> numpy.ndarray:
-        self._validate_closed()
-        subscript, out_shape = get_subscript_result_size(subscript, self.raw_shape)
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _get_thread_file_object(self) -> BinaryIO:
+        """
+        Gets the file object for use by the current worker thread, opening it
+        using `file_opener` on first use.
+
+        Returns
+        -------
+        BinaryIO
+        """
+
+        file_object = getattr(self._thread_data, 'file_object', None)
+        if file_object is None:
+            file_object = self._file_opener()
+            if not is_file_like(file_object):
+                raise ValueError('file_opener must return a file-like object')
+            self._thread_data.file_object = file_object
+            with self._file_lock:
+                self._opened_files.append(file_object)
+        return file_object
+
+    def _get_buffer(self, size: int) -> memoryview:
+        """
+        Gets a writable byte buffer of the given size, reusing the buffer
+        retained for the current thread if possible.
 
-        init_slice = subscript[0]
-        init_reverse = (init_slice.step < 0)
-        if init_reverse:
-            init_slice = _reverse_slice(init_slice)
-
-        pixel_per_row = 1 if self.formatted_ndim == 1 else int(numpy.prod(self.raw_shape[1:]))
-        row_stride = self.raw_dtype.itemsize*pixel_per_row
-
-        start_row = init_slice.start
-        rows = init_slice.stop - init_slice.start
-
-        # read the whole contiguous chunk from start_row up to the final row
-        # seek to the proper start location
-        start_loc = self._data_offset + start_row*row_stride
-        self.file_object.seek(start_loc, os.SEEK_SET)
-        total_size = rows*row_stride
-        # read our data
-        data = self.file_object.read(total_size)
-        if len(data) != total_size:
+        Parameters
+        ----------
+        size : int
+
+        Returns
+        -------
+        memoryview
+        """
+
+        if size > self.pooled_buffer_limit:
+            return memoryview(bytearray(size))
+
+        buffer = getattr(self._thread_data, 'buffer', None)
+        if buffer is None or len(buffer) < size:
+            buffer = bytearray(size)
+            self._thread_data.buffer = buffer
+        return memoryview(buffer)[:size]
+
+    def _fetch_into(self, start_loc: int, buffer: memoryview) -> None:
+        """
+        Populate the given writable byte buffer from the file, starting at the
+        given absolute location. This is safe to call concurrently from worker
+        threads.
+
+        Parameters
+        ----------
+        start_loc : int
+        buffer : memoryview
+        """
+
+        size = buffer.nbytes
+        if self._file_opener is not None:
+            file_object = self._get_thread_file_object()
+            file_object.seek(start_loc, os.SEEK_SET)
+            count = _read_into_buffer(file_object, buffer)
+        elif hasattr(os, 'preadv') and is_real_file(self.file_object):
+            # positional reads do not modify the shared file position
+            file_number = self.file_object.fileno()
+            count = 0
+            while count < size:
+                part = os.preadv(file_number, [buffer[count:]], start_loc + count)
+                if part == 0:
+                    break
+                count += part
+        else:
+            with self._file_lock:
+                self.file_object.seek(start_loc, os.SEEK_SET)
+                count = _read_into_buffer(self.file_object, buffer)
+
+        if count != size:
             raise ValueError(
                 'Tried to read {} bytes of data, but received {}.\n'
                 'The most likely reason for this is a malformed chipper, \n'
-                'which attempts to read more data than the file contains'.format(total_size, len(data)))
-        # define temp array from this data
-        data = numpy.frombuffer(data, self._raw_dtype, rows*pixel_per_row)
-        data = numpy.reshape(data, (rows, ) + self.raw_shape[1:])
-        # extract our data
-        out = data[(slice(None, None, init_slice.step), ) + subscript[1:]]
-        out = numpy.reshape(out, out_shape)
-        if init_reverse:
-            out = numpy.flip(out, axis=0)
+                'which attempts to read more data than the file contains'.format(size, count))
 
-        if squeeze:
-            out = numpy.copy(numpy.squeeze(out))
+    def _read_ranges(self, buffer: memoryview, ranges: Sequence[Tuple[int, int, int]]) -> None:
+        """
+        Populates the given byte buffer from the given collection of byte ranges.
+        The ranges are fetched concurrently, if `max_workers > 1` and there is
+        more than one range.
+
+        Parameters
+        ----------
+        buffer : memoryview
+        ranges : Sequence[Tuple[int, int, int]]
+            Each entry is of the form `(file location, buffer offset, size)`.
+        """
+
+        if self.max_workers == 1 or len(ranges) == 1:
+            for start_loc, offset, size in ranges:
+                self._fetch_into(start_loc, buffer[offset:offset+size])
+            return
+
+        futures = [
+            self._get_executor().submit(self._fetch_into, start_loc, buffer[offset:offset+size])
+            for start_loc, offset, size in ranges]
+        for future in futures:
+            future.result()  # NB: this will raise any exception from the worker
+
+    def _get_stripe_rows(self, row_step_bytes: int, rows: int) -> int:
+        """
+        Gets the number of rows to be fetched in a single read, in keeping with
+        `max_workers` and `stripe_size`.
+
+        Parameters
+        ----------
+        row_step_bytes : int
+            The number of bytes between the starts of consecutive requested rows.
+        rows : int
+            The total number of requested rows.
+
+        Returns
+        -------
+        int
+        """
+
+        if self.max_workers == 1:
+            return rows
+        return max(1, int(self.stripe_size/row_step_bytes))
+
+    def plan_row_ranges(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]]) -> List[Tuple[int, int, int]]:
+        """
+        Determine the collection of byte ranges which will be read to satisfy the
+        given raw subscript. Only the columns spanned by the subscript in each
+        requested row are read, and the ranges for consecutive requested rows
+        are combined if separated by no more than `coalesce_gap` bytes.
+
+        Parameters
+        ----------
+        subscript : None|int|slice|Sequence[int|slice|Tuple[int, ...]]
+
+        Returns
+        -------
+        List[Tuple[int, int, int]]
+            Each entry is of the form `(file location, first row index, row count)`,
+            where the row index is relative to the requested rows, in increasing
+            order. The read of an entry covers the column window of each of the
+            row count requested rows, and the unneeded bytes between them.
+        """
+
+        return self._get_read_plan(self.verify_raw_subscript(subscript))[0]
+
+    def _get_read_plan(self, subscript: Tuple[slice, ...]) -> Tuple[List[Tuple[int, int, int]], dict]:
+        """
+        Determine the read ranges and details necessary for interpreting the
+        fetched bytes for the given normalized raw subscript.
+
+        Parameters
+        ----------
+        subscript : Tuple[slice, ...]
+
+        Returns
+        -------
+        ranges : List[Tuple[int, int, int]]
+        details : dict
+        """
+
+        itemsize = self.raw_dtype.itemsize
+        element_strides = tuple(
+            itemsize*int(numpy.prod(self.raw_shape[index+1:])) for index in range(self.raw_ndim))
+        row_stride = element_strides[0]
+
+        row_slice = subscript[0]
+        if row_slice.step < 0:
+            row_slice = _reverse_slice(row_slice)
+        rows = get_slice_result_size(row_slice)
+
+        if self.raw_ndim > 1:
+            # determine the window of columns spanned by the subscript
+            col_slice = subscript[1]
+            col_count = get_slice_result_size(col_slice)
+            col_last = col_slice.start + (col_count - 1)*col_slice.step
+            col_first = min(col_slice.start, col_last)
+            window_cols = abs(col_last - col_slice.start) + 1
+            local_stop = None if col_slice.stop is None else col_slice.stop - col_first
+            if local_stop is not None and local_stop < 0:
+                local_stop = None
+            window_shape = (window_cols, ) + self.raw_shape[2:]
+            window_subscript = (slice(col_slice.start - col_first, local_stop, col_slice.step), ) + subscript[2:]
+            window_offset = col_first*element_strides[1]
+            window_bytes = window_cols*element_strides[1]
         else:
-            out = numpy.copy(out)
-        del data
-        return out
+            window_shape = ()
+            window_subscript = ()
+            window_offset = 0
+            window_bytes = row_stride
+
+        row_step_bytes = row_slice.step*row_stride
+        if row_step_bytes - window_bytes <= self.coalesce_gap:
+            rows_per_range = min(rows, self._get_stripe_rows(row_step_bytes, rows))
+        else:
+            rows_per_range = 1
+
+        ranges = []
+        for first_row in range(0, rows, rows_per_range):
+            the_row = row_slice.start + first_row*row_slice.step
+            ranges.append(
+                (self.data_offset + the_row*row_stride + window_offset, first_row, min(rows_per_range, rows - first_row)))
+        details = {
+            'row_step_bytes': row_step_bytes, 'window_bytes': window_bytes,
+            'window_shape': window_shape, 'window_subscript': window_subscript,
+            'strides': (row_step_bytes, ) + element_strides[1:]}
+        return ranges, details
+
+    def read_raw(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        self._validate_closed()
+        subscript, out_shape = get_subscript_result_size(subscript, self.raw_shape)
+        out_view = _get_out_view(out, out_shape, self.raw_dtype, squeeze)
+        ranges, details = self._get_read_plan(subscript)
+        row_step_bytes = details['row_step_bytes']
+        window_bytes = details['window_bytes']
+
+        full_rows = (subscript[0].step == 1) and all(
+            entry == slice(0, size, 1) for entry, size in zip(subscript[1:], self.raw_shape[1:]))
+        if full_rows and (out_view is None or out_view.flags.c_contiguous):
+            # the requested data is exactly a contiguous span, so read it directly
+            data = numpy.empty(out_shape, dtype=self.raw_dtype) if out_view is None else out_view
+            self._read_ranges(
+                _get_byte_view(data),
+                [(start_loc, first_row*row_step_bytes, (row_count - 1)*row_step_bytes + window_bytes)
+                 for start_loc, first_row, row_count in ranges])
+            return _finalize_read(data, out, squeeze)
+
+        # read each range into a reusable buffer, one after another
+        buffer_ranges = []
+        total_size = 0
+        for start_loc, first_row, row_count in ranges:
+            size = (row_count - 1)*row_step_bytes + window_bytes
+            buffer_ranges.append((start_loc, total_size, size))
+            total_size += size
+        buffer = self._get_buffer(total_size)
+        self._read_ranges(buffer, buffer_ranges)
+
+        if out_view is None:
+            out_view = numpy.empty(out_shape, dtype=self.raw_dtype)
+        # NB: rows are fetched in increasing order
+        target = numpy.flip(out_view, axis=0) if subscript[0].step < 0 else out_view
+        for (start_loc, first_row, row_count), (_, offset, size) in zip(ranges, buffer_ranges):
+            # interpret the bytes as the column windows of the given rows
+            fetched = numpy.ndarray(
+                (row_count, ) + details['window_shape'], dtype=self.raw_dtype,
+                buffer=buffer[offset:offset+size], strides=details['strides'])
+            target[first_row:first_row+row_count] = fetched[(slice(None), ) + details['window_subscript']]
+        return _finalize_read(out_view, out, squeeze)
 
     def write_raw(
             self,
@@ -2499,6 +4092,11 @@ class FileReadDataSegment(DataSegment):
             if self._closed:
                 return
 
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            while len(self._opened_files) > 0:
+                self._opened_files.pop().close()
             if self._close_file:
                 if hasattr(self.file_object, 'close'):
                     self.file_object.close()
@@ -2506,3 +4104,633 @@ class FileReadDataSegment(DataSegment):
             DataSegment.close(self)
         except AttributeError:
             return
+
+
+class BlockDecodedDataSegment(DataSegment):
+    """
+    Read a data array which is stored as a collection of independently encoded
+    blocks in a file. The decoding of a single block is provided by the
+    :meth:`_decode_block` method of the concrete subclass.
+
+    Only the blocks intersecting a given read request are decoded, and a bounded
+    number of the most recently used decoded blocks are retained. The raw data
+    has bands in the final dimension.
+
+    The blocks intersecting a read request may be decoded concurrently using
+    `max_workers` threads, each block being placed directly into the output
+    array. This is most beneficial when reading all, or much, of the data,
+    possibly into a caller supplied memory map via the `out` argument.
+
+    Introduced in version 1.3.79.
+    """
+    _allowed_modes = ('r', )
+
+    __slots__ = (
+        '_file_object', '_close_file', '_block_bounds', '_byte_ranges', '_band_indices',
+        '_missing_data_value', '_max_cached_blocks', '_cache', '_hits', '_misses',
+        '_cache_lock', '_file_lock', '_max_workers', '_executor')
+
+    def __init__(
+            self,
+            file_object: BinaryIO,
+            raw_dtype: Union[str, numpy.dtype],
+            raw_shape: Tuple[int, ...],
+            block_bounds: Sequence[Tuple[int, int, int, int]],
+            byte_ranges: Sequence[Optional[Tuple[int, int]]],
+            band_indices: Optional[Sequence[int]] = None,
+            formatted_dtype: Optional[Union[str, numpy.dtype]] = None,
+            formatted_shape: Optional[Tuple[int, ...]] = None,
+            reverse_axes: Optional[Union[int, Sequence[int]]] = None,
+            transpose_axes: Optional[Tuple[int, ...]] = None,
+            format_function: Optional[FormatFunction] = None,
+            missing_data_value=0,
+            max_cached_blocks: int = 16,
+            close_file: bool = False,
+            max_workers: int = 1):
+        """
+
+        Parameters
+        ----------
+        file_object : BinaryIO
+        raw_dtype : str|numpy.dtype
+        raw_shape : Tuple[int, ...]
+            Of the form `(rows, columns)` or `(rows, columns, bands)`.
+        block_bounds : Sequence[Tuple[int, int, int, int]]
+            The `(row_start, row_end, column_start, column_end)` pixel bounds
+            of each block, which are assumed to be pairwise disjoint. Any padding
+            of the decoded block beyond these bounds is discarded.
+        byte_ranges : Sequence[None|Tuple[int, int]]
+            The `(start, end)` byte location of each encoded block relative to
+            the start of the file-like object, or `None` for a block which is
+            masked out, and populated by `missing_data_value`.
+        band_indices : None|Sequence[int]
+            If provided, the block is the single band of this index (e.g. NITF
+            `IMODE=S`). Otherwise, each block contains all bands.
+        formatted_dtype : None|str|numpy.dtype
+        formatted_shape : None|Tuple[int, ...]
+        reverse_axes : None|int|Sequence[int]
+        transpose_axes : None|Tuple[int, ...]
+        format_function : None|FormatFunction
+        missing_data_value
+        max_cached_blocks : int
+            The maximum number of decoded blocks retained.
+        close_file : bool
+        max_workers : int
+            The maximum number of threads used to decode blocks concurrently.
+        """
+
+        self._close_file = None
+        self.close_file = close_file
+        if not is_file_like(file_object):
+            raise ValueError('Requires a file-like object')
+        self._file_object = file_object
+        self._missing_data_value = missing_data_value
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._cache_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._max_cached_blocks = None
+        self.max_cached_blocks = max_cached_blocks
+        self._executor = None
+        self._max_workers = 1
+        self.max_workers = max_workers
+
+        if formatted_dtype is None:
+            formatted_dtype = raw_dtype
+        if formatted_shape is None:
+            formatted_shape = raw_shape
+        DataSegment.__init__(
+            self, raw_dtype, raw_shape, formatted_dtype, formatted_shape,
+            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+            format_function=format_function, mode='r')
+        self._set_blocks(block_bounds, byte_ranges, band_indices)
+
+    @property
+    def close_file(self) -> bool:
+        """
+        bool: Close the file object when complete?
+        """
+
+        return self._close_file
+
+    @close_file.setter
+    def close_file(self, value):
+        self._close_file = bool(value)
+
+    @property
+    def file_object(self) -> BinaryIO:
+        return self._file_object
+
+    @property
+    def block_count(self) -> int:
+        """
+        int: The number of blocks.
+        """
+
+        return self._block_bounds.shape[0]
+
+    @property
+    def max_cached_blocks(self) -> int:
+        """
+        int: The maximum number of decoded blocks retained.
+        """
+
+        return self._max_cached_blocks
+
+    @max_cached_blocks.setter
+    def max_cached_blocks(self, value: int) -> None:
+        value = int(value)
+        if value < 0:
+            raise ValueError('max_cached_blocks must be a non-negative integer')
+        self._max_cached_blocks = value
+        with self._cache_lock:
+            self._evict()
+
+    @property
+    def max_workers(self) -> int:
+        """
+        int: The maximum number of threads used to decode blocks concurrently.
+        """
+
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        value = int(value)
+        if value < 1:
+            raise ValueError('max_workers must be a positive integer')
+        if value != self._max_workers and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._max_workers = value
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def _set_blocks(
+            self,
+            block_bounds: Sequence[Tuple[int, int, int, int]],
+            byte_ranges: Sequence[Optional[Tuple[int, int]]],
+            band_indices: Optional[Sequence[int]]) -> None:
+        block_bounds = numpy.array(block_bounds, dtype='int64')
+        if block_bounds.ndim != 2 or block_bounds.shape[1] != 4:
+            raise ValueError('block_bounds must have entries of the form (row_start, row_end, col_start, col_end)')
+        if len(byte_ranges) != block_bounds.shape[0]:
+            raise ValueError('We must have the same number of block_bounds and byte_ranges entries')
+        if numpy.any(block_bounds[:, 0] < 0) or numpy.any(block_bounds[:, 1] > self.raw_shape[0]) or \
+                numpy.any(block_bounds[:, 2] < 0) or numpy.any(block_bounds[:, 3] > self.raw_shape[1]) or \
+                numpy.any(block_bounds[:, 0] >= block_bounds[:, 1]) or numpy.any(block_bounds[:, 2] >= block_bounds[:, 3]):
+            raise ValueError('Got block_bounds inconsistent with raw_shape {}'.format(self.raw_shape))
+        if band_indices is not None:
+            if self.raw_ndim != 3:
+                raise ValueError('band_indices requires raw_shape of the form (rows, columns, bands)')
+            band_indices = tuple(int(entry) for entry in band_indices)
+            if len(band_indices) != block_bounds.shape[0]:
+                raise ValueError('We must have the same number of block_bounds and band_indices entries')
+            if any(entry < 0 or entry >= self.raw_shape[2] for entry in band_indices):
+                raise ValueError('Got band_indices inconsistent with raw_shape {}'.format(self.raw_shape))
+        self._block_bounds = block_bounds
+        self._byte_ranges = tuple(None if entry is None else (int(entry[0]), int(entry[1])) for entry in byte_ranges)
+        self._band_indices = band_indices
+
+    def get_cache_statistics(self) -> dict:
+        """
+        Gets the decoded block cache statistics.
+
+        Returns
+        -------
+        dict
+            With keys `hits`, `misses` (the number of block decodes), `blocks`
+            (the number of decoded blocks retained), and `max_blocks`.
+        """
+
+        with self._cache_lock:
+            return {
+                'hits': self._hits, 'misses': self._misses,
+                'blocks': len(self._cache), 'max_blocks': self._max_cached_blocks}
+
+    def clear_cache(self) -> None:
+        """
+        Discard all retained decoded blocks.
+        """
+
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _evict(self) -> None:
+        while len(self._cache) > self._max_cached_blocks:
+            self._cache.popitem(last=False)
+
+    def _read_block_bytes(self, block_index: int) -> bytes:
+        start, end = self._byte_ranges[block_index]
+        if hasattr(os, 'pread') and is_real_file(self.file_object):
+            # positional reads do not modify the shared file position
+            the_bytes = os.pread(self.file_object.fileno(), end - start, start)
+        else:
+            with self._file_lock:
+                initial_loc = self.file_object.tell()
+                self.file_object.seek(start, os.SEEK_SET)
+                the_bytes = self.file_object.read(end - start)
+                self.file_object.seek(initial_loc, os.SEEK_SET)
+        if len(the_bytes) != end - start:
+            raise ValueError(
+                'Tried to read {} bytes of data for block {}, but received {}'.format(
+                    end - start, block_index, len(the_bytes)))
+        return the_bytes
+
+    def _decode_block(self, block_index: int) -> numpy.ndarray:
+        """
+        Decodes the given block, discarding any padding.
+
+        Parameters
+        ----------
+        block_index : int
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `(rows, columns, bands)` with `bands=1` for a single band
+            block, and of `raw_dtype`.
+        """
+
+        raise NotImplementedError
+
+    def _trim_block(self, block_index: int, data: numpy.ndarray) -> numpy.ndarray:
+        """
+        Discards any padding of the decoded block beyond its bounds.
+
+        Parameters
+        ----------
+        block_index : int
+        data : numpy.ndarray
+            The decoded block, of shape `(rows, columns, bands)`.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        row_start, row_end, col_start, col_end = self._block_bounds[block_index]
+        data = data[:row_end - row_start, :col_end - col_start]
+        if data.shape[:2] != (row_end - row_start, col_end - col_start):
+            raise ValueError(
+                'Block {} decoded to shape {}, which is smaller than the expected shape {}'.format(
+                    block_index, data.shape[:2], (row_end - row_start, col_end - col_start)))
+        return data.astype(self.raw_dtype, copy=False)
+
+    def _get_block(self, block_index: int) -> numpy.ndarray:
+        with self._cache_lock:
+            data = self._cache.get(block_index, None)
+            if data is not None:
+                self._cache.move_to_end(block_index)
+                self._hits += 1
+                return data
+            self._misses += 1
+
+        # NB: decode outside of the lock, so distinct blocks may be decoded concurrently
+        data = self._decode_block(block_index)
+        data.setflags(write=False)
+        if self._max_cached_blocks > 0:
+            with self._cache_lock:
+                self._cache[block_index] = data
+                self._evict()
+        return data
+
+    def _get_block_subscript(self, block_index: int) -> Tuple[slice, ...]:
+        row_start, row_end, col_start, col_end = [int(entry) for entry in self._block_bounds[block_index]]
+        out = (slice(row_start, row_end, 1), slice(col_start, col_end, 1))
+        if self.raw_ndim == 3:
+            if self._band_indices is None:
+                out += (slice(0, self.raw_shape[2], 1), )
+            else:
+                band = self._band_indices[block_index]
+                out += (slice(band, band+1, 1), )
+        return out
+
+    def _get_candidate_blocks(self, subscript: Tuple[slice, ...]) -> numpy.ndarray:
+        """
+        Gets the indices of the blocks whose bounding box intersects that of
+        the subscript.
+        """
+
+        limits = []
+        for entry, size in zip(subscript[:2], self.raw_shape[:2]):
+            indices = range(size)[entry]
+            limits.append((min(indices[0], indices[-1]), max(indices[0], indices[-1])) if len(indices) > 0 else (0, -1))
+        bounds = self._block_bounds
+        return numpy.nonzero(
+            (bounds[:, 0] <= limits[0][1]) & (limits[0][0] < bounds[:, 1]) &
+            (bounds[:, 2] <= limits[1][1]) & (limits[1][0] < bounds[:, 3]))[0]
+
+    def read_raw(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        self._validate_closed()
+
+        subscript, result_shape = get_subscript_result_size(subscript, self.raw_shape)
+
+        tasks = []
+        covered = 0
+        for block_index in self._get_candidate_blocks(subscript):
+            use_block = True
+            block_subscript = []
+            out_subscript = []
+            for data_slice, block_slice in zip(subscript, self._get_block_subscript(block_index)):
+                block_entry, out_entry = _find_slice_overlap(data_slice, block_slice)
+                if out_entry is None:
+                    use_block = False
+                    break
+                block_subscript.append(block_entry)
+                out_subscript.append(out_entry)
+            if use_block and self._byte_ranges[block_index] is not None:
+                covered += int(numpy.prod([entry.stop - entry.start for entry in out_subscript]))
+                tasks.append((block_index, tuple(block_subscript), tuple(out_subscript)))
+
+        # NB: the blocks are disjoint, so the output is fully populated exactly
+        #   when the overlap sizes sum to the output size
+        fully_covered = covered == int(numpy.prod(result_shape))
+        data = _get_out_view(out, result_shape, self.raw_dtype, squeeze)
+        if data is None:
+            data = numpy.empty(result_shape, dtype=self.raw_dtype) if fully_covered else \
+                numpy.full(result_shape, fill_value=self._missing_data_value, dtype=self.raw_dtype)
+        elif not fully_covered:
+            data[...] = self._missing_data_value
+
+        def populate(block_index: int, block_subscript: Tuple[slice, ...], out_subscript: Tuple[slice, ...]) -> None:
+            block_data = self._get_block(block_index)
+            if self.raw_ndim == 2:
+                block_subscript += (0, )
+            data[out_subscript] = block_data[block_subscript]
+
+        if self._max_workers > 1 and len(tasks) > 1:
+            # NB: the blocks populate disjoint views of the output
+            futures = [self._get_executor().submit(populate, *task) for task in tasks]
+            for future in futures:
+                future.result()
+        else:
+            for task in tasks:
+                populate(*task)
+        return _finalize_read(data, out, squeeze)
+
+    def write_raw(
+            self,
+            data: numpy.ndarray,
+            start_indices: Union[None, int, Tuple[int, ...]] = None,
+            subscript: Union[None, Sequence[slice]] = None,
+            **kwargs):
+
+        if self.mode != 'w':
+            raise ValueError('I/O Error, functionality requires mode == "w"')
+        raise NotImplementedError
+
+    def get_raw_bytes(self, warn: bool = True) -> Union[bytes, Tuple]:
+        raise NotImplementedError
+
+    def check_fully_written(self, warn: bool = False) -> bool:
+        return True
+
+    def close(self) -> None:
+        try:
+            if self._closed:
+                return
+
+            self.clear_cache()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._close_file and hasattr(self.file_object, 'close'):
+                self.file_object.close()
+            self._file_object = None
+            DataSegment.close(self)
+        except AttributeError:
+            return
+
+
+class JPEGBlockDataSegment(BlockDecodedDataSegment):
+    """
+    Read a data array which is stored as a collection of independently compressed
+    (JPEG, or other PIL decodable) blocks in a file, such as the blocks of a
+    compressed NITF image segment.
+
+    Introduced in version 1.3.69.
+
+    **Changed in version 1.3.79** to be a subclass of :class:`BlockDecodedDataSegment`.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+            self,
+            file_object: BinaryIO,
+            raw_dtype: Union[str, numpy.dtype],
+            raw_shape: Tuple[int, ...],
+            block_bounds: Sequence[Tuple[int, int, int, int]],
+            byte_ranges: Sequence[Optional[Tuple[int, int]]],
+            band_indices: Optional[Sequence[int]] = None,
+            formatted_dtype: Optional[Union[str, numpy.dtype]] = None,
+            formatted_shape: Optional[Tuple[int, ...]] = None,
+            reverse_axes: Optional[Union[int, Sequence[int]]] = None,
+            transpose_axes: Optional[Tuple[int, ...]] = None,
+            format_function: Optional[FormatFunction] = None,
+            missing_data_value=0,
+            max_cached_blocks: int = 16,
+            close_file: bool = False,
+            max_workers: int = 1):
+        """
+        The parameters are as for :class:`BlockDecodedDataSegment`.
+        """
+
+        if PIL_Image is None:
+            raise ValueError('JPEGBlockDataSegment requires PIL')
+
+        BlockDecodedDataSegment.__init__(
+            self, file_object, raw_dtype, raw_shape, block_bounds, byte_ranges,
+            band_indices=band_indices, formatted_dtype=formatted_dtype, formatted_shape=formatted_shape,
+            reverse_axes=reverse_axes, transpose_axes=transpose_axes, format_function=format_function,
+            missing_data_value=missing_data_value, max_cached_blocks=max_cached_blocks,
+            close_file=close_file, max_workers=max_workers)
+
+    def _decode_block(self, block_index: int) -> numpy.ndarray:
+        # noinspection PyUnresolvedReferences
+        img = PIL_Image.open(BytesIO(self._read_block_bytes(block_index)))
+        data = numpy.asarray(img)
+        if data.ndim == 2:
+            data = data[:, :, numpy.newaxis]
+        return self._trim_block(block_index, data)
+
+
+class StreamingWriteSegment(DataSegment):
+    """
+    A write-only data segment which passes its raw data, in order along the
+    first raw axis, to an output function, rather than writing into an
+    underlying array or file with random access. This permits writing to
+    sequential sinks, like pipes or upload streams.
+
+    Each write must span the full extent of every raw axis other than the first.
+    Writes arriving ahead of the next expected position along the first axis
+    are held in memory, up to `max_pending_bytes`, until the preceding data has
+    been written.
+
+    Introduced in version 1.3.75.
+    """
+
+    __slots__ = (
+        '_output_function', '_next_index', '_pending', '_pending_bytes',
+        '_max_pending_bytes', '_write_lock')
+    _allowed_modes = ('w', )
+
+    def __init__(
+            self,
+            output_function: Callable[[numpy.ndarray], None],
+            raw_dtype: Union[str, numpy.dtype],
+            raw_shape: Tuple[int, ...],
+            formatted_dtype: Optional[Union[str, numpy.dtype]] = None,
+            formatted_shape: Optional[Tuple[int, ...]] = None,
+            reverse_axes: Optional[Union[int, Sequence[int]]] = None,
+            transpose_axes: Optional[Tuple[int, ...]] = None,
+            format_function: Optional[FormatFunction] = None,
+            max_pending_bytes: int = 268435456):
+        """
+
+        Parameters
+        ----------
+        output_function : Callable[[numpy.ndarray], None]
+            Accepts each C-contiguous array of raw data, in order.
+        raw_dtype : str|numpy.dtype
+        raw_shape : Tuple[int, ...]
+        formatted_dtype : None|str|numpy.dtype
+        formatted_shape : None|Tuple[int, ...]
+        reverse_axes : None|int|Sequence[int]
+        transpose_axes : None|Tuple[int, ...]
+        format_function : None|FormatFunction
+        max_pending_bytes : int
+            The maximum size of the data held in memory, awaiting the write of
+            preceding data.
+        """
+
+        if not callable(output_function):
+            raise TypeError('output_function must be callable')
+        self._output_function = output_function
+        self._next_index = 0
+        self._pending = {}
+        self._pending_bytes = 0
+        self._write_lock = threading.Lock()
+        max_pending_bytes = int(max_pending_bytes)
+        if max_pending_bytes < 0:
+            raise ValueError('max_pending_bytes must be non-negative')
+        self._max_pending_bytes = max_pending_bytes
+
+        if formatted_dtype is None:
+            formatted_dtype = raw_dtype
+        if formatted_shape is None:
+            formatted_shape = raw_shape if transpose_axes is None else \
+                tuple(raw_shape[index] for index in transpose_axes)
+        DataSegment.__init__(
+            self, raw_dtype, raw_shape, formatted_dtype, formatted_shape,
+            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+            format_function=format_function, mode='w')
+
+    @property
+    def next_index(self) -> int:
+        """
+        int: The next position along the first raw axis to be output.
+        """
+
+        return self._next_index
+
+    @property
+    def pending_bytes(self) -> int:
+        """
+        int: The size of the data held in memory, awaiting the write of preceding
+        data.
+        """
+
+        return self._pending_bytes
+
+    def read_raw(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        raise ValueError('Requires mode == "r"')
+
+    def _output(self, data: numpy.ndarray) -> None:
+        self._output_function(numpy.ascontiguousarray(data, dtype=self.raw_dtype))
+
+    def write_raw(
+            self,
+            data: numpy.ndarray,
+            start_indices: Optional[Union[int, Tuple[int, ...]]] = None,
+            subscript: Optional[Sequence[slice]] = None,
+            **kwargs):
+        self._validate_closed()
+        self._verify_write_raw_details(data)
+        subscript = _infer_subscript_for_write(data, start_indices, subscript, self.raw_shape)
+        if subscript[0].step != 1:
+            raise ValueError('Streaming writes require step 1 along the first axis, got `{}`'.format(subscript[0]))
+        for index, (entry, size) in enumerate(zip(subscript[1:], self.raw_shape[1:])):
+            if entry != slice(0, size, 1):
+                raise ValueError(
+                    'Streaming writes must span the full extent of raw axis {},\n\t'
+                    'got `{}`'.format(index + 1, entry))
+
+        start, stop = subscript[0].start, subscript[0].stop
+        if start == stop:
+            return
+        with self._write_lock:
+            if start < self._next_index:
+                raise ValueError(
+                    'Raw indices {}:{} along the first axis were previously written'.format(start, stop))
+            for pending_start, (pending_stop, _) in self._pending.items():
+                if start < pending_stop and pending_start < stop:
+                    raise ValueError(
+                        'Raw indices {}:{} along the first axis overlap pending indices {}:{}'.format(
+                            start, stop, pending_start, pending_stop))
+
+            if start > self._next_index:
+                if self._pending_bytes + data.nbytes > self._max_pending_bytes:
+                    raise ValueError(
+                        'Writing raw indices {}:{} requires holding {} bytes in memory,\n\t'
+                        'beyond max_pending_bytes {}, since the next index to be output '
+                        'is {}'.format(
+                            start, stop, self._pending_bytes + data.nbytes,
+                            self._max_pending_bytes, self._next_index))
+                self._pending[start] = (stop, numpy.array(data, dtype=self.raw_dtype))
+                self._pending_bytes += data.nbytes
+                return
+
+            self._output(data)
+            self._next_index = stop
+            while self._next_index in self._pending:
+                stop, pending_data = self._pending.pop(self._next_index)
+                self._pending_bytes -= pending_data.nbytes
+                self._output(pending_data)
+                self._next_index = stop
+
+    def check_fully_written(self, warn: bool = False) -> bool:
+        if self._next_index < self.raw_shape[0]:
+            if warn:
+                logger.error(
+                    'Segment expected {} entries along the first axis output,\n\t'
+                    'but only {} were output, with {} bytes pending'.format(
+                        self.raw_shape[0], self._next_index, self._pending_bytes))
+            return False
+        return True
+
+    def get_raw_bytes(self, warn: bool = True) -> Union[bytes, Tuple]:
+        raise ValueError('The raw data for a streaming data segment is not retained')
+
+    def close(self) -> None:
+        try:
+            if self._closed:
+                return
+            self._pending = None
+            self._output_function = None
+            DataSegment.close(self)
+        except AttributeError:
+            return
@@ -0,0 +1,399 @@
+"""
+A persistent on-disk cache of decoded (decompressed) image data, shared across
+reader instances, processes, and runs.
+
+This module introduced in version 1.3.71.
+"""
+
+__classification__ = "UNCLASSIFIED"
+__author__ = "Thomas McCullough"
+
+import hashlib
+import logging
+import os
+import socket
+import time
+from tempfile import mkstemp
+from typing import Union, Tuple, Callable, List, Optional
+
+import numpy
+
+logger = logging.getLogger(__name__)
+
+
+def _process_exists(pid: int) -> bool:
+    """
+    Checks whether the process with the given id (on this host) exists. This
+    is assumed to be true if it cannot be determined.
+    """
+
+    if os.name == 'nt':
+        return True  # NB: os.kill terminates the process on Windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # e.g. owned by another user
+    return True
+
+
+class DecodedSegmentCache(object):
+    """
+    A directory of decoded image data files, keyed by the identity (path, size,
+    and modification time) of the source file and an index for the portion of
+    the source file, such as the image segment index for a NITF file.
+
+    Each entry is created in a temporary file, which is atomically renamed into
+    place once completely populated, so an entry is never observed partially
+    written. Simultaneous creation of the same entry by different processes is
+    coordinated using a lock file, recording the host and process id of its owner,
+    so that the work is not duplicated. Once the total size of the entries
+    (including any partially written entries) exceeds `max_bytes`, the least
+    recently used entries are removed. Lock files and partially written entries
+    abandoned by a process which no longer exists, or older than `lock_timeout`,
+    are removed.
+
+    Introduced in version 1.3.71.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from sarpy.io.product.sidd import SIDDReader
+        reader = SIDDReader('compressed_sidd.nitf', decode_cache='/scratch/sarpy_decode_cache')
+    """
+
+    suffix = '.sarpy_cache'
+    partial_suffix = '.partial'
+    lock_suffix = '.lock'
+    __slots__ = ('_directory', '_max_bytes', '_lock_timeout')
+
+    def __init__(
+            self,
+            directory: str,
+            max_bytes: int = 16*1073741824,
+            lock_timeout: float = 600.):
+        """
+
+        Parameters
+        ----------
+        directory : str
+            The cache directory, which will be created if it does not exist.
+        max_bytes : int
+            The maximum total size of the entries in the cache directory.
+        lock_timeout : float
+            The maximum time, in seconds, to wait for another process which is
+            creating the same entry. Beyond this, the entry is created without
+            the lock. A lock or partially written entry of this age, whose owner
+            cannot be verified as alive, is considered abandoned.
+        """
+
+        self._directory = None
+        self._max_bytes = None
+        self._lock_timeout = None
+        os.makedirs(directory, exist_ok=True)
+        self._directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.lock_timeout = lock_timeout
+
+    @property
+    def directory(self) -> str:
+        """
+        str: The cache directory.
+        """
+
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        int: The maximum total size of the entries in the cache directory.
+        """
+
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        value = int(value)
+        if value < 0:
+            raise ValueError('max_bytes must be non-negative')
+        self._max_bytes = value
+
+    @property
+    def lock_timeout(self) -> float:
+        """
+        float: The maximum time, in seconds, to wait for another process which
+        is creating the same entry.
+        """
+
+        return self._lock_timeout
+
+    @lock_timeout.setter
+    def lock_timeout(self, value: float) -> None:
+        value = float(value)
+        if value < 0:
+            raise ValueError('lock_timeout must be non-negative')
+        self._lock_timeout = value
+
+    @staticmethod
+    def get_key(
+            file_name: str,
+            index: int,
+            dtype: Union[str, numpy.dtype],
+            shape: Tuple[int, ...]) -> str:
+        """
+        Gets the cache key for the given file and portion of it.
+
+        Parameters
+        ----------
+        file_name : str
+        index : int
+            The index of the portion of the file, e.g. image segment index.
+        dtype : str|numpy.dtype
+            The data type of the decoded data.
+        shape : Tuple[int, ...]
+            The shape of the decoded data.
+
+        Returns
+        -------
+        str
+        """
+
+        stat = os.stat(file_name)
+        identity = '{}|{}|{}|{}|{}|{}'.format(
+            os.path.realpath(file_name), stat.st_size, stat.st_mtime_ns,
+            int(index), numpy.dtype(dtype).str, tuple(int(entry) for entry in shape))
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def _get_entries(self, suffix: Optional[str] = None) -> List[Tuple[str, float, int]]:
+        """
+        Gets the current entries, as (path, modification time, size).
+
+        Parameters
+        ----------
+        suffix : None|str
+            The file suffix, defaulting to the suffix of complete entries.
+        """
+
+        suffix = self.suffix if suffix is None else suffix
+        out = []
+        for fil in os.listdir(self.directory):
+            if not fil.endswith(suffix):
+                continue
+            path = os.path.join(self.directory, fil)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # removed by another process
+            out.append((path, stat.st_mtime, stat.st_size))
+        return out
+
+    def get_size(self) -> int:
+        """
+        Gets the total size of the entries, including any partially written
+        entries, in the cache directory.
+
+        Returns
+        -------
+        int
+        """
+
+        return sum(entry[2] for entry in self._get_entries()) + \
+            sum(entry[2] for entry in self._get_entries(self.partial_suffix))
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # NB: possibly in use, on some operating systems, or already removed
+            logger.debug('Failed removing cache file {}'.format(path))
+            return False
+
+    def _remove_abandoned(self) -> int:
+        """
+        Remove the partially written entries and lock files which have been
+        abandoned, e.g. by a process which crashed.
+
+        Returns
+        -------
+        int
+            The total size of the removed partially written entries.
+        """
+
+        removed = 0
+        now = time.time()
+        for path, mod_time, size in self._get_entries(self.partial_suffix):
+            if now - mod_time > self.lock_timeout and self._remove(path):
+                removed += size
+        for path, _, _ in self._get_entries(self.lock_suffix):
+            if self._is_stale_lock(path):
+                self._remove(path)
+        return removed
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove any abandoned partially written entries and lock files, and then
+        the least recently used entries, until the total size does not exceed
+        `max_bytes`.
+
+        Parameters
+        ----------
+        keep : None|str
+            An entry which should not be removed.
+        """
+
+        total = self.get_size() - self._remove_abandoned()
+        entries = sorted(self._get_entries(), key=lambda entry: entry[1])
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self._remove(path):
+                total -= size
+
+    def clear(self) -> None:
+        """
+        Remove all entries, and any abandoned partially written entries and lock files.
+        """
+
+        for path, _, _ in self._get_entries():
+            self._remove(path)
+        self._remove_abandoned()
+
+    @staticmethod
+    def _get_lock_owner() -> str:
+        return '{} {}'.format(socket.gethostname(), os.getpid())
+
+    def _is_stale_lock(self, lock_path: str) -> bool:
+        """
+        Checks whether the given lock file has been abandoned. That is, its owner
+        is a process on this host which no longer exists, or its owner cannot be
+        verified and it is older than `lock_timeout`.
+        """
+
+        try:
+            lock_age = time.time() - os.stat(lock_path).st_mtime
+            with open(lock_path, 'r') as fi:
+                host, _, pid = fi.read().partition(' ')
+        except (OSError, ValueError):
+            return False  # the lock was just released
+        if host == socket.gethostname() and pid.isdigit():
+            return not _process_exists(int(pid))
+        return lock_age > self.lock_timeout
+
+    def _acquire_lock(self, lock_path: str, path: str) -> Optional[bool]:
+        """
+        Acquire the lock for creating the given entry, waiting for any other
+        process creating the same entry.
+
+        Returns
+        -------
+        None|bool
+            `True` if the lock was acquired, `False` if the entry was created by
+            another process while waiting, and `None` if the lock is still held
+            by another (live) process after waiting `lock_timeout`.
+        """
+
+        start = time.time()
+        while True:
+            try:
+                fi = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                try:
+                    os.write(fi, self._get_lock_owner().encode('utf-8'))
+                finally:
+                    os.close(fi)
+                return True
+            except FileExistsError:
+                pass
+            if os.path.exists(path):
+                return False
+            if self._is_stale_lock(lock_path):
+                logger.warning('Removing the abandoned lock file {}'.format(lock_path))
+                self._remove(lock_path)
+                continue
+            if time.time() - start > self.lock_timeout:
+                logger.warning(
+                    'The lock file {} is still held after {} seconds,\n\t'
+                    'creating the entry without the lock'.format(lock_path, self.lock_timeout))
+                return None
+            time.sleep(0.05)
+
+    def get_file(
+            self,
+            file_name: str,
+            index: int,
+            dtype: Union[str, numpy.dtype],
+            shape: Tuple[int, ...],
+            populate: Callable[[numpy.memmap], None]) -> str:
+        """
+        Gets the path of the cache entry for the given file and portion of it,
+        creating it if necessary.
+
+        Parameters
+        ----------
+        file_name : str
+        index : int
+            The index of the portion of the file, e.g. image segment index.
+        dtype : str|numpy.dtype
+            The data type of the decoded data.
+        shape : Tuple[int, ...]
+            The shape of the decoded data.
+        populate : Callable[[numpy.memmap], None]
+            Populates the provided (writable, initially zero) memory map of the
+            given dtype and shape with the decoded data.
+
+        Returns
+        -------
+        str
+        """
+
+        dtype = numpy.dtype(dtype)
+        expected_size = dtype.itemsize*int(numpy.prod(shape))
+        path = os.path.join(self.directory, self.get_key(file_name, index, dtype, shape) + self.suffix)
+
+        def use_existing() -> bool:
+            try:
+                if os.stat(path).st_size != expected_size:
+                    return False
+                os.utime(path)  # mark as recently used
+                return True
+            except OSError:
+                return False
+
+        if use_existing():
+            logger.debug('Using decoded cache entry {} for {}, index {}'.format(path, file_name, index))
+            return path
+
+        lock_path = path + self.lock_suffix
+        locked = self._acquire_lock(lock_path, path)
+        if not locked and use_existing():
+            return path
+
+        try:
+            if locked and use_existing():
+                return path  # created by another process, after our first check
+            fi, temp_path = mkstemp(suffix=self.partial_suffix, dir=self.directory)
+            os.close(fi)
+            try:
+                mem_map = numpy.memmap(temp_path, dtype=dtype, mode='w+', offset=0, shape=shape)
+                populate(mem_map)
+                mem_map.flush()
+                del mem_map
+                os.replace(temp_path, path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        finally:
+            if locked:
+                try:
+                    os.remove(lock_path)
+                except OSError:
+                    pass
+
+        logger.info('Created decoded cache entry {} for {}, index {}'.format(path, file_name, index))
+        self.evict(keep=path)
+        return path
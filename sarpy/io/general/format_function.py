@@ -9,7 +9,7 @@ __author__ = "Thomas McCullough"
 
 
 import logging
-from typing import Union, Tuple, Optional
+from typing import Union, Tuple, Optional, List
 
 import numpy
 
@@ -270,7 +270,8 @@ class FormatFunction(object):
             self,
             array: numpy.ndarray,
             subscript: Tuple[slice, ...],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         """
         Performs the reformatting operation. The output data will have
         dimensions of size 1 squeezed by this operation, it should not generally
@@ -284,14 +285,23 @@ class FormatFunction(object):
             The slice definition which yielded the input raw array.
         squeeze : bool
             Apply numpy.squeeze operation, which eliminates dimensions of size 1?
+            This is ignored if `out` is provided.
+        out : None|numpy.ndarray
+            Optional array into which the formatted data will be written. This
+            must have the appropriate data type, and the same number of elements
+            as the formatted result.
 
         Returns
         -------
         numpy.ndarray
-            The output formatted array.
+            The output formatted array. This will be `out`, if provided.
         """
 
         array = self._reverse_and_transpose(array, inverse=False)
+        if out is not None:
+            self._forward_functional_step_into(array, subscript, out)
+            return out
+
         array = self._forward_functional_step(array, subscript)
         if squeeze:
             return numpy.squeeze(array)
@@ -415,6 +425,33 @@ class FormatFunction(object):
 
         raise NotImplementedError
 
+    def _forward_functional_step_into(
+            self,
+            array: numpy.ndarray,
+            subscript: Tuple[slice, ...],
+            out: numpy.ndarray) -> None:
+        """
+        Performs the functional operation, writing the result into the provided
+        array. This default implementation simply copies the result of
+        :func:`_forward_functional_step`, and should be overridden where the
+        result can be written directly.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            The raw data to be transformed.
+        subscript : Tuple[int, ...]
+            The subscript in raw coordinates which would yield the raw data.
+        out : numpy.ndarray
+            The array to be populated.
+
+        Returns
+        -------
+        None
+        """
+
+        out[...] = numpy.reshape(self._forward_functional_step(array, subscript), out.shape)
+
     # noinspection PyTypeChecker
     def _reverse_functional_step(
             self,
@@ -530,13 +567,18 @@ class ComplexFormatFunction(FormatFunction):
     assuming that the raw data has fixed dimensionality and the real/imaginary
     pairs fall along a given band dimension.
 
+    IQ and QI formatted data is written directly into the (complex64) output,
+    viewed as interleaved float32 pairs when the band dimension is last, in a
+    single pass and without temporary arrays. Setting `chunk_size` bounds the
+    size of intermediate arrays used in magnitude/phase conversion.
+
     Introduced in version 1.3.0.
     """
     has_inverse = True
     _allowed_ordering = ('IQ', 'QI', 'MP', 'PM')
 
     __slots__ = (
-        '_band_dimension', '_order', '_raw_dtype')
+        '_band_dimension', '_order', '_raw_dtype', '_chunk_size')
 
     def __init__(
             self,
@@ -546,7 +588,8 @@ class ComplexFormatFunction(FormatFunction):
             formatted_shape: Optional[Tuple[int, ...]] = None,
             reverse_axes: Optional[Tuple[int, ...]] = None,
             transpose_axes: Optional[Tuple[int, ...]] = None,
-            band_dimension: int = -1):
+            band_dimension: int = -1,
+            chunk_size: Optional[int] = None):
         """
 
         Parameters
@@ -564,12 +607,17 @@ class ComplexFormatFunction(FormatFunction):
         transpose_axes : None|Tuple[int, ...]
         band_dimension : int
             Which band is the complex dimension, **after** the transpose operation.
+        chunk_size : None|int
+            The approximate maximum number of formatted elements to convert at
+            a time. All at once, if not provided.
         """
 
         self._raw_dtype = numpy.dtype(raw_dtype)  # type: numpy.dtype
         self._band_dimension = None
         self._order = None
+        self._chunk_size = None
         self._set_order(order)
+        self.chunk_size = chunk_size
 
         FormatFunction.__init__(
             self, raw_shape=raw_shape, formatted_shape=formatted_shape,
@@ -608,6 +656,26 @@ class ComplexFormatFunction(FormatFunction):
                 raise ValueError('band_dimension is read only once set')
         self._band_dimension = value
 
+    @property
+    def chunk_size(self) -> Optional[int]:
+        """
+        None|int: The approximate maximum number of formatted elements to convert
+        at a time, which bounds the size of intermediate arrays. All at once,
+        if `None`.
+        """
+
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value: Optional[int]) -> None:
+        if value is None:
+            self._chunk_size = None
+            return
+        value = int(value)
+        if value < 1:
+            raise ValueError('chunk_size must be a positive integer')
+        self._chunk_size = value
+
     @property
     def order(self) -> str:
         """
@@ -781,10 +849,20 @@ class ComplexFormatFunction(FormatFunction):
         out.real = magnitude*numpy.cos(theta)
         out.imag = magnitude*numpy.sin(theta)
 
-    def _forward_functional_step(
-            self,
-            data: numpy.ndarray,
-            subscript: Tuple[slice, ...]) -> numpy.ndarray:
+    def _get_forward_shape(self, data: numpy.ndarray) -> Tuple[int, ...]:
+        """
+        Validates the reoriented raw data, and gets the shape of the corresponding
+        formatted data.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+
+        Returns
+        -------
+        Tuple[int, ...]
+        """
+
         if data.ndim != self.raw_ndim:
             raise ValueError('Expected raw data of dimension {}'.format(self.raw_ndim))
         if (data.shape[self.band_dimension] % 2) != 0:
@@ -794,40 +872,155 @@ class ComplexFormatFunction(FormatFunction):
 
         band_dim_size = data.shape[self.band_dimension]
         if self.formatted_ndim < self.raw_ndim:
-            out_shape = data.shape[:self.band_dimension] + data.shape[self.band_dimension + 1:]
+            return data.shape[:self.band_dimension] + data.shape[self.band_dimension + 1:]
         else:
-            out_shape = data.shape[:self.band_dimension] + \
-                        (int(band_dim_size/2), ) + \
-                        data.shape[self.band_dimension + 1:]
+            return data.shape[:self.band_dimension] + \
+                (int(band_dim_size/2), ) + \
+                data.shape[self.band_dimension + 1:]
 
-        out = numpy.empty(out_shape, dtype='complex64')
-        if self.order == 'IQ':
-            out.real = numpy.reshape(
-                data.take(indices=range(0, band_dim_size, 2), axis=self.band_dimension), out.shape)
-            out.imag = numpy.reshape(
-                data.take(indices=range(1, band_dim_size, 2), axis=self.band_dimension), out.shape)
-        elif self.order == 'QI':
-            out.imag = numpy.reshape(
-                data.take(indices=range(0, band_dim_size, 2), axis=self.band_dimension), out.shape)
-            out.real = numpy.reshape(
-                data.take(indices=range(1, band_dim_size, 2), axis=self.band_dimension), out.shape)
-        elif self.order in ['MP', 'PM']:
-            if self.order == 'MP':
-                mag = numpy.reshape(
-                    data.take(indices=range(0, band_dim_size, 2), axis=self.band_dimension), out.shape)
-                theta = numpy.reshape(
-                    data.take(indices=range(1, band_dim_size, 2), axis=self.band_dimension), out.shape)
-            else:
-                mag = numpy.reshape(
-                    data.take(indices=range(1, band_dim_size, 2), axis=self.band_dimension), out.shape)
-                theta = numpy.reshape(
-                    data.take(indices=range(0, band_dim_size, 2), axis=self.band_dimension), out.shape)
-            self._forward_magnitude_theta(data, out, mag, theta, subscript)
+    def _get_chunks(
+            self,
+            data: numpy.ndarray) -> List[Tuple[Tuple[slice, ...], Tuple[slice, ...]]]:
+        """
+        Partition the conversion into chunks, along the first non-band dimension,
+        in keeping with `chunk_size`.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+
+        Returns
+        -------
+        List[Tuple[Tuple[slice, ...], Tuple[slice, ...]]]
+            The sequence of `(raw data slice, formatted data slice)` pairs.
+        """
+
+        out_size = int(data.size/2)
+        non_band_axes = [index for index in range(data.ndim) if index != self.band_dimension]
+        if self.chunk_size is None or out_size <= self.chunk_size or len(non_band_axes) == 0:
+            return [(
+                tuple(slice(None) for _ in range(data.ndim)),
+                tuple(slice(None) for _ in range(self.formatted_ndim))), ]
+
+        axis = non_band_axes[0]
+        out_axis = axis if (axis < self.band_dimension or self.formatted_ndim == self.raw_ndim) else axis - 1
+        step = max(1, int(self.chunk_size*data.shape[axis]/out_size))
+        chunks = []
+        for start in range(0, data.shape[axis], step):
+            data_slice = [slice(None), ]*data.ndim
+            data_slice[axis] = slice(start, start+step)
+            out_slice = [slice(None), ]*self.formatted_ndim
+            out_slice[out_axis] = slice(start, start+step)
+            chunks.append((tuple(data_slice), tuple(out_slice)))
+        return chunks
+
+    def _get_pair_views(self, data: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Gets views of the first and second entries of the data pairs along the
+        band dimension, with shape matching the formatted data.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+
+        Returns
+        -------
+        first : numpy.ndarray
+        second : numpy.ndarray
+        """
+
+        first = [slice(None), ]*data.ndim
+        second = [slice(None), ]*data.ndim
+        if self.formatted_ndim < self.raw_ndim:
+            first[self.band_dimension] = 0
+            second[self.band_dimension] = 1
         else:
-            raise ValueError('Unhandled order value {}'.format(self.order))
+            first[self.band_dimension] = slice(0, None, 2)
+            second[self.band_dimension] = slice(1, None, 2)
+        return data[tuple(first)], data[tuple(second)]
+
+    def _get_output_view(
+            self,
+            data: numpy.ndarray,
+            out: numpy.ndarray) -> numpy.ndarray:
+        """
+        Validates the provided output array, and gets a view of it with shape
+        matching the formatted data for the given reoriented raw data.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+        out : numpy.ndarray
+
+        Returns
+        -------
+        numpy.ndarray
+
+        Raises
+        ------
+        ValueError
+            If `out` is not of complex64 dtype, or can not be viewed with the
+            formatted shape.
+        """
+
+        out_shape = self._get_forward_shape(data)
+        if out.dtype.name != 'complex64':
+            raise ValueError('Requires output of dtype complex64, got {}'.format(out.dtype))
+        if out.shape != out_shape:
+            if out.size != int(numpy.prod(out_shape)):
+                raise ValueError(
+                    'Requires output of shape {}, got shape {}'.format(out_shape, out.shape))
+            # NB: only a contiguous array is certain to be reshaped without a copy
+            if not out.flags.c_contiguous:
+                raise ValueError(
+                    'Requires output of shape {}, or a C-contiguous output of the same size, '
+                    'got non-contiguous output of shape {}'.format(out_shape, out.shape))
+            out = numpy.reshape(out, out_shape)
+        return out
 
+    def _forward_functional_step(
+            self,
+            data: numpy.ndarray,
+            subscript: Tuple[slice, ...]) -> numpy.ndarray:
+        out = numpy.empty(self._get_forward_shape(data), dtype='complex64')
+        self._forward_functional_step_into(data, subscript, out)
         return out
 
+    def _forward_functional_step_into(
+            self,
+            data: numpy.ndarray,
+            subscript: Tuple[slice, ...],
+            out: numpy.ndarray) -> None:
+        out = self._get_output_view(data, out)
+        if self.order in ['IQ', 'QI'] and self.band_dimension == data.ndim - 1 and \
+                out.flags.c_contiguous:
+            # view the complex64 output as float32 (real, imag) pairs, which
+            # permits a single pass without temporary arrays
+            pairs = numpy.reshape(out.view('float32'), data.shape)
+            if self.order == 'IQ':
+                pairs[...] = data
+            else:
+                pairs[..., 0::2] = data[..., 1::2]
+                pairs[..., 1::2] = data[..., 0::2]
+            return
+
+        for data_slice, out_slice in self._get_chunks(data):
+            data_chunk = data[data_slice]
+            out_chunk = out[out_slice]
+            first, second = self._get_pair_views(data_chunk)
+            if self.order == 'IQ':
+                out_chunk.real = first
+                out_chunk.imag = second
+            elif self.order == 'QI':
+                out_chunk.real = second
+                out_chunk.imag = first
+            elif self.order == 'MP':
+                self._forward_magnitude_theta(data_chunk, out_chunk, first, second, subscript)
+            elif self.order == 'PM':
+                self._forward_magnitude_theta(data_chunk, out_chunk, second, first, subscript)
+            else:
+                raise ValueError('Unhandled order value {}'.format(self.order))
+
     def _reverse_magnitude_theta(
             self,
             data: numpy.ndarray,
@@ -1010,10 +1203,8 @@ class SingleLUTFormatFunction(FormatFunction):
             out.append(slice(0, lim, 1))
         return tuple(out)
 
-    def _forward_functional_step(
-            self,
-            array: numpy.ndarray,
-            subscript: Tuple[slice, ...]) -> numpy.ndarray:
+    @staticmethod
+    def _validate_lookup_input(array: numpy.ndarray) -> None:
         if not isinstance(array, numpy.ndarray):
             raise ValueError('requires a numpy.ndarray, got {}'.format(type(array)))
 
@@ -1023,29 +1214,40 @@ class SingleLUTFormatFunction(FormatFunction):
 
         if array.ndim != 2:
             raise ValueError('Requires a two-dimensional numpy.ndarray, got shape {}'.format(array.shape))
-        temp = numpy.reshape(array, (-1, ))
-        out = self.lookup_table[temp]
-        if self.lookup_table.ndim == 2:
-            out_shape = array.shape + (self.lookup_table.shape[1], )
-        else:
-            out_shape = array.shape
-        return numpy.reshape(out, out_shape)
+
+    def _forward_functional_step(
+            self,
+            array: numpy.ndarray,
+            subscript: Tuple[slice, ...]) -> numpy.ndarray:
+        self._validate_lookup_input(array)
+        # NB: this is a single gather, yielding shape array.shape + lookup_table.shape[1:]
+        return numpy.take(self.lookup_table, array, axis=0)
 
     def __call__(
             self,
             array: numpy.ndarray,
             subscript: Tuple[slice, ...],
-            squeeze=True) -> numpy.ndarray:
+            squeeze=True,
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
         array = self._reverse_and_transpose(array, inverse=False)
+        if out is not None and self.lookup_table.ndim == 1:
+            # the lookup is a single gather directly into the output
+            self._validate_lookup_input(array)
+            numpy.take(self.lookup_table, array, out=numpy.reshape(out, array.shape))
+            return out
+
         array = self._forward_functional_step(array, subscript)
         if self.raw_ndim < self.formatted_ndim:
             # apply slice in the band (final dimension)
             array = array.take(
                 indices=numpy.arange(self.formatted_shape[-1])[subscript[-1]], axis=-1)
             # ensure shape is as expected - any squeeze handled consistently
-            out_shape = get_subscript_result_size(subscript, self.formatted_shape)
+            _, out_shape = get_subscript_result_size(subscript, self.formatted_shape)
             array = numpy.reshape(array, out_shape)
-        if squeeze:
+        if out is not None:
+            out[...] = numpy.reshape(array, out.shape)
+            return out
+        elif squeeze:
             return numpy.squeeze(array)
         else:
             return array
@@ -10,8 +10,10 @@ __author__ = "Thomas McCullough"
 
 import logging
 import os
+import mmap
+import functools
 
-from typing import Union, List, Tuple, BinaryIO, Sequence, Optional
+from typing import Union, List, Tuple, BinaryIO, Sequence, Optional, Callable
 from tempfile import mkstemp
 from collections import OrderedDict
 import struct
@@ -24,7 +26,8 @@ from sarpy.io.general.format_function import FormatFunction, ComplexFormatFuncti
     SingleLUTFormatFunction
 from sarpy.io.general.data_segment import DataSegment, BandAggregateSegment, \
     BlockAggregateSegment, SubsetSegment, NumpyArraySegment, NumpyMemmapSegment, \
-    FileReadDataSegment
+    FileReadDataSegment, JPEGBlockDataSegment, StreamingWriteSegment
+from sarpy.io.general.decode_cache import DecodedSegmentCache
 
 # noinspection PyProtectedMember
 from sarpy.io.general.nitf_elements.nitf_head import NITFHeader, NITFHeader0, \
@@ -38,6 +41,7 @@ from sarpy.io.general.nitf_elements.res import ReservedExtensionHeader, Reserved
 from sarpy.io.general.nitf_elements.image import ImageSegmentHeader, ImageSegmentHeader0, MaskSubheader
 from sarpy.io.general.nitf_elements.des import DataExtensionHeader, DataExtensionHeader0
 from sarpy.io.general.utils import is_file_like, is_nitf, is_real_file
+from sarpy.io.general.opener_signature import OpenerSignature
 
 from sarpy.io.complex.sicd_elements.blocks import LatLonType
 from sarpy.geometry.geocoords import ecf_to_geodetic, geodetic_to_ecf
@@ -70,6 +74,14 @@ if system_os == 'Linux':
 logger = logging.getLogger(__name__)
 
 _unhandled_version_text = 'Unhandled NITF version `{}`'
+_write_stripe_bytes = 16*1048576
+"""
+The maximum size of a single row stripe write, for concurrent writing.
+"""
+_stream_buffer_size = 8*1048576
+"""
+The output buffer size for streaming writes.
+"""
 
 
 #####
@@ -113,17 +125,29 @@ def extract_image_corners(
     return numpy.array(icps, dtype='float64')
 
 
-def find_jpeg_delimiters(the_bytes: bytes) -> List[Tuple[int, int]]:
+def find_jpeg_delimiters(
+        the_bytes: Union[bytes, mmap.mmap],
+        start: int = 0,
+        end: Optional[int] = None) -> List[Tuple[int, int]]:
     """
     Finds regular jpeg delimiters from the image segment bytes.
 
+    **Changed in version 1.3.69** to return the correct start location of each
+    jpeg block, and to permit searching a portion of a memory map.
+
     Parameters
     ----------
-    the_bytes : bytes
+    the_bytes : bytes|mmap.mmap
+    start : int
+        The location at which the search starts.
+    end : None|int
+        The location at which the search ends, defaulting to the length.
 
     Returns
     -------
     List[Tuple[int, int]]
+        The `(start, end)` location of each jpeg block, relative to the beginning
+        of `the_bytes`.
 
     Raises
     ------
@@ -135,16 +159,18 @@ def find_jpeg_delimiters(the_bytes: bytes) -> List[Tuple[int, int]]:
     start_pattern = b'\xff\xd8'
     end_pattern = b'\xff\xd9'  # these should never be used for anything else
 
+    if end is None:
+        end = len(the_bytes)
     out = []
-    next_location = 0
-    while next_location < len(the_bytes):
+    next_location = start
+    while next_location < end:
         if the_bytes[next_location:next_location+2] != start_pattern:
             raise ValueError('The jpeg block {} does not start with the jpeg start delimiter'.format(len(out)))
-        end_block = the_bytes.find(end_pattern, next_location)
+        end_block = the_bytes.find(end_pattern, next_location, end)
         if end_block == -1:
             raise ValueError('The new jpeg block {} does not contain the jpeg end delimiter'.format(len(out)))
+        out.append((next_location, end_block + 2))
         next_location = end_block + 2
-        out.append((0, next_location))
     return out
 
 
@@ -1238,6 +1264,336 @@ class NITFDetails(object):
                 pass
 
 
+#####
+# lightweight header indexing
+
+# (name, subheader length field size, item length field size) for each segment type
+_segment_count_fields = {
+    '02.10': (
+        ('img', 6, 10), ('graphics', 4, 6), (None, 0, 0),  # NUMX is reserved
+        ('text', 4, 5), ('des', 4, 9), ('res', 4, 7)),
+    '02.00': (
+        ('img', 6, 10), ('symbol', 4, 6), ('label', 4, 3),
+        ('text', 4, 5), ('des', 4, 9), ('res', 4, 7))}
+_image_fixed_format = struct.Struct('8s8s3s8s8s2s1s1s')  # NROWS through ICORDS
+_image_block_format = struct.Struct('1s1s4s4s4s4s2s')  # ISYNC through NBPP
+_des_fixed_format = struct.Struct('2s25s2s')  # DE, DESID, DESVER
+
+
+class NITFHeaderIndex(object):
+    """
+    A lightweight index of a NITF 2.0 or 2.1 file, intended for cataloging a
+    large collection of files. Only the segment offsets and sizes, and the basic
+    image and data extension subheader fields are extracted from their fixed
+    positions in the file. No NITF element objects are constructed, and no TREs
+    are parsed. The full subheaders remain available via :class:`NITFDetails`.
+
+    Introduced in version 1.3.72.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        index = NITFHeaderIndex('image.nitf')
+        for entry in index.image_segments:
+            print(entry['IMODE'], entry['IC'], entry['NROWS'], entry['NCOLS'])
+    """
+
+    __slots__ = (
+        '_file_name', '_nitf_version', '_file_length', '_header_length',
+        '_segments', '_image_segments', '_des_segments')
+    _prefix_length = 2048  # the number of image subheader bytes initially read
+
+    def __init__(self, file_object: Union[str, BinaryIO]):
+        """
+
+        Parameters
+        ----------
+        file_object : str|BinaryIO
+            file name for a NITF file, or file like object opened in binary mode.
+        """
+
+        self._file_name = None
+        self._segments = {}
+        self._image_segments = []
+        self._des_segments = []
+
+        if isinstance(file_object, str):
+            if not os.path.isfile(file_object):
+                raise SarpyIOError('Path {} is not a file'.format(file_object))
+            self._file_name = file_object
+            with open(file_object, 'rb') as fi:
+                self._parse(fi)
+        elif is_file_like(file_object):
+            if hasattr(file_object, 'name') and isinstance(file_object.name, str):
+                self._file_name = file_object.name
+            else:
+                self._file_name = '<file like object>'
+            self._parse(file_object)
+        else:
+            raise TypeError('file_object is required to be a file like object, or string path to a file.')
+
+    @property
+    def file_name(self) -> Optional[str]:
+        """
+        None|str: the file name, which may not be useful if the input was based
+        on a file like object
+        """
+
+        return self._file_name
+
+    @property
+    def nitf_version(self) -> str:
+        """
+        str: The NITF version number.
+        """
+
+        return self._nitf_version
+
+    @property
+    def file_length(self) -> int:
+        """
+        int: The file length, as stated in the `FL` field of the file header.
+        """
+
+        return self._file_length
+
+    @property
+    def header_length(self) -> int:
+        """
+        int: The file header length, as stated in the `HL` field.
+        """
+
+        return self._header_length
+
+    @property
+    def image_segments(self) -> List[dict]:
+        """
+        List[dict]: The basic details for each image segment. The keys are
+        `subheader_offset`, `subheader_size`, `offset`, `size`, `IID1`, `NROWS`,
+        `NCOLS`, `PVTYPE`, `IREP`, `ICAT`, `ABPP`, `ICORDS`, `IGEOLO` (`None`
+        if not populated), `IC`, `NBANDS`, `IMODE`, `NBPR`, `NBPC`, `NPPBH`,
+        `NPPBV`, and `NBPP`.
+        """
+
+        return self._image_segments
+
+    @property
+    def des_segments(self) -> List[dict]:
+        """
+        List[dict]: The basic details for each data extension segment. The keys
+        are `subheader_offset`, `subheader_size`, `offset`, `size`, `DESID`
+        (the data extension type), and `DESVER`.
+        """
+
+        return self._des_segments
+
+    def get_segment_offsets(
+            self,
+            name: str) -> Tuple[Optional[numpy.ndarray], Optional[numpy.ndarray], Optional[numpy.ndarray], Optional[numpy.ndarray]]:
+        """
+        Gets the offset and size arrays for the given segment type, with the
+        same conventions as the corresponding :class:`NITFDetails` attributes.
+
+        Parameters
+        ----------
+        name : str
+            One of `'img'`, `'graphics'`, `'symbol'`, `'label'`, `'text'`,
+            `'des'`, or `'res'`.
+
+        Returns
+        -------
+        subheader_offsets : None|numpy.ndarray
+        subheader_sizes : None|numpy.ndarray
+        segment_offsets : None|numpy.ndarray
+        segment_sizes : None|numpy.ndarray
+            Each is `None` if there are no segments of the given type.
+        """
+
+        if name not in ['img', 'graphics', 'symbol', 'label', 'text', 'des', 'res']:
+            raise KeyError('Unrecognized segment type `{}`'.format(name))
+        return self._segments.get(name, (None, None, None, None))
+
+    def to_dict(self) -> dict:
+        """
+        Gets a json serializable dictionary of the index.
+
+        Returns
+        -------
+        dict
+        """
+
+        out = OrderedDict()
+        out['file_name'] = self.file_name
+        out['nitf_version'] = self.nitf_version
+        out['file_length'] = self.file_length
+        out['header_length'] = self.header_length
+        counts = OrderedDict()
+        for name in ['img', 'graphics', 'symbol', 'label', 'text', 'des', 'res']:
+            offsets = self.get_segment_offsets(name)[0]
+            if offsets is not None:
+                counts[name] = int(offsets.size)
+        out['segment_counts'] = counts
+        out['image_segments'] = self.image_segments
+        out['des_segments'] = self.des_segments
+        return out
+
+    def _parse(self, file_object: BinaryIO) -> None:
+        is_nitf_file, vers_string = is_nitf(file_object, return_version=True)
+        if not is_nitf_file:
+            raise SarpyIOError('Not a NITF file')
+        if vers_string not in _segment_count_fields:
+            raise SarpyIOError('Unsupported NITF version {} for file {}'.format(vers_string, self._file_name))
+        self._nitf_version = vers_string
+
+        # NB: the header is typically at most a few kilobytes, and the file length
+        #   field is at a fixed position, aside from the 2.0 downgrade event
+        file_object.seek(0, os.SEEK_SET)
+        header = file_object.read(1024)
+        if vers_string == '02.10':
+            loc = 342
+        else:
+            loc = 326 if header[280:286] == b'999998' else 286
+            loc += 56
+        self._file_length = int(header[loc:loc+12])
+        self._header_length = int(header[loc+12:loc+18])
+        if len(header) < self._header_length:
+            file_object.seek(0, os.SEEK_SET)
+            header = file_object.read(self._header_length)
+        loc += 18
+
+        cur_loc = self._header_length
+        for name, subhead_len, item_len in _segment_count_fields[vers_string]:
+            count = int(header[loc:loc+3])
+            loc += 3
+            if name is None:
+                continue
+            if count == 0:
+                continue
+            values = numpy.array(
+                [(int(header[start:start+subhead_len]), int(header[start+subhead_len:start+subhead_len+item_len]))
+                 for start in range(loc, loc + count*(subhead_len + item_len), subhead_len + item_len)],
+                dtype=numpy.int64)
+            loc += count*(subhead_len + item_len)
+            subhead_offsets = numpy.full((count, ), cur_loc, dtype=numpy.int64)
+            subhead_offsets[1:] += numpy.cumsum(values[:-1, 0]) + numpy.cumsum(values[:-1, 1])
+            item_offsets = subhead_offsets + values[:, 0]
+            cur_loc = int(item_offsets[-1] + values[-1, 1])
+            self._segments[name] = (subhead_offsets, values[:, 0].copy(), item_offsets, values[:, 1].copy())
+
+        if 'img' in self._segments:
+            for entry in zip(*self._segments['img']):
+                self._image_segments.append(self._parse_image_subheader(file_object, *entry))
+        if 'des' in self._segments:
+            for entry in zip(*self._segments['des']):
+                self._des_segments.append(self._parse_des_subheader(file_object, *entry))
+
+    @staticmethod
+    def _get_base_entry(subheader_offset, subheader_size, offset, size) -> dict:
+        out = OrderedDict()
+        out['subheader_offset'] = int(subheader_offset)
+        out['subheader_size'] = int(subheader_size)
+        out['offset'] = int(offset)
+        out['size'] = int(size)
+        return out
+
+    def _parse_image_subheader(
+            self,
+            file_object: BinaryIO,
+            subheader_offset: int,
+            subheader_size: int,
+            offset: int,
+            size: int) -> dict:
+        file_object.seek(int(subheader_offset), os.SEEK_SET)
+        value = file_object.read(int(min(subheader_size, self._prefix_length)))
+
+        def verify_length(required):
+            nonlocal value
+            if len(value) < required < subheader_size:
+                # only in the event of large band lookup tables
+                file_object.seek(int(subheader_offset), os.SEEK_SET)
+                value = file_object.read(int(subheader_size))
+            if len(value) < required:
+                raise SarpyIOError(
+                    'Image subheader at offset {} of file {} is truncated'.format(subheader_offset, self._file_name))
+
+        if value[:2] != b'IM':
+            raise SarpyIOError(
+                'Expected image subheader at offset {} of file {}'.format(subheader_offset, self._file_name))
+        out = self._get_base_entry(subheader_offset, subheader_size, offset, size)
+        out['IID1'] = value[2:12].decode('utf-8').strip()
+        if self.nitf_version == '02.10':
+            loc = 333
+        else:
+            loc = 373 if value[284:290] == b'999998' else 333
+        verify_length(loc + _image_fixed_format.size)
+        nrows, ncols, pvtype, irep, icat, abpp, _, icords = _image_fixed_format.unpack_from(value, loc)
+        loc += _image_fixed_format.size
+        out['NROWS'] = int(nrows)
+        out['NCOLS'] = int(ncols)
+        out['PVTYPE'] = pvtype.decode('utf-8').strip()
+        out['IREP'] = irep.decode('utf-8').strip()
+        out['ICAT'] = icat.decode('utf-8').strip()
+        out['ABPP'] = int(abpp)
+        out['ICORDS'] = icords.decode('utf-8').strip()
+        if icords == (b' ' if self.nitf_version == '02.10' else b'N'):
+            out['IGEOLO'] = None
+        else:
+            verify_length(loc + 60)
+            out['IGEOLO'] = value[loc:loc+60].decode('utf-8')
+            loc += 60
+
+        verify_length(loc + 1)
+        loc += 1 + 80*int(value[loc:loc+1])  # skip the comments
+        verify_length(loc + 6)
+        out['IC'] = value[loc:loc+2].decode('utf-8')
+        loc += 2 if out['IC'] in ['NC', 'NM'] else 6
+        bands = int(value[loc:loc+1])
+        loc += 1
+        if bands == 0:
+            bands = int(value[loc:loc+5])
+            loc += 5
+        out['NBANDS'] = bands
+        for _ in range(bands):
+            # skip IREPBAND, ISUBCAT, IFC, and IMFLT, then the lookup table
+            verify_length(loc + 13)
+            loc += 12
+            nluts = int(value[loc:loc+1])
+            loc += 1
+            if nluts > 0:
+                verify_length(loc + 5)
+                loc += 5 + nluts*int(value[loc:loc+5])
+
+        verify_length(loc + _image_block_format.size)
+        _, imode, nbpr, nbpc, nppbh, nppbv, nbpp = _image_block_format.unpack_from(value, loc)
+        out['IMODE'] = imode.decode('utf-8')
+        out['NBPR'] = int(nbpr)
+        out['NBPC'] = int(nbpc)
+        out['NPPBH'] = int(nppbh)
+        out['NPPBV'] = int(nppbv)
+        out['NBPP'] = int(nbpp)
+        return out
+
+    def _parse_des_subheader(
+            self,
+            file_object: BinaryIO,
+            subheader_offset: int,
+            subheader_size: int,
+            offset: int,
+            size: int) -> dict:
+        file_object.seek(int(subheader_offset), os.SEEK_SET)
+        value = file_object.read(_des_fixed_format.size)
+        if len(value) < _des_fixed_format.size or value[:2] != b'DE':
+            raise SarpyIOError(
+                'Expected data extension subheader at offset {} of file {}'.format(
+                    subheader_offset, self._file_name))
+        _, desid, desver = _des_fixed_format.unpack(value)
+        out = self._get_base_entry(subheader_offset, subheader_size, offset, size)
+        out['DESID'] = desid.decode('utf-8').strip()
+        out['DESVER'] = int(desver)
+        return out
+
+
 class NITFReader(BaseReader):
     """
     A reader implementation based around array-type image data fetching for
@@ -1253,14 +1609,17 @@ class NITFReader(BaseReader):
 
     __slots__ = (
         '_nitf_details', '_unsupported_segments', '_image_segment_collections',
-        '_reverse_axes', '_transpose_axes', '_image_segment_data_segments')
+        '_reverse_axes', '_transpose_axes', '_image_segment_data_segments',
+        '_max_decode_workers', '_decode_cache')
 
     def __init__(
             self,
             nitf_details: Union[str, BinaryIO, NITFDetails],
             reader_type="OTHER",
             reverse_axes: Union[None, int, Sequence[int]] = None,
-            transpose_axes: Union[None, Tuple[int, ...]] = None):
+            transpose_axes: Union[None, Tuple[int, ...]] = None,
+            max_decode_workers: int = 1,
+            decode_cache: Union[None, str, DecodedSegmentCache] = None):
         """
 
         Parameters
@@ -1275,9 +1634,26 @@ class NITFReader(BaseReader):
             of `1` means to reverse the columns (in the raw sense).
         transpose_axes : None|Tuple[int, ...]
             If presented this should be only `(1, 0)`.
+        max_decode_workers : int
+            The maximum number of threads used to decode the independent blocks
+            of compressed image segments concurrently.
+        decode_cache : None|str|DecodedSegmentCache
+            If provided, compressed image segments are fully decoded once into
+            this persistent cache (or cache directory), and reused by any reader
+            of the same file using the same cache. This is only applicable for
+            a local file.
         """
 
         self._image_segment_data_segments = {}
+        max_decode_workers = int(max_decode_workers)
+        if max_decode_workers < 1:
+            raise ValueError('max_decode_workers must be a positive integer')
+        self._max_decode_workers = max_decode_workers
+        if isinstance(decode_cache, str):
+            decode_cache = DecodedSegmentCache(decode_cache)
+        if not (decode_cache is None or isinstance(decode_cache, DecodedSegmentCache)):
+            raise TypeError('decode_cache must be None, a directory, or DecodedSegmentCache')
+        self._decode_cache = decode_cache
         try:
             _ = self._delete_temp_files
             # something has already defined this, so it's already ready
@@ -1402,6 +1778,72 @@ class NITFReader(BaseReader):
 
         return is_real_file(self.nitf_details.file_object)
 
+    @property
+    def max_decode_workers(self) -> int:
+        """
+        int: The maximum number of threads used to decode the independent blocks
+        of compressed image segments concurrently.
+        """
+
+        return self._max_decode_workers
+
+    @property
+    def decode_cache(self) -> Optional[DecodedSegmentCache]:
+        """
+        None|DecodedSegmentCache: The persistent cache for decoded compressed
+        image segments, if any.
+        """
+
+        return self._decode_cache
+
+    def _get_cached_decoded_segment(
+            self,
+            image_segment_index: int,
+            raw_dtype: numpy.dtype,
+            raw_shape: Tuple[int, ...],
+            populate: Callable[[numpy.memmap], None],
+            formatted_dtype: numpy.dtype,
+            formatted_shape: Tuple[int, ...],
+            reverse_axes: Optional[Tuple[int, ...]],
+            transpose_axes: Optional[Tuple[int, ...]],
+            format_function: Optional[FormatFunction]) -> Optional[DataSegment]:
+        """
+        Gets the data segment for the fully decoded image segment from the
+        persistent decode cache, if applicable, decoding it as necessary.
+
+        Parameters
+        ----------
+        image_segment_index : int
+        raw_dtype : numpy.dtype
+        raw_shape : Tuple[int, ...]
+        populate : Callable[[numpy.memmap], None]
+            Populates the provided memory map with the decoded data.
+        formatted_dtype : numpy.dtype
+        formatted_shape : Tuple[int, ...]
+        reverse_axes : None|Tuple[int, ...]
+        transpose_axes : None|Tuple[int, ...]
+        format_function : None|FormatFunction
+
+        Returns
+        -------
+        None|DataSegment
+            `None` if there is no decode cache, or the file is not a local file.
+        """
+
+        if self._decode_cache is None:
+            return None
+        if self.file_name is None or not self.can_use_memmap():
+            logger.info(
+                'The decode cache is only applicable for a local file,\n\t'
+                'so it will not be used for image segment {}'.format(image_segment_index))
+            return None
+        path_name = self._decode_cache.get_file(
+            self.file_name, image_segment_index, raw_dtype, raw_shape, populate)
+        return NumpyMemmapSegment(
+            path_name, 0, raw_dtype, raw_shape, formatted_dtype, formatted_shape,
+            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+            format_function=format_function, mode='r', close_file=True)
+
     def _read_file_data(self, start_bytes: int, byte_length: int) -> bytes:
         initial_loc = self.file_object.tell()
         self.file_object.seek(start_bytes, os.SEEK_SET)
@@ -1618,6 +2060,45 @@ class NITFReader(BaseReader):
         # noinspection PyTypeChecker
         return _get_collection_element_coordinate_limits(image_headers, return_clevel=False)
 
+    def _create_block_decoded_segment(
+            self,
+            image_segment_index: int,
+            raw_dtype: numpy.dtype,
+            raw_shape: Tuple[int, ...],
+            pixel_bounds: List[Tuple[int, int, int, int]],
+            byte_ranges: List[Optional[Tuple[int, int]]],
+            band_indices: Optional[List[int]],
+            formatted_dtype: numpy.dtype,
+            formatted_shape: Tuple[int, ...],
+            reverse_axes: Optional[Tuple[int, ...]],
+            transpose_axes: Optional[Tuple[int, ...]],
+            format_function: Optional[FormatFunction]) -> DataSegment:
+        """
+        Creates the data segment for an image segment consisting of independently
+        compressed blocks. This is decoded lazily, unless using a decode cache.
+        """
+
+        def populate(mem_map: numpy.memmap) -> None:
+            block_segment = JPEGBlockDataSegment(
+                self.file_object, raw_dtype, raw_shape, pixel_bounds, byte_ranges,
+                band_indices=band_indices, max_cached_blocks=0, close_file=False,
+                max_workers=self._max_decode_workers)
+            block_segment.read_raw(None, squeeze=False, out=mem_map)
+            block_segment.close()
+
+        cached_segment = self._get_cached_decoded_segment(
+            image_segment_index, raw_dtype, raw_shape, populate,
+            formatted_dtype, formatted_shape, reverse_axes, transpose_axes, format_function)
+        if cached_segment is not None:
+            return cached_segment
+
+        return JPEGBlockDataSegment(
+            self.file_object, raw_dtype, raw_shape, pixel_bounds, byte_ranges,
+            band_indices=band_indices, formatted_dtype=formatted_dtype,
+            formatted_shape=formatted_shape, reverse_axes=reverse_axes,
+            transpose_axes=transpose_axes, format_function=format_function,
+            close_file=False, max_workers=self._max_decode_workers)
+
     def _handle_jpeg2k_no_mask(self, image_segment_index: int, apply_format: bool) -> DataSegment:
         # NOTE: it appears that the PIL to numpy array conversion will rearrange
         # bands to be in the final dimension, regardless of storage particulars?
@@ -1637,22 +2118,14 @@ class NITFReader(BaseReader):
         raw_dtype, formatted_dtype, formatted_bands, complex_order, lut = self._get_dtypes(image_segment_index)
         raw_shape = _get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2)
 
-        # the block details will be handled by the jpeg2000 compression scheme,
-        # just read everything and decompress
-        the_bytes = self._read_file_data(offset, image_segment_size)
-        # create a memmap, and extract all of our jpeg data into it as appropriate
-        fi, path_name = mkstemp(suffix='.sarpy_cache', text=False)
-        self._delete_temp_files.append(path_name)
-        mem_map = numpy.memmap(
-            path_name, dtype=raw_dtype, mode='w+', offset=0,
-            shape=_get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2))
-        # noinspection PyUnresolvedReferences
-        img = PIL_Image.open(BytesIO(the_bytes))
-        data = numpy.asarray(img)
-        mem_map[:] = data[:image_header.NROWS, :image_header.NCOLS]
-        mem_map.flush()  # write all the data to the file
-        del mem_map  # clean up the memmap
-        os.close(fi)
+        def populate(mem_map: numpy.memmap) -> None:
+            # the block details will be handled by the jpeg2000 compression scheme,
+            # just read everything and decompress
+            the_bytes = self._read_file_data(offset, image_segment_size)
+            # noinspection PyUnresolvedReferences
+            img = PIL_Image.open(BytesIO(the_bytes))
+            data = numpy.asarray(img)
+            mem_map[:] = data[:image_header.NROWS, :image_header.NCOLS]
 
         if apply_format:
             format_function = self.get_format_function(
@@ -1671,6 +2144,21 @@ class NITFReader(BaseReader):
             formatted_dtype = raw_dtype
             formatted_shape = raw_shape
 
+        cached_segment = self._get_cached_decoded_segment(
+            image_segment_index, raw_dtype, raw_shape, populate,
+            formatted_dtype, formatted_shape, reverse_axes, transpose_axes, format_function)
+        if cached_segment is not None:
+            return cached_segment
+
+        # create a memmap, and extract all of our jpeg data into it as appropriate
+        fi, path_name = mkstemp(suffix='.sarpy_cache', text=False)
+        self._delete_temp_files.append(path_name)
+        mem_map = numpy.memmap(path_name, dtype=raw_dtype, mode='w+', offset=0, shape=raw_shape)
+        populate(mem_map)
+        mem_map.flush()  # write all the data to the file
+        del mem_map  # clean up the memmap
+        os.close(fi)
+
         return NumpyMemmapSegment(
             path_name, 0, raw_dtype, raw_shape, formatted_dtype, formatted_shape,
             reverse_axes=reverse_axes, transpose_axes=transpose_axes,
@@ -1706,36 +2194,28 @@ class NITFReader(BaseReader):
         if len(block_bounds) != len(mask_offsets):
             raise ValueError('Got mismatch between block definition and mask offsets definition')
 
-        # jpeg2000 compression, read everything excluding the mask
-        the_bytes = self._read_file_data(offset+additional_offset, image_segment_size-additional_offset)
-
         raw_shape = _get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2)
 
-        # create a memmap, and extract all of our jpeg data into it as appropriate
-        fi, path_name = mkstemp(suffix='.sarpy_cache', text=False)
-        self._delete_temp_files.append(path_name)
-        mem_map = numpy.memmap(
-            path_name, dtype=raw_dtype, mode='w+', offset=0,
-            shape=_get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2))
-        next_jpeg_block = 0
-        for mask_index, (mask_offset, block_bound) in enumerate(zip(mask_offsets, block_bounds)):
+        # each populated block is an independent jpeg2000 code stream, which
+        # extends to the start of the next one (excluding the mask)
+        data_start = offset + additional_offset
+        data_end = offset + image_segment_size
+        populated_starts = numpy.unique(mask_offsets[mask_offsets != exclude_value])
+        byte_ranges = []
+        for mask_offset in mask_offsets:
             if mask_offset == exclude_value:
-                continue  # just skip it, because it is masked out
-
-            start_bytes = mask_offset  # TODO: verify that we don't need to account for mask definition length
-            end_bytes = len(the_bytes) if mask_index == len(mask_offsets)-1 else mask_offsets[mask_index + 1]
-            # noinspection PyUnresolvedReferences
-            img = PIL_Image.open(BytesIO(the_bytes[start_bytes:end_bytes]))
-            # handle block padding situation
-            row_start, row_end = block_bound[0], min(block_bound[1], image_header.NROWS)
-            col_start, col_end = block_bound[2], min(block_bound[3], image_header.NCOLS)
-            mem_map[row_start: row_end, col_start:col_end] = \
-                numpy.asarray(img)[0:row_end - row_start, 0:col_end - col_start]
-            next_jpeg_block += 1
-
-        mem_map.flush()  # write all the data to the file
-        del mem_map  # clean up the memmap
-        os.close(fi)
+                byte_ranges.append(None)  # it's masked out
+                continue
+            # NB: the mask offsets are relative to the start of the blocked image
+            #   data, which follows the mask subheader (i.e. IMDATOFF)
+            next_index = numpy.searchsorted(populated_starts, mask_offset, side='right')
+            end_bytes = data_end if next_index == populated_starts.size else \
+                data_start + int(populated_starts[next_index])
+            byte_ranges.append((data_start + int(mask_offset), end_bytes))
+        # handle block padding situation
+        pixel_bounds = [
+            (entry[0], min(entry[1], image_header.NROWS), entry[2], min(entry[3], image_header.NCOLS))
+            for entry in block_bounds]
 
         if apply_format:
             format_function = self.get_format_function(
@@ -1754,11 +2234,38 @@ class NITFReader(BaseReader):
             formatted_dtype = raw_dtype
             formatted_shape = raw_shape
 
-        return NumpyMemmapSegment(
-            path_name, 0, raw_dtype, raw_shape,
-            formatted_dtype, formatted_shape,
-            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
-            format_function=format_function, mode='r', close_file=True)
+        return self._create_block_decoded_segment(
+            image_segment_index, raw_dtype, raw_shape, pixel_bounds, byte_ranges, None,
+            formatted_dtype, formatted_shape, reverse_axes, transpose_axes, format_function)
+
+    def _find_jpeg_block_ranges(self, image_segment_index: int) -> List[Tuple[int, int]]:
+        """
+        Locates the jpeg blocks of the given image segment, without decompressing.
+
+        Parameters
+        ----------
+        image_segment_index : int
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The `(start, end)` byte location of each jpeg block, relative to the
+            start of the file.
+        """
+
+        offset = self.nitf_details.img_segment_offsets[image_segment_index]
+        image_segment_size = self.nitf_details.img_segment_sizes[image_segment_index]
+        _, _, additional_offset = self._get_mask_details(image_segment_index)
+        start = offset + additional_offset
+        end = offset + image_segment_size
+
+        if self.can_use_memmap():
+            # NB: search the memory map, rather than reading the whole image segment
+            with mmap.mmap(self.file_object.fileno(), 0, access=mmap.ACCESS_READ) as the_map:
+                return find_jpeg_delimiters(the_map, start=start, end=end)
+        else:
+            the_bytes = self._read_file_data(start, end - start)
+            return [(start + entry[0], start + entry[1]) for entry in find_jpeg_delimiters(the_bytes)]
 
     def _handle_jpeg(self, image_segment_index: int, apply_format: bool) -> DataSegment:
         # NOTE: it appears that the PIL to numpy array conversion will rearrange
@@ -1773,9 +2280,6 @@ class NITFReader(BaseReader):
         if PIL_Image is None:
             raise ValueError('Image segment {} is compressed, which requires PIL'.format(image_segment_index))
 
-        # get bytes offset to this image segment (relative to start of file)
-        offset = self.nitf_details.img_segment_offsets[image_segment_index]
-        image_segment_size = self.nitf_details.img_segment_sizes[image_segment_index]
         raw_bands = len(image_header.Bands)
         raw_dtype, formatted_dtype, formatted_bands, complex_order, lut = self._get_dtypes(image_segment_index)
         # Establish block pixel bounds
@@ -1787,9 +2291,8 @@ class NITFReader(BaseReader):
         # get mask definition details
         mask_offsets, exclude_value, additional_offset = self._get_mask_details(image_segment_index)
 
-        # jpeg compression, read everything (skipping mask) and find the jpeg delimiters
-        the_bytes = self._read_file_data(offset+additional_offset, image_segment_size-additional_offset)
-        jpeg_delimiters = find_jpeg_delimiters(the_bytes)
+        # jpeg compression, find the jpeg delimiters (skipping mask), without decompressing
+        jpeg_delimiters = self._find_jpeg_block_ranges(image_segment_index)
 
         # validate our discovered delimiters and the mask offsets
         if mask_offsets is not None:
@@ -1798,56 +2301,20 @@ class NITFReader(BaseReader):
 
             if len(block_bounds) != len(mask_offsets):
                 raise ValueError('Got mismatch between block definition and mask offsets definition')
-
-            # TODO: verify that we don't need to account for mask definition length
-            anticipated_jpeg_indices = [index for index, entry in enumerate(mask_offsets)
-                                        if entry != exclude_value]
-            if len(jpeg_delimiters) != len(anticipated_jpeg_indices):
-                raise ValueError(
-                    'Found different number of jpeg delimiters ({})\n\t'
-                    'than populated blocks ({}) in masked image segment {}'.format(
-                        len(jpeg_delimiters), len(anticipated_jpeg_indices), image_segment_index))
-            for jpeg_delim, mask_index in zip(jpeg_delimiters, anticipated_jpeg_indices):
-                if anticipated_jpeg_indices[mask_index] != jpeg_delim[0]:
-                    raise ValueError(
-                        'Populated mask offsets ({})\n\t'
-                        'do not agree with discovered jpeg offsets ({})\n\t'
-                        'with mask subheader length {}'.format(jpeg_delim, mask_offsets, additional_offset))
-
+            populated = mask_offsets != exclude_value
         else:
-            if len(jpeg_delimiters) != len(block_bounds):
-                raise ValueError(
-                    'Found different number of jpeg delimiters ({}) than blocks ({}) in image segment {}'.format(
-                        len(jpeg_delimiters), len(block_bounds), image_segment_index))
-            mask_offsets = [entry[0] for entry in jpeg_delimiters]
-
-        # create a memmap, and extract all of our jpeg data into it as appropriate
-        fi, path_name = mkstemp(suffix='.sarpy_cache', text=False)
-        self._delete_temp_files.append(path_name)
-        mem_map = numpy.memmap(
-            path_name, dtype=raw_dtype, mode='w+', offset=0,
-            shape=_get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2))
-        if image_header.is_masked:
-            mem_map.fill(0)  # TODO: missing value?
-
-        next_jpeg_block = 0
-        for mask_offset, block_bound in zip(mask_offsets, block_bounds):
-            if mask_offset == exclude_value:
-                continue  # just skip it, it's masked out
-            jpeg_delim = jpeg_delimiters[next_jpeg_block]
-            # noinspection PyUnresolvedReferences
-            the_image_bytes = the_bytes[jpeg_delim[0]:jpeg_delim[1]]
-            img = PIL_Image.open(BytesIO(the_image_bytes))
-            # handle block padding situation
-            row_start, row_end = block_bound[0], min(block_bound[1], image_header.NROWS)
-            col_start, col_end = block_bound[2], min(block_bound[3], image_header.NCOLS)
-            mem_map[row_start:row_end, col_start:col_end] = \
-                numpy.asarray(img)[0:row_end - row_start, 0:col_end - col_start]
-            next_jpeg_block += 1
-
-        mem_map.flush()  # write all the data to the file
-        del mem_map  # clean up the memmap
-        os.close(fi)
+            populated = numpy.ones((len(block_bounds), ), dtype='bool')
+        self._validate_jpeg_delimiters(
+            image_segment_index, jpeg_delimiters, mask_offsets, populated, additional_offset)
+
+        # the populated blocks are in order
+        byte_ranges = [None, ]*len(block_bounds)
+        for block_index, jpeg_delim in zip(numpy.nonzero(populated)[0], jpeg_delimiters):
+            byte_ranges[block_index] = jpeg_delim
+        # handle block padding situation
+        pixel_bounds = [
+            (entry[0], min(entry[1], image_header.NROWS), entry[2], min(entry[3], image_header.NCOLS))
+            for entry in block_bounds]
 
         if apply_format:
             format_function = self.get_format_function(
@@ -1866,11 +2333,56 @@ class NITFReader(BaseReader):
             formatted_dtype = raw_dtype
             formatted_shape = raw_shape
 
-        return NumpyMemmapSegment(
-            path_name, 0, raw_dtype, raw_shape,
-            formatted_dtype, formatted_shape,
-            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
-            format_function=format_function, mode='r', close_file=False)
+        return self._create_block_decoded_segment(
+            image_segment_index, raw_dtype, raw_shape, pixel_bounds, byte_ranges, None,
+            formatted_dtype, formatted_shape, reverse_axes, transpose_axes, format_function)
+
+    def _validate_jpeg_delimiters(
+            self,
+            image_segment_index: int,
+            jpeg_delimiters: List[Tuple[int, int]],
+            mask_offsets: Optional[numpy.ndarray],
+            populated: numpy.ndarray,
+            additional_offset: int) -> None:
+        """
+        Validates the discovered jpeg delimiters versus the populated blocks and
+        any mask offsets.
+
+        Parameters
+        ----------
+        image_segment_index : int
+        jpeg_delimiters : List[Tuple[int, int]]
+        mask_offsets : None|numpy.ndarray
+        populated : numpy.ndarray
+            Boolean array indicating which blocks are populated.
+        additional_offset : int
+
+        Raises
+        ------
+        ValueError
+            If the discovered jpeg delimiters do not agree with the populated
+            blocks, or with the populated mask offsets.
+        """
+
+        if len(jpeg_delimiters) != int(numpy.count_nonzero(populated)):
+            raise ValueError(
+                'Found different number of jpeg delimiters ({})\n\t'
+                'than populated blocks ({}) in image segment {}'.format(
+                    len(jpeg_delimiters), int(numpy.count_nonzero(populated)), image_segment_index))
+        if mask_offsets is None:
+            return
+
+        # NB: the mask offsets are relative to the start of the blocked image
+        #   data, which follows the mask subheader (i.e. IMDATOFF)
+        data_start = self.nitf_details.img_segment_offsets[image_segment_index] + additional_offset
+        discovered = numpy.array([entry[0] - data_start for entry in jpeg_delimiters], dtype='int64')
+        anticipated = numpy.reshape(mask_offsets, (-1, ))[numpy.reshape(populated, (-1, ))]
+        if not numpy.all(discovered == anticipated):
+            raise ValueError(
+                'Populated mask offsets ({})\n\t'
+                'do not agree with discovered jpeg offsets ({})\n\t'
+                'with mask subheader length {} for image segment {}'.format(
+                    anticipated, discovered, additional_offset, image_segment_index))
 
     def _handle_no_compression(self, image_segment_index: int, apply_format: bool) -> DataSegment:
         # NB: Natural order inside the block is (bands, rows, columns)
@@ -2040,9 +2552,6 @@ class NITFReader(BaseReader):
         if PIL_Image is None:
             raise ValueError('Image segment {} is compressed, which requires PIL'.format(image_segment_index))
 
-        # get bytes offset to this image segment (relative to start of file)
-        offset = self.nitf_details.img_segment_offsets[image_segment_index]
-        image_segment_size = self.nitf_details.img_segment_sizes[image_segment_index]
         raw_bands = len(image_header.Bands)
         raw_dtype, formatted_dtype, formatted_bands, complex_order, lut = self._get_dtypes(image_segment_index)
         # Establish block pixel bounds
@@ -2051,74 +2560,41 @@ class NITFReader(BaseReader):
 
         # get mask definition details
         mask_offsets, exclude_value, additional_offset = self._get_mask_details(image_segment_index)
-        # NB: if defined, mask_offsets is a 2-d array here
+        # NB: if defined, mask_offsets is a 2-d array here, unless there is a single band
 
-        # jpeg compression, read everything (skipping mask) and find the jpeg delimiters
-        the_bytes = self._read_file_data(offset+additional_offset, image_segment_size-additional_offset)
-        jpeg_delimiters = find_jpeg_delimiters(the_bytes)
+        # jpeg compression, find the jpeg delimiters (skipping mask), without decompressing
+        jpeg_delimiters = self._find_jpeg_block_ranges(image_segment_index)
 
         # validate our discovered delimiters and the mask offsets
         if mask_offsets is not None:
-            if not (isinstance(mask_offsets, numpy.ndarray) and mask_offsets.ndim == 2):
-                raise ValueError('Got unexpected mask offsets `{}`'.format(mask_offsets))
-
-            if len(block_bounds) != mask_offsets.shape[1]:
+            mask_offsets = numpy.reshape(mask_offsets, (raw_bands, -1))
+            if mask_offsets.shape[1] != len(block_bounds):
                 raise ValueError('Got mismatch between block definition and mask offsets definition')
-
-            # TODO: verify that we don't need to account for mask definition length
-            anticipated_jpeg_indices = [index for index, entry in enumerate(mask_offsets.ravel())
-                                        if entry != exclude_value]
-            if len(jpeg_delimiters) != len(anticipated_jpeg_indices):
-                raise ValueError(
-                    'Found different number of jpeg delimiters ({})\n\t'
-                    'than populated blocks ({}) in masked image segment {}'.format(
-                        len(jpeg_delimiters), len(anticipated_jpeg_indices), image_segment_index))
-            for jpeg_delim, mask_index in zip(jpeg_delimiters, anticipated_jpeg_indices):
-                if anticipated_jpeg_indices[mask_index] != jpeg_delim[0]:
-                    raise ValueError(
-                        'Populated mask offsets ({})\n\t'
-                        'do not agree with discovered jpeg offsets ({})\n\t'
-                        'with mask subheader length {}'.format(jpeg_delim, mask_offsets, additional_offset))
-
+            populated = mask_offsets != exclude_value
         else:
-            if len(jpeg_delimiters) != len(block_bounds)*raw_bands:
-                raise ValueError(
-                    'Found different number of jpeg delimiters ({}) than blocks,\n\t'
-                    'bands ({}, {}) in image segment {}'.format(
-                        len(jpeg_delimiters), len(block_bounds), raw_bands, image_segment_index))
-            mask_offsets = numpy.reshape(
-                numpy.array([entry[0] for entry in jpeg_delimiters], dtype='int64'),
-                (raw_bands, len(block_bounds)))
-
-        # create a memmap, and extract all of our jpeg data into it as appropriate
-        raw_shape = _get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2)
-        fi, path_name = mkstemp(suffix='.sarpy_cache', text=False)
-        self._delete_temp_files.append(path_name)
-        mem_map = numpy.memmap(
-            path_name, dtype=raw_dtype, mode='w+', offset=0,
-            shape=raw_shape)
-        if image_header.is_masked:
-            mem_map.fill(0)  # TODO: missing value?
-
+            populated = numpy.ones((raw_bands, len(block_bounds)), dtype='bool')
+        self._validate_jpeg_delimiters(
+            image_segment_index, jpeg_delimiters, mask_offsets, populated, additional_offset)
+
+        # the blocks are stored band sequentially, each a single band
+        pixel_bounds = []
+        byte_ranges = []
+        band_indices = []
         next_jpeg_block = 0
         for band_number in range(raw_bands):
-            for mask_offset, block_bound in zip(mask_offsets, block_bounds):
-                if mask_offset == exclude_value:
-                    continue  # just skip it, it's masked out
-                jpeg_delim = jpeg_delimiters[next_jpeg_block]
-                # noinspection PyUnresolvedReferences
-                img = PIL_Image.open(BytesIO(the_bytes[jpeg_delim[0]:jpeg_delim[1]]))
+            for block_index, block_bound in enumerate(block_bounds):
                 # handle block padding situation
-                row_start, row_end = block_bound[0], min(block_bound[1], image_header.NROWS)
-                col_start, col_end = block_bound[2], min(block_bound[3], image_header.NCOLS)
-                mem_map[row_start: row_end, col_start:col_end, band_number] = \
-                    numpy.asarray(img)[0:row_end - row_start, 0:col_end - col_start]
-                next_jpeg_block += 1
-
-        mem_map.flush()  # write all the data to the file
-        del mem_map  # clean up the memmap
-        os.close(fi)
+                pixel_bounds.append(
+                    (block_bound[0], min(block_bound[1], image_header.NROWS),
+                     block_bound[2], min(block_bound[3], image_header.NCOLS)))
+                band_indices.append(band_number)
+                if populated[band_number, block_index]:
+                    byte_ranges.append(jpeg_delimiters[next_jpeg_block])
+                    next_jpeg_block += 1
+                else:
+                    byte_ranges.append(None)  # it's masked out
 
+        raw_shape = _get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2)
         if apply_format:
             format_function = self.get_format_function(
                 raw_dtype, complex_order, lut, 2,
@@ -2136,11 +2612,10 @@ class NITFReader(BaseReader):
             formatted_dtype = raw_dtype
             formatted_shape = raw_shape
 
-        return NumpyMemmapSegment(
-            path_name, 0, raw_dtype, raw_shape,
-            formatted_dtype, formatted_shape,
-            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
-            format_function=format_function, mode='r', close_file=False)
+        return self._create_block_decoded_segment(
+            image_segment_index, raw_dtype, raw_shape, pixel_bounds, byte_ranges,
+            None if raw_bands == 1 else band_indices,
+            formatted_dtype, formatted_shape, reverse_axes, transpose_axes, format_function)
 
     def _handle_imode_s_no_compression(self, image_segment_index: int, apply_format: bool) -> DataSegment:
         image_header = self.get_image_header(image_segment_index)
@@ -2453,6 +2928,9 @@ class NITFReader(BaseReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(magic=(b'NITF', ))
+
+
 def is_a(file_name: Union[str, BinaryIO]) -> Optional[NITFReader]:
     """
     Tests whether a given file_name corresponds to a nitf file. Returns a
@@ -3536,16 +4014,76 @@ class NITFWritingDetails(object):
 #############
 # An array based (for only uncompressed images) nitf 2.1 writer
 
+class _SequentialOutput(object):
+    """
+    Wraps a binary output, which need not be seekable, buffering writes and
+    permitting only seeks to the current position. This permits the subheader
+    managers, which seek to the known offset of each element prior to writing,
+    to write sequentially, provided that elements are written in file order.
+    """
+
+    __slots__ = ('_file_object', '_position', '_buffer', '_buffer_size')
+
+    def __init__(self, file_object: BinaryIO, buffer_size: int = _stream_buffer_size):
+        self._file_object = file_object
+        self._position = 0
+        self._buffer = bytearray()
+        self._buffer_size = int(buffer_size)
+
+    @property
+    def file_object(self) -> BinaryIO:
+        return self._file_object
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence != os.SEEK_SET:
+            raise ValueError('Streaming output only supports seeking relative to the start or current position')
+        if offset != self._position:
+            raise ValueError(
+                'Streaming output is at position {}, and cannot seek to {}.\n\t'
+                'The NITF elements must be written in file order.'.format(self._position, offset))
+        return offset
+
+    def _write_buffer(self) -> None:
+        if len(self._buffer) > 0:
+            self._file_object.write(self._buffer)
+            self._buffer = bytearray()
+
+    def write(self, data) -> int:
+        view = memoryview(data).cast('B')
+        if len(self._buffer) + view.nbytes > self._buffer_size:
+            self._write_buffer()
+        if view.nbytes >= self._buffer_size:
+            self._file_object.write(view)
+        else:
+            self._buffer += view
+        self._position += view.nbytes
+        return view.nbytes
+
+    def flush(self) -> None:
+        self._write_buffer()
+        if hasattr(self._file_object, 'flush'):
+            self._file_object.flush()
+
+
 class NITFWriter(BaseWriter):
     __slots__ = (
         '_file_object', '_file_name', '_in_memory',
-        '_nitf_writing_details', '_image_segment_data_segments')
+        '_nitf_writing_details', '_image_segment_data_segments', '_max_workers',
+        '_streaming', '_max_buffer_bytes', '_stream_counts', '_stream_pending', '_stream_pending_bytes')
 
     def __init__(
             self,
             file_object: Union[str, BinaryIO],
             writing_details: NITFWritingDetails,
-            check_existence: bool = True):
+            check_existence: bool = True,
+            max_workers: int = 1,
+            streaming: bool = False,
+            max_buffer_bytes: int = 268435456):
         """
 
         Parameters
@@ -3554,6 +4092,22 @@ class NITFWriter(BaseWriter):
         writing_details : NITFWritingDetails
         check_existence : bool
             Should we check if the given file already exists?
+        max_workers : int
+            The number of threads used to write image data. If greater than 1,
+            then the independent image segments and blocks, and the row stripes
+            within each, are written concurrently. This is only applicable for
+            file (not in-memory) processing.
+        streaming : bool
+            Write the file strictly sequentially, which permits a non-seekable
+            output like a pipe or upload stream. The header and subheaders are
+            written as soon as all preceding content has been written, and image
+            data must be written in full width row stripes, which are output in
+            row order. This requires uncompressed and unmasked image segments
+            each consisting of a single block, and the item bytes for all other
+            segments populated in `writing_details`.
+        max_buffer_bytes : int
+            For streaming, the maximum size of the image data held in memory
+            while awaiting the preceding image data.
 
         Raises
         ------
@@ -3563,6 +4117,18 @@ class NITFWriter(BaseWriter):
 
         self._nitf_writing_details = None
         self._image_segment_data_segments = []  # type: List[DataSegment]
+        max_workers = int(max_workers)
+        if max_workers < 1:
+            raise ValueError('max_workers must be a positive integer')
+        self._max_workers = max_workers
+        self._streaming = bool(streaming)
+        max_buffer_bytes = int(max_buffer_bytes)
+        if max_buffer_bytes < 0:
+            raise ValueError('max_buffer_bytes must be non-negative')
+        self._max_buffer_bytes = max_buffer_bytes
+        self._stream_counts = {}
+        self._stream_pending = {}
+        self._stream_pending_bytes = 0
 
         if isinstance(file_object, str):
             if check_existence and os.path.exists(file_object):
@@ -3573,11 +4139,16 @@ class NITFWriter(BaseWriter):
         if not is_file_like(file_object):
             raise ValueError('file_object requires a file path or BinaryIO object')
 
-        self._file_object = file_object
-        if is_real_file(file_object):
+        if self._streaming:
+            self._file_name = None
+            self._in_memory = False
+            self._file_object = _SequentialOutput(file_object)
+        elif is_real_file(file_object):
+            self._file_object = file_object
             self._file_name = file_object.name
             self._in_memory = False
         else:
+            self._file_object = file_object
             self._file_name = None
             self._in_memory = True
 
@@ -3596,7 +4167,12 @@ class NITFWriter(BaseWriter):
         data_segments = self.get_data_segments()
 
         self.nitf_writing_details.set_all_sizes(require=True)  # NB: while no compression supported...
-        if not self._in_memory:
+        if self._streaming:
+            # NB: everything must be sized, since the header is written first
+            self.nitf_writing_details.verify_all_offsets(require=True)
+            self.nitf_writing_details.set_header_clevel()
+            self._write_streaming_items()
+        elif not self._in_memory:
             self.nitf_writing_details.write_all_populated_items(self._file_object)
         BaseWriter.__init__(self, data_segments)
 
@@ -3616,6 +4192,93 @@ class NITFWriter(BaseWriter):
             raise TypeError('nitf_writing_details must be of type {}'.format(NITFWritingDetails))
         self._nitf_writing_details = value
 
+    @property
+    def max_workers(self) -> int:
+        """
+        int: The number of threads used to write image data.
+        """
+
+        return self._max_workers
+
+    @property
+    def streaming(self) -> bool:
+        """
+        bool: Is the file being written strictly sequentially?
+        """
+
+        return self._streaming
+
+    def _write_streaming_items(self) -> None:
+        """
+        For streaming, write in file order each subheader and item which is
+        available, stopping at the first image segment whose data is incomplete,
+        or other item which is not populated.
+        """
+
+        details = self.nitf_writing_details
+        details.write_header(self._file_object, overwrite=False)
+        for managers in [
+                details.image_managers, details.graphics_managers, details.text_managers,
+                details.des_managers, details.res_managers]:
+            if managers is None:
+                continue
+            for index, entry in enumerate(managers):
+                entry.write_subheader(self._file_object)
+                if entry.item_written:
+                    continue
+                if isinstance(entry, ImageSubheaderManager):
+                    self._write_pending_image_data(index)
+                else:
+                    entry.write_item(self._file_object)
+                if not entry.item_written:
+                    return
+
+    def _write_pending_image_data(self, image_segment_index: int) -> None:
+        pending = self._stream_pending.pop(image_segment_index, [])
+        for data in pending:
+            self._stream_pending_bytes -= data.nbytes
+            self._stream_image_data(image_segment_index, data)
+
+    def _stream_image_data(self, image_segment_index: int, data: numpy.ndarray) -> None:
+        """
+        The output function for the streaming data segment of the given image
+        segment, which accepts the raw data in order.
+        """
+
+        manager = self.image_managers[image_segment_index]
+        if not manager.subheader_written:
+            # the preceding image segments are incomplete
+            if self._stream_pending_bytes + data.nbytes > self._max_buffer_bytes:
+                raise ValueError(
+                    'Writing data for image segment {} requires holding {} bytes in memory,\n\t'
+                    'beyond max_buffer_bytes {}, since the preceding image segments are incomplete'.format(
+                        image_segment_index, self._stream_pending_bytes + data.nbytes, self._max_buffer_bytes))
+            self._stream_pending.setdefault(image_segment_index, []).append(data.copy())
+            self._stream_pending_bytes += data.nbytes
+            return
+
+        self._file_object.write(data)
+        count = self._stream_counts.get(image_segment_index, 0) + data.nbytes
+        self._stream_counts[image_segment_index] = count
+        if count == manager.item_size:
+            manager.item_written = True
+            self._write_streaming_items()
+
+    def _get_write_concurrency(self) -> Tuple[int, Optional[int]]:
+        """
+        Gets the `max_workers` and `max_write_bytes` values for an aggregate
+        data segment.
+
+        Returns
+        -------
+        max_workers : int
+        max_write_bytes : None|int
+        """
+
+        if self._in_memory or self._streaming or self._max_workers < 2:
+            return 1, None
+        return self._max_workers, _write_stripe_bytes
+
     @property
     def image_managers(self) -> Tuple[ImageSubheaderManager, ...]:
         return self.nitf_writing_details.image_managers
@@ -3883,7 +4546,7 @@ class NITFWriter(BaseWriter):
 
         # set the details in the image manager...
         self.image_managers[image_segment_index].item_size = final_block_ending - additional_offset
-        if not self._in_memory:
+        if not (self._in_memory or self._streaming):
             self.image_managers[image_segment_index].item_written = True
             # NB: it's written in principle by the data segment
 
@@ -3920,9 +4583,24 @@ class NITFWriter(BaseWriter):
         else:
             raise ValueError('Unhandled IMODE `{}`'.format(image_header.IMODE))
 
-        if len(block_bounds) == 1:
+        if self._streaming:
+            # NB: the image data must be stored in row order
+            if len(block_bounds) != 1 or mask_offsets is not None or additional_offset != 0 or \
+                    (image_header.IMODE == 'B' and raw_bands > 1) or \
+                    block_size != raw_dtype.itemsize*int(numpy.prod(raw_shape)):
+                raise ValueError(
+                    'Streaming requires an unmasked image segment consisting of a single unpadded block,\n\t'
+                    'with row ordered data, which is not the case for image segment {}'.format(image_segment_index))
+            return StreamingWriteSegment(
+                functools.partial(self._stream_image_data, image_segment_index),
+                raw_dtype, raw_shape, formatted_dtype, formatted_shape,
+                reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+                format_function=format_function, max_pending_bytes=self._max_buffer_bytes)
+
+        max_workers, max_write_bytes = self._get_write_concurrency()
+        if len(block_bounds) == 1 and max_workers == 1:
             # there is just a single block, no need to obfuscate behind a
-            # block aggregate
+            # block aggregate, unless we are writing concurrently
 
             if self._in_memory:
                 underlying_array = numpy.full(raw_shape, 0, dtype=raw_dtype)
@@ -3976,7 +4654,7 @@ class NITFWriter(BaseWriter):
             data_segments, child_arrangement, 'raw', 0, raw_shape,
             formatted_dtype, formatted_shape, reverse_axes=reverse_axes,
             transpose_axes=transpose_axes, format_function=format_function,
-            close_children=True)
+            close_children=True, max_workers=max_workers, max_write_bytes=max_write_bytes)
 
     def _create_data_segment_from_imode_b(self, image_segment_index: int, apply_format: bool) -> DataSegment:
         image_header = self.get_image_header(image_segment_index)
@@ -4107,8 +4785,14 @@ class NITFWriter(BaseWriter):
         child_segments = []
         child_arrangement = []
         raw_bands = None
+        max_workers, max_write_bytes = self._get_write_concurrency()
         for img_index, block_def in zip(block, block_definition):
             child_segment = self.create_data_segment_for_image_segment(img_index, False)
+            if isinstance(child_segment, BlockAggregateSegment):
+                # NB: the concurrency is managed here, with row stripes spanning
+                #   the image segments, rather than nested thread pools
+                child_segment.max_workers = 1
+                child_segment.max_write_bytes = None
             # NB: the bands in the formatted data will be in the final dimension
             if raw_bands is None:
                 raw_bands = 1 if child_segment.formatted_ndim == 2 else \
@@ -4125,7 +4809,8 @@ class NITFWriter(BaseWriter):
 
         return BlockAggregateSegment(
             child_segments, child_arrangement, 'raw', 0, raw_shape, formatted_dtype, formatted_shape,
-            format_function=format_function, close_children=True)
+            format_function=format_function, close_children=True,
+            max_workers=max_workers, max_write_bytes=max_write_bytes)
 
     def get_data_segments(self) -> List[DataSegment]:
         """
@@ -4147,6 +4832,11 @@ class NITFWriter(BaseWriter):
         BaseWriter.flush(self, force=force)
 
         try:
+            if self._streaming:
+                self._write_streaming_items()
+                self._file_object.flush()
+                return
+
             if self._in_memory:
                 if self._image_segment_data_segments is not None:
                     for index, entry in enumerate(self._image_segment_data_segments):
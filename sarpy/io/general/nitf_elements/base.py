@@ -1108,14 +1108,14 @@ class TREList(NITFElement):
             loc = start
             while loc < len(value):
                 anticipated_length = int(value[loc+6:loc+11]) + 11
-                tre = TRE.from_bytes(value, loc)
-                parsed_length = tre.get_bytes_length()
-                if parsed_length != anticipated_length:
+                # NB: the tre data is decoded lazily, and its decoded length is checked then
+                if loc + anticipated_length > len(value):
                     logger.error(
-                        'The given length for TRE {} instance is {}, but the constructed length is {}. '
-                        'This is the result of a malformed TRE object definition. '
-                        'If possible, this should be reported to the sarpy team for review/repair.'.format(
-                            tre.TAG, anticipated_length, parsed_length))
+                        'The given length for TRE {} instance is {}, but only {} bytes remain. '
+                        'This is the result of a truncated or malformed TRE extension.'.format(
+                            value[loc:loc+6].decode('utf-8', errors='replace').strip(),
+                            anticipated_length, len(value) - loc))
+                tre = TRE.from_bytes(value, loc)
                 loc += anticipated_length
                 tres.append(tre)
             fields['tres'] = tres
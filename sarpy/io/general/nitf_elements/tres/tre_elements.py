@@ -278,9 +278,15 @@ class TRELoop(TREElement):
 class TREExtension(TRE):
     """
     Extend this object to provide concrete TRE implementations.
+
+    When constructed from bytes, the TRE data is retained as raw bytes, and
+    only decoded into the `_data_type` instance on the first access of `DATA`.
+    A TRE whose data has never been accessed is serialized directly from the
+    retained raw bytes. Decoding is attempted only once, and the raw bytes are
+    retained if it fails.
     """
 
-    __slots__ = ('_data', )
+    __slots__ = ('_data', '_raw_data', '_decode_failed')
     _tag_value = None
     _data_type = None
 
@@ -292,6 +298,8 @@ class TREExtension(TRE):
         if len(self._tag_value) > 6:
             raise ValueError('Tag value must have 6 or fewer characters.')
         self._data = None
+        self._raw_data = None
+        self._decode_failed = False
         self.DATA = value
 
     @property
@@ -299,7 +307,16 @@ class TREExtension(TRE):
         return self._tag_value
 
     @property
-    def DATA(self):  # type: () -> _data_type
+    def DATA(self):  # type: () -> Union[_data_type, bytes]
+        """
+        The TRE data, decoded on first access. In the event that decoding
+        fails, the raw bytes are returned, without further decoding attempts.
+        """
+
+        if self._data is None and self._raw_data is not None and not self._decode_failed:
+            self._decode()
+        if self._data is None:
+            return self._raw_data
         return self._data
 
     @DATA.setter
@@ -307,17 +324,57 @@ class TREExtension(TRE):
         # type: (Union[bytes, _data_type]) -> None
         if isinstance(value, self._data_type):
             self._data = value
+            self._raw_data = None
+            self._decode_failed = False
         elif isinstance(value, bytes):
-            self._data = self._data_type(value)
+            self._data = None
+            self._raw_data = value
+            self._decode_failed = False
         else:
             raise TypeError(
                 'data must be of {} type or a bytes array. '
                 'Got {}'.format(self._data_type, type(value)))
 
+    @property
+    def is_decoded(self):
+        """
+        bool: Has the TRE data been decoded from the raw bytes?
+        """
+
+        return self._data is not None
+
+    def _decode(self):
+        """
+        Decode the raw bytes into the `_data_type` instance.
+
+        Returns
+        -------
+        None
+        """
+
+        try:
+            data = self._data_type(self._raw_data)
+        except Exception as e:
+            logger.error(
+                "Returning unparsed tre data, because we failed parsing tre as "
+                "type {} with exception\n\t{}".format(self.__class__.__name__, e))
+            self._decode_failed = True
+            return
+
+        parsed_length = data.get_bytes_length()
+        if parsed_length != len(self._raw_data):
+            logger.error(
+                'The given length for TRE {} instance is {}, but the constructed length is {}. '
+                'This is the result of a malformed TRE object definition. '
+                'If possible, this should be reported to the sarpy team for review/repair.'.format(
+                    self.TAG, len(self._raw_data) + 11, parsed_length + 11))
+        self._data = data
+        self._raw_data = None
+
     @property
     def EL(self):
         if self._data is None:
-            return 0
+            return 0 if self._raw_data is None else len(self._raw_data)
         return self._data.get_bytes_length()
 
     @classmethod
@@ -328,7 +385,11 @@ class TREExtension(TRE):
         return 11 + self.EL
 
     def to_bytes(self):
-        return ('{0:6s}{1:05d}'.format(self.TAG, self.EL)).encode('utf-8') + self._data.to_bytes()
+        if self._data is None:
+            data = b'' if self._raw_data is None else self._raw_data
+        else:
+            data = self._data.to_bytes()
+        return ('{0:6s}{1:05d}'.format(self.TAG, self.EL)).encode('utf-8') + data
 
     @classmethod
     def from_bytes(cls, value, start):
@@ -0,0 +1,230 @@
+"""
+Inexpensive signatures for narrowing the candidate openers (i.e. :func:`is_a`)
+for a given file, prior to attempting the full (possibly expensive) check.
+
+This module introduced in version 1.3.80.
+"""
+
+__classification__ = "UNCLASSIFIED"
+__author__ = "Thomas McCullough"
+
+import logging
+import os
+from fnmatch import fnmatchcase
+from typing import Union, Optional, Sequence, BinaryIO, Tuple, FrozenSet
+
+from sarpy.io.general.utils import h5py, is_file_like
+
+logger = logging.getLogger(__name__)
+
+_HDF5_MAGIC = b'\x89HDF'
+
+
+class OpenerProbe(object):
+    """
+    The inexpensive details of a path or file-like object, used for checking
+    against any number of :class:`OpenerSignature` instances. Each detail is
+    only fetched when first required, and then reused. That is, the initial
+    bytes are fetched using a single small read, the directory contents using a
+    single listing, and the root hdf5 attribute and member names by opening the
+    file once.
+
+    Introduced in version 1.3.80.
+    """
+
+    __slots__ = (
+        '_file_name', '_header_size', '_header', '_entries', '_hdf5_keys')
+
+    def __init__(self, file_name: Union[str, BinaryIO], header_size: int = 512):
+        """
+
+        Parameters
+        ----------
+        file_name : str|BinaryIO
+        header_size : int
+            The number of initial bytes fetched.
+        """
+
+        self._file_name = file_name
+        self._header_size = int(header_size)
+        self._header = None
+        self._entries = None
+        self._hdf5_keys = None
+
+    @property
+    def file_name(self) -> Union[str, BinaryIO]:
+        return self._file_name
+
+    @property
+    def is_file_like(self) -> bool:
+        """
+        bool: Is this a file-like object, rather than a path?
+        """
+
+        return is_file_like(self._file_name)
+
+    @property
+    def is_directory(self) -> bool:
+        """
+        bool: Is this the path of a directory?
+        """
+
+        return (not self.is_file_like) and os.path.isdir(self._file_name)
+
+    @property
+    def base_name(self) -> Optional[str]:
+        """
+        None|str: The base name of the file, for a path.
+        """
+
+        if self.is_file_like:
+            return None
+        return os.path.basename(os.path.normpath(self._file_name))
+
+    @property
+    def header(self) -> bytes:
+        """
+        bytes: The (up to `header_size`) initial bytes of the file. This will be
+        empty for a directory, or a path which cannot be read.
+        """
+
+        if self._header is None:
+            self._header = b''
+            try:
+                if self.is_file_like:
+                    current_location = self._file_name.tell()
+                    self._file_name.seek(0, os.SEEK_SET)
+                    self._header = self._file_name.read(self._header_size)
+                    self._file_name.seek(current_location, os.SEEK_SET)
+                elif os.path.isfile(self._file_name):
+                    with open(self._file_name, 'rb') as fi:
+                        self._header = fi.read(self._header_size)
+            except (OSError, ValueError) as e:
+                logger.debug('Failed fetching the initial bytes of {} with error\n\t{}'.format(self._file_name, e))
+        return self._header
+
+    @property
+    def directory_entries(self) -> Tuple[str, ...]:
+        """
+        Tuple[str, ...]: The names of the entries of the directory, or of the
+        directory containing the file, for a path.
+        """
+
+        if self._entries is None:
+            self._entries = ()
+            if not self.is_file_like:
+                the_dir = self._file_name if self.is_directory else \
+                    os.path.dirname(os.path.abspath(self._file_name))
+                try:
+                    self._entries = tuple(os.listdir(the_dir))
+                except OSError as e:
+                    logger.debug('Failed listing the directory {} with error\n\t{}'.format(the_dir, e))
+        return self._entries
+
+    @property
+    def hdf5_keys(self) -> Optional[FrozenSet[str]]:
+        """
+        None|FrozenSet[str]: The names of the root attributes and root members
+        of a hdf5 file. This is `None` if this cannot be determined, and empty if
+        this is not a hdf5 file.
+        """
+
+        if self._hdf5_keys is None:
+            if not self.header.startswith(_HDF5_MAGIC):
+                self._hdf5_keys = frozenset()
+            elif h5py is None or self.is_file_like:
+                return None
+            else:
+                try:
+                    with h5py.File(self._file_name, 'r') as hf:
+                        self._hdf5_keys = frozenset(hf.attrs.keys()).union(hf.keys())
+                except Exception as e:
+                    logger.debug('Failed opening hdf5 file {} with error\n\t{}'.format(self._file_name, e))
+                    return None
+        return self._hdf5_keys
+
+
+class OpenerSignature(object):
+    """
+    The inexpensive necessary conditions for a file to be read by a given opener.
+    Each populated condition must be satisfied, and an unpopulated condition is
+    not checked.
+
+    Introduced in version 1.3.80.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        # in a module defining is_a()
+        is_a_signature = OpenerSignature(magic=(b'NITF', b'NSIF'))
+    """
+
+    __slots__ = ('_magic', '_file_names', '_manifest_names', '_hdf5_keys')
+
+    def __init__(
+            self,
+            magic: Optional[Sequence[bytes]] = None,
+            file_names: Optional[Sequence[str]] = None,
+            manifest_names: Optional[Sequence[str]] = None,
+            hdf5_keys: Optional[Sequence[str]] = None):
+        """
+
+        Parameters
+        ----------
+        magic : None|Sequence[bytes]
+            The file must begin with one of these byte strings. A directory
+            never satisfies this.
+        file_names : None|Sequence[str]
+            The base name of a file path must match one of these (case sensitive,
+            shell-style) patterns. A directory or file-like object is not checked.
+        manifest_names : None|Sequence[str]
+            The directory, or the directory containing the file, must contain
+            an entry matching one of these (case sensitive, shell-style) patterns.
+            A file-like object never satisfies this.
+        hdf5_keys : None|Sequence[str]
+            The file must be a hdf5 file with all of these names as root attributes
+            or root members.
+        """
+
+        self._magic = None if magic is None else tuple(bytes(entry) for entry in magic)
+        self._file_names = None if file_names is None else tuple(file_names)
+        self._manifest_names = None if manifest_names is None else tuple(manifest_names)
+        self._hdf5_keys = None if hdf5_keys is None else tuple(hdf5_keys)
+        if self._hdf5_keys is not None:
+            self._magic = (_HDF5_MAGIC, )
+
+    def matches(self, probe: OpenerProbe) -> bool:
+        """
+        Check whether the probed file satisfies these conditions. The least
+        expensive conditions are checked first.
+
+        Parameters
+        ----------
+        probe : OpenerProbe
+
+        Returns
+        -------
+        bool
+            `False` if the file definitely cannot be read by the opener.
+        """
+
+        if self._file_names is not None and not (probe.is_file_like or probe.is_directory):
+            if not any(fnmatchcase(probe.base_name, entry) for entry in self._file_names):
+                return False
+        if self._magic is not None:
+            header = probe.header
+            if not any(header.startswith(entry) for entry in self._magic):
+                return False
+        if self._manifest_names is not None:
+            if probe.is_file_like:
+                return False
+            entries = probe.directory_entries
+            if not any(fnmatchcase(name, pattern) for pattern in self._manifest_names for name in entries):
+                return False
+        if self._hdf5_keys is not None:
+            keys = probe.hdf5_keys
+            # NB: the hdf5 details could not be determined, so let the opener decide
+            if keys is not None and not all(entry in keys for entry in self._hdf5_keys):
+                return False
+        return True
@@ -0,0 +1,302 @@
+"""
+Asynchronous read-ahead for a known sequence of reads from a reader or data
+segment, permitting reading to be overlapped with processing.
+
+This module introduced in version 1.3.64.
+"""
+
+__classification__ = "UNCLASSIFIED"
+__author__ = "Thomas McCullough"
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Union, Tuple, Sequence, Optional, Iterator, Iterable
+
+import numpy
+
+from sarpy.io.general.base import BaseReader
+from sarpy.io.general.data_segment import DataSegment
+
+logger = logging.getLogger(__name__)
+
+_SubscriptType = Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]]
+
+
+class ReadPrefetcher(object):
+    """
+    Reads a sequence of upcoming subscripts from a reader or data segment on a
+    background thread, holding at most `queue_depth` completed or in progress
+    reads at any time.
+
+    Reads of scheduled subscripts are intended to be requested in the order in
+    which they were scheduled, via :meth:`read` or by iteration. The time spent
+    waiting for a scheduled read to complete is recorded as stall time, which
+    is the quantity to examine when tuning the queue depth.
+
+    Introduced in version 1.3.64.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        subscripts = [(slice(start, min(start+1024, rows)), slice(None)) for start in range(0, rows, 1024)]
+        with ReadPrefetcher(reader, subscripts, index=0, queue_depth=2) as prefetcher:
+            for subscript, data in prefetcher:
+                process(data)
+            print(prefetcher.get_statistics())
+    """
+
+    __slots__ = (
+        '_data_segment', '_raw', '_squeeze', '_queue_depth', '_executor',
+        '_scheduled', '_in_flight', '_lock', '_stall_time', '_stall_count',
+        '_read_time', '_read_count', '_hits', '_misses', '_closed')
+
+    def __init__(
+            self,
+            source: Union[BaseReader, DataSegment],
+            subscripts: Optional[Iterable[_SubscriptType]] = None,
+            index: int = 0,
+            raw: bool = False,
+            squeeze: bool = True,
+            queue_depth: int = 2):
+        """
+
+        Parameters
+        ----------
+        source : BaseReader|DataSegment
+        subscripts : None|Iterable
+            The initial sequence of subscripts to be scheduled.
+        index : int
+            The data segment index, if `source` is a reader.
+        raw : bool
+            Read raw data, rather than formatted data?
+        squeeze : bool
+            Squeeze length 1 dimensions out of the shape of the returned arrays?
+        queue_depth : int
+            The maximum number of reads permitted to be in progress or completed
+            but not yet consumed.
+        """
+
+        self._closed = True
+        if isinstance(source, BaseReader):
+            source = source.get_data_segment_as_tuple()[index]
+        if not isinstance(source, DataSegment):
+            raise TypeError('source must be a BaseReader or DataSegment, got type `{}`'.format(type(source)))
+        if source.mode != 'r':
+            raise ValueError('Requires a data segment with mode "r"')
+        self._data_segment = source
+        self._raw = bool(raw)
+        self._squeeze = bool(squeeze)
+
+        queue_depth = int(queue_depth)
+        if queue_depth < 1:
+            raise ValueError('queue_depth must be a positive integer')
+        self._queue_depth = queue_depth
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._scheduled = deque()
+        self._in_flight = deque()
+        self._lock = threading.Lock()
+        self._stall_time = 0.0
+        self._stall_count = 0
+        self._read_time = 0.0
+        self._read_count = 0
+        self._hits = 0
+        self._misses = 0
+        self._closed = False
+        if subscripts is not None:
+            self.schedule(*subscripts)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        int: The maximum number of reads in progress or completed but not yet consumed.
+        """
+
+        return self._queue_depth
+
+    @property
+    def pending_count(self) -> int:
+        """
+        int: The number of scheduled subscripts which have not yet been consumed.
+        """
+
+        return len(self._scheduled) + len(self._in_flight)
+
+    @property
+    def stall_time(self) -> float:
+        """
+        float: The total time, in seconds, spent waiting on scheduled reads which
+        were not complete when requested.
+        """
+
+        return self._stall_time
+
+    @property
+    def stall_count(self) -> int:
+        """
+        int: The number of scheduled reads which were not complete when requested.
+        """
+
+        return self._stall_count
+
+    @property
+    def closed(self) -> bool:
+        """
+        bool: Is the prefetcher closed?
+        """
+
+        return self._closed
+
+    def get_statistics(self) -> dict:
+        """
+        Gets the prefetch statistics.
+
+        Returns
+        -------
+        dict
+            With keys `hits` (requests satisfied by a scheduled read), `misses`
+            (requests for subscripts which were not scheduled, read synchronously),
+            `stall_count`, `stall_time` (seconds), `read_count`, and `read_time`
+            (total seconds spent in background reads).
+        """
+
+        with self._lock:
+            return {
+                'hits': self._hits, 'misses': self._misses,
+                'stall_count': self._stall_count, 'stall_time': self._stall_time,
+                'read_count': self._read_count, 'read_time': self._read_time}
+
+    def _validate_closed(self) -> None:
+        if self._closed:
+            raise ValueError('I/O operation of closed prefetcher')
+
+    def _normalize(self, subscript: _SubscriptType) -> Tuple[slice, ...]:
+        if self._raw:
+            return self._data_segment.verify_raw_subscript(subscript)
+        return self._data_segment.verify_formatted_subscript(subscript)
+
+    def _read(self, subscript: Tuple[slice, ...]) -> numpy.ndarray:
+        if self._raw:
+            return self._data_segment.read_raw(subscript, squeeze=self._squeeze)
+        return self._data_segment.read(subscript, squeeze=self._squeeze)
+
+    def _timed_read(self, subscript: Tuple[slice, ...]) -> numpy.ndarray:
+        start = time.perf_counter()
+        data = self._read(subscript)
+        with self._lock:
+            self._read_time += time.perf_counter() - start
+            self._read_count += 1
+        return data
+
+    def _fill(self) -> None:
+        while len(self._in_flight) < self._queue_depth and len(self._scheduled) > 0:
+            subscript = self._scheduled.popleft()
+            self._in_flight.append((subscript, self._executor.submit(self._timed_read, subscript)))
+
+    def schedule(self, *subscripts: _SubscriptType) -> None:
+        """
+        Append the given subscripts to the sequence of upcoming reads.
+
+        Parameters
+        ----------
+        subscripts
+            Each entry is a subscript appropriate for `data_segment.read()` usage.
+
+        Returns
+        -------
+        None
+        """
+
+        self._validate_closed()
+        for subscript in subscripts:
+            self._scheduled.append(self._normalize(subscript))
+        self._fill()
+
+    def _wait(self, future: Future) -> numpy.ndarray:
+        if not future.done():
+            start = time.perf_counter()
+            data = future.result()
+            with self._lock:
+                self._stall_time += time.perf_counter() - start
+                self._stall_count += 1
+            return data
+        return future.result()
+
+    def read(self, subscript: _SubscriptType) -> numpy.ndarray:
+        """
+        Read the data for the given subscript, from the scheduled reads if
+        present, and otherwise synchronously.
+
+        Parameters
+        ----------
+        subscript
+            The subscript appropriate for `data_segment.read()` usage.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        self._validate_closed()
+        subscript = self._normalize(subscript)
+
+        for i, (the_subscript, future) in enumerate(self._in_flight):
+            if the_subscript == subscript:
+                del self._in_flight[i]
+                self._fill()
+                with self._lock:
+                    self._hits += 1
+                return self._wait(future)
+
+        try:
+            self._scheduled.remove(subscript)
+            logger.debug('Subscript {} was requested before its read was started'.format(subscript))
+        except ValueError:
+            pass
+        with self._lock:
+            self._misses += 1
+        return self._read(subscript)
+
+    def __iter__(self) -> Iterator[Tuple[Tuple[slice, ...], numpy.ndarray]]:
+        """
+        Consume the scheduled reads, in order.
+
+        Yields
+        ------
+        subscript : Tuple[slice, ...]
+            The normalized subscript.
+        data : numpy.ndarray
+        """
+
+        while not self._closed and self.pending_count > 0:
+            self._fill()
+            subscript = self._in_flight[0][0]
+            yield subscript, self.read(subscript)
+
+    def close(self) -> None:
+        """
+        Cancel any outstanding reads, and release the background thread. This
+        does not close the source.
+        """
+
+        if not hasattr(self, '_closed') or self._closed:
+            return
+        self._closed = True
+        self._scheduled.clear()
+        while len(self._in_flight) > 0:
+            _, future = self._in_flight.popleft()
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
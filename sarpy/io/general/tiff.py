@@ -13,14 +13,16 @@ __author__ = ("Thomas McCullough", "Daniel Haverporth")
 
 import logging
 import os
+import zlib
 
 import numpy
 import re
-from typing import Union, Tuple, Dict, BinaryIO, Sequence
+from typing import Union, Tuple, Dict, BinaryIO, Sequence, Optional, List
 
 from sarpy.io.general.base import BaseReader, SarpyIOError
 from sarpy.io.general.format_function import ComplexFormatFunction
-from sarpy.io.general.data_segment import NumpyMemmapSegment
+from sarpy.io.general.data_segment import NumpyMemmapSegment, BlockDecodedDataSegment
+from sarpy.io.general.opener_signature import OpenerSignature
 
 logger = logging.getLogger(__name__)
 
@@ -361,6 +363,14 @@ class TiffDetails(object):
             tags[value['Name']] = value['Value']
         self._parse_ifd(fi, tags, type_dtype, count_dtype, offset_dtype, offset_size)  # recurse
 
+    @property
+    def is_tiled(self) -> bool:
+        """
+        bool: Is the image data stored in tiles, rather than strips?
+        """
+
+        return 'TileLength' in self.tags or 'TileWidth' in self.tags
+
     def check_compression(self):
         """
         Check the Compression tag, and verify uncompressed.
@@ -370,12 +380,13 @@ class TiffDetails(object):
         None
         """
 
-        if self.tags['Compression'] != 1:
+        if self.tags.get('Compression', 1) != 1:
             raise ValueError(
-                'The file {} indicates some kind of tiff compression, and the sarpy API requirements '
-                'do not presently support reading of compressed tiff files. Consider using gdal to '
-                'translate this tiff to an uncompressed file via the command\n\t'
-                '"gdal_translate -co TILED=no <input_file> <output_file>"')
+                'The file {} indicates some kind of tiff compression, and direct memory mapping '
+                'does not support reading of compressed tiff files. Consider using '
+                'TiledTiffDataSegment, or using gdal to translate this tiff to an uncompressed '
+                'file via the command\n\t'
+                '"gdal_translate -co TILED=no <input_file> <output_file>"'.format(self.file_name))
 
     def check_tiled(self):
         """
@@ -386,12 +397,122 @@ class TiffDetails(object):
         None
         """
 
-        if 'TileLength' in self.tags or 'TileWidth' in self.tags:
+        if self.is_tiled:
+            raise ValueError(
+                'The file {} indicates that this is a tiled file, and direct memory mapping '
+                'does not support reading of tiled tiff files. Consider using '
+                'TiledTiffDataSegment, or using gdal to translate this tiff to a flat file '
+                'via the command\n\t'
+                '"gdal_translate -co TILED=no <input_file> <output_file>"'.format(self.file_name))
+
+    def check_contiguous(self):
+        """
+        Check that the strips of the tiff file are contiguous, so that the image
+        data occupies a single range of bytes.
+
+        Returns
+        -------
+        None
+        """
+
+        offsets = numpy.atleast_1d(self.tags['StripOffsets']).astype('int64')
+        byte_counts = numpy.atleast_1d(self.tags['StripByteCounts']).astype('int64')
+        if numpy.any(offsets[1:] != offsets[:-1] + byte_counts[:-1]):
+            raise ValueError(
+                'The file {} has non-contiguous strips, and direct memory mapping does not '
+                'support reading these. Consider using TiledTiffDataSegment.'.format(self.file_name))
+
+
+_SAMPLE_FORMATS = {
+    1: 'u', 2: 'i', 3: 'f', 5: 'i', 6: 'f'}  # 5 and 6 are complex int/float
+
+
+def _get_tiff_format_details(
+        tiff_details: TiffDetails,
+        reverse_axes: Union[None, int, Sequence[int]],
+        transpose_axes: Union[None, Tuple[int, ...]]) -> Tuple[
+            numpy.dtype, Tuple[int, ...], Union[str, numpy.dtype], Tuple[int, ...],
+            Optional[ComplexFormatFunction], Union[None, Tuple[int, ...]], Union[None, Tuple[int, ...]]]:
+    """
+    Determine the raw and formatted data details for the image data of a tiff
+    file. This makes SAR specific (not necessarily general) choices.
+
+    Parameters
+    ----------
+    tiff_details : TiffDetails
+    reverse_axes : None|int|Sequence[int]
+    transpose_axes : None|Tuple[int, ...]
+
+    Returns
+    -------
+    raw_dtype : numpy.dtype
+    raw_shape : Tuple[int, ...]
+    output_dtype : str|numpy.dtype
+    output_shape : Tuple[int, ...]
+    format_function : None|ComplexFormatFunction
+    reverse_axes : None|Tuple[int, ...]
+    transpose_axes : None|Tuple[int, ...]
+    """
+
+    samp_form = int(numpy.atleast_1d(tiff_details.tags.get('SampleFormat', 1))[0])
+    if samp_form not in _SAMPLE_FORMATS:
+        raise ValueError('Invalid sample format {}'.format(samp_form))
+    bits_per_sample = int(numpy.atleast_1d(tiff_details.tags['BitsPerSample'])[0])
+
+    raw_bands = int(tiff_details.tags.get('SamplesPerPixel', 1))
+
+    if samp_form in [5, 6]:
+        transform_data = 'COMPLEX'
+        output_bands = int(raw_bands)
+        raw_bands *= 2
+        bits_per_sample /= 2
+        output_dtype = 'complex64'
+    elif raw_bands == 2:
+        # NB: this is heavily skewed towards SAR and obviously not general
+        transform_data = 'COMPLEX'
+        output_dtype = 'complex64'
+        output_bands = 1
+    else:
+        transform_data = None
+        output_bands = raw_bands
+        output_dtype = None
+
+    raw_shape = (int(tiff_details.tags['ImageLength']), int(tiff_details.tags['ImageWidth']), raw_bands)
+    raw_dtype = numpy.dtype('{0:s}{1:s}{2:d}'.format(
+        tiff_details.endian, _SAMPLE_FORMATS[samp_form], int(bits_per_sample/8)))
+    if output_dtype is None:
+        output_dtype = raw_dtype
+
+    format_function = None
+    if transform_data == 'COMPLEX':
+        format_function = ComplexFormatFunction(raw_dtype, order='IQ')
+
+    if reverse_axes is not None:
+        if isinstance(reverse_axes, int):
+            reverse_axes = (reverse_axes, )
+        for entry in reverse_axes:
+            if not entry < 2:
+                raise ValueError('reversing of axes on permitted along the first two axes.')
+
+    if transpose_axes is not None:
+        if len(transpose_axes) < 2 or len(transpose_axes) > 3:
+            raise ValueError('transpose axes must have length 2 or 3')
+        elif len(transpose_axes) == 2:
+            transpose_axes = transpose_axes + (2, )
+
+        if transpose_axes[2] != 2:
             raise ValueError(
-                'The file {} indicates that this is a tiled file, and the sarpy API requirements '
-                'do not presently support reading of tiled tiff files. Consider using gdal to '
-                'translate this tiff to a flat file via the command\n\t'
-                '"gdal_translate -co TILED=no <input_file> <output_file>"')
+                'The transpose operation must preserve the location of the band data,\n\t'
+                'in the final dimension')
+
+    if transpose_axes is None or transpose_axes == (0, 1, 2):
+        output_shape = raw_shape[:2]
+    else:
+        output_shape = (raw_shape[1], raw_shape[0])
+
+    if output_bands > 1:
+        output_shape = output_shape + (output_bands, )
+    return raw_dtype, raw_shape, output_dtype, output_shape, format_function, reverse_axes, transpose_axes
 
 
 class NativeTiffDataSegment(NumpyMemmapSegment):
@@ -402,8 +523,7 @@ class NativeTiffDataSegment(NumpyMemmapSegment):
     """
 
     __slots__ = ('_tiff_details', )
-    _SAMPLE_FORMATS = {
-        1: 'u', 2: 'i', 3: 'f', 5: 'i', 6: 'f'}  # 5 and 6 are complex int/float
+    _SAMPLE_FORMATS = _SAMPLE_FORMATS
 
     def __init__(self,
                  tiff_details: Union[str, TiffDetails],
@@ -428,73 +548,12 @@ class NativeTiffDataSegment(NumpyMemmapSegment):
 
         tiff_details.check_compression()
         tiff_details.check_tiled()
+        tiff_details.check_contiguous()
 
         self._tiff_details = tiff_details
-        if isinstance(tiff_details.tags['SampleFormat'], numpy.ndarray):
-            samp_form = tiff_details.tags['SampleFormat'][0]
-        else:
-            samp_form = tiff_details.tags['SampleFormat']
-        if samp_form not in self._SAMPLE_FORMATS:
-            raise ValueError('Invalid sample format {}'.format(samp_form))
-        if isinstance(tiff_details.tags['BitsPerSample'], numpy.ndarray):
-            bits_per_sample = tiff_details.tags['BitsPerSample'][0]
-        else:
-            bits_per_sample = tiff_details.tags['BitsPerSample']
-
-        raw_bands = int(tiff_details.tags['SamplesPerPixel'])
-
-        if samp_form in [5, 6]:
-            transform_data = 'COMPLEX'
-            output_bands = int(raw_bands)
-            raw_bands *= 2
-            bits_per_sample /= 2
-            output_dtype = 'complex64'
-        elif raw_bands == 2:
-            # NB: this is heavily skewed towards SAR and obviously not general
-            transform_data = 'COMPLEX'
-            output_dtype = 'complex64'
-            output_bands = 1
-        else:
-            transform_data = None
-            output_bands = raw_bands
-            output_dtype = None
-
-        raw_shape = (int(tiff_details.tags['ImageLength']), int(tiff_details.tags['ImageWidth']), raw_bands)
-        raw_dtype = numpy.dtype('{0:s}{1:s}{2:d}'.format(
-            self._tiff_details.endian, self._SAMPLE_FORMATS[samp_form], int(bits_per_sample/8)))
-        if output_dtype is None:
-            output_dtype = raw_dtype
-        data_offset = int(tiff_details.tags['StripOffsets'][0])
-
-        format_function = None
-        if transform_data == 'COMPLEX':
-            format_function = ComplexFormatFunction(raw_dtype, order='IQ')
-
-        if reverse_axes is not None:
-            if isinstance(reverse_axes, int):
-                reverse_axes = (reverse_axes, )
-            for entry in reverse_axes:
-                if not entry < 2:
-                    raise ValueError('reversing of axes on permitted along the first two axes.')
-
-        if transpose_axes is not None:
-            if len(transpose_axes) < 2 or len(transpose_axes) > 3:
-                raise ValueError('transpose axes must have length 2 or 3')
-            elif len(transpose_axes) == 2:
-                transpose_axes = transpose_axes + (2, )
-
-            if transpose_axes[2] != 2:
-                raise ValueError(
-                    'The transpose operation must preserve the location of the band data,\n\t'
-                    'in the final dimension')
-
-        if transpose_axes is None or transpose_axes == (0, 1, 2):
-            output_shape = raw_shape[:2]
-        else:
-            output_shape = (raw_shape[1], raw_shape[0])
-
-        if output_bands > 1:
-            output_shape = output_shape + (output_bands, )
+        raw_dtype, raw_shape, output_dtype, output_shape, format_function, reverse_axes, transpose_axes = \
+            _get_tiff_format_details(tiff_details, reverse_axes, transpose_axes)
+        data_offset = int(numpy.atleast_1d(tiff_details.tags['StripOffsets'])[0])
 
         NumpyMemmapSegment.__init__(
             self, tiff_details.file_name, data_offset, raw_dtype, raw_shape,
@@ -507,11 +566,190 @@ class NativeTiffDataSegment(NumpyMemmapSegment):
         return self._tiff_details
 
 
+class TiledTiffDataSegment(BlockDecodedDataSegment):
+    """
+    Reading of data from a tiff file stored as a collection of tiles, or of
+    (possibly non-contiguous) strips, each of which may be deflate compressed.
+
+    Only the tiles or strips intersecting a given read request are fetched and
+    decoded, possibly concurrently using `max_workers` threads, and a bounded
+    number of the most recently used decoded blocks are retained.
+
+    Introduced in version 1.3.79.
+    """
+
+    __slots__ = ('_tiff_details', '_compression', '_predictor', '_block_shape')
+    _COMPRESSIONS = (1, 8, 32946)  # none, adobe deflate, and deflate
+
+    def __init__(self,
+                 tiff_details: Union[str, TiffDetails],
+                 reverse_axes: Union[None, int, Sequence[int]] = None,
+                 transpose_axes: Union[None, Tuple[int, ...]] = None,
+                 max_cached_blocks: int = 16,
+                 max_workers: int = 1):
+        """
+        The format function and format_dtype will be determined using SAR
+        specific (not necessarily general) choices.
+
+        Parameters
+        ----------
+        tiff_details : TiffDetails
+        reverse_axes : None|Tuple[int, ...]
+        transpose_axes : None|Tuple[int, ...]
+        max_cached_blocks : int
+            The maximum number of decoded tiles or strips retained.
+        max_workers : int
+            The maximum number of threads used to decode tiles or strips concurrently.
+        """
+
+        if isinstance(tiff_details, str):
+            tiff_details = TiffDetails(tiff_details)
+        if not isinstance(tiff_details, TiffDetails):
+            raise TypeError('TiledTiffDataSegment input argument must be a filename '
+                            'or TiffDetails object.')
+
+        self._tiff_details = tiff_details
+        self._compression = int(tiff_details.tags.get('Compression', 1))
+        if self._compression not in self._COMPRESSIONS:
+            raise ValueError(
+                'The file {} uses tiff compression {}, and only compression values {} are '
+                'supported. Consider using gdal to translate this tiff to an uncompressed '
+                'file via the command\n\t'
+                '"gdal_translate -co TILED=no <input_file> <output_file>"'.format(
+                    tiff_details.file_name, self._compression, self._COMPRESSIONS))
+        self._predictor = int(tiff_details.tags.get('Predictor', 1))
+
+        raw_dtype, raw_shape, output_dtype, output_shape, format_function, reverse_axes, transpose_axes = \
+            _get_tiff_format_details(tiff_details, reverse_axes, transpose_axes)
+        if self._predictor not in [1, 2] or (self._predictor == 2 and raw_dtype.kind not in 'iu'):
+            raise ValueError(
+                'The file {} uses tiff predictor {} for data type {}, which is not '
+                'supported'.format(tiff_details.file_name, self._predictor, raw_dtype))
+        block_bounds, byte_ranges, band_indices = self._get_block_layout(raw_shape)
+
+        file_object = open(tiff_details.file_name, 'rb')
+        try:
+            BlockDecodedDataSegment.__init__(
+                self, file_object, raw_dtype, raw_shape,
+                block_bounds, byte_ranges, band_indices=band_indices,
+                formatted_dtype=output_dtype, formatted_shape=output_shape,
+                reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+                format_function=format_function, max_cached_blocks=max_cached_blocks,
+                close_file=True, max_workers=max_workers)
+        except Exception:
+            file_object.close()
+            raise
+
+    @property
+    def tiff_details(self) -> TiffDetails:
+        return self._tiff_details
+
+    def _get_block_layout(
+            self,
+            raw_shape: Tuple[int, ...]) -> Tuple[
+                List[Tuple[int, int, int, int]], List[Optional[Tuple[int, int]]], Optional[List[int]]]:
+        """
+        Gets the pixel bounds, byte ranges, and (for separate sample planes) the
+        band of each tile or strip.
+        """
+
+        tags = self.tiff_details.tags
+        rows, cols, raw_bands = raw_shape
+        if self.tiff_details.is_tiled:
+            block_rows, block_cols = int(tags['TileLength']), int(tags['TileWidth'])
+            offsets, byte_counts = tags['TileOffsets'], tags['TileByteCounts']
+        else:
+            block_rows, block_cols = min(int(tags.get('RowsPerStrip', rows)), rows), cols
+            offsets, byte_counts = tags['StripOffsets'], tags['StripByteCounts']
+        self._block_shape = (block_rows, block_cols)
+        offsets = numpy.atleast_1d(offsets).astype('int64')
+        byte_counts = numpy.atleast_1d(byte_counts).astype('int64')
+
+        planes = 1
+        if int(tags.get('PlanarConfiguration', 1)) == 2:
+            planes = int(tags.get('SamplesPerPixel', 1))
+            if planes > 1 and planes != raw_bands:
+                raise ValueError(
+                    'The file {} stores complex samples in separate planes, which is '
+                    'not supported'.format(self.tiff_details.file_name))
+
+        plane_bounds = [
+            (row, min(row + block_rows, rows), col, min(col + block_cols, cols))
+            for row in range(0, rows, block_rows) for col in range(0, cols, block_cols)]
+        if offsets.size != len(plane_bounds)*planes or byte_counts.size != offsets.size:
+            raise ValueError(
+                'The file {} has {} block offsets and {} block byte counts, but expected {} '
+                'blocks'.format(self.tiff_details.file_name, offsets.size, byte_counts.size, len(plane_bounds)*planes))
+        # NB: a zero byte count indicates a sparse block, which is not populated
+        byte_ranges = [
+            None if count == 0 else (int(offset), int(offset + count))
+            for offset, count in zip(offsets, byte_counts)]
+        band_indices = None if planes == 1 else \
+            [band for band in range(planes) for _ in plane_bounds]
+        return plane_bounds*planes, byte_ranges, band_indices
+
+    def _decode_block(self, block_index: int) -> numpy.ndarray:
+        the_bytes = self._read_block_bytes(block_index)
+        if self._compression in [8, 32946]:
+            the_bytes = zlib.decompress(the_bytes)
+
+        bands = self.raw_shape[2] if self._band_indices is None else 1
+        block_rows, block_cols = self._block_shape
+        # NB: the final strip may be truncated, rather than padded
+        row_size = block_cols*bands*self.raw_dtype.itemsize
+        available_rows = min(block_rows, len(the_bytes)//row_size)
+        data = numpy.frombuffer(
+            the_bytes, dtype=self.raw_dtype, count=available_rows*block_cols*bands).reshape(
+            (available_rows, block_cols, bands))
+        if self._predictor == 2:
+            # undo the horizontal differencing, with wrapping integer arithmetic
+            native_dtype = self.raw_dtype.newbyteorder('=')
+            data = numpy.cumsum(data.astype(native_dtype), axis=1, dtype=native_dtype)
+        return self._trim_block(block_index, data)
+
+
+def get_tiff_data_segment(
+        tiff_details: Union[str, TiffDetails],
+        reverse_axes: Union[None, int, Sequence[int]] = None,
+        transpose_axes: Union[None, Tuple[int, ...]] = None,
+        max_workers: int = 1) -> Union[NativeTiffDataSegment, TiledTiffDataSegment]:
+    """
+    Gets the appropriate data segment for the image data of the tiff file. This
+    is a :class:`NativeTiffDataSegment` for an uncompressed file with contiguous
+    strips, and a :class:`TiledTiffDataSegment` otherwise.
+
+    Parameters
+    ----------
+    tiff_details : str|TiffDetails
+    reverse_axes : None|int|Sequence[int]
+    transpose_axes : None|Tuple[int, ...]
+    max_workers : int
+        The maximum number of threads used to decode tiles or strips concurrently,
+        only applicable for a :class:`TiledTiffDataSegment`.
+
+    Returns
+    -------
+    NativeTiffDataSegment|TiledTiffDataSegment
+    """
+
+    if isinstance(tiff_details, str):
+        tiff_details = TiffDetails(tiff_details)
+    try:
+        tiff_details.check_compression()
+        tiff_details.check_tiled()
+        tiff_details.check_contiguous()
+    except ValueError:
+        return TiledTiffDataSegment(
+            tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes, max_workers=max_workers)
+    return NativeTiffDataSegment(tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes)
+
+
 class TiffReader(BaseReader):
     def __init__(self,
                  tiff_details: Union[str, TiffDetails],
                  reverse_axes: Union[None, int, Sequence[int]] = None,
-                 transpose_axes: Union[None, Tuple[int, ...]] = None):
+                 transpose_axes: Union[None, Tuple[int, ...]] = None,
+                 max_workers: int = 1):
         """
 
         Parameters
@@ -519,15 +757,19 @@ class TiffReader(BaseReader):
         tiff_details : TiffDetails
         reverse_axes : None|int|Sequence[int]
         transpose_axes : None|Tuple[int, ...]
+        max_workers : int
+            The maximum number of threads used to decode tiles or strips
+            concurrently, for a tiled, compressed, or non-contiguous file.
         """
 
-        data_segment = NativeTiffDataSegment(tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes)
+        data_segment = get_tiff_data_segment(
+            tiff_details, reverse_axes=reverse_axes, transpose_axes=transpose_axes, max_workers=max_workers)
         BaseReader.__init__(self, data_segment, reader_type='OTHER', close_segments=True)
 
     @property
-    def data_segment(self) -> NativeTiffDataSegment:
+    def data_segment(self) -> Union[NativeTiffDataSegment, TiledTiffDataSegment]:
         """
-        NativeTiffDataSegment: The tiff data segment.
+        NativeTiffDataSegment|TiledTiffDataSegment: The tiff data segment.
         """
 
         return self._data_segment
@@ -547,6 +789,8 @@ class TiffReader(BaseReader):
 ########
 # base expected functionality for a module with an implemented Reader
 
+is_a_signature = OpenerSignature(magic=(b'II*\x00', b'MM\x00*', b'II+\x00', b'MM\x00+'))
+
 
 def is_a(file_name: str) -> Union[None, TiffReader]:
     """
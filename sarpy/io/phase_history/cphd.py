@@ -142,18 +142,17 @@ class AmpScalingFunction(ComplexFormatFunction):
                 'Use of scaling multiplier requires the array length\n\t'
                 'and the first dimension of raw_shape match.')
 
-    def _forward_functional_step(
+    def _forward_functional_step_into(
             self,
             data: numpy.ndarray,
-            subscript: Tuple[slice, ...]) -> numpy.ndarray:
-        out = ComplexFormatFunction._forward_functional_step(self, data, subscript)
+            subscript: Tuple[slice, ...],
+            out: numpy.ndarray) -> None:
+        ComplexFormatFunction._forward_functional_step_into(self, data, subscript, out)
 
         # NB: subscript is in raw coordinates, but we have verified that
         #   the first dimension is unchanged
         if self._amplitude_scaling is not None:
-            out = self._amplitude_scaling[subscript[0]][:, numpy.newaxis] * out
-
-        return out
+            out *= self._amplitude_scaling[subscript[0]][:, numpy.newaxis]
 
     def _reverse_functional_step(
             self,
@@ -177,13 +177,19 @@ class SIDDReader(NITFReader, SIDDTypeReader):
     A reader object for a SIDD file (NITF container with SIDD contents)
     """
 
-    def __init__(self, nitf_details):
+    def __init__(self, nitf_details, max_decode_workers: int = 1, decode_cache=None):
         """
 
         Parameters
         ----------
         nitf_details : str|BinaryIO|SIDDDetails
             filename, file-like object, or SIDDDetails object
+        max_decode_workers : int
+            The maximum number of threads used to decode the independent blocks
+            of compressed image segments concurrently.
+        decode_cache : None|str|DecodedSegmentCache
+            If provided, compressed image segments are fully decoded once into
+            this persistent cache (or cache directory), and subsequently reused.
         """
 
         if isinstance(nitf_details, str) or is_file_like(nitf_details):
@@ -199,7 +205,8 @@ class SIDDReader(NITFReader, SIDDTypeReader):
 
         self._nitf_details = nitf_details
         SIDDTypeReader.__init__(self, None, self.nitf_details.sidd_meta, self.nitf_details.sicd_meta)
-        NITFReader.__init__(self, nitf_details, reader_type="SIDD")
+        NITFReader.__init__(self, nitf_details, reader_type="SIDD", max_decode_workers=max_decode_workers,
+            decode_cache=decode_cache)
         self._check_sizes()
 
     @property
@@ -892,7 +899,8 @@ class SIDDWriter(NITFWriter):
                                 Sequence[SIDDType2], Sequence[SIDDType1]]] = None,
             sicd_meta: Optional[Union[SICDType, Sequence[SICDType]]] = None,
             sidd_writing_details: Optional[SIDDWritingDetails] = None,
-            check_existence: bool = True):
+            check_existence: bool = True,
+            max_workers: int = 1):
         """
 
         Parameters
@@ -903,6 +911,8 @@ class SIDDWriter(NITFWriter):
         sidd_writing_details : None|SIDDWritingDetails
         check_existence : bool
             Should we check if the given file already exists?
+        max_workers : int
+            The number of threads used to write image data.
         """
 
         if sidd_meta is None and sidd_writing_details is None:
@@ -910,7 +920,8 @@ class SIDDWriter(NITFWriter):
         if sidd_writing_details is None:
             sidd_writing_details = SIDDWritingDetails(sidd_meta, sicd_meta=sicd_meta)
         NITFWriter.__init__(
-            self, file_object, sidd_writing_details, check_existence=check_existence)
+            self, file_object, sidd_writing_details, check_existence=check_existence,
+            max_workers=max_workers)
 
     @property
     def nitf_writing_details(self) -> SIDDWritingDetails:
@@ -0,0 +1,108 @@
+"""
+Benchmark the per-file cost of the lightweight NITF header index, compared with
+fully parsing the NITF header and image and data extension subheaders.
+
+To benchmark all NITF files in a directory from the command-line
+
+>>> python -m sarpy.utils.benchmark_nitf_index <path to nitf file or directory>
+
+For a basic help on the command-line, check
+
+>>> python -m sarpy.utils.benchmark_nitf_index --help
+
+This module introduced in version 1.3.72.
+"""
+
+__classification__ = "UNCLASSIFIED"
+__author__ = "Thomas McCullough"
+
+import argparse
+import os
+import time
+from typing import List, Union
+
+from sarpy.io.general.nitf import NITFDetails, NITFHeaderIndex
+from sarpy.io.general.utils import is_nitf
+
+
+def _get_nitf_files(input_path: str) -> List[str]:
+    if os.path.isfile(input_path):
+        return [input_path, ]
+    out = []
+    for fil in sorted(os.listdir(input_path)):
+        path = os.path.join(input_path, fil)
+        if os.path.isfile(path) and is_nitf(path):
+            out.append(path)
+    return out
+
+
+def _index_file(file_name: str) -> None:
+    NITFHeaderIndex(file_name)
+
+
+def _parse_file(file_name: str) -> None:
+    details = NITFDetails(file_name)
+    try:
+        _ = details.img_headers
+        if details.des_subheader_offsets is not None:
+            for index in range(details.des_subheader_offsets.size):
+                details.parse_des_subheader(index)
+    finally:
+        details.file_object.close()
+
+
+def benchmark(input_path: Union[str, List[str]], repeat: int = 10) -> dict:
+    """
+    Time the lightweight header index and full header parsing for the given
+    NITF files.
+
+    Parameters
+    ----------
+    input_path : str|List[str]
+        A NITF file, a directory containing NITF files, or a list of NITF files.
+    repeat : int
+        The number of times to process each file, to amortize timer resolution.
+
+    Returns
+    -------
+    dict
+        With keys `file_count`, `index_time` and `parse_time` (the mean seconds
+        per file), and `speedup`.
+    """
+
+    file_names = _get_nitf_files(input_path) if isinstance(input_path, str) else list(input_path)
+    if len(file_names) == 0:
+        raise ValueError('No NITF files found for {}'.format(input_path))
+    repeat = int(repeat)
+    if repeat < 1:
+        raise ValueError('repeat must be a positive integer')
+
+    results = {}
+    for name, function in [('index_time', _index_file), ('parse_time', _parse_file)]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for file_name in file_names:
+                function(file_name)
+        results[name] = (time.perf_counter() - start)/(repeat*len(file_names))
+    results['file_count'] = len(file_names)
+    results['speedup'] = results['parse_time']/results['index_time'] if results['index_time'] > 0 else float('inf')
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Benchmark the per-file cost of NITF header indexing.",
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument(
+        'input_path', metavar='input_path',
+        help='Path to a NITF file, or a directory containing NITF files.')
+    parser.add_argument(
+        '-r', '--repeat', default=10, type=int,
+        help='The number of times to process each file.')
+    args = parser.parse_args()
+
+    the_results = benchmark(args.input_path, repeat=args.repeat)
+    print('files:              {}'.format(the_results['file_count']))
+    print('header index:       {:.1f} microseconds per file'.format(1e6*the_results['index_time']))
+    print('full header parse:  {:.1f} microseconds per file'.format(1e6*the_results['parse_time']))
+    print('speedup:            {:.1f}'.format(the_results['speedup']))
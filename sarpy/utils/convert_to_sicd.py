@@ -18,7 +18,7 @@ from sarpy.io.complex.converter import conversion_utility
 
 
 def convert(input_file, output_dir, preserve_nitf_information=False,
-            dem_filename_pattern=None, dem_type=None, geoid_file=None):
+            dem_filename_pattern=None, dem_type=None, geoid_file=None, checkpoint=False):
     """
 
     Parameters
@@ -43,10 +43,14 @@ def convert(input_file, output_dir, preserve_nitf_information=False,
         reference surface is not specified, then EGM2008 is assumed.
     geoid_file : str | None
         Optional Geoid file which might be needed when dem_filename_pattern is specified.
+    checkpoint : bool
+        Record the progress of each output file in a checkpoint file, and resume
+        any interrupted conversion?
     """
 
     conversion_utility(input_file, output_dir, preserve_nitf_information=preserve_nitf_information,
-                       dem_filename_pattern=dem_filename_pattern, dem_type=dem_type, geoid_file=geoid_file)
+                       dem_filename_pattern=dem_filename_pattern, dem_type=dem_type, geoid_file=geoid_file,
+                       checkpoint=checkpoint)
 
 
 if __name__ == '__main__':
@@ -109,6 +113,10 @@ if __name__ == '__main__':
         help='Optional path to a geoid definition file.\n'
              'A geoid definition file is required when dem-path-pattern is specified\n'
              'and the DEM height values are relative to a geoid.\n')
+    parser.add_argument(
+        '-r', '--resume', action='store_true',
+        help='Record the progress of each output file in a checkpoint file,\n'
+             'and resume any interrupted conversion from its checkpoint file?')
     parser.add_argument(
         '-v', '--verbose', action='store_true', help='Verbose (level="INFO") logging?')
 
@@ -119,4 +127,5 @@ if __name__ == '__main__':
     logger.setLevel(level)
 
     convert(args.input_file, args.output_directory, preserve_nitf_information=args.preserve,
-            dem_filename_pattern=args.dem_filename_pattern, dem_type=args.dem_type, geoid_file=args.geoid_file)
+            dem_filename_pattern=args.dem_filename_pattern, dem_type=args.dem_type, geoid_file=args.geoid_file,
+            checkpoint=args.resume)
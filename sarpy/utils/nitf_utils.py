@@ -5,6 +5,11 @@ To dump NITF header information to a text file from the command-line
 
 >>> python -m sarpy.utils.nitf_utils <path to nitf file>
 
+To inventory all NITF files in a directory tree, writing one summary record
+per file (with per file timing) as json lines or csv, using a pool of processes
+
+>>> python -m sarpy.utils.nitf_utils <path to directory> -f jsonl -o inventory.jsonl
+
 For a basic help on the command-line, check
 
 >>> python -m sarpy.utils.nitf_utils --help
@@ -16,14 +21,19 @@ __author__ = "Austin Lan, L3/Harris"
 
 
 import argparse
+import csv
 import functools
+import json
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from xml.dom import minidom
 import os
-from typing import Union, BinaryIO, TextIO, List, Dict
+from typing import Union, BinaryIO, TextIO, List, Dict, Optional
 from io import StringIO
 
-from sarpy.io.general.nitf import NITFDetails
+from sarpy.io.general.nitf import NITFDetails, NITFHeaderIndex
 from sarpy.io.general.nitf_elements.base import NITFElement, TRE, TREList, UserHeaderType
 from sarpy.io.general.nitf_elements.des import DataExtensionHeader, DataExtensionHeader0, \
     DESUserHeader
@@ -444,6 +454,189 @@ def dump_nitf_file(file_name, dest, over_write=True):
             print_nitf(file_name, dest=the_file)
 
 
+############
+# bulk extraction methods
+
+# the csv columns, where image and data extension segment values are joined by ';'
+_csv_columns = (
+    'file_name', 'file_size', 'elapsed', 'error', 'nitf_version', 'file_length',
+    'image_count', 'graphics_count', 'symbol_count', 'label_count', 'text_count',
+    'des_count', 'res_count', 'IID1', 'IC', 'IMODE', 'NROWS', 'NCOLS', 'NBANDS',
+    'PVTYPE', 'NBPP', 'ICORDS', 'IGEOLO', 'DESID')
+_image_columns = ('IID1', 'IC', 'IMODE', 'NROWS', 'NCOLS', 'NBANDS', 'PVTYPE', 'NBPP', 'ICORDS', 'IGEOLO')
+
+
+def find_nitf_files(input_path: str, recursive: bool = True) -> List[str]:
+    """
+    Find the NITF files in the given directory (tree).
+
+    Parameters
+    ----------
+    input_path : str
+        A NITF file, or a directory.
+    recursive : bool
+        Search subdirectories?
+
+    Returns
+    -------
+    List[str]
+    """
+
+    if os.path.isfile(input_path):
+        return [input_path, ] if _filter_files(input_path) else []
+    out = []
+    for root, dirs, files in os.walk(input_path):
+        dirs.sort()
+        out.extend(filter(_filter_files, [os.path.join(root, fil) for fil in sorted(files)]))
+        if not recursive:
+            break
+    return out
+
+
+def _json_default(value):
+    if isinstance(value, bytes):
+        decoded = _decode_effort(value)
+        return decoded if isinstance(decoded, str) else repr(value)
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def extract_nitf_summary(file_name: str, full: bool = False) -> Dict:
+    """
+    Extract the summary record for a single NITF file. This is intended for use
+    in a separate process, so no exception is raised on failure.
+
+    Parameters
+    ----------
+    file_name : str
+    full : bool
+        If `True`, the complete header and subheader details (as in
+        :meth:`NITFDetails.get_headers_json`) are included under key `headers`.
+        Otherwise, the summary is extracted using the lightweight
+        :class:`NITFHeaderIndex`.
+
+    Returns
+    -------
+    dict
+        With keys `file_name`, `file_size`, `elapsed` (seconds), `error` (`None`
+        on success), and the summary contents.
+    """
+
+    start = time.perf_counter()
+    out = OrderedDict([('file_name', file_name), ('file_size', None), ('elapsed', None), ('error', None)])
+    # noinspection PyBroadException
+    try:
+        out['file_size'] = os.path.getsize(file_name)
+        index = NITFHeaderIndex(file_name)
+        out.update((key, value) for key, value in index.to_dict().items() if key != 'file_name')
+        if full:
+            details = NITFDetails(file_name)
+            try:
+                out['headers'] = details.get_headers_json()
+            finally:
+                details.file_object.close()
+    except Exception as e:
+        out['error'] = '{}: {}'.format(type(e).__name__, e)
+    out['elapsed'] = time.perf_counter() - start
+    return out
+
+
+def _flatten_summary(record: Dict) -> Dict:
+    out = OrderedDict((key, record.get(key, None)) for key in _csv_columns[:6])
+    counts = record.get('segment_counts', {})
+    for name, column in [
+            ('img', 'image_count'), ('graphics', 'graphics_count'), ('symbol', 'symbol_count'),
+            ('label', 'label_count'), ('text', 'text_count'), ('des', 'des_count'), ('res', 'res_count')]:
+        out[column] = counts.get(name, 0)
+    image_segments = record.get('image_segments', [])
+    for column in _image_columns:
+        out[column] = ';'.join('' if entry[column] is None else str(entry[column]) for entry in image_segments)
+    out['DESID'] = ';'.join(entry['DESID'] for entry in record.get('des_segments', []))
+    return out
+
+
+def extract_nitf_summaries(
+        input_path: Union[str, List[str]],
+        dest: Union[str, TextIO],
+        output_format: str = 'jsonl',
+        processes: Optional[int] = None,
+        full: bool = False,
+        recursive: bool = True) -> Dict:
+    """
+    Extract summary records for a collection of NITF files using a pool of
+    processes, writing one record per file (in sorted file order) as json lines
+    or csv.
+
+    Parameters
+    ----------
+    input_path : str|List[str]
+        A NITF file, a directory to search for NITF files, or a list of files.
+    dest : str|TextIO
+        The output file path, or text file-like object.
+    output_format : str
+        One of `'jsonl'` or `'csv'`.
+    processes : None|int
+        The number of worker processes. `None` uses the cpu count, and `1` will
+        process all files in the current process.
+    full : bool
+        Include the complete header details? This is only supported for
+        `output_format='jsonl'`.
+    recursive : bool
+        Search subdirectories, if `input_path` is a directory?
+
+    Returns
+    -------
+    dict
+        With keys `file_count`, `failure_count`, and `elapsed` (total seconds).
+    """
+
+    if output_format not in ['jsonl', 'csv']:
+        raise ValueError('output_format must be one of `jsonl` or `csv`, got `{}`'.format(output_format))
+    if full and output_format != 'jsonl':
+        raise ValueError('Full header extraction requires output_format `jsonl`')
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = int(processes)
+    if processes < 1:
+        raise ValueError('processes must be a positive integer')
+
+    start = time.perf_counter()
+    file_names = find_nitf_files(input_path, recursive=recursive) if isinstance(input_path, str) else list(input_path)
+    worker = functools.partial(extract_nitf_summary, full=full)
+
+    def write_records(records, the_file):
+        writer = None
+        if output_format == 'csv':
+            writer = csv.DictWriter(the_file, fieldnames=_csv_columns)
+            writer.writeheader()
+        count = 0
+        failures = 0
+        for record in records:
+            count += 1
+            if record['error'] is not None:
+                failures += 1
+            if writer is None:
+                the_file.write(json.dumps(record, default=_json_default) + '\n')
+            else:
+                writer.writerow(_flatten_summary(record))
+        return count, failures
+
+    def process(the_file):
+        if processes == 1 or len(file_names) < 2:
+            return write_records(map(worker, file_names), the_file)
+        with ProcessPoolExecutor(max_workers=min(processes, len(file_names))) as executor:
+            chunk_size = max(1, min(64, len(file_names)//(4*processes)))
+            return write_records(executor.map(worker, file_names, chunksize=chunk_size), the_file)
+
+    if isinstance(dest, str):
+        with open(dest, 'w', newline='' if output_format == 'csv' else None) as fi:
+            file_count, failure_count = process(fi)
+    else:
+        file_count, failure_count = process(dest)
+    return {'file_count': file_count, 'failure_count': failure_count, 'elapsed': time.perf_counter() - start}
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
         description='Utility to dump NITF 2.1 or 2.0 headers.',
@@ -462,10 +655,39 @@ if __name__ == '__main__':
              "       an output directory for the output following the default naming scheme.\n"
              "*    if `input_file` a file path, this is expected to be the path to a file \n"
              "       and output will be written there.\n"
-             "  In either case, existing output files will be overwritten.")
+             "  In either case, existing output files will be overwritten.\n"
+             "For the `jsonl` or `csv` formats, this is 'stdout' or the path for the\n"
+             "single output file, and 'default' is '<input path>.headers.<format>'.")
+    parser.add_argument(
+        '-f', '--format', default='text', choices=['text', 'jsonl', 'csv'],
+        help="The output format.\n"
+             "* 'text' dumps the full header details of each file.\n"
+             "* 'jsonl' or 'csv' writes a summary record for each NITF file in the\n"
+             "   directory tree, with per file timing, in a single output.")
+    parser.add_argument(
+        '-p', '--processes', default=None, type=int,
+        help='The number of worker processes for the `jsonl` or `csv` formats.\n'
+             'The default is the cpu count.')
+    parser.add_argument(
+        '--full', action='store_true',
+        help='Include the full header details for the `jsonl` format?')
     args = parser.parse_args()
 
-    if os.path.isdir(args.input_file):
+    if args.format != 'text':
+        if args.output == 'stdout':
+            the_dest = sys.stdout
+        elif args.output == 'default':
+            the_dest = os.path.normpath(args.input_file) + '.headers.{}'.format(args.format)
+        else:
+            the_dest = args.output
+        stats = extract_nitf_summaries(
+            args.input_file, the_dest, output_format=args.format,
+            processes=args.processes, full=args.full)
+        print(
+            'Processed {} files ({} failures) in {:0.2f} seconds'.format(
+                stats['file_count'], stats['failure_count'], stats['elapsed']),
+            file=sys.stderr)
+    elif os.path.isdir(args.input_file):
         entries = [os.path.join(args.input_file, part) for part in os.listdir(args.input_file)]
         for file_number, entry in enumerate(filter(_filter_files, entries)):
             if args.output == 'stdout':
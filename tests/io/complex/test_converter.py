@@ -0,0 +1,169 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy
+
+from sarpy.io.complex.converter import Converter, conversion_utility
+from sarpy.io.complex.sicd import SICDReader, SICDWriter
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.io.general.base import BaseWriter, SarpyIOError
+
+
+this_loc = os.path.abspath(__file__)
+
+
+def _get_example_sicd(rows, cols):
+    sicd = SICDType.from_xml_file(
+        os.path.join(os.path.split(os.path.split(os.path.split(this_loc)[0])[0])[0], 'data', 'example.sicd.xml'))
+    sicd.ImageData.NumRows = rows
+    sicd.ImageData.NumCols = cols
+    sicd.ImageData.FullImage.NumRows = rows
+    sicd.ImageData.FullImage.NumCols = cols
+    sicd.ImageData.FirstRow = 0
+    sicd.ImageData.FirstCol = 0
+    return sicd
+
+
+def _get_open_files():
+    """
+    Gets the paths of the files open by this process, or `None` if this cannot
+    be determined.
+    """
+
+    fd_directory = '/proc/self/fd'
+    if not os.path.isdir(fd_directory):
+        return None
+    out = set()
+    for entry in os.listdir(fd_directory):
+        try:
+            out.add(os.path.realpath(os.readlink(os.path.join(fd_directory, entry))))
+        except OSError:
+            continue
+    return out
+
+
+class TestConversionCheckpoint(unittest.TestCase):
+    def test_resume(self):
+        sicd = _get_example_sicd(1400, 200)
+        data = numpy.empty((1400, 200), dtype='complex64')
+        data.real = numpy.reshape(numpy.arange(1400*200) % 251, (1400, 200))
+        data.imag = -data.real
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            input_file = os.path.join(tmpdirname, 'input.nitf')
+            with SICDWriter(input_file, sicd) as writer:
+                writer(data, start_indices=(0, 0))
+            reader = SICDReader(input_file)
+            output_file = os.path.join(tmpdirname, 'output.nitf')
+            checkpoint_file = output_file + '.checkpoint'
+
+            read_count = [0]
+            fail_at = [2]
+            original_getitem = SICDReader.__getitem__
+
+            def failing_getitem(the_reader, item):
+                read_count[0] += 1
+                if read_count[0] == fail_at[0]:
+                    raise RuntimeError('Simulated failure')
+                return original_getitem(the_reader, item)
+
+            opened = []
+
+            def tracking_open(*args, **kwargs):
+                opened.append(open(*args, **kwargs))
+                return opened[-1]
+
+            with self.subTest(msg='interrupted conversion'):
+                # NB: the converter is retained, so its file handles must be closed on exit
+                converter = Converter(reader, tmpdirname, output_file='output.nitf', checkpoint=True)
+                with mock.patch.object(SICDReader, '__getitem__', failing_getitem):
+                    with self.assertRaises(RuntimeError):
+                        with converter:
+                            converter.write_data(max_block_size=2**20)
+                # the output file is closed, without waiting for garbage collection
+                open_files = _get_open_files()
+                if open_files is not None:
+                    self.assertNotIn(os.path.realpath(output_file), open_files)
+                with open(checkpoint_file, 'r') as fi:
+                    self.assertEqual(json.load(fi)['completed_rows'], [[0, 655]])
+
+            with self.subTest(msg='interrupted resumed conversion'):
+                read_count[0] = 0
+                with mock.patch.object(SICDReader, '__getitem__', failing_getitem), \
+                        mock.patch('sarpy.io.complex.converter.open', tracking_open, create=True):
+                    converter = Converter(reader, tmpdirname, output_file='output.nitf', checkpoint=True)
+                    with self.assertRaises(RuntimeError):
+                        with converter:
+                            converter.write_data(max_block_size=2**20)
+                # the output file opened for resuming is closed
+                self.assertTrue(len(opened) > 0)
+                self.assertTrue(all(entry.closed for entry in opened))
+                with open(checkpoint_file, 'r') as fi:
+                    self.assertEqual(json.load(fi)['completed_rows'], [[0, 1310]])
+
+            with self.subTest(msg='resumed conversion'):
+                read_count[0] = 0
+                fail_at[0] = None
+                del opened[:]
+                with mock.patch.object(SICDReader, '__getitem__', failing_getitem), \
+                        mock.patch('sarpy.io.complex.converter.open', tracking_open, create=True):
+                    conversion_utility(
+                        reader, tmpdirname, output_files='output.nitf',
+                        max_block_size=2**20, checkpoint=True)
+                self.assertTrue(len(opened) > 0)
+                self.assertTrue(all(entry.closed for entry in opened))
+                # only the remaining 90 rows are read, in one block
+                self.assertEqual(read_count[0], 1)
+                self.assertFalse(os.path.exists(checkpoint_file))
+                reader2 = SICDReader(output_file)
+                self.assertTrue(numpy.all(reader2[:, :] == data))
+                self.assertEqual(os.stat(output_file).st_size, reader2.nitf_details.nitf_header.FL)
+                reader2.close()
+            del converter
+
+            with self.subTest(msg='existing output without checkpoint'):
+                with self.assertRaises(SarpyIOError):
+                    conversion_utility(reader, tmpdirname, output_files='output.nitf', checkpoint=True)
+            reader.close()
+
+
+class TestConversionPipeline(unittest.TestCase):
+    def test_pipeline(self):
+        sicd = _get_example_sicd(1400, 200)
+        data = numpy.empty((1400, 200), dtype='complex64')
+        data.real = numpy.reshape(numpy.arange(1400*200) % 251, (1400, 200))
+        data.imag = -data.real
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            input_file = os.path.join(tmpdirname, 'input.nitf')
+            with SICDWriter(input_file, sicd) as writer:
+                writer(data, start_indices=(0, 0))
+            reader = SICDReader(input_file)
+
+            original_write_raw = BaseWriter.write_raw
+            for queue_depth in [0, 1, 2]:
+                with self.subTest(msg='queue_depth {}'.format(queue_depth)):
+                    output_file = 'output{}.nitf'.format(queue_depth)
+                    indices = []
+
+                    def tracking_write_raw(the_writer, data, start_indices=None, subscript=None, index=0):
+                        indices.append(index)
+                        return original_write_raw(
+                            the_writer, data, start_indices=start_indices, subscript=subscript, index=index)
+
+                    with mock.patch.object(BaseWriter, 'write_raw', tracking_write_raw):
+                        with Converter(reader, tmpdirname, output_file=output_file) as converter:
+                            converter.write_data(max_block_size=2**20, queue_depth=queue_depth)
+                            statistics = converter.get_statistics()
+                    # each block is written once, to the first data segment
+                    self.assertEqual(indices, [0, 0, 0])
+                    for stage in ['read', 'convert', 'write']:
+                        self.assertEqual(statistics[stage]['blocks'], 3)
+                        self.assertEqual(statistics[stage]['bytes'], data.nbytes)
+                    reader2 = SICDReader(os.path.join(tmpdirname, output_file))
+                    self.assertTrue(numpy.all(reader2[:, :] == data))
+                    reader2.close()
+            reader.close()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+@unittest.skipIf(h5py is None, 'h5py is not available')
+class TestICEYEDataSegment(unittest.TestCase):
+    def setUp(self):
+        self.opened = []
+
+    def _tracking_file(self, *args, **kwargs):
+        file_object = h5py.File(*args, **kwargs)
+        self.opened.append(file_object)
+        return file_object
+
+    def test_shared_file(self):
+        from sarpy.io.complex.iceye import get_iceye_data_segment
+
+        data = numpy.reshape(numpy.arange(2*20*30, dtype='float32'), (2, 20, 30))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'test.h5')
+            with h5py.File(file_name, 'w') as hf:
+                hf.create_dataset('s_i', data=data[0])
+                hf.create_dataset('s_q', data=data[1])
+
+            with mock.patch('sarpy.io.complex.iceye.h5py', SimpleNamespace(File=self._tracking_file)):
+                with self.subTest(msg='read and close'):
+                    data_segment = get_iceye_data_segment(file_name, None, None)
+                    self.assertEqual(len(self.opened), 1)
+                    test_data = data_segment.read(None)
+                    self.assertTrue(numpy.all(test_data.real == data[0]))
+                    self.assertTrue(numpy.all(test_data.imag == data[1]))
+                    data_segment.close()
+                    self.assertFalse(bool(self.opened[-1]))
+
+                with self.subTest(msg='close on failed construction'):
+                    with self.assertRaises(KeyError):
+                        get_iceye_data_segment(file_name, None, None, imaginary_grop='missing')
+                    self.assertEqual(len(self.opened), 2)
+                    self.assertFalse(bool(self.opened[-1]))
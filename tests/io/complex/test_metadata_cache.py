@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from xml.etree import ElementTree
+
+import numpy
+
+from sarpy.io.complex.metadata_cache import SICDMetadataCache, get_metadata_cache
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+
+
+tests_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sicd_xml = os.path.join(tests_path, 'data', 'example.sicd.xml')
+
+
+def _assert_xml_close(test_case, first, second):
+    """
+    Assert that the xml elements are the same, up to floating point precision.
+    """
+
+    test_case.assertEqual(first.tag, second.tag)
+    test_case.assertEqual(first.attrib, second.attrib)
+    first_text = (first.text or '').strip()
+    second_text = (second.text or '').strip()
+    try:
+        first_value, second_value = float(first_text), float(second_text)
+    except ValueError:
+        test_case.assertEqual(first_text, second_text, msg='text of {}'.format(first.tag))
+    else:
+        test_case.assertTrue(
+            numpy.isclose(first_value, second_value, rtol=1e-12, atol=1e-12),
+            msg='value of {}, {} != {}'.format(first.tag, first_text, second_text))
+    test_case.assertEqual(len(first), len(second), msg='children of {}'.format(first.tag))
+    for first_child, second_child in zip(first, second):
+        _assert_xml_close(test_case, first_child, second_child)
+
+
+class TestSICDMetadataCache(unittest.TestCase):
+    def setUp(self):
+        self.sicd = SICDType.from_xml_file(sicd_xml)
+        self.derive_count = 0
+
+    def _derive(self):
+        self.derive_count += 1
+        return ['data_file.tiff', ], [self.sicd, [self.sicd.copy(), None]]
+
+    def _check_collection(self, collection):
+        self.assertIsInstance(collection, tuple)
+        self.assertEqual(collection[0], ['data_file.tiff', ])
+        sicd, (other_sicd, empty) = collection[1]
+        self.assertIsInstance(sicd, SICDType)
+        self.assertIsNone(empty)
+        expected = ElementTree.fromstring(self.sicd.to_xml_string())
+        _assert_xml_close(self, ElementTree.fromstring(sicd.to_xml_string()), expected)
+        _assert_xml_close(self, ElementTree.fromstring(other_sicd.to_xml_string()), expected)
+
+    def _check_cache(self, cache, source_files):
+        derived = cache.get_collection('TestReader', source_files, self._derive)
+        self._check_collection(derived)
+        self.assertEqual(self.derive_count, 1)
+        self.assertTrue(os.path.isfile(cache.get_path('TestReader', source_files)))
+
+        with self.subTest(msg='cached collection'):
+            cached = cache.get_collection('TestReader', source_files, self._derive)
+            self._check_collection(cached)
+            self.assertEqual(self.derive_count, 1)
+            # a cache miss and a cache hit yield identical metadata
+            self.assertEqual(cached[1][0].to_xml_string(), derived[1][0].to_xml_string())
+            self.assertEqual(cached[1][1][0].to_xml_string(), derived[1][1][0].to_xml_string())
+
+        with self.subTest(msg='different reader type'):
+            self.assertIsNone(cache.fetch('OtherReader', source_files))
+
+        with self.subTest(msg='modified source file'):
+            with open(source_files[-1], 'a') as fi:
+                fi.write('<!-- modified -->')
+            self.assertIsNone(cache.fetch('TestReader', source_files))
+            self._check_collection(cache.get_collection('TestReader', source_files, self._derive))
+            self.assertEqual(self.derive_count, 2)
+
+        with self.subTest(msg='corrupted entry'):
+            with open(cache.get_path('TestReader', source_files), 'w') as fi:
+                fi.write('{')
+            with self.assertLogs('sarpy.io.complex.metadata_cache', level='WARNING'):
+                self.assertIsNone(cache.fetch('TestReader', source_files))
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            source_files = [os.path.join(tmpdirname, 'product.xml'), os.path.join(tmpdirname, 'noise.xml')]
+            for file_name in source_files:
+                with open(file_name, 'w') as fi:
+                    fi.write('<xml/>')
+            cache_dir = os.path.join(tmpdirname, 'cache')
+            cache = get_metadata_cache(cache_dir)
+            self.assertIsInstance(cache, SICDMetadataCache)
+            self.assertEqual(cache.directory, cache_dir)
+            self.assertEqual(os.path.dirname(cache.get_path('TestReader', source_files)), cache_dir)
+            self._check_cache(cache, source_files)
+
+    def test_sidecar(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            source_files = [os.path.join(tmpdirname, 'manifest.safe'), ]
+            with open(source_files[0], 'w') as fi:
+                fi.write('<xml/>')
+            cache = SICDMetadataCache()
+            self.assertIsNone(cache.directory)
+            self.assertEqual(
+                cache.get_path('TestReader', source_files),
+                os.path.realpath(source_files[0]) + '.TestReader' + SICDMetadataCache.suffix)
+            self._check_cache(cache, source_files)
+
+    def test_get_metadata_cache(self):
+        self.assertIsNone(get_metadata_cache(None))
+        cache = SICDMetadataCache()
+        self.assertIs(get_metadata_cache(cache), cache)
+        with self.assertRaises(TypeError):
+            get_metadata_cache(1)
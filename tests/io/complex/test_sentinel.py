@@ -0,0 +1,168 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy
+
+from sarpy.io.complex.sicd import SICDReader
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.io.complex.sentinel import SentinelDetails, SentinelReader, _get_burst_definitions, \
+    _convert_burst, convert_bursts_to_sicd
+from sarpy.io.general.tiff import TiledTiffDataSegment
+
+from tests.io.complex.test_reader import complex_file_types
+from tests.io.general.test_tiff import _write_tiff
+
+
+tests_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sicd_xml = os.path.join(tests_path, 'data', 'example.sicd.xml')
+
+
+def _get_sicd(core_name, num_cols):
+    sicd = SICDType.from_xml_file(sicd_xml)
+    sicd.CollectionInfo.CoreName = core_name
+    sicd.ImageData.NumCols = num_cols
+    # NB: constructed through the setters, like the sicds derived from the
+    #   product metadata, rather than as parsed from xml
+    return sicd.copy()
+
+
+def _fake_file_set_sicds(file_name, file_set):
+    """
+    Stand in for the module level process pool helper, with a sicd per burst.
+    """
+
+    return file_set['data'], [
+        _get_sicd('{}_{}'.format(file_set['data'], burst), 100 + burst) for burst in range(file_set['bursts'])]
+
+
+def _fake_file_set_sicds_method(self, file_set):
+    return _fake_file_set_sicds(self.file_name, file_set)
+
+
+class TestBurstDefinitions(unittest.TestCase):
+    def test_get_burst_definitions(self):
+        stripmap = _get_sicd('stripmap', 50)
+        single = _get_sicd('single', 60)
+        bursts = [_get_sicd('burst_0', 10), _get_sicd('burst_1', 20), _get_sicd('burst_2', 30)]
+        definitions = _get_burst_definitions(
+            [('stripmap.tiff', stripmap), ('single.tiff', [single, ]), ('topsar.tiff', bursts)])
+        self.assertEqual(len(definitions), 5)
+        self.assertEqual(definitions[0], ('stripmap.tiff', stripmap, None))
+        self.assertEqual(definitions[1], ('single.tiff', single, None))
+        # the bursts are consecutive column ranges of the data file
+        self.assertEqual(
+            [(data_file, column_limits) for data_file, _, column_limits in definitions[2:]],
+            [('topsar.tiff', (0, 10)), ('topsar.tiff', (10, 30)), ('topsar.tiff', (30, 60))])
+        for (_, sicd, _), burst in zip(definitions[2:], bursts):
+            self.assertIs(sicd, burst)
+        self.assertEqual(_get_burst_definitions([]), [])
+
+
+class TestSentinelSICDCollection(unittest.TestCase):
+    def test_max_workers(self):
+        file_sets = [{'data': 's1-iw{}-slc.tiff'.format(swath), 'bursts': swath} for swath in range(1, 4)]
+        details = SentinelDetails.__new__(SentinelDetails)
+        details._file_name = 'manifest.safe'
+        with mock.patch.object(SentinelDetails, '_get_file_sets', return_value=file_sets), \
+                mock.patch.object(SentinelDetails, '_get_file_set_sicds', _fake_file_set_sicds_method), \
+                mock.patch('sarpy.io.complex.sentinel._get_file_set_sicds', _fake_file_set_sicds):
+            serial = details.get_sicd_collection(max_workers=1)
+            parallel = details.get_sicd_collection(max_workers=2)
+        self.assertEqual([entry[0] for entry in serial], [entry['data'] for entry in file_sets])
+        self.assertEqual(len(parallel), len(serial))
+        for (serial_file, serial_sicds), (parallel_file, parallel_sicds) in zip(serial, parallel):
+            self.assertEqual(parallel_file, serial_file)
+            self.assertEqual(
+                [sicd.to_xml_string() for sicd in parallel_sicds], [sicd.to_xml_string() for sicd in serial_sicds])
+
+        with self.assertRaises(ValueError):
+            details.get_sicd_collection(max_workers=0)
+
+    @unittest.skipIf(len(complex_file_types.get('Sentinel-1', [])) == 0, 'No Sentinel-1 files specified or found')
+    def test_max_workers_files(self):
+        for test_file in complex_file_types['Sentinel-1']:
+            details = SentinelDetails(test_file)
+            serial = _get_burst_definitions(details.get_sicd_collection(max_workers=1))
+            parallel = _get_burst_definitions(details.get_sicd_collection(max_workers=2))
+            with self.subTest(msg='max_workers for file {}'.format(test_file)):
+                self.assertEqual(len(parallel), len(serial))
+                for (serial_file, serial_sicd, serial_limits), (parallel_file, parallel_sicd, parallel_limits) in \
+                        zip(serial, parallel):
+                    self.assertEqual(parallel_file, serial_file)
+                    self.assertEqual(parallel_limits, serial_limits)
+                    self.assertEqual(parallel_sicd.to_xml_string(), serial_sicd.to_xml_string())
+
+
+class TestBurstConversion(unittest.TestCase):
+    def setUp(self):
+        # NB: the tiff lines are the sicd columns, for Sentinel-1 data
+        self.data = numpy.reshape(numpy.arange(40*52*2, dtype='int64') % 30011 - 15000, (40, 52, 2)).astype('<i2')
+        self.expected = (self.data[:, :, 0] + 1j*self.data[:, :, 1]).T
+        self.column_limits = [(0, 15), (15, 40)]
+        self.sicds = []
+        for index, (begin_col, end_col) in enumerate(self.column_limits):
+            sicd = _get_sicd('burst_{}'.format(index), end_col - begin_col)
+            sicd.ImageData.NumRows = 52
+            self.sicds.append(sicd)
+
+    def _write_data_file(self, file_name):
+        blocks = []
+        for row in range(0, 40, 16):
+            for col in range(0, 52, 16):
+                tile = numpy.zeros((16, 16, 2), dtype='<i2')
+                tile_data = self.data[row:row+16, col:col+16]
+                tile[:tile_data.shape[0], :tile_data.shape[1]] = tile_data
+                blocks.append(tile.tobytes())
+        tags = {
+            'ImageWidth': 52, 'ImageLength': 40, 'BitsPerSample': [16, 16], 'SamplesPerPixel': 2,
+            'SampleFormat': [2, 2], 'PlanarConfiguration': 1, 'Compression': 1,
+            'TileWidth': 16, 'TileLength': 16}
+        _write_tiff(file_name, tags, blocks)
+
+    def _check_output(self, output_file, index):
+        begin_col, end_col = self.column_limits[index]
+        reader = SICDReader(output_file)
+        try:
+            self.assertEqual(reader.sicd_meta.CollectionInfo.CoreName, 'burst_{}'.format(index))
+            self.assertTrue(numpy.all(reader[:, :] == self.expected[:, begin_col:end_col]))
+        finally:
+            reader.close()
+
+    def test_convert_burst(self):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            data_file = os.path.join(tmpdirname, 's1-iw1-slc.tiff')
+            self._write_data_file(data_file)
+            for index, (sicd, column_limits) in enumerate(zip(self.sicds, self.column_limits)):
+                output_file = _convert_burst(
+                    data_file, sicd, column_limits, tmpdirname, 'burst_{}.nitf'.format(index), True, 2**12)
+                self.assertEqual(output_file, os.path.join(tmpdirname, 'burst_{}.nitf'.format(index)))
+                self._check_output(output_file, index)
+
+    def test_convert_bursts_to_sicd(self):
+        details = SentinelDetails.__new__(SentinelDetails)
+        details._file_name = 'manifest.safe'
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            data_file = os.path.join(tmpdirname, 's1-iw1-slc.tiff')
+            self._write_data_file(data_file)
+            collection = [(data_file, self.sicds)]
+            with mock.patch.object(SentinelDetails, 'get_sicd_collection', return_value=collection):
+                with self.subTest(msg='reader'):
+                    reader = SentinelReader(details, max_decode_workers=2)
+                    self.assertIsInstance(reader._parent_segments[0], TiledTiffDataSegment)
+                    for index, (begin_col, end_col) in enumerate(self.column_limits):
+                        self.assertTrue(numpy.all(reader[:, :, index] == self.expected[:, begin_col:end_col]))
+                    reader.close()
+
+                for max_workers in [1, 2]:
+                    with self.subTest(msg='max_workers {}'.format(max_workers)):
+                        output_directory = os.path.join(tmpdirname, 'output{}'.format(max_workers))
+                        os.mkdir(output_directory)
+                        output_files = convert_bursts_to_sicd(
+                            details, output_directory, max_workers=max_workers, max_block_size=2**12)
+                        self.assertEqual(len(output_files), 2)
+                        self.assertEqual(len(set(output_files)), 2)
+                        for index, output_file in enumerate(output_files):
+                            self.assertEqual(os.path.dirname(output_file), output_directory)
+                            self._check_output(output_file, index)
@@ -1,10 +1,14 @@
+import io
 import os
 import json
 import tempfile
 import unittest
 
+import numpy
+
 from sarpy.io.complex.converter import conversion_utility
-from sarpy.io.complex.sicd import SICDReader
+from sarpy.io.complex.sicd import SICDReader, SICDWriter, SICDWritingDetails, AmpLookupFunction
+from sarpy.io.complex.sicd_elements.SICD import SICDType
 from sarpy.io.complex.sicd_schema import get_schema_path, get_default_version_string
 
 
@@ -36,6 +40,56 @@ the_version = get_default_version_string()
 the_schema = get_schema_path(the_version)
 
 
+class _NonSeekableOutput(io.BytesIO):
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation('seek')
+
+    def tell(self):
+        raise io.UnsupportedOperation('tell')
+
+
+class TestAmpLookupFunction(unittest.TestCase):
+    def test_forward_and_inverse(self):
+        amp_table = numpy.cumsum(numpy.linspace(0.5, 1.5, 256))
+        amp_index = numpy.reshape(numpy.arange(48, dtype='uint8')*5, (6, 8))
+        phase = numpy.reshape(numpy.arange(48, dtype='uint8')*3 + 7, (6, 8))
+        raw_data = numpy.stack([amp_index, phase], axis=2)
+        raw_subscript = (slice(0, 6, 1), slice(0, 8, 1), slice(0, 2, 1))
+
+        magnitude = amp_table[amp_index]
+        theta = phase.astype('float64')*(2*numpy.pi/256)
+        expected = magnitude*numpy.cos(theta) + 1j*magnitude*numpy.sin(theta)
+
+        for reverse_axes in [None, (1, )]:
+            with self.subTest(msg='reverse axes {}'.format(reverse_axes)):
+                func = AmpLookupFunction(
+                    'uint8', amp_table, raw_shape=(6, 8, 2), formatted_shape=(6, 8),
+                    reverse_axes=reverse_axes, band_dimension=2)
+                test_expected = expected if reverse_axes is None else expected[:, ::-1]
+                out_data = func(raw_data, raw_subscript)
+                self.assertEqual(out_data.dtype.name, 'complex64')
+                self.assertTrue(numpy.allclose(out_data, test_expected, atol=1e-4))
+
+                # the same data, with the band dimension not contiguous in memory
+                band_first = numpy.transpose(numpy.ascontiguousarray(numpy.transpose(raw_data, (2, 0, 1))), (1, 2, 0))
+                func.chunk_size = 10
+                out_data = func(band_first, raw_subscript)
+                self.assertTrue(numpy.allclose(out_data, test_expected, atol=1e-4))
+
+                inv_data = func.inverse(out_data, raw_subscript[:2])
+                self.assertTrue(numpy.all(inv_data == raw_data))
+
+        with self.subTest(msg='nearest amplitude'):
+            func = AmpLookupFunction(
+                'uint8', amp_table, raw_shape=(1, 4, 2), formatted_shape=(1, 4), band_dimension=2)
+            values = numpy.array([[0, amp_table[3] + 0.1, amp_table[10] - 0.1, 2*amp_table[-1]]], dtype='complex64')
+            inv_data = func.inverse(values, (slice(0, 1, 1), slice(0, 4, 1)))
+            self.assertTrue(numpy.all(inv_data[0, :, 0] == [0, 3, 10, 255]))
+
+
 class TestSICDWriting(unittest.TestCase):
 
     @unittest.skipIf(len(sicd_files) == 0, 'No sicd files found')
@@ -63,3 +117,84 @@ class TestSICDWriting(unittest.TestCase):
             with self.subTest(msg='Test writing a single row of the sicd file {}'.format(fil)):
                 with tempfile.TemporaryDirectory() as tmpdirname:
                     conversion_utility(reader, tmpdirname, row_limits=(0, 1))
+
+
+def _get_example_sicd(rows, cols):
+    sicd = SICDType.from_xml_file(
+        os.path.join(os.path.split(os.path.split(os.path.split(this_loc)[0])[0])[0], 'data', 'example.sicd.xml'))
+    sicd.ImageData.NumRows = rows
+    sicd.ImageData.NumCols = cols
+    sicd.ImageData.FullImage.NumRows = rows
+    sicd.ImageData.FullImage.NumCols = cols
+    sicd.ImageData.FirstRow = 0
+    sicd.ImageData.FirstCol = 0
+    return sicd
+
+
+class TestStreamingSICDWriter(unittest.TestCase):
+    def test_streaming(self):
+        sicd = _get_example_sicd(60, 40)
+        data = numpy.empty((60, 40), dtype='complex64')
+        data.real = numpy.reshape(numpy.arange(60*40), (60, 40))
+        data.imag = -data.real
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'standard.nitf')
+            with SICDWriter(file_name, sicd, check_existence=False) as writer:
+                writer(data, start_indices=(0, 0))
+            with open(file_name, 'rb') as fi:
+                expected_bytes = fi.read()
+
+            with self.subTest(msg='non-seekable output'):
+                sink = _NonSeekableOutput()
+                with SICDWriter(sink, sicd, streaming=True) as writer:
+                    writer(data[20:40], start_indices=(20, 0))
+                    writer(data[:20], start_indices=(0, 0))
+                    writer(data[40:], start_indices=(40, 0))
+                self.assertEqual(sink.getvalue(), expected_bytes)
+
+                stream_name = os.path.join(tmpdirname, 'stream.nitf')
+                with open(stream_name, 'wb') as fi:
+                    fi.write(sink.getvalue())
+                reader = SICDReader(stream_name)
+                self.assertTrue(numpy.all(reader[:, :] == data))
+                reader.close()
+
+            with self.subTest(msg='partial columns'):
+                sink = _NonSeekableOutput()
+                writer = SICDWriter(sink, sicd, streaming=True)
+                with self.assertRaises(ValueError):
+                    writer(data[:10, :20], start_indices=(0, 0))
+                writer.close()
+
+            with self.subTest(msg='buffer limit'):
+                sink = _NonSeekableOutput()
+                writer = SICDWriter(sink, sicd, streaming=True, max_buffer_bytes=1000)
+                with self.assertRaises(ValueError):
+                    writer(data[20:40], start_indices=(20, 0))
+                writer.close()
+
+
+class TestConcurrentSICDWriter(unittest.TestCase):
+    def test_out_of_order(self):
+        sicd = _get_example_sicd(500, 60)
+        data = numpy.empty((500, 60), dtype='complex64')
+        data.real = numpy.reshape(numpy.arange(500*60), (500, 60))
+        data.imag = -data.real
+        # row stripes which straddle the image segment boundaries, in a scrambled order
+        stripes = [(start, min(start + 37, 500)) for start in range(0, 500, 37)]
+        order = numpy.random.RandomState(3).permutation(len(stripes))
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'concurrent.nitf')
+            writing_details = SICDWritingDetails(sicd, row_limit=90)
+            with SICDWriter(file_name, sicd_writing_details=writing_details, max_workers=3) as writer:
+                for index in order:
+                    start, stop = stripes[index]
+                    writer(data[start:stop], start_indices=(start, 0))
+
+            reader = SICDReader(file_name)
+            self.assertEqual(len(reader.nitf_details.img_segment_offsets), 6)
+            self.assertTrue(numpy.all(reader[:, :] == data))
+            self.assertEqual(os.stat(file_name).st_size, reader.nitf_details.nitf_header.FL)
+            reader.close()
@@ -79,6 +79,92 @@ class TestBaseReader(unittest.TestCase):
         with self.assertRaises(ValueError, msg='read_raw access when closed'):
             _ = reader.read_raw()
 
+    def test_enable_cache(self):
+        data = numpy.reshape(numpy.arange(24, dtype='int16'), (3, 4, 2))
+        complex_data = numpy.empty((3, 4), dtype='complex64')
+        complex_data.real = data[:, :, 0]
+        complex_data.imag = data[:, :, 1]
+
+        data_segment = NumpyArraySegment(
+            data, formatted_dtype='complex64', formatted_shape=(3, 4),
+            format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+            mode='r')
+        reader = BaseReader(data_segment)
+        self.assertEqual(reader.get_cache_statistics(), (None, ))
+
+        reader.enable_cache(tile_shape=(2, 2))
+        with self.subTest(msg='cached read'):
+            test_data = reader[1:3, ::-1]
+            self.assertTrue(numpy.all(complex_data[1:3, ::-1] == test_data))
+            test_data = reader[:]
+            self.assertTrue(numpy.all(complex_data == test_data))
+            stats = reader.get_cache_statistics()[0]
+            self.assertEqual(stats['misses'], 4)
+            self.assertEqual(stats['hits'], 4)
+
+        with self.subTest(msg='cached raw read'):
+            test_data = reader[:, 'raw']
+            self.assertTrue(numpy.all(data == test_data))
+
+        with self.subTest(msg='repeated enable'):
+            the_segment = reader.data_segment
+            reader.enable_cache()
+            self.assertTrue(reader.data_segment is the_segment)
+
+        reader.close()
+        self.assertTrue(data_segment.closed)
+
+    def test_iterate_blocks(self):
+        data = numpy.reshape(numpy.arange(7*5*2, dtype='int16'), (7, 5, 2))
+        complex_data = numpy.empty((7, 5), dtype='complex64')
+        complex_data.real = data[:, :, 0]
+        complex_data.imag = data[:, :, 1]
+
+        data_segment = NumpyArraySegment(
+            data, formatted_dtype='complex64', formatted_shape=(7, 5),
+            format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+            mode='r')
+        reader = BaseReader(data_segment)
+
+        with self.subTest(msg='block bounds'):
+            self.assertEqual(
+                reader.get_block_bounds(block_shape=(3, 4)),
+                [(0, 3, 0, 4), (0, 3, 4, 5), (3, 6, 0, 4), (3, 6, 4, 5), (6, 7, 0, 4), (6, 7, 4, 5)])
+            self.assertEqual(
+                reader.get_block_bounds(block_shape=(3, 4), order='column', bounds=(1, 7, 2, 5)),
+                [(1, 4, 2, 5), (4, 7, 2, 5)])
+            self.assertEqual(
+                reader.get_block_bounds(block_shape=3, overlap=(1, 0), bounds=(0, 7, 0, 3)),
+                [(0, 4, 0, 3), (2, 7, 0, 3), (5, 7, 0, 3)])
+            self.assertEqual(
+                reader.get_block_bounds(memory_budget=2*5*8 + 1),
+                [(0, 2, 0, 5), (2, 4, 0, 5), (4, 6, 0, 5), (6, 7, 0, 5)])
+            self.assertEqual(
+                reader.get_block_bounds(memory_budget=3*4, raw=True, bounds=(0, 1, 0, 5)),
+                [(0, 1, 0, 3), (0, 1, 3, 5)])
+
+        with self.assertRaises(ValueError, msg='block_shape and memory_budget'):
+            reader.get_block_bounds(block_shape=2, memory_budget=100)
+
+        for prefetch in [0, 2]:
+            with self.subTest(msg='iterate blocks with prefetch {}'.format(prefetch)):
+                test_data = numpy.zeros((7, 5), dtype='complex64')
+                count = 0
+                for bounds, block in reader.iterate_blocks(block_shape=(2, 3), prefetch=prefetch):
+                    self.assertEqual(block.shape, (bounds[1] - bounds[0], bounds[3] - bounds[2]))
+                    test_data[bounds[0]:bounds[1], bounds[2]:bounds[3]] = block
+                    count += 1
+                self.assertEqual(count, 8)
+                self.assertTrue(numpy.all(complex_data == test_data))
+
+        with self.subTest(msg='iterate raw blocks'):
+            for bounds, block in reader.iterate_blocks(block_shape=4, raw=True, prefetch=1):
+                self.assertTrue(numpy.all(data[bounds[0]:bounds[1], bounds[2]:bounds[3]] == block))
+
+        with self.subTest(msg='early termination with prefetch'):
+            for bounds, block in reader.iterate_blocks(block_shape=1, prefetch=3):
+                break
+
     def test_read_with_symmetry(self):
         data = numpy.reshape(numpy.arange(24, dtype='int16'), (3, 4, 2))
 
@@ -1,12 +1,29 @@
+import os
+import tempfile
+import time
 import unittest
 
 import numpy
 
 from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.data_segment import NumpyArraySegment, SubsetSegment, \
-    BandAggregateSegment, BlockAggregateSegment, FileReadDataSegment
+    BandAggregateSegment, BlockAggregateSegment, FileReadDataSegment, CachedDataSegment, \
+    BlockDecodedDataSegment, JPEGBlockDataSegment, StreamingWriteSegment, PixelCoverage, \
+    HDF5DatasetSegment
+from sarpy.io.general.nitf import find_jpeg_delimiters
+from sarpy.io.general.slice_parsing import verify_subscript
 from io import BytesIO
 
+try:
+    from PIL import Image as PIL_Image
+except ImportError:
+    PIL_Image = None
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
 
 class TestNumpyArraySegment(unittest.TestCase):
     def test_basic_read(self):
@@ -175,6 +192,28 @@ class TestNumpyArraySegment(unittest.TestCase):
             data_segment.write(complex_data, start_indices=0)
             self.assertTrue(numpy.all(empty == data))
 
+        with self.subTest(msg='format_for_write'):
+            empty = numpy.zeros((3, 4, 2), dtype='int16')
+            data_segment = NumpyArraySegment(
+                empty, formatted_dtype='complex64', formatted_shape=(3, 4),
+                format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+                mode='w')
+
+            raw_data, raw_subscript = data_segment.format_for_write(complex_data[1:], start_indices=(1, 0))
+            self.assertTrue(numpy.all(raw_data == data[1:]))
+            self.assertEqual(raw_subscript, (slice(1, 3, 1), slice(0, 4, 1), slice(0, 2, 1)))
+            self.assertTrue(numpy.all(empty == 0))
+            data_segment.write_raw(raw_data, subscript=raw_subscript)
+            self.assertTrue(numpy.all(empty[1:] == data[1:]))
+            with self.assertRaises(ValueError, msg='itemsize mismatch'):
+                data_segment.format_for_write(data, start_indices=0)
+
+        with self.assertRaises(ValueError, msg='format_for_write in read mode'):
+            NumpyArraySegment(
+                data, formatted_dtype='complex64', formatted_shape=(3, 4),
+                format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+                mode='r').format_for_write(complex_data, start_indices=0)
+
         with self.assertRaises(ValueError, msg='read_raw attempt'):
             _ = data_segment.read_raw(0)
 
@@ -198,6 +237,113 @@ class TestNumpyArraySegment(unittest.TestCase):
             data_segment.write(complex_data)
 
 
+    def test_read_into_out(self):
+        data = numpy.reshape(numpy.arange(60, dtype='int16'), (5, 6, 2))
+        complex_data = numpy.empty((5, 6), dtype='complex64')
+        complex_data.real = data[:, :, 0]
+        complex_data.imag = data[:, :, 1]
+
+        data_segment = NumpyArraySegment(
+            data, formatted_dtype='complex64', formatted_shape=(5, 6),
+            format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+            mode='r')
+
+        with self.subTest(msg='read_raw into out'):
+            out = numpy.zeros((2, 2, 2), dtype='int16')
+            test_data = data_segment.read_raw((slice(0, 2, 1), slice(1, 3, 1)), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(data[:2, 1:3] == out))
+
+        with self.subTest(msg='read into out'):
+            out = numpy.zeros((2, 2), dtype='complex64')
+            test_data = data_segment.read((slice(0, 2, 1), slice(1, 3, 1)), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(complex_data[:2, 1:3] == out))
+
+        with self.subTest(msg='read into squeezed out'):
+            out = numpy.zeros((6, ), dtype='complex64')
+            data_segment.read((2, slice(None)), out=out)
+            self.assertTrue(numpy.all(complex_data[2, :] == out))
+
+        with self.assertRaises(ValueError, msg='out of incorrect shape'):
+            data_segment.read((slice(0, 2, 1), slice(1, 3, 1)), out=numpy.zeros((2, 3), dtype='complex64'))
+
+        with self.assertRaises(ValueError, msg='out of incorrect dtype'):
+            data_segment.read((slice(0, 2, 1), slice(1, 3, 1)), out=numpy.zeros((2, 2), dtype='complex128'))
+
+
+class TestPixelCoverage(unittest.TestCase):
+    def test_coverage(self):
+        coverage = PixelCoverage((9, 10, 2))
+        full = slice(0, 2, 1)
+
+        with self.subTest(msg='block writes'):
+            for row in range(0, 9, 4):
+                for col in range(0, 10, 5):
+                    if (row, col) != (4, 5):
+                        self.assertEqual(coverage.add((slice(row, min(row+4, 9), 1), slice(col, col+5, 1), full)), 0)
+            self.assertFalse(coverage.is_complete())
+            self.assertEqual(coverage.covered_count, 180 - 40)
+            self.assertEqual(coverage.get_missing_ranges(), [((4, 8), (5, 10), (0, 2))])
+
+        with self.subTest(msg='overlap detection'):
+            self.assertEqual(coverage.add((slice(7, 3, -1), slice(4, 6, 1), slice(0, 1, 1))), 4)
+            self.assertEqual(coverage.overlap_count, 4)
+            self.assertEqual(coverage.covered_count, 180 - 36)
+            self.assertEqual(
+                coverage.get_missing_ranges(max_count=2),
+                [((4, 8), (5, 6), (1, 2)), ((4, 8), (6, 10), (0, 2))])
+
+        with self.subTest(msg='strided writes'):
+            coverage.add((slice(4, 8, 2), slice(5, 10, 1), full))
+            coverage.add((slice(5, 8, 2), slice(5, 10, 1), full))
+            self.assertTrue(coverage.is_complete())
+            self.assertEqual(coverage.get_missing_ranges(), [])
+            # the complete coverage collapses to a single interval
+            self.assertEqual(coverage._root, [[0, 9, None]])
+
+        with self.subTest(msg='reset'):
+            coverage.reset()
+            self.assertEqual(coverage.covered_count, 0)
+            self.assertEqual(coverage.get_missing_ranges(), [((0, 9), (0, 10), (0, 2))])
+
+    def test_random_writes(self):
+        shape = (23, 17, 3)
+        coverage = PixelCoverage(shape)
+        written = numpy.zeros(shape, dtype='bool')
+        random_state = numpy.random.RandomState(7)
+        for _ in range(200):
+            subscript = []
+            for size in shape:
+                start = int(random_state.randint(0, size))
+                stop = int(random_state.randint(start + 1, size + 1))
+                step = int(random_state.randint(1, 4))
+                subscript.append(
+                    slice(stop - 1, start - 1 if start > 0 else None, -step) if random_state.rand() < 0.3
+                    else slice(start, stop, step))
+            subscript = tuple(subscript)
+            expected_overlap = int(numpy.count_nonzero(written[subscript]))
+            self.assertEqual(coverage.add(verify_subscript(subscript, shape)), expected_overlap)
+            written[subscript] = True
+            self.assertEqual(coverage.covered_count, int(numpy.count_nonzero(written)))
+        missing = numpy.ones(shape, dtype='bool')
+        for entry in coverage.get_missing_ranges():
+            missing[tuple(slice(start, stop) for start, stop in entry)] = False
+        self.assertTrue(numpy.all(missing == written))
+
+    def test_large_strided_writes(self):
+        # NB: strided writes must not be quadratic in the number of intervals
+        coverage = PixelCoverage((20000, 5000))
+        start_time = time.perf_counter()
+        coverage.add((slice(0, 20000, 2), slice(0, 5000, 2)))
+        coverage.add((slice(0, 20000, 1), slice(1, 5000, 2)))
+        coverage.add((slice(1, 20000, 2), slice(0, 5000, 2)))
+        self.assertLess(time.perf_counter() - start_time, 5)
+        self.assertTrue(coverage.is_complete())
+        self.assertEqual(coverage.overlap_count, 0)
+        self.assertEqual(coverage._root, [[0, 20000, None]])
+
+
 class TestSubsetSegment(unittest.TestCase):
     def test_read(self):
         data = numpy.reshape(numpy.arange(24, dtype='int16'), (6, 4))
@@ -214,6 +360,12 @@ class TestSubsetSegment(unittest.TestCase):
             test_data = data_segment[1:3]
             self.assertTrue(numpy.all(data[(slice(3, 5, 1), slice(2, 4, 1))] == test_data))
 
+        with self.subTest(msg='read into out'):
+            out = numpy.zeros((2, 2), dtype='int16')
+            test_data = data_segment.read(slice(1, 3, 1), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(data[(slice(3, 5, 1), slice(2, 4, 1))] == out))
+
         with self.subTest(msg='close functionality test'):
             self.assertFalse(data_segment.closed)
             data_segment.close()
@@ -235,8 +387,14 @@ class TestSubsetSegment(unittest.TestCase):
         test_data = numpy.reshape(numpy.arange(6, dtype='int16'), (3, 2))
 
         with self.subTest(msg='subset write'):
-            data_segment.write(test_data, start_indices=0)
+            data_segment.write(test_data[:2], start_indices=0)
+            self.assertFalse(data_segment.check_fully_written())
+            self.assertEqual(data_segment.get_unwritten_ranges(), [((2, 3), (0, 2))])
+            data_segment.write(test_data[2:], start_indices=2)
+            self.assertTrue(data_segment.check_fully_written())
             self.assertTrue(numpy.all(data[subset_def] == test_data))
+            # the parent tracks the portion outside the subset as unwritten
+            self.assertEqual(len(parent_segment.get_unwritten_ranges()), 3)
 
         with self.subTest(msg='close functionality test'):
             self.assertFalse(data_segment.closed)
@@ -273,6 +431,14 @@ class TestBandAggregateSegment(unittest.TestCase):
             self.assertTrue(numpy.all(test_data[..., 0] == data0[subset]))
             self.assertTrue(numpy.all(test_data[..., 1] == data1[subset]))
 
+        with self.subTest(msg='section reading into out'):
+            subset = (slice(1, 3, 1), slice(1, 3, 1))
+            out = numpy.zeros((2, 2, 2), dtype='uint8')
+            test_data = data_segment.read(subset, out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(out[..., 0] == data0[subset]))
+            self.assertTrue(numpy.all(out[..., 1] == data1[subset]))
+
         with self.subTest(msg='close functionality test'):
             self.assertFalse(data_segment.closed)
             data_segment.close()
@@ -326,6 +492,13 @@ class TestBlockAggregateSegment(unittest.TestCase):
             self.assertTrue(numpy.all(data0 == test_data[:, :2]))
             self.assertTrue(numpy.all(data1 == test_data[:, 2:]))
 
+        with self.subTest(msg='read into out'):
+            out = numpy.zeros((2, 3), dtype='int16')
+            test_data = data_segment.read((slice(1, 3, 1), slice(1, 4, 1)), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(data0[1:3, 1:] == out[:, :1]))
+            self.assertTrue(numpy.all(data1[1:3, :] == out[:, 1:]))
+
         with self.subTest(msg='close functionality test'):
             self.assertFalse(data_segment.closed)
             data_segment.close()
@@ -365,6 +538,204 @@ class TestBlockAggregateSegment(unittest.TestCase):
         with self.assertRaises(ValueError, msg='write_raw access when closed'):
             data_segment.write(test_data)
 
+    def test_parallel_write(self):
+        test_data = numpy.reshape(numpy.arange(9*10, dtype='float32'), (9, 10))
+        block_defs = [
+            (slice(row, min(row+4, 9), 1), slice(col, col+5, 1)) for row in range(0, 9, 4) for col in range(0, 10, 5)]
+        for max_workers, max_write_bytes in [(1, None), (3, None), (3, 20)]:
+            arrays = [numpy.zeros((block_def[0].stop - block_def[0].start, 5), dtype='float32') for block_def in block_defs]
+            children = [NumpyArraySegment(array, mode='w') for array in arrays]
+            data_segment = BlockAggregateSegment(
+                children, block_defs, 'raw', 0, (9, 10), 'float32', (9, 10),
+                max_workers=max_workers, max_write_bytes=max_write_bytes)
+            with self.subTest(msg='write, max_workers {}, max_write_bytes {}'.format(max_workers, max_write_bytes)):
+                data_segment.write(test_data[:5], start_indices=0)
+                self.assertFalse(data_segment.check_fully_written())
+                self.assertEqual(
+                    data_segment.get_unwritten_ranges(),
+                    [((5, 8), (0, 5)), ((5, 8), (5, 10)), ((8, 9), (0, 5)), ((8, 9), (5, 10))])
+                data_segment.write(test_data[5:], start_indices=(5, 0))
+                self.assertTrue(data_segment.check_fully_written())
+                for array, block_def in zip(arrays, block_defs):
+                    self.assertTrue(numpy.all(array == test_data[block_def]))
+            data_segment.close()
+
+        with self.subTest(msg='reversed block'):
+            arrays = [numpy.zeros((4, 5), dtype='float32') for _ in range(2)]
+            children = [NumpyArraySegment(array, mode='w') for array in arrays]
+            data_segment = BlockAggregateSegment(
+                children, [(slice(0, 4, 1), slice(0, 5, 1)), (slice(3, None, -1), slice(5, 10, 1))],
+                'raw', 0, (4, 10), 'float32', (4, 10))
+            data_segment.write(test_data[1:3], start_indices=(1, 0))
+            self.assertEqual(
+                data_segment.get_unwritten_ranges(),
+                [((0, 1), (0, 5)), ((3, 4), (0, 5)), ((3, 4), (5, 10)), ((0, 1), (5, 10))])
+            self.assertEqual(children[1].get_unwritten_ranges(), [((0, 1), (0, 5)), ((3, 4), (0, 5))])
+            data_segment.close()
+
+        with self.assertRaises(ValueError, msg='invalid max_write_bytes'):
+            BlockAggregateSegment(
+                [NumpyArraySegment(numpy.zeros((3, 2), dtype='int16'), mode='w')], [(slice(0, 3, 1), slice(0, 2, 1))],
+                'raw', 0, (3, 2), 'int16', (3, 2), max_write_bytes=0)
+
+    def test_strided_parallel_read(self):
+        data = numpy.reshape(numpy.arange(9*10, dtype='float32'), (9, 10))
+        # a 3 x 2 grid of blocks, with one block missing
+        block_defs = [
+            (slice(row, min(row+4, 9), 1), slice(col, col+5, 1)) for row in range(0, 9, 4) for col in range(0, 10, 5)]
+        block_defs.pop(3)
+        expected = numpy.copy(data)
+        expected[4:8, 5:] = -1
+
+        subscripts = [
+            None,
+            (slice(1, 9, 3), slice(0, 10, 2)),
+            (slice(None, None, -2), slice(9, 0, -3)),
+            (slice(7, 1, -1), 6)]
+        for max_workers, max_read_bytes in [(1, None), (3, None), (3, 20)]:
+            children = [NumpyArraySegment(data[block_def], mode='r') for block_def in block_defs]
+            data_segment = BlockAggregateSegment(
+                children, block_defs, 'raw', -1, (9, 10), 'float32', (9, 10),
+                max_workers=max_workers, max_read_bytes=max_read_bytes)
+            for subscript in subscripts:
+                with self.subTest(msg='read {}, max_workers {}, max_read_bytes {}'.format(
+                        subscript, max_workers, max_read_bytes)):
+                    norm_subscript = data_segment.verify_raw_subscript(subscript)
+                    test_data = data_segment.read(subscript, squeeze=False)
+                    self.assertTrue(numpy.all(expected[norm_subscript] == test_data))
+            data_segment.close()
+            self.assertTrue(all(child.closed for child in children))
+
+        with self.subTest(msg='overlapping blocks'):
+            children = [NumpyArraySegment(data[:5], mode='r'), NumpyArraySegment(-data[3:], mode='r')]
+            data_segment = BlockAggregateSegment(
+                children, [(slice(0, 5, 1), slice(0, 10, 1)), (slice(3, 9, 1), slice(0, 10, 1))],
+                'raw', 0, (9, 10), 'float32', (9, 10), max_workers=2, close_children=False)
+            test_data = data_segment[2:5]
+            self.assertTrue(numpy.all(test_data[0] == data[2]))
+            self.assertTrue(numpy.all(test_data[1:] == -data[3:5]))
+            data_segment.close()
+            self.assertFalse(children[0].closed)
+
+
+class TestCachedDataSegment(unittest.TestCase):
+    def test_read(self):
+        data = numpy.reshape(numpy.arange(11*7*2, dtype='int16'), (11, 7, 2))
+        complex_data = numpy.empty((11, 7), dtype='complex64')
+        complex_data.real = data[:, :, 0]
+        complex_data.imag = data[:, :, 1]
+
+        subscripts = [
+            None,
+            (slice(2, 9, 1), slice(1, 6, 1)),
+            (slice(None, None, -1), slice(1, 7, 2)),
+            (slice(10, 0, -3), 3),
+            (4, slice(6, None, -2))]
+
+        for basis in ['formatted', 'raw']:
+            parent = NumpyArraySegment(
+                data, formatted_dtype='complex64', formatted_shape=(11, 7),
+                format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+                mode='r')
+            tile_shape = (3, 2) if basis == 'formatted' else (3, 2, 2)
+            data_segment = CachedDataSegment(parent, tile_shape=tile_shape, coordinate_basis=basis)
+
+            for subscript in subscripts:
+                with self.subTest(msg='{} basis read {}'.format(basis, subscript)):
+                    norm_subscript = data_segment.verify_formatted_subscript(subscript)
+                    test_data = data_segment.read(subscript, squeeze=False)
+                    self.assertTrue(numpy.all(complex_data[norm_subscript] == test_data))
+                    test_data = data_segment.read_raw(subscript, squeeze=False)
+                    norm_subscript = data_segment.verify_raw_subscript(subscript)
+                    self.assertTrue(numpy.all(data[norm_subscript] == test_data))
+
+            with self.subTest(msg='{} basis read into out'.format(basis)):
+                out = numpy.zeros((2, 3), dtype='complex64')
+                test_data = data_segment.read((slice(1, 3, 1), slice(1, 4, 1)), out=out)
+                self.assertTrue(test_data is out)
+                self.assertTrue(numpy.all(complex_data[1:3, 1:4] == out))
+
+            with self.subTest(msg='{} basis cache statistics'.format(basis)):
+                self.assertEqual(data_segment.misses, 16)
+                self.assertTrue(data_segment.hits > 0)
+                expected_bytes = complex_data.nbytes if basis == 'formatted' else data.nbytes
+                self.assertEqual(data_segment.cached_bytes, expected_bytes)
+
+            with self.subTest(msg='{} basis close'.format(basis)):
+                data_segment.close()
+                self.assertTrue(data_segment.closed)
+                self.assertTrue(parent.closed)
+
+    def test_eviction(self):
+        data = numpy.reshape(numpy.arange(64, dtype='float32'), (8, 8))
+        data_segment = CachedDataSegment(
+            NumpyArraySegment(data, mode='r'), tile_shape=(4, 4), max_bytes=2*4*4*4)
+
+        _ = data_segment[:4, :]
+        self.assertEqual(data_segment.get_cache_statistics()['tiles'], 2)
+        _ = data_segment[4:, :4]
+        self.assertEqual(data_segment.get_cache_statistics()['tiles'], 2)
+        self.assertEqual(data_segment.misses, 3)
+
+        with self.subTest(msg='least recently used tile evicted'):
+            _ = data_segment[:4, 4:]
+            self.assertEqual(data_segment.hits, 1)
+            _ = data_segment[:4, :4]
+            self.assertEqual(data_segment.misses, 4)
+
+        with self.subTest(msg='reduce budget'):
+            data_segment.max_bytes = 4*4*4
+            self.assertEqual(data_segment.cached_bytes, 4*4*4)
+            data_segment.clear_cache()
+            self.assertEqual(data_segment.cached_bytes, 0)
+
+        with self.subTest(msg='oversize tile not cached'):
+            data_segment.max_bytes = 10
+            test_data = data_segment[:]
+            self.assertTrue(numpy.all(test_data == data))
+            self.assertEqual(data_segment.cached_bytes, 0)
+
+
+@unittest.skipIf(h5py is None, 'h5py is not available')
+class TestHDF5DatasetSegment(unittest.TestCase):
+    def test_read(self):
+        data = numpy.reshape(numpy.arange(50*60*2, dtype='int16'), (50, 60, 2))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'test.h5')
+            with h5py.File(file_name, 'w') as hf:
+                hf.create_dataset('chunked', data=data, chunks=(8, 16, 2), compression='gzip')
+                hf.create_dataset('contiguous', data=data)
+
+            file_object = h5py.File(file_name, 'r')
+            chunked = HDF5DatasetSegment(
+                file_object, 'chunked', close_file=False, chunk_cache_bytes=1048576, max_batch_bytes=2048)
+            contiguous = HDF5DatasetSegment(file_object, 'contiguous', close_file=True)
+            self.assertEqual(chunked.chunks, (8, 16, 2))
+            self.assertIsNone(contiguous.chunks)
+
+            subscripts = [
+                None,
+                (slice(3, 47, 3), slice(5, 55, 2)),
+                (slice(None, None, -5), slice(58, 1, -7), 1),
+                (slice(2, 40, 20), slice(1, 60, 30)),
+                (slice(10, 20, 1), slice(0, 60, 4), slice(0, 2, 1))]
+            for segment in [chunked, contiguous]:
+                for subscript in subscripts:
+                    with self.subTest(msg='read {} {}'.format(segment.data_set.name, subscript)):
+                        norm_subscript = segment.verify_raw_subscript(subscript)
+                        self.assertTrue(numpy.all(segment.read_raw(subscript) == numpy.squeeze(data[norm_subscript])))
+
+            with self.subTest(msg='read into out'):
+                out = numpy.zeros((15, 25, 2), dtype='int16')
+                self.assertIs(chunked.read_raw((slice(3, 47, 3), slice(5, 55, 2)), out=out), out)
+                self.assertTrue(numpy.all(out == data[3:47:3, 5:55:2]))
+
+            with self.subTest(msg='shared file close'):
+                chunked.close()
+                self.assertTrue(bool(file_object))
+                contiguous.close()
+                self.assertFalse(bool(file_object))
+
 
 class TestFileReadSegment(unittest.TestCase):
     def test_read(self):
@@ -431,6 +802,29 @@ class TestFileReadSegment(unittest.TestCase):
             test_data = data_segment[0:2, 1:3, 'raw']
             self.assertTrue(numpy.all(data[subscript] == test_data))
 
+        with self.subTest(msg='read_raw full rows into out'):
+            out = numpy.zeros((2, 4, 2), dtype='int16')
+            test_data = data_segment.read_raw(slice(1, 3, 1), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(data[1:3] == out))
+
+        with self.subTest(msg='read_raw subscript into out'):
+            out = numpy.zeros((2, 2, 2), dtype='int16')
+            test_data = data_segment.read_raw((slice(2, 0, -1), slice(1, 3, 1)), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(data[2:0:-1, 1:3] == out))
+
+        with self.subTest(msg='read_raw full rows into non-contiguous out'):
+            out = numpy.zeros((2, 4, 4), dtype='int16')
+            data_segment.read_raw(slice(1, 3, 1), out=out[:, :, ::2])
+            self.assertTrue(numpy.all(data[1:3] == out[:, :, ::2]))
+
+        with self.subTest(msg='read into out'):
+            out = numpy.zeros((3, 2), dtype='complex64')
+            test_data = data_segment.read((slice(None), slice(1, 3, 1)), out=out)
+            self.assertTrue(test_data is out)
+            self.assertTrue(numpy.all(complex_data[:, 1:3] == out))
+
         with self.assertRaises(ValueError, msg='write_raw attempt'):
             data_segment.write_raw(data, start_indices=0)
 
@@ -447,3 +841,301 @@ class TestFileReadSegment(unittest.TestCase):
 
         with self.assertRaises(ValueError, msg='read_raw access when closed'):
             _ = data_segment.read_raw(None)
+
+    def test_parallel_read(self):
+        data = numpy.reshape(numpy.arange(1200, dtype='int16'), (30, 20, 2))
+        raw_bytes = data.tobytes()
+
+        def get_segment(file_object, file_opener=None):
+            # NB: a stripe size of 240 bytes is three rows
+            return FileReadDataSegment(
+                file_object, 0, 'int16', (30, 20, 2), 'int16', (30, 20, 2),
+                max_workers=4, stripe_size=240, file_opener=file_opener)
+
+        subscripts = [
+            None,
+            (slice(3, 28, 1), slice(1, 19, 1)),
+            (slice(1, 29, 4), slice(2, 18, 3)),
+            (slice(27, 2, -2), )]
+
+        with self.subTest(msg='serialized file access'):
+            data_segment = get_segment(BytesIO(raw_bytes))
+            for subscript in subscripts:
+                test_data = data_segment.read_raw(subscript)
+                self.assertTrue(numpy.all(data[subscript] == test_data), msg='{}'.format(subscript))
+            data_segment.close()
+
+        with self.subTest(msg='independent file objects'):
+            data_segment = get_segment(BytesIO(raw_bytes), file_opener=lambda: BytesIO(raw_bytes))
+            for subscript in subscripts:
+                test_data = data_segment.read_raw(subscript)
+                self.assertTrue(numpy.all(data[subscript] == test_data), msg='{}'.format(subscript))
+            data_segment.close()
+
+        with self.subTest(msg='positional reads from real file'):
+            with tempfile.TemporaryDirectory() as temp_directory:
+                file_name = os.path.join(temp_directory, 'data.bin')
+                with open(file_name, 'wb') as fi:
+                    fi.write(b'\x00'*10 + raw_bytes)
+                with open(file_name, 'rb') as fi:
+                    data_segment = FileReadDataSegment(
+                        fi, 10, 'int16', (30, 20, 2), 'int16', (30, 20, 2),
+                        max_workers=4, stripe_size=240)
+                    for subscript in subscripts:
+                        test_data = data_segment.read_raw(subscript)
+                        self.assertTrue(numpy.all(data[subscript] == test_data), msg='{}'.format(subscript))
+                    data_segment.close()
+
+        with self.assertRaises(ValueError, msg='read beyond the end of the file'):
+            data_segment = get_segment(BytesIO(raw_bytes[:-100]))
+            _ = data_segment.read_raw(None)
+
+    def test_planned_read(self):
+        data = numpy.reshape(numpy.arange(4000, dtype='int16'), (40, 50, 2))
+        raw_bytes = data.tobytes()
+
+        class CountingBytesIO(BytesIO):
+            bytes_read = 0
+
+            def readinto(self, buffer):
+                count = BytesIO.readinto(self, buffer)
+                self.bytes_read += count
+                return count
+
+        subscripts = [
+            (slice(0, 40, 16), ),
+            (slice(3, 37, 5), slice(10, 14, 1)),
+            (slice(3, 37, 5), slice(48, 2, -7), slice(1, 2, 1)),
+            (slice(36, 1, -3), slice(2, 49, 3)),
+            (slice(5, 6, 1), slice(20, 30, 1))]
+
+        for coalesce_gap in [0, 200, 10000]:
+            for max_workers in [1, 3]:
+                file_object = CountingBytesIO(raw_bytes)
+                data_segment = FileReadDataSegment(
+                    file_object, 0, 'int16', (40, 50, 2), 'int16', (40, 50, 2),
+                    max_workers=max_workers, stripe_size=1000, coalesce_gap=coalesce_gap)
+                for subscript in subscripts:
+                    with self.subTest(msg='subscript {}, coalesce_gap {}, max_workers {}'.format(
+                            subscript, coalesce_gap, max_workers)):
+                        test_data = data_segment.read_raw(subscript)
+                        self.assertTrue(numpy.all(numpy.squeeze(data[subscript]) == test_data))
+                data_segment.close()
+
+        with self.subTest(msg='decimated read only fetches the requested rows'):
+            file_object = CountingBytesIO(raw_bytes)
+            data_segment = FileReadDataSegment(
+                file_object, 0, 'int16', (40, 50, 2), 'int16', (40, 50, 2), coalesce_gap=0)
+            ranges = data_segment.plan_row_ranges((slice(0, 40, 16), ))
+            self.assertEqual(ranges, [(0, 0, 1), (16*200, 1, 1), (32*200, 2, 1)])
+            _ = data_segment.read_raw((slice(0, 40, 16), ))
+            self.assertEqual(file_object.bytes_read, 3*200)
+
+        with self.subTest(msg='column window only fetches the requested columns'):
+            file_object.bytes_read = 0
+            ranges = data_segment.plan_row_ranges((slice(3, 5, 1), slice(10, 14, 1)))
+            self.assertEqual(ranges, [(3*200 + 40, 0, 1), (4*200 + 40, 1, 1)])
+            _ = data_segment.read_raw((slice(3, 5, 1), slice(10, 14, 1)))
+            self.assertEqual(file_object.bytes_read, 2*16)
+
+        with self.subTest(msg='nearby ranges are coalesced'):
+            data_segment.coalesce_gap = 200
+            ranges = data_segment.plan_row_ranges((slice(3, 5, 1), slice(10, 14, 1)))
+            self.assertEqual(ranges, [(3*200 + 40, 0, 2)])
+
+        with self.subTest(msg='one dimensional data'):
+            flat_data = numpy.arange(100, dtype='float32')
+            data_segment = FileReadDataSegment(
+                BytesIO(flat_data.tobytes()), 0, 'float32', (100, ), 'float32', (100, ), coalesce_gap=0)
+            self.assertTrue(numpy.all(flat_data[5:90:7] == data_segment.read_raw(slice(5, 90, 7))))
+            self.assertTrue(numpy.all(flat_data[90:5:-7] == data_segment.read_raw(slice(90, 5, -7))))
+
+
+class _RawBlockDataSegment(BlockDecodedDataSegment):
+    """
+    Blocks stored as raw bytes of the full block size, for testing.
+    """
+
+    __slots__ = ('_block_size', )
+
+    def __init__(self, block_size, *args, **kwargs):
+        self._block_size = block_size
+        BlockDecodedDataSegment.__init__(self, *args, **kwargs)
+
+    def _decode_block(self, block_index):
+        data = numpy.frombuffer(self._read_block_bytes(block_index), dtype=self.raw_dtype)
+        return self._trim_block(block_index, data.reshape((self._block_size, self._block_size, -1)))
+
+
+class TestBlockDecodedDataSegment(unittest.TestCase):
+    def test_read(self):
+        data = numpy.reshape(numpy.arange(30*44, dtype='uint16'), (30, 44))
+        block_size = 16
+        block_bounds = []
+        byte_ranges = []
+        the_bytes = BytesIO()
+        for row in range(0, data.shape[0], block_size):
+            for col in range(0, data.shape[1], block_size):
+                block = numpy.zeros((block_size, block_size), dtype='uint16')
+                row_end, col_end = min(row+block_size, data.shape[0]), min(col+block_size, data.shape[1])
+                block[:row_end-row, :col_end-col] = data[row:row_end, col:col_end]
+                start = the_bytes.tell()
+                the_bytes.write(block.tobytes())
+                block_bounds.append((row, row_end, col, col_end))
+                byte_ranges.append((start, the_bytes.tell()))
+
+        with self.subTest(msg='abstract decode'):
+            data_segment = BlockDecodedDataSegment(the_bytes, 'uint16', data.shape, block_bounds, byte_ranges)
+            with self.assertRaises(NotImplementedError):
+                data_segment.read_raw(None)
+
+        subscripts = [None, (slice(3, 29, 2), slice(40, 2, -3)), (slice(17, 30, 1), 20)]
+        for max_workers in [1, 3]:
+            data_segment = _RawBlockDataSegment(
+                block_size, the_bytes, 'uint16', data.shape, block_bounds, byte_ranges, max_workers=max_workers)
+            for subscript in subscripts:
+                with self.subTest(msg='read {} with max_workers {}'.format(subscript, max_workers)):
+                    norm_subscript = data_segment.verify_raw_subscript(subscript)
+                    self.assertTrue(numpy.all(data_segment.read_raw(subscript) == numpy.squeeze(data[norm_subscript])))
+            data_segment.close()
+
+
+@unittest.skipIf(PIL_Image is None, 'PIL is not available')
+class TestJPEGBlockDataSegment(unittest.TestCase):
+    @staticmethod
+    def _get_blocks(data, block_size, header):
+        block_bounds = []
+        byte_ranges = []
+        decoded = numpy.zeros_like(data)
+        the_bytes = BytesIO()
+        the_bytes.write(header)
+        for row in range(0, data.shape[0], block_size):
+            for col in range(0, data.shape[1], block_size):
+                # NB: blocks are padded to the full block size
+                block = numpy.zeros((block_size, block_size) + data.shape[2:], dtype='uint8')
+                row_end, col_end = min(row+block_size, data.shape[0]), min(col+block_size, data.shape[1])
+                block[:row_end-row, :col_end-col] = data[row:row_end, col:col_end]
+                jpeg_bytes = BytesIO()
+                PIL_Image.fromarray(block).save(jpeg_bytes, format='JPEG', quality=95)
+                start = the_bytes.tell()
+                the_bytes.write(jpeg_bytes.getvalue())
+                block_bounds.append((row, row_end, col, col_end))
+                byte_ranges.append((start, the_bytes.tell()))
+                decoded[row:row_end, col:col_end] = numpy.asarray(
+                    PIL_Image.open(BytesIO(jpeg_bytes.getvalue())))[:row_end-row, :col_end-col]
+        return the_bytes, block_bounds, byte_ranges, decoded
+
+    def test_read(self):
+        data = numpy.reshape(numpy.arange(40*52*3, dtype='int64') % 251, (40, 52, 3)).astype('uint8')
+        header = b'not jpeg'
+        the_bytes, block_bounds, byte_ranges, decoded = self._get_blocks(data, 16, header)
+
+        with self.subTest(msg='find_jpeg_delimiters'):
+            self.assertEqual(
+                find_jpeg_delimiters(the_bytes.getvalue(), start=len(header)), byte_ranges)
+
+        # mask out one block
+        byte_ranges[4] = None
+        expected = decoded.copy()
+        row_start, row_end, col_start, col_end = block_bounds[4]
+        expected[row_start:row_end, col_start:col_end] = 0
+
+        data_segment = JPEGBlockDataSegment(
+            the_bytes, 'uint8', data.shape, block_bounds, byte_ranges, max_cached_blocks=4)
+        subscripts = [
+            (slice(0, 10, 1), slice(0, 10, 1)),
+            None,
+            (slice(None, None, -3), slice(5, 50, 7), 1),
+            (slice(17, 31, 1), slice(20, 40, 1))]
+        for subscript in subscripts:
+            with self.subTest(msg='read {}'.format(subscript)):
+                norm_subscript = data_segment.verify_raw_subscript(subscript)
+                self.assertTrue(numpy.all(data_segment.read_raw(subscript) == numpy.squeeze(expected[norm_subscript])))
+
+        with self.subTest(msg='decode only intersecting blocks'):
+            data_segment.clear_cache()
+            stats = data_segment.get_cache_statistics()
+            _ = data_segment.read_raw((slice(0, 10, 1), slice(10, 20, 1)))
+            _ = data_segment.read_raw((slice(0, 10, 1), slice(10, 20, 1)))
+            new_stats = data_segment.get_cache_statistics()
+            self.assertEqual(new_stats['misses'] - stats['misses'], 2)
+            self.assertEqual(new_stats['hits'] - stats['hits'], 2)
+            self.assertEqual(new_stats['blocks'], 2)
+
+        with self.subTest(msg='concurrent decode into out'):
+            data_segment.clear_cache()
+            data_segment.max_workers = 3
+            misses = data_segment.get_cache_statistics()['misses']
+            out = numpy.empty(data.shape, dtype='uint8')
+            self.assertIs(data_segment.read_raw(None, out=out), out)
+            self.assertTrue(numpy.all(out == expected))
+            # every populated block is decoded exactly once
+            self.assertEqual(data_segment.get_cache_statistics()['misses'] - misses, len(block_bounds) - 1)
+
+        with self.subTest(msg='close functionality test'):
+            data_segment.close()
+            self.assertTrue(data_segment.closed)
+
+    def test_single_band_blocks(self):
+        data = numpy.reshape(numpy.arange(20*24*2, dtype='int64') % 253, (20, 24, 2)).astype('uint8')
+        the_bytes0, block_bounds, byte_ranges0, decoded0 = self._get_blocks(data[:, :, 0], 16, b'')
+        the_bytes1, _, byte_ranges1, decoded1 = self._get_blocks(data[:, :, 1], 16, b'')
+        offset = the_bytes0.tell()
+        the_bytes0.write(the_bytes1.getvalue())
+        byte_ranges = byte_ranges0 + [(start + offset, end + offset) for start, end in byte_ranges1]
+
+        data_segment = JPEGBlockDataSegment(
+            the_bytes0, 'uint8', data.shape, block_bounds*2, byte_ranges,
+            band_indices=[0, ]*len(block_bounds) + [1, ]*len(block_bounds))
+        test_data = data_segment.read_raw(None)
+        self.assertTrue(numpy.all(test_data[:, :, 0] == decoded0))
+        self.assertTrue(numpy.all(test_data[:, :, 1] == decoded1))
+        test_data = data_segment.read_raw((slice(3, 18, 2), slice(None), 1))
+        self.assertTrue(numpy.all(test_data == decoded1[3:18:2]))
+
+
+class TestStreamingWriteSegment(unittest.TestCase):
+    def test_write(self):
+        data = numpy.reshape(numpy.arange(10*4*2, dtype='int16'), (10, 4, 2))
+        complex_data = numpy.empty((10, 4), dtype='complex64')
+        complex_data.real = data[:, :, 0]
+        complex_data.imag = data[:, :, 1]
+
+        output = []
+        data_segment = StreamingWriteSegment(
+            lambda x: output.append(x.copy()), 'int16', (10, 4, 2),
+            formatted_dtype='complex64', formatted_shape=(10, 4),
+            format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+            max_pending_bytes=48)
+
+        with self.subTest(msg='out of order buffering'):
+            data_segment.write(complex_data[2:4], start_indices=(2, 0))
+            self.assertEqual(len(output), 0)
+            self.assertEqual(data_segment.pending_bytes, 32)
+            data_segment.write(complex_data[:2], start_indices=0)
+            self.assertEqual(data_segment.next_index, 4)
+            self.assertEqual(data_segment.pending_bytes, 0)
+            self.assertFalse(data_segment.check_fully_written(warn=False))
+
+        with self.subTest(msg='overlap checks'):
+            with self.assertRaises(ValueError, msg='previously written'):
+                data_segment.write(complex_data[3:5], start_indices=(3, 0))
+            data_segment.write(complex_data[6:8], start_indices=(6, 0))
+            with self.assertRaises(ValueError, msg='pending overlap'):
+                data_segment.write(complex_data[7:9], start_indices=(7, 0))
+            with self.assertRaises(ValueError, msg='partial columns'):
+                data_segment.write(complex_data[4:6, :2], start_indices=(4, 0))
+            with self.assertRaises(ValueError, msg='buffer limit'):
+                data_segment.write(complex_data[8:10], start_indices=(8, 0))
+
+        with self.subTest(msg='completion'):
+            data_segment.write(complex_data[4:6], start_indices=(4, 0))
+            data_segment.write(complex_data[8:10], start_indices=(8, 0))
+            self.assertTrue(data_segment.check_fully_written(warn=False))
+            self.assertTrue(numpy.all(numpy.concatenate(output, axis=0) == data))
+
+        with self.assertRaises(ValueError, msg='read attempt'):
+            data_segment.read_raw(None)
+
+        data_segment.close()
+        self.assertTrue(data_segment.closed)
@@ -0,0 +1,126 @@
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy
+
+from sarpy.io.general.decode_cache import DecodedSegmentCache
+
+
+class TestDecodedSegmentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_directory = os.path.join(self.directory, 'cache')
+        self.source = os.path.join(self.directory, 'source.bin')
+        with open(self.source, 'wb') as fi:
+            fi.write(b'\x00'*64)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_file(self):
+        cache = DecodedSegmentCache(self.cache_directory)
+        data = numpy.reshape(numpy.arange(12, dtype='uint16'), (3, 4))
+        calls = []
+
+        def populate(mem_map):
+            calls.append(1)
+            mem_map[:] = data
+
+        with self.subTest(msg='create'):
+            path = cache.get_file(self.source, 0, 'uint16', (3, 4), populate)
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(numpy.all(numpy.fromfile(path, dtype='uint16').reshape((3, 4)) == data))
+            self.assertEqual(cache.get_size(), data.nbytes)
+            self.assertEqual(
+                [fil for fil in os.listdir(self.cache_directory) if not fil.endswith(cache.suffix)], [])
+
+        with self.subTest(msg='reuse'):
+            self.assertEqual(path, cache.get_file(self.source, 0, 'uint16', (3, 4), populate))
+            self.assertEqual(len(calls), 1)
+
+        with self.subTest(msg='distinct index'):
+            other_path = cache.get_file(self.source, 1, 'uint16', (3, 4), populate)
+            self.assertNotEqual(path, other_path)
+            self.assertEqual(len(calls), 2)
+
+        with self.subTest(msg='source modification'):
+            stat = os.stat(self.source)
+            os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+            self.assertNotEqual(path, cache.get_file(self.source, 0, 'uint16', (3, 4), populate))
+            self.assertEqual(len(calls), 3)
+
+        with self.subTest(msg='failed populate'):
+            def bad_populate(mem_map):
+                raise ValueError('failed decoding')
+
+            with self.assertRaises(ValueError):
+                cache.get_file(self.source, 5, 'uint16', (3, 4), bad_populate)
+            self.assertEqual(len(os.listdir(self.cache_directory)), 3)
+
+        with self.subTest(msg='clear'):
+            cache.clear()
+            self.assertEqual(cache.get_size(), 0)
+
+    def test_evict(self):
+        cache = DecodedSegmentCache(self.cache_directory, max_bytes=250)
+
+        def populate(mem_map):
+            mem_map[:] = 1
+
+        paths = []
+        for index in range(3):
+            paths.append(cache.get_file(self.source, index, 'uint8', (10, 10), populate))
+            os.utime(paths[-1], (index, index))
+        # the oldest entries are removed, keeping the most recently created
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertTrue(os.path.exists(paths[2]))
+        self.assertTrue(cache.get_size() <= 250)
+
+        with self.assertRaises(ValueError):
+            cache.max_bytes = -1
+
+    def test_abandoned_files(self):
+        cache = DecodedSegmentCache(self.cache_directory, lock_timeout=60)
+
+        def populate(mem_map):
+            mem_map[:] = 1
+
+        path = os.path.join(
+            self.cache_directory, cache.get_key(self.source, 0, 'uint8', (10, 10)) + cache.suffix)
+        lock_path = path + cache.lock_suffix
+
+        with self.subTest(msg='live lock'):
+            with open(lock_path, 'w') as fi:
+                fi.write('{} {}'.format(socket.gethostname(), os.getpid()))
+            self.assertFalse(cache._is_stale_lock(lock_path))
+            with open(lock_path, 'w') as fi:
+                fi.write('other_host 1')
+            self.assertFalse(cache._is_stale_lock(lock_path))
+            os.utime(lock_path, (0, 0))
+            self.assertTrue(cache._is_stale_lock(lock_path))
+
+        with self.subTest(msg='lock of finished process'):
+            process = subprocess.Popen([sys.executable, '-c', 'pass'])
+            process.wait()
+            with open(lock_path, 'w') as fi:
+                fi.write('{} {}'.format(socket.gethostname(), process.pid))
+            self.assertTrue(cache._is_stale_lock(lock_path))
+            self.assertEqual(path, cache.get_file(self.source, 0, 'uint8', (10, 10), populate))
+            self.assertFalse(os.path.exists(lock_path))
+
+        with self.subTest(msg='partial entries'):
+            partial_path = os.path.join(self.cache_directory, 'abandoned' + cache.partial_suffix)
+            with open(partial_path, 'wb') as fi:
+                fi.write(b'\x00'*50)
+            self.assertEqual(cache.get_size(), 150)
+            cache.evict()
+            self.assertTrue(os.path.exists(partial_path))  # possibly still being written
+            os.utime(partial_path, (0, 0))
+            cache.evict()
+            self.assertFalse(os.path.exists(partial_path))
+            self.assertEqual(cache.get_size(), 100)
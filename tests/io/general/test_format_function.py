@@ -1,7 +1,8 @@
 import unittest
 
 import numpy
-from sarpy.io.general.format_function import IdentityFunction, ComplexFormatFunction
+from sarpy.io.general.format_function import IdentityFunction, ComplexFormatFunction, \
+    SingleLUTFormatFunction
 
 
 class TestIdentityFunction(unittest.TestCase):
@@ -171,3 +172,88 @@ class TestComplexFunction(unittest.TestCase):
 
                 inv_data = func.inverse(out_data, (slice(0, 2, 1), slice(0, 3, 1)))
                 self.assertTrue(numpy.all(base_data == inv_data), msg='PM {} inverse'.format(raw_type))
+
+    def test_out_and_chunking(self):
+        raw_data = numpy.reshape(numpy.arange(4*6*2, dtype='int16'), (4, 6, 2))
+        raw_subscript = (slice(0, 4, 1), slice(0, 6, 1), slice(0, 2, 1))
+
+        for order in ['IQ', 'QI']:
+            first = 0 if order == 'IQ' else 1
+            for reverse_axes, transpose_axes in [(None, None), ((0, ), None), ((1, ), (1, 0, 2)), (None, (2, 0, 1))]:
+                band_dimension = 0 if transpose_axes == (2, 0, 1) else 2
+                arranged = raw_data if reverse_axes is None else numpy.flip(raw_data, axis=reverse_axes)
+                if transpose_axes is not None:
+                    arranged = numpy.transpose(arranged, transpose_axes)
+                arranged = numpy.moveaxis(arranged, band_dimension, -1)
+                test_data = numpy.empty(arranged.shape[:2], dtype='complex64')
+                test_data.real = arranged[:, :, first]
+                test_data.imag = arranged[:, :, 1 - first]
+
+                for chunk_size in [None, 5]:
+                    with self.subTest(msg='{}, reverse {}, transpose {}, chunk {}'.format(
+                            order, reverse_axes, transpose_axes, chunk_size)):
+                        func = ComplexFormatFunction(
+                            'int16', order, raw_shape=(4, 6, 2), formatted_shape=test_data.shape,
+                            reverse_axes=reverse_axes, transpose_axes=transpose_axes,
+                            band_dimension=band_dimension, chunk_size=chunk_size)
+                        out_data = func(raw_data, raw_subscript)
+                        self.assertTrue(numpy.all(out_data == test_data))
+
+                        out = numpy.zeros(test_data.shape, dtype='complex64')
+                        result = func(raw_data, raw_subscript, out=out)
+                        self.assertTrue(result is out)
+                        self.assertTrue(numpy.all(out == test_data))
+
+                        # a non-contiguous output
+                        out = numpy.zeros((test_data.shape[0], 2*test_data.shape[1]), dtype='complex64')
+                        func(raw_data, raw_subscript, out=out[:, ::2])
+                        self.assertTrue(numpy.all(out[:, ::2] == test_data))
+                        self.assertTrue(numpy.all(out[:, 1::2] == 0))
+
+        with self.subTest(msg='MP chunked'):
+            mp_data = numpy.reshape(numpy.arange(5*3*2, dtype='uint8'), (5, 3, 2))
+            func = ComplexFormatFunction('uint8', 'MP', raw_shape=(5, 3, 2), formatted_shape=(5, 3), band_dimension=2)
+            test_data = func(mp_data, raw_subscript)
+            func.chunk_size = 4
+            out_data = func(mp_data, raw_subscript)
+            self.assertTrue(numpy.all(out_data == test_data))
+
+        with self.assertRaises(ValueError, msg='out dtype'):
+            func(mp_data, raw_subscript, out=numpy.zeros((5, 3), dtype='complex128'))
+
+        with self.assertRaises(ValueError, msg='out shape'):
+            func(mp_data, raw_subscript, out=numpy.zeros((3, 4), dtype='complex64'))
+
+        # a flattened output of matching size is reshaped as a view
+        out = numpy.zeros((15, ), dtype='complex64')
+        func(mp_data, raw_subscript, out=out)
+        self.assertTrue(numpy.all(numpy.reshape(out, (5, 3)) == test_data))
+
+        with self.assertRaises(ValueError, msg='out non-contiguous, of matching size'):
+            func(mp_data, raw_subscript, out=numpy.zeros((3, 10), dtype='complex64')[:, ::2])
+
+        with self.assertRaises(ValueError, msg='chunk size'):
+            func.chunk_size = 0
+
+
+class TestSingleLUTFunction(unittest.TestCase):
+    def test_lookup(self):
+        base_data = numpy.reshape(numpy.arange(12, dtype='uint8'), (3, 4))
+        subscript = (slice(0, 3, 1), slice(0, 4, 1))
+
+        lut = numpy.arange(256, dtype='uint8')[::-1]
+        func = SingleLUTFormatFunction(lut, raw_shape=(3, 4), formatted_shape=(4, 3), transpose_axes=(1, 0))
+        with self.subTest(msg='1-d lookup'):
+            self.assertTrue(numpy.all(func(base_data, subscript) == lut[base_data.T]))
+            out = numpy.zeros((4, 3), dtype='uint8')
+            self.assertTrue(func(base_data, subscript, out=out) is out)
+            self.assertTrue(numpy.all(out == lut[base_data.T]))
+
+        lut = numpy.reshape(numpy.arange(3*256, dtype='uint16') % 256, (256, 3)).astype('uint8')
+        func = SingleLUTFormatFunction(lut, raw_shape=(3, 4), formatted_shape=(3, 4, 3))
+        with self.subTest(msg='2-d lookup'):
+            formatted_subscript = subscript + (slice(0, 3, 1), )
+            self.assertTrue(numpy.all(func(base_data, formatted_subscript) == lut[base_data]))
+            out = numpy.zeros((3, 4, 3), dtype='uint8')
+            func(base_data, formatted_subscript, out=out)
+            self.assertTrue(numpy.all(out == lut[base_data]))
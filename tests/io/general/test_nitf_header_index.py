@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from sarpy.io.complex.sicd import SICDWriter
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.io.general.base import SarpyIOError
+from sarpy.io.general.nitf import NITFDetails, NITFHeaderIndex
+
+this_loc = os.path.abspath(__file__)
+sicd_file = os.path.join(os.path.split(os.path.split(os.path.split(this_loc)[0])[0])[0], 'data', 'example.sicd.xml')
+
+
+class TestNITFHeaderIndex(unittest.TestCase):
+    def test_index(self):
+        sicd = SICDType.from_xml_file(sicd_file)
+        sicd.ImageData.NumRows = 200
+        sicd.ImageData.NumCols = 100
+        sicd.ImageData.FullImage.NumRows = 200
+        sicd.ImageData.FullImage.NumCols = 100
+        sicd.ImageData.FirstRow = 0
+        sicd.ImageData.FirstCol = 0
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'example.nitf')
+            with SICDWriter(file_name, sicd, check_existence=False) as writer:
+                writer(numpy.zeros((200, 100), dtype='complex64'), start_indices=(0, 0))
+
+            index = NITFHeaderIndex(file_name)
+            details = NITFDetails(file_name)
+            try:
+                with self.subTest(msg='offsets'):
+                    self.assertEqual(index.header_length, details.nitf_header.HL)
+                    self.assertEqual(index.file_length, os.path.getsize(file_name))
+                    for name in ['img', 'des', 'text', 'res']:
+                        for attribute, value in zip(
+                                ['subheader_offsets', 'subheader_sizes', 'segment_offsets', 'segment_sizes'],
+                                index.get_segment_offsets(name)):
+                            expected = getattr(details, '{}_{}'.format(name, attribute))
+                            if expected is None:
+                                self.assertIsNone(value)
+                            else:
+                                self.assertTrue(numpy.all(expected == value))
+
+                with self.subTest(msg='image subheaders'):
+                    self.assertEqual(len(index.image_segments), len(details.img_headers))
+                    for entry, img_header in zip(index.image_segments, details.img_headers):
+                        for attribute in [
+                                'IID1', 'NROWS', 'NCOLS', 'PVTYPE', 'IREP', 'ICORDS', 'IGEOLO',
+                                'IC', 'IMODE', 'NBPR', 'NBPC', 'NPPBH', 'NPPBV', 'NBPP']:
+                            self.assertEqual(entry[attribute], getattr(img_header, attribute), msg=attribute)
+                        self.assertEqual(entry['NBANDS'], len(img_header.Bands))
+
+                with self.subTest(msg='data extension subheaders'):
+                    self.assertEqual(len(index.des_segments), 1)
+                    self.assertEqual(index.des_segments[0]['DESID'], 'XML_DATA_CONTENT')
+                    self.assertEqual(index.to_dict()['segment_counts'], {'img': 1, 'des': 1})
+            finally:
+                details.file_object.close()
+
+            with self.assertRaises(SarpyIOError):
+                NITFHeaderIndex(sicd_file)
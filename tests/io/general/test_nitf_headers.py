@@ -4,7 +4,9 @@ import logging
 import json
 import unittest
 
-from sarpy.io.general.nitf import NITFDetails
+import numpy
+
+from sarpy.io.general.nitf import NITFDetails, NITFHeaderIndex
 from sarpy.io.general.nitf_elements.image import ImageSegmentHeader
 from sarpy.io.general.nitf_elements.text import TextSegmentHeader
 from sarpy.io.general.nitf_elements.graphics import GraphicsSegmentHeader
@@ -116,9 +118,39 @@ def generic_nitf_header_test(instance, test_file):
                     des_bytes, des_sub.to_bytes(), msg='des subheader serializes and deserializes as expected')
 
 
+def generic_nitf_header_index_test(instance, test_file):
+    assert isinstance(instance, unittest.TestCase)
+
+    details = NITFDetails(test_file)
+    index = NITFHeaderIndex(test_file)
+
+    # do the lightweight index segment locations agree?
+    with instance.subTest(msg="header index offsets match"):
+        for name in ['img', 'graphics', 'symbol', 'label', 'text', 'des', 'res']:
+            index_offsets = index.get_segment_offsets(name)
+            for attribute, index_value in zip(
+                    ['subheader_offsets', 'subheader_sizes', 'segment_offsets', 'segment_sizes'], index_offsets):
+                value = getattr(details, '{}_{}'.format(name, attribute))
+                if value is None:
+                    instance.assertIsNone(index_value)
+                else:
+                    instance.assertTrue(numpy.all(value == index_value))
+
+    # do the lightweight index image subheader fields agree?
+    with instance.subTest(msg="header index image fields match"):
+        for entry, img_header in zip(index.image_segments, details.img_headers or []):
+            for attribute in ['NROWS', 'NCOLS', 'IC', 'IMODE', 'NBPP', 'NPPBH', 'NPPBV', 'IGEOLO']:
+                instance.assertEqual(entry[attribute], getattr(img_header, attribute))
+
+
 class TestNITFHeader(unittest.TestCase):
 
     @unittest.skipIf(no_files, 'No nitf files identified for testing')
     def test_nitf_header(self):
         for test_file in test_files:
             generic_nitf_header_test(self, test_file)
+
+    @unittest.skipIf(no_files, 'No nitf files identified for testing')
+    def test_nitf_header_index(self):
+        for test_file in test_files:
+            generic_nitf_header_index_test(self, test_file)
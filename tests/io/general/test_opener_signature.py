@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from sarpy.io.general.opener_signature import OpenerSignature, OpenerProbe
+
+
+class TestOpenerSignature(unittest.TestCase):
+    def test_magic(self):
+        signature = OpenerSignature(magic=(b'NITF', b'NSIF'))
+        self.assertTrue(signature.matches(OpenerProbe(BytesIO(b'NITF02.10'))))
+        self.assertTrue(signature.matches(OpenerProbe(BytesIO(b'NSIF01.00'))))
+        self.assertFalse(signature.matches(OpenerProbe(BytesIO(b'GSATIMG'))))
+        self.assertFalse(signature.matches(OpenerProbe(BytesIO(b''))))
+
+        with self.subTest(msg='file position preserved'):
+            file_object = BytesIO(b'NITF02.10')
+            file_object.seek(3)
+            self.assertTrue(signature.matches(OpenerProbe(file_object)))
+            self.assertEqual(file_object.tell(), 3)
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            with self.subTest(msg='directory never matches'):
+                self.assertFalse(signature.matches(OpenerProbe(tmpdirname)))
+
+    def test_names(self):
+        signature = OpenerSignature(file_names=('manifest.safe', ), manifest_names=('manifest.safe', ))
+        palsar_signature = OpenerSignature(manifest_names=('IMG-*', ))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            manifest = os.path.join(tmpdirname, 'manifest.safe')
+            other = os.path.join(tmpdirname, 'IMG-HH-test')
+            for file_name in [manifest, other]:
+                with open(file_name, 'wb') as fi:
+                    fi.write(b'<xml/>')
+
+            self.assertTrue(signature.matches(OpenerProbe(tmpdirname)))
+            self.assertTrue(signature.matches(OpenerProbe(manifest)))
+            self.assertFalse(signature.matches(OpenerProbe(other)))
+            self.assertFalse(signature.matches(OpenerProbe(BytesIO(b'<xml/>'))))
+
+            self.assertTrue(palsar_signature.matches(OpenerProbe(tmpdirname)))
+            self.assertTrue(palsar_signature.matches(OpenerProbe(manifest)))
+            os.remove(other)
+            self.assertFalse(palsar_signature.matches(OpenerProbe(manifest)))
+
+    def test_hdf5(self):
+        signature = OpenerSignature(hdf5_keys=('Mission ID', ))
+        self.assertFalse(signature.matches(OpenerProbe(BytesIO(b'NITF02.10'))))
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy
+
+from sarpy.io.general.format_function import ComplexFormatFunction
+from sarpy.io.general.data_segment import NumpyArraySegment
+from sarpy.io.general.base import BaseReader
+from sarpy.io.general.prefetch import ReadPrefetcher
+
+
+class TestReadPrefetcher(unittest.TestCase):
+    def test_read(self):
+        data = numpy.reshape(numpy.arange(10*4*2, dtype='int16'), (10, 4, 2))
+        complex_data = numpy.empty((10, 4), dtype='complex64')
+        complex_data.real = data[:, :, 0]
+        complex_data.imag = data[:, :, 1]
+
+        data_segment = NumpyArraySegment(
+            data, formatted_dtype='complex64', formatted_shape=(10, 4),
+            format_function=ComplexFormatFunction('int16', 'IQ', band_dimension=2),
+            mode='r')
+        reader = BaseReader(data_segment)
+        subscripts = [(slice(start, min(start+3, 10)), slice(None)) for start in range(0, 10, 3)]
+
+        with self.subTest(msg='iteration'):
+            with ReadPrefetcher(reader, subscripts, queue_depth=2) as prefetcher:
+                self.assertEqual(prefetcher.pending_count, 4)
+                count = 0
+                for subscript, test_data in prefetcher:
+                    self.assertTrue(numpy.all(complex_data[subscript] == test_data))
+                    count += 1
+                self.assertEqual(count, 4)
+                self.assertEqual(prefetcher.pending_count, 0)
+                stats = prefetcher.get_statistics()
+                self.assertEqual(stats['hits'], 4)
+                self.assertEqual(stats['misses'], 0)
+                self.assertEqual(stats['read_count'], 4)
+                self.assertTrue(stats['stall_time'] >= 0)
+            self.assertTrue(prefetcher.closed)
+            self.assertFalse(data_segment.closed)
+
+        with self.subTest(msg='raw read and scheduling'):
+            prefetcher = ReadPrefetcher(data_segment, raw=True, squeeze=False, queue_depth=1)
+            prefetcher.schedule(*subscripts)
+            test_data = prefetcher.read((slice(3, 6), slice(None)))
+            self.assertTrue(numpy.all(data[3:6] == test_data))
+            test_data = prefetcher.read((slice(0, 3, 1), slice(0, 4, 1)))
+            self.assertTrue(numpy.all(data[0:3] == test_data))
+            test_data = prefetcher.read(9)
+            self.assertEqual(test_data.shape, (1, 4, 2))
+            self.assertTrue(numpy.all(data[9:10] == test_data))
+            stats = prefetcher.get_statistics()
+            # only the first scheduled read had been started
+            self.assertEqual(stats['hits'], 1)
+            self.assertEqual(stats['misses'], 2)
+            self.assertEqual(prefetcher.pending_count, 1)
+            prefetcher.close()
+            self.assertEqual(prefetcher.pending_count, 0)
+
+        with self.assertRaises(ValueError, msg='read when closed'):
+            prefetcher.read(0)
+
+        with self.assertRaises(ValueError, msg='invalid queue depth'):
+            ReadPrefetcher(reader, queue_depth=0)
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+import zlib
+
+import numpy
+
+from sarpy.io.general.tiff import TiffDetails, NativeTiffDataSegment, TiledTiffDataSegment, \
+    TiffReader
+
+
+def _write_tiff(file_name, tags, blocks):
+    """
+    Writes a minimal little endian tiff file, with the given blocks populating
+    the offsets and byte counts tags.
+    """
+
+    offsets = []
+    byte_counts = []
+    with open(file_name, 'wb') as fi:
+        fi.write(b'II' + numpy.array([42, 0, 0], dtype='<u2').tobytes())
+        for block in blocks:
+            offsets.append(fi.tell())
+            byte_counts.append(len(block))
+            fi.write(block)
+        if 'TileWidth' in tags:
+            tags['TileOffsets'], tags['TileByteCounts'] = offsets, byte_counts
+        else:
+            tags['StripOffsets'], tags['StripByteCounts'] = offsets, byte_counts
+
+        tag_numbers = {
+            'ImageWidth': 256, 'ImageLength': 257, 'BitsPerSample': 258, 'Compression': 259,
+            'StripOffsets': 273, 'SamplesPerPixel': 277, 'RowsPerStrip': 278, 'StripByteCounts': 279,
+            'PlanarConfiguration': 284, 'Predictor': 317, 'TileWidth': 322, 'TileLength': 323,
+            'TileOffsets': 324, 'TileByteCounts': 325, 'SampleFormat': 339}
+        entries = sorted((tag_numbers[key], numpy.atleast_1d(value).astype('<u4')) for key, value in tags.items())
+        ifd_offset = fi.tell()
+        extra_offset = ifd_offset + 2 + 12*len(entries) + 4
+        ifd = numpy.array([len(entries), ], dtype='<u2').tobytes()
+        extra = b''
+        for tag, value in entries:
+            ifd += numpy.array([tag, 4], dtype='<u2').tobytes() + numpy.array([value.size], dtype='<u4').tobytes()
+            if value.size == 1:
+                ifd += value.tobytes()
+            else:
+                ifd += numpy.array([extra_offset + len(extra)], dtype='<u4').tobytes()
+                extra += value.tobytes()
+        fi.write(ifd + b'\x00\x00\x00\x00' + extra)
+        fi.seek(4)
+        fi.write(numpy.array([ifd_offset], dtype='<u4').tobytes())
+
+
+class TestTiledTiffDataSegment(unittest.TestCase):
+    def setUp(self):
+        self.data = numpy.reshape(numpy.arange(40*52*2, dtype='int64') % 30011 - 15000, (40, 52, 2)).astype('<i2')
+        self.expected = self.data[:, :, 0] + 1j*self.data[:, :, 1]
+        self.tags = {
+            'ImageWidth': 52, 'ImageLength': 40, 'BitsPerSample': [16, 16], 'SamplesPerPixel': 2,
+            'SampleFormat': [2, 2], 'PlanarConfiguration': 1}
+
+    def _check_reader(self, file_name, segment_type, **kwargs):
+        reader = TiffReader(file_name, **kwargs)
+        self.assertIsInstance(reader.data_segment, segment_type)
+        self.assertTrue(numpy.all(reader[:, :] == self.expected))
+        self.assertTrue(numpy.all(reader[3:37:3, 50:4:-5] == self.expected[3:37:3, 50:4:-5]))
+        self.assertTrue(numpy.all(reader.read_raw(slice(17, 31), slice(20, 40)) == self.data[17:31, 20:40]))
+        reader.close()
+
+    def test_tiles(self):
+        blocks = []
+        for row in range(0, 40, 16):
+            for col in range(0, 52, 16):
+                # NB: tiles are padded to the full tile size
+                tile = numpy.zeros((16, 16, 2), dtype='<i2')
+                tile_data = self.data[row:row+16, col:col+16]
+                tile[:tile_data.shape[0], :tile_data.shape[1]] = tile_data
+                blocks.append(tile.tobytes())
+        tags = dict(self.tags, Compression=1, TileWidth=16, TileLength=16)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'tiled.tif')
+            _write_tiff(file_name, tags, blocks)
+            self.assertTrue(TiffDetails(file_name).is_tiled)
+            self._check_reader(file_name, TiledTiffDataSegment)
+            self._check_reader(file_name, TiledTiffDataSegment, max_workers=3)
+
+    def test_deflate_strips(self):
+        blocks = []
+        for row in range(0, 40, 7):
+            strip = self.data[row:row+7].copy()
+            # horizontal differencing predictor
+            strip[:, 1:] = numpy.diff(strip, axis=1)
+            blocks.append(zlib.compress(strip.tobytes()))
+        tags = dict(self.tags, Compression=8, Predictor=2, RowsPerStrip=7)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'strips.tif')
+            _write_tiff(file_name, tags, blocks)
+            self._check_reader(file_name, TiledTiffDataSegment, max_workers=2)
+
+    def test_flat_strips(self):
+        blocks = [self.data[row:row+8].tobytes() for row in range(0, 40, 8)]
+        tags = dict(self.tags, Compression=1, RowsPerStrip=8)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            file_name = os.path.join(tmpdirname, 'flat.tif')
+            _write_tiff(file_name, tags, blocks)
+            self._check_reader(file_name, NativeTiffDataSegment)
@@ -1,9 +1,71 @@
+from sarpy.io.general.nitf_elements.base import TRE, TREList
 from sarpy.io.general.nitf_elements.tres.registration import find_tre
 from sarpy.io.general.nitf_elements.tres.unclass.ACFTA import ACFTA
+from sarpy.io.general.nitf_elements.tres.unclass.ACCPOB import ACCPOB
+from sarpy.io.general.nitf_elements.tres.unclass.BLOCKA import BLOCKA, BLOCKAType
 import unittest
+from unittest import mock
+
+
+blocka_data = b'01' + b'00000' + b'01024' + b'090' + b'270' + b' '*16 + \
+    b'+42.000000-071.000000' + b'+41.900000-071.000000' + b'+41.900000-070.900000' + \
+    b'+42.000000-070.900000' + b'     '
+blocka_bytes = b'BLOCKA' + '{0:05d}'.format(len(blocka_data)).encode('utf-8') + blocka_data
 
 
 class TestTreRegistry(unittest.TestCase):
     def test_find_tre(self):
         the_tre = find_tre('ACFTA')
         self.assertEqual(the_tre, ACFTA)
+
+
+class TestLazyTRE(unittest.TestCase):
+    def test_lazy_decode(self):
+        tre = TRE.from_bytes(blocka_bytes, 0)
+        self.assertIsInstance(tre, BLOCKA)
+
+        with self.subTest(msg='undecoded'):
+            self.assertFalse(tre.is_decoded)
+            self.assertEqual(tre.EL, len(blocka_data))
+            self.assertEqual(tre.get_bytes_length(), len(blocka_bytes))
+            self.assertEqual(tre.to_bytes(), blocka_bytes)
+            self.assertFalse(tre.is_decoded)
+
+        with self.subTest(msg='decoded'):
+            data = tre.DATA
+            self.assertIsInstance(data, BLOCKAType)
+            self.assertTrue(tre.is_decoded)
+            self.assertIs(tre.DATA, data)
+            self.assertEqual(data.L_LINES, '01024')
+            self.assertEqual(tre.to_bytes(), blocka_bytes)
+
+        with self.subTest(msg='modified'):
+            data.L_LINES = '00512'
+            self.assertEqual(tre.to_bytes(), blocka_bytes.replace(b'01024', b'00512'))
+
+    def test_failed_decode(self):
+        tre = ACCPOB(b'XX')
+        self.assertEqual(tre.to_bytes(), b'ACCPOB00002XX')
+        with self.assertLogs('sarpy.io.general.nitf_elements.tres.tre_elements', level='ERROR'):
+            self.assertEqual(tre.DATA, b'XX')
+        self.assertFalse(tre.is_decoded)
+        with self.subTest(msg='failure recorded once'):
+            with mock.patch.object(ACCPOB, '_data_type') as data_type:
+                self.assertEqual(tre.DATA, b'XX')
+                data_type.assert_not_called()
+
+    def test_tre_list(self):
+        value = blocka_bytes + b'UNKNWN00004abcd'
+        tres = TREList.from_bytes(value, 0)
+        self.assertEqual(len(tres), 2)
+        self.assertFalse(tres['BLOCKA'].is_decoded)
+        self.assertEqual(tres.to_bytes(), value)
+        self.assertEqual(tres[1].DATA, b'abcd')
+        self.assertEqual(tres[0].DATA.N_GRAY, '00000')
+        self.assertTrue(tres['BLOCKA'].is_decoded)
+        self.assertEqual(tres.to_bytes(), value)
+
+    def test_truncated_tre_list(self):
+        with self.assertLogs('sarpy.io.general.nitf_elements.base', level='ERROR'):
+            tres = TREList.from_bytes(b'UNKNWN00010abcd', 0)
+        self.assertEqual(len(tres), 1)
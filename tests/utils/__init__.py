@@ -0,0 +1,2 @@
+
+__classification__ = 'UNCLASSIFIED'
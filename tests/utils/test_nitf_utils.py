@@ -0,0 +1,135 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+
+import numpy
+
+from sarpy.io.complex.sicd import SICDWriter
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.utils.nitf_utils import find_nitf_files, extract_nitf_summary, extract_nitf_summaries
+
+from tests import parse_file_entry
+
+
+this_loc = os.path.abspath(__file__)
+tests_path = os.path.split(os.path.split(this_loc)[0])[0]
+sicd_file = os.path.join(tests_path, 'data', 'example.sicd.xml')
+
+test_files = []
+file_reference = os.path.join(tests_path, 'io', 'general', 'nitf_headers.json')  # specifies file locations
+if os.path.isfile(file_reference):
+    with open(file_reference, 'r') as fi:
+        for entry in json.load(fi):
+            the_file = parse_file_entry(entry)
+            if the_file is not None:
+                test_files.append(the_file)
+
+
+def _write_sicd(file_name, rows, cols):
+    sicd = SICDType.from_xml_file(sicd_file)
+    sicd.ImageData.NumRows = rows
+    sicd.ImageData.NumCols = cols
+    sicd.ImageData.FullImage.NumRows = rows
+    sicd.ImageData.FullImage.NumCols = cols
+    sicd.ImageData.FirstRow = 0
+    sicd.ImageData.FirstCol = 0
+    with SICDWriter(file_name, sicd, check_existence=False) as writer:
+        writer(numpy.zeros((rows, cols), dtype='complex64'), start_indices=(0, 0))
+
+
+def _without_elapsed(records):
+    return [dict((key, value) for key, value in record.items() if key != 'elapsed') for record in records]
+
+
+def _get_jsonl_records(input_path, processes, full=False):
+    dest = StringIO()
+    stats = extract_nitf_summaries(input_path, dest, output_format='jsonl', processes=processes, full=full)
+    records = [json.loads(line) for line in dest.getvalue().splitlines()]
+    return stats, records
+
+
+class TestNITFSummaries(unittest.TestCase):
+    def setUp(self):
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temp_directory.name
+        os.makedirs(os.path.join(self.directory, 'sub'))
+        self.first_file = os.path.join(self.directory, 'a.nitf')
+        self.second_file = os.path.join(self.directory, 'sub', 'b.nitf')
+        self.bad_file = os.path.join(self.directory, 'sub', 'truncated.nitf')
+        _write_sicd(self.first_file, 20, 10)
+        _write_sicd(self.second_file, 30, 15)
+        with open(self.bad_file, 'wb') as fi:
+            fi.write(b'NITF02.10' + b'\x00'*20)
+        with open(os.path.join(self.directory, 'readme.txt'), 'w') as fi:
+            fi.write('not a nitf')
+
+    def tearDown(self):
+        self.temp_directory.cleanup()
+
+    def test_find_nitf_files(self):
+        self.assertEqual(
+            find_nitf_files(self.directory), [self.first_file, self.second_file, self.bad_file])
+        self.assertEqual(find_nitf_files(self.directory, recursive=False), [self.first_file, ])
+        self.assertEqual(find_nitf_files(self.second_file), [self.second_file, ])
+
+    def test_extract_nitf_summary(self):
+        record = extract_nitf_summary(self.second_file)
+        self.assertIsNone(record['error'])
+        self.assertEqual(record['file_size'], os.path.getsize(self.second_file))
+        self.assertEqual(record['segment_counts']['img'], 1)
+        self.assertEqual(record['image_segments'][0]['NROWS'], 30)
+        self.assertEqual(record['image_segments'][0]['NCOLS'], 15)
+        self.assertNotIn('headers', record)
+
+        with self.subTest(msg='full'):
+            self.assertIn('headers', extract_nitf_summary(self.second_file, full=True))
+
+        with self.subTest(msg='failure'):
+            record = extract_nitf_summary(self.bad_file)
+            self.assertIsNotNone(record['error'])
+
+    def test_serial_and_pool(self):
+        serial_stats, serial_records = _get_jsonl_records(self.directory, 1)
+        pool_stats, pool_records = _get_jsonl_records(self.directory, 2)
+        for stats in [serial_stats, pool_stats]:
+            self.assertEqual(stats['file_count'], 3)
+            self.assertEqual(stats['failure_count'], 1)
+        self.assertEqual(
+            [record['file_name'] for record in serial_records],
+            [self.first_file, self.second_file, self.bad_file])
+        self.assertEqual(_without_elapsed(serial_records), _without_elapsed(pool_records))
+
+        with self.subTest(msg='full'):
+            _, serial_records = _get_jsonl_records([self.first_file, self.second_file], 1, full=True)
+            _, pool_records = _get_jsonl_records([self.first_file, self.second_file], 2, full=True)
+            self.assertEqual(_without_elapsed(serial_records), _without_elapsed(pool_records))
+
+        with self.subTest(msg='csv'):
+            outputs = []
+            for processes in [1, 2]:
+                output_file = os.path.join(self.directory, 'inventory_{}.csv'.format(processes))
+                extract_nitf_summaries(self.directory, output_file, output_format='csv', processes=processes)
+                with open(output_file, 'r', newline='') as fi:
+                    outputs.append(_without_elapsed(csv.DictReader(fi)))
+            self.assertEqual(len(outputs[0]), 3)
+            self.assertEqual(outputs[0][1]['NROWS'], '30')
+            self.assertEqual(outputs[0], outputs[1])
+
+    def test_arguments(self):
+        with self.assertRaises(ValueError):
+            extract_nitf_summaries(self.directory, StringIO(), output_format='xml')
+        with self.assertRaises(ValueError):
+            extract_nitf_summaries(self.directory, StringIO(), output_format='csv', full=True)
+        with self.assertRaises(ValueError):
+            extract_nitf_summaries(self.directory, StringIO(), processes=0)
+
+    @unittest.skipIf(len(test_files) == 0, 'No nitf files identified for testing')
+    def test_nitf_test_files(self):
+        serial_stats, serial_records = _get_jsonl_records(test_files, 1)
+        pool_stats, pool_records = _get_jsonl_records(test_files, 4)
+        self.assertEqual(serial_stats['file_count'], len(test_files))
+        self.assertEqual(serial_stats['failure_count'], pool_stats['failure_count'])
+        self.assertEqual(_without_elapsed(serial_records), _without_elapsed(pool_records))